@@ -1385,8 +1385,8 @@ class DummyViewModel(
 
     async def export_events(self) -> None:
         export_format_extensions: dict[str, str] = {
-            key: exporter.get_extension()
-            for key, exporter in self._event_list_export_formats.items()
+            key: create_exporter().get_extension()
+            for key, create_exporter in self._event_list_export_formats.items()
         }
         try:
             event_list_exporter, file = await self._configure_event_exporter(
@@ -1410,12 +1410,10 @@ class DummyViewModel(
         )
         file = export_config.file
         export_format = export_config.export_format
-        event_list_exporter = self._event_list_export_formats.get(export_format, None)
-        if event_list_exporter is None:
-            raise ExporterNotFoundError(
-                f"{event_list_exporter} is not a valid export format"
-            )
-        return event_list_exporter, file
+        create_exporter = self._event_list_export_formats.get(export_format, None)
+        if create_exporter is None:
+            raise ExporterNotFoundError(f"{export_format} is not a valid export format")
+        return create_exporter(), file
 
     def set_track_offset(self, offset_x: float, offset_y: float) -> None:
         start_msg_popup = self._ui_factory.minimal_info_box(
@@ -1647,9 +1645,12 @@ class DummyViewModel(
 
     def on_tracks_cut(self, cut_tracks_dto: CutTracksDto) -> None:
         window_position = self._get_window_position()
+        section_names = ", ".join(
+            f"'{section.name}'" for section in cut_tracks_dto.sections
+        )
         msg = (
             "Cut successful. "
-            f"Cutting section '{cut_tracks_dto.section} '"
+            f"Cutting section {section_names}"
             " and original tracks deleted.\n"
             f"{len(cut_tracks_dto.original_tracks)} out of "
             f"{self._application.get_track_repository_size()} tracks successfully cut. "
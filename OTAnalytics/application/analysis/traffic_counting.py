@@ -1,3 +1,4 @@
+import math
 import re
 import unicodedata
 from abc import ABC, abstractmethod
@@ -5,7 +6,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Callable, Iterable, Optional
+from typing import Callable, Iterable, Optional, Sequence
 
 from PIL.Image import Image
 
@@ -639,9 +640,16 @@ class FilterBySectionEnterEvent(RoadUserAssignerDecorator):
     """Decorator to filters events by event type section-enter."""
 
     def assign(self, events: Iterable[Event], flows: list[Flow]) -> RoadUserAssignments:
-        section_enter_events = PythonEventDataset(
-            [event for event in events if event.event_type == EventType.SECTION_ENTER]
-        )
+        if isinstance(events, EventDataset):
+            section_enter_events = events.filter(event_types=[EventType.SECTION_ENTER])
+        else:
+            section_enter_events = PythonEventDataset(
+                [
+                    event
+                    for event in events
+                    if event.event_type == EventType.SECTION_ENTER
+                ]
+            )
         return super().assign(section_enter_events, flows)
 
 
@@ -984,6 +992,97 @@ def aggregation_time(
     return start_of(rua)
 
 
+CubeKey = tuple[Flow, RoadUserType, int]
+
+
+class CountingCube:
+    """
+    Counts of road users per flow, mode and time bucket at a base resolution.
+
+    Time buckets are identified by the timestamp of their start in seconds. They are
+    aligned the same way as the time slots of `create_timeslot_tag`. Thus, the counts
+    of any interval being a multiple of the resolution are derived by summing up the
+    base buckets without tagging the assignments again.
+
+    Args:
+        counts (dict[CubeKey, int]): counts per flow, mode and base bucket. Keys with
+            a zero count represent road users that were filtered out. They keep the
+            time slot present in derived counts.
+        resolution (timedelta): length of the base buckets.
+    """
+
+    def __init__(self, counts: dict[CubeKey, int], resolution: timedelta) -> None:
+        self._counts = counts
+        self._resolution = int(resolution.total_seconds())
+
+    @staticmethod
+    def build(
+        assignments: Iterable[RoadUserAssignment],
+        counting_event: CountingEvent,
+        resolution: timedelta,
+        condition: Callable[[RoadUserAssignment], bool] | None = None,
+    ) -> "CountingCube":
+        """
+        Count the given assignments in a single pass.
+
+        Args:
+            assignments (Iterable[RoadUserAssignment]): assignments to count.
+            counting_event (CountingEvent): event defining the time of an assignment.
+            resolution (timedelta): length of the base buckets.
+            condition (Callable[[RoadUserAssignment], bool] | None): only
+                assignments fulfilling the condition are counted. All assignments
+                are counted if no condition is given.
+
+        Returns:
+            CountingCube: the counts of the assignments.
+        """
+        resolution_in_seconds = resolution.total_seconds()
+        counts: dict[CubeKey, int] = defaultdict(int)
+        for assignment in assignments:
+            timestamp = int(aggregation_time(assignment, counting_event).timestamp())
+            bucket = int(int(timestamp / resolution_in_seconds) * resolution_in_seconds)
+            key = (assignment.assignment, assignment.road_user_type, bucket)
+            counts[key] += 1 if condition is None or condition(assignment) else 0
+        return CountingCube(dict(counts), resolution)
+
+    def count(self, interval: timedelta, flows: list[Flow]) -> Count:
+        """
+        Derive the counts per mode and time slot of the given interval.
+
+        Args:
+            interval (timedelta): length of the time slots. Must be a multiple of the
+                resolution of this cube.
+            flows (list[Flow]): flows to count for. Flows without road users are
+                assigned a zero count.
+
+        Returns:
+            Count: traffic counts per mode and time slot.
+        """
+        interval_in_seconds = int(interval.total_seconds())
+        if interval_in_seconds % self._resolution:
+            raise ValueError(
+                f"Interval of {interval} is not a multiple of the cube resolution "
+                f"of {self._resolution} seconds."
+            )
+        slots: dict[tuple[RoadUserType, int], dict[Flow, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+        for (flow, mode, bucket), count in self._counts.items():
+            slot = int(bucket / interval_in_seconds) * interval_in_seconds
+            slots[(mode, slot)][flow] += count
+        empty = {flow: 0 for flow in flows}
+        return GroupedCount(
+            {
+                create_mode_tag(mode).combine(
+                    create_timeslot_tag(
+                        datetime.fromtimestamp(slot, tz=timezone.utc), interval
+                    )
+                ): CountByFlow(empty | dict(counts))
+                for (mode, slot), counts in slots.items()
+            }
+        )
+
+
 class TrafficCounting:
     """
     Use case to produce traffic counts.
@@ -1041,6 +1140,72 @@ class TrafficCounting:
 
         return tagged_assignments.count(flows)
 
+    def count_all(
+        self, specifications: Sequence[CountingSpecificationDto]
+    ) -> list[Count]:
+        """
+        Produce traffic counts for several specifications at once.
+
+        The assignments are counted once per counting window and counting event into
+        a CountingCube. The counts of each specification are derived from the cube.
+        Custom taggers can not be derived from a cube. Thus, each specification is
+        counted separately if a tagger factory other than SimpleTaggerFactory is used.
+
+        Args:
+            specifications (Sequence[CountingSpecificationDto]): specifications of
+                the countings.
+
+        Returns:
+            list[Count]: the counts in the order of the given specifications.
+        """
+        if not isinstance(self._tagger_factory, SimpleTaggerFactory):
+            return [self.count(specification) for specification in specifications]
+
+        flows = self.get_flows()
+        assignments = self._get_assignments.get().as_list()
+        cubes: dict[tuple, CountingCube] = {}
+        counts: list[Count] = []
+        for specification in specifications:
+            key = self.__cube_key_of(specification)
+            if (cube := cubes.get(key)) is None:
+                cube = self.__build_cube(assignments, specification, specifications)
+                cubes[key] = cube
+            interval = timedelta(minutes=specification.interval_in_minutes)
+            counts.append(cube.count(interval, flows))
+        return counts
+
+    @staticmethod
+    def __cube_key_of(specification: CountingSpecificationDto) -> tuple:
+        if specification.count_all_events:
+            return (specification.counting_event,)
+        return (specification.counting_event, specification.start, specification.end)
+
+    def __build_cube(
+        self,
+        assignments: list[RoadUserAssignment],
+        specification: CountingSpecificationDto,
+        specifications: Sequence[CountingSpecificationDto],
+    ) -> CountingCube:
+        key = self.__cube_key_of(specification)
+        resolution_in_minutes = math.gcd(
+            *(
+                current.interval_in_minutes
+                for current in specifications
+                if self.__cube_key_of(current) == key
+            )
+        )
+        condition = (
+            None
+            if specification.count_all_events
+            else self.__assignment_filter_for(specification)
+        )
+        return CountingCube.build(
+            assignments,
+            specification.counting_event,
+            timedelta(minutes=resolution_in_minutes),
+            condition,
+        )
+
     def __assignment_filter_for(
         self,
         specification: CountingSpecificationDto,
@@ -1132,7 +1297,23 @@ class ExportTrafficCounting(ExportCounts):
             specification (CountingSpecificationDto): specification of the export
         """
         counts = self._traffic_counting.count(specification)
+        self.__export(specification, counts)
+
+    def export_all(self, specifications: Sequence[CountingSpecificationDto]) -> None:
+        """
+        Export the traffic countings of several specifications. The assignments are
+        counted only once and the counts of each specification are derived from the
+        result.
+
+        Args:
+            specifications (Sequence[CountingSpecificationDto]): specifications of
+                the exports
+        """
+        all_counts = self._traffic_counting.count_all(specifications)
+        for specification, counts in zip(specifications, all_counts):
+            self.__export(specification, counts)
 
+    def __export(self, specification: CountingSpecificationDto, counts: Count) -> None:
         flows = self._traffic_counting.get_flows()
         export_specification = create_export_specification(
             flows, specification, self._traffic_counting.provide_get_sections_by_id()
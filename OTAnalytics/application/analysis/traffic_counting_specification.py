@@ -2,7 +2,7 @@ from abc import ABC
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Iterable
+from typing import Iterable, Sequence
 
 from OTAnalytics.application.export_formats.export_mode import ExportMode
 
@@ -91,5 +91,9 @@ class ExportCounts(ABC):
     def export(self, specification: CountingSpecificationDto) -> None:
         raise NotImplementedError
 
+    def export_all(self, specifications: Sequence[CountingSpecificationDto]) -> None:
+        for specification in specifications:
+            self.export(specification)
+
     def get_supported_formats(self) -> Iterable[ExportFormat]:
         raise NotImplementedError
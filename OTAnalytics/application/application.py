@@ -64,8 +64,8 @@ from OTAnalytics.application.use_cases.track_repository import (
     TrackRepositorySize,
 )
 from OTAnalytics.application.use_cases.track_statistics import (
-    CalculateTrackStatistics,
     TrackStatistics,
+    TrackStatisticsCalculator,
 )
 from OTAnalytics.application.use_cases.track_statistics_export import (
     ExportTrackStatistics,
@@ -143,7 +143,7 @@ class OTAnalyticsApplication:
         config_has_changed: ConfigHasChanged,
         export_road_user_assignments: ExportRoadUserAssignments,
         file_name_suggester: SavePathSuggester,
-        calculate_track_statistics: CalculateTrackStatistics,
+        calculate_track_statistics: TrackStatisticsCalculator,
         number_of_tracks_assigned_to_each_flow: NumberOfTracksAssignedToEachFlow,
         export_track_statistics: ExportTrackStatistics,
         get_current_remark: GetCurrentRemark,
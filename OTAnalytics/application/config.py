@@ -16,12 +16,16 @@ DEFAULT_EVENTLIST_FILE_TYPE: str = "otevents"
 DEFAULT_COUNTS_FILE_TYPE: str = "csv"
 DEFAULT_COUNT_INTERVAL_TIME_UNIT: str = "min"
 DEFAULT_TRACK_FILE_TYPE: str = "ottrk"
+DEFAULT_TRACK_EXPORT_FORMAT: str = "csv"
 DEFAULT_SECTIONS_FILE_TYPE: str = "otflow"
 DEFAULT_COUNTING_INTERVAL_IN_MINUTES: int = 15
 DEFAULT_COUNTING_EVENT: str = "start"
 DEFAULT_TRACK_OFFSET: RelativeOffsetCoordinate = RelativeOffsetCoordinate(0.5, 0.5)
 DEFAULT_PROGRESSBAR_STEP_PERCENTAGE: int = 5
 DEFAULT_NUM_PROCESSES = 1
+DEFAULT_TRACK_CACHE_DIR = Path.home() / ".cache" / "OTAnalytics" / "tracks"
+"""The directory to cache parsed track files in."""
+DEFAULT_TRACK_CACHE_SIZE_IN_MB: int = 10240
 
 
 # File Types
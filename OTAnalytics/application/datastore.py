@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Optional, Sequence
+from typing import Iterable, Iterator, Optional, Sequence
 
 from OTAnalytics.application.export_formats.export_mode import OVERWRITE
 from OTAnalytics.application.project import Project
@@ -79,6 +79,20 @@ class TrackParser(ABC):
         videos_metadata = [result.video_metadata for result in results]
         return TracksParseResult(tracks, detections_metadata, videos_metadata)
 
+    def parse_each(self, files: Sequence[Path]) -> Iterator[TrackParseResult]:
+        """Parse the given files one by one.
+
+        Results are provided in the order of the given files.
+
+        Args:
+            files (Sequence[Path]): the files to parse.
+
+        Returns:
+            Iterator[TrackParseResult]: the parse result of each file.
+        """
+        for file in files:
+            yield self.parse(file)
+
     @abstractmethod
     def parse(self, file: Path) -> TrackParseResult:
         raise NotImplementedError
@@ -271,7 +285,7 @@ class Datastore:
             event_list_exporter (EventListExporter): Exporter building the format
         """
         event_list_exporter.export(
-            events=self._event_repository.get_all(),
+            events=self._event_repository.get_dataset(),
             sections=self._section_repository.get_all(),
             export_specification=EventExportSpecification(
                 file=file,
@@ -6,6 +6,7 @@ class ExportMode:
     name: str
     first: bool
     flush: bool
+    resumed: bool = False
 
     def is_first_write(self) -> bool:
         return self.first
@@ -16,12 +17,19 @@ class ExportMode:
     def is_final_write(self) -> bool:
         return self.flush
 
+    def is_resumed_write(self) -> bool:
+        """First write of a process continuing the writes of an interrupted one."""
+        return self.resumed
+
     @staticmethod
     def values() -> list["ExportMode"]:
         return [OVERWRITE, INITIAL_MERGE, MERGE, FLUSH]
 
     @staticmethod
-    def create(is_first: bool, flush: bool) -> "ExportMode":
+    def create(is_first: bool, flush: bool, resumed: bool = False) -> "ExportMode":
+        if resumed and not is_first:
+            return RESUME_FLUSH if flush else RESUME_MERGE
+
         if is_first and flush:
             return OVERWRITE
 
@@ -39,3 +47,5 @@ OVERWRITE = ExportMode("overwrite", True, True)
 INITIAL_MERGE = ExportMode("initial_merge", True, False)
 MERGE = ExportMode("merge", False, False)
 FLUSH = ExportMode("final_merge", False, True)
+RESUME_MERGE = ExportMode("resume_merge", False, False, True)
+RESUME_FLUSH = ExportMode("resume_final_merge", False, True, True)
@@ -51,11 +51,17 @@ class CliArguments:
     save_name: str | None = None
     save_suffix: str | None = None
     event_formats: list[str] | None = None
+    track_formats: list[str] | None = None
     count_intervals: list[int] | None = None
     counting_event: CountingEvent | None = None
     log_file: str | None = None
     include_classes: list[str] | None = None
     exclude_classes: list[str] | None = None
+    num_processes: int | None = None
+    track_cache_dir: str | None = None
+    no_track_cache: bool = False
+    stream_window_in_minutes: int | None = None
+    resume: bool = False
 
 
 class CliValueProvider(OtConfigDefaultValueProvider):
@@ -114,6 +120,8 @@ class CliValueProvider(OtConfigDefaultValueProvider):
 
     @property
     def num_processes(self) -> int:
+        if self._cli_args.num_processes:
+            return self._cli_args.num_processes
         return DEFAULT_NUM_PROCESSES
 
     @property
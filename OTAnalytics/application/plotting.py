@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import partial
 from math import floor
+from threading import Lock
 from typing import Any, Callable, Generic, Iterable, Optional, Sequence, TypeVar
 
 from OTAnalytics.application.logger import logger
@@ -10,6 +12,7 @@ from OTAnalytics.application.state import (
     ObservableOptionalProperty,
     ObservableProperty,
     Plotter,
+    RenderImage,
     VideosMetadata,
 )
 from OTAnalytics.domain.track import TrackImage
@@ -82,6 +85,9 @@ class PlottingLayer(Plotter, Layer):
         """
         return self._other.plot() if self._enabled.get() else None
 
+    def snapshot(self) -> RenderImage:
+        return self._other.snapshot() if self._enabled.get() else _render_nothing
+
     def get_name(self) -> str:
         return self._name
 
@@ -102,20 +108,25 @@ class PlottingLayer(Plotter, Layer):
 class LayeredPlotter(Plotter):
     def __init__(self, layers: Sequence[PlottingLayer]) -> None:
         self._layers = layers
-        self._current_image: Optional[TrackImage] = None
 
     def plot(self) -> Optional[TrackImage]:
-        self._current_image = None
-        for layer in self._layers:
-            if current_layer := layer.plot():
-                self.__add(current_layer)
-        return self._current_image
+        return _combine(layer.plot() for layer in self._layers)
+
+    def snapshot(self) -> RenderImage:
+        renders = [layer.snapshot() for layer in self._layers]
+        return lambda: _combine(render() for render in renders)
+
 
-    def __add(self, image: TrackImage) -> None:
-        if self._current_image:
-            self._current_image = self._current_image.add(image)
-        else:
-            self._current_image = image
+def _combine(images: Iterable[Optional[TrackImage]]) -> Optional[TrackImage]:
+    combined: Optional[TrackImage] = None
+    for image in images:
+        if image:
+            combined = combined.add(image) if combined else image
+    return combined
+
+
+def _render_nothing() -> Optional[TrackImage]:
+    return None
 
 
 class VisualizationTimeProvider(ABC):
@@ -139,12 +150,15 @@ class TrackBackgroundPlotter(Plotter):
         self._visualization_time_provider = visualization_time_provider
 
     def plot(self) -> Optional[TrackImage]:
+        return self.snapshot()()
+
+    def snapshot(self) -> RenderImage:
         if videos := self._video_provider():
             visualization_time = self._visualization_time_provider.get_time()
             frame_number = videos[-1].get_frame_number_for(visualization_time)
             logger().debug(f"Background plotter frame number: {frame_number}")
-            return videos[-1].get_frame(frame_number)
-        return None
+            return partial(videos[-1].get_frame, frame_number)
+        return _render_nothing
 
 
 class LiveImagePlotter(Plotter):
@@ -163,6 +177,10 @@ class CachedPlotter(Plotter):
     It can listen to changes of observable properties to invalidate the cache.
     It can also be registered at subjects via:
         subject.register(cached_plotter.invalidate_cache)
+
+    The image may be plotted on another thread than the cache is invalidated on.
+    An image whose plotting started before the latest invalidation is returned but
+    not cached, because it may show outdated data.
     """
 
     def __init__(
@@ -172,18 +190,39 @@ class CachedPlotter(Plotter):
     ) -> None:
         self._other = other
         self._cache: Optional[TrackImage] = None
+        self._generation = 0
+        self._lock = Lock()
 
         for subject in subjects:
             subject.register(self.invalidate_cache)
 
     def plot(self) -> Optional[TrackImage]:
-        if self._cache is None:
-            self._cache = self._other.plot()
-
-        return self._cache
+        with self._lock:
+            if self._cache is not None:
+                return self._cache
+            generation = self._generation
+        return self._update_cache(generation, self._other.plot())
+
+    def snapshot(self) -> RenderImage:
+        with self._lock:
+            if (cache := self._cache) is not None:
+                return lambda: cache
+            generation = self._generation
+        render = self._other.snapshot()
+        return lambda: self._update_cache(generation, render())
+
+    def _update_cache(
+        self, generation: int, image: Optional[TrackImage]
+    ) -> Optional[TrackImage]:
+        with self._lock:
+            if generation == self._generation:
+                self._cache = image
+        return image
 
     def invalidate_cache(self, _: Any) -> None:
-        self._cache = None
+        with self._lock:
+            self._generation += 1
+            self._cache = None
 
 
 ENTITY = TypeVar("ENTITY")
@@ -228,6 +267,10 @@ class DynamicLayersPlotter(Plotter, Generic[ENTITY]):
         layer_plotter = LayeredPlotter(list(self._layer_mapping.values()))
         return layer_plotter.plot()
 
+    def snapshot(self) -> RenderImage:
+        layer_plotter = LayeredPlotter(list(self._layer_mapping.values()))
+        return layer_plotter.snapshot()
+
     def notify_visibility(self, visible_entities: list[ENTITY]) -> None:
         """Set visibility of given entities to true, others to false."""
         for entity, layer in self._layer_mapping.items():
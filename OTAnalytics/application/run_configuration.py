@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Callable, Sequence
 
@@ -10,6 +10,8 @@ from OTAnalytics.application.config import (
     DEFAULT_COUNTING_INTERVAL_IN_MINUTES,
     DEFAULT_EVENTLIST_FILE_TYPE,
     DEFAULT_NUM_PROCESSES,
+    DEFAULT_TRACK_CACHE_DIR,
+    DEFAULT_TRACK_EXPORT_FORMAT,
 )
 from OTAnalytics.application.config_specification import OtConfigDefaultValueProvider
 from OTAnalytics.application.logger import DEFAULT_LOG_FILE
@@ -169,8 +171,28 @@ class RunConfiguration(OtConfigDefaultValueProvider):
 
     @property
     def num_processes(self) -> int:
+        if self._cli_args.num_processes:
+            return self._cli_args.num_processes
         return DEFAULT_NUM_PROCESSES
 
+    @property
+    def track_cache_dir(self) -> Path | None:
+        if self._cli_args.no_track_cache:
+            return None
+        if self._cli_args.track_cache_dir:
+            return Path(self._cli_args.track_cache_dir).expanduser()
+        return DEFAULT_TRACK_CACHE_DIR
+
+    @property
+    def stream_window(self) -> timedelta | None:
+        if self._cli_args.stream_window_in_minutes:
+            return timedelta(minutes=self._cli_args.stream_window_in_minutes)
+        return None
+
+    @property
+    def resume(self) -> bool:
+        return self._cli_args.resume
+
     @property
     def log_file(self) -> Path:
         if self._cli_args.log_file:
@@ -205,6 +227,15 @@ class RunConfiguration(OtConfigDefaultValueProvider):
     def do_export_tracks(self) -> bool:
         return self._cli_args.track_export
 
+    @property
+    def track_formats(self) -> set[str]:
+        if self._cli_args.track_formats:
+            return {
+                track_format.lower().lstrip(".")
+                for track_format in self._cli_args.track_formats
+            }
+        return {DEFAULT_TRACK_EXPORT_FORMAT}
+
     @property
     def do_export_track_statistics(self) -> bool:
         return self._cli_args.track_statistics_export
@@ -281,6 +281,10 @@ class VideoImageSizeUpdater:
             self._updater.notify(image)
 
 
+RenderImage = Callable[[], Optional[TrackImage]]
+PublishImage = Callable[[Optional[TrackImage]], None]
+
+
 class Plotter(ABC):
     """Abstraction to plot the background image."""
 
@@ -288,6 +292,48 @@ class Plotter(ABC):
     def plot(self) -> Optional[TrackImage]:
         pass
 
+    def snapshot(self) -> RenderImage:
+        """Read everything the image depends on and defer the rendering.
+
+        The snapshot is taken on the thread owning the application state. The
+        returned render function must not read repositories or other shared state
+        and may run on another thread. By default, the image is plotted right away.
+
+        Returns:
+            RenderImage: renders the image from the inputs read.
+        """
+        image = self.plot()
+        return lambda: image
+
+
+class RenderScheduler(ABC):
+    """Decides when and where the background image is rendered."""
+
+    @abstractmethod
+    def schedule(self, plotter: Plotter, publish: PublishImage) -> None:
+        """Request a new background image.
+
+        Args:
+            plotter (Plotter): plots the image.
+            publish (PublishImage): receives the rendered image.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def shutdown(self) -> None:
+        """Cancel pending renders and release the resources of the scheduler."""
+        raise NotImplementedError
+
+
+class SynchronousRenderScheduler(RenderScheduler):
+    """Renders and publishes each requested image immediately."""
+
+    def schedule(self, plotter: Plotter, publish: PublishImage) -> None:
+        publish(plotter.plot())
+
+    def shutdown(self) -> None:
+        pass
+
 
 class VideosMetadata:
     def __init__(self) -> None:
@@ -492,12 +538,18 @@ class TrackImageUpdater(TrackListObserver, SectionListObserver):
         section_state: SectionState,
         flow_state: FlowState,
         plotter: Plotter,
+        render_scheduler: RenderScheduler | None = None,
     ) -> None:
         self._datastore = datastore
         self._track_view_state = track_view_state
         self._section_state = section_state
         self._flow_state = flow_state
         self._plotter = plotter
+        self._render_scheduler = (
+            render_scheduler
+            if render_scheduler is not None
+            else SynchronousRenderScheduler()
+        )
         # React to any relevant changes that should affect the background image
         self._track_view_state.track_offset.register(self._notify_track_offset)
         self._track_view_state.filter_element.register(self._notify_filter_element)
@@ -578,8 +630,11 @@ class TrackImageUpdater(TrackListObserver, SectionListObserver):
     def update_image(self) -> None:
         """
         Updates the current background image with or without tracks and sections.
+        The render scheduler decides when the image is rendered.
         """
-        self._track_view_state.background_image.set(self._plotter.plot())
+        self._render_scheduler.schedule(
+            self._plotter, self._track_view_state.background_image.set
+        )
 
 
 class TracksMetadata(TrackListObserver):
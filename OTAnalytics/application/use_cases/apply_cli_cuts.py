@@ -31,15 +31,14 @@ class ApplyCliCuts:
             key=lambda section: section.id.id,
         )
         logger().info(f"Track repository has size: {self._track_repository_size.get()}")
-        logger().info("Cut tracks with cutting sections...")
         if self._track_repository_size.get() == 0:
             logger().info("No tracks to cut")
             return
-        for cutting_section in cutting_sections:
-            logger().info(
-                f"Cut tracks with cutting section '{cutting_section.name}'..."
-            )
-            self._cut_tracks(
-                cutting_section, preserve_cutting_section=preserve_cutting_sections
-            )
+        logger().info(
+            "Cut tracks with cutting sections "
+            f"{', '.join(section.name for section in cutting_sections)}..."
+        )
+        self._cut_tracks.cut_all(
+            cutting_sections, preserve_cutting_sections=preserve_cutting_sections
+        )
         logger().info("Finished cutting all tracks")
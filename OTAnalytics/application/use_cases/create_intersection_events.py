@@ -9,6 +9,7 @@ from OTAnalytics.domain.event import (
     EventDataset,
     PythonEventDataset,
     SectionEventBuilder,
+    concat_event_datasets,
 )
 from OTAnalytics.domain.geometry import (
     DirectionVector2D,
@@ -47,13 +48,10 @@ class IntersectByIntersectionPoints(Intersector):
         sections_grouped_by_offset = group_sections_by_offset(
             sections, EventType.SECTION_ENTER
         )
-        event_dataset = PythonEventDataset()
-        for offset, section_group in sections_grouped_by_offset.items():
-            result = self.__do_intersect(
-                track_dataset, section_group, offset, event_builder
-            )
-            event_dataset.extend(result)
-        return event_dataset
+        return concat_event_datasets(
+            self.__do_intersect(track_dataset, section_group, offset, event_builder)
+            for offset, section_group in sections_grouped_by_offset.items()
+        )
 
     def __do_intersect(
         self,
@@ -84,13 +82,10 @@ class IntersectAreaByTrackPoints(Intersector):
         sections_grouped_by_offset = group_sections_by_offset(
             sections, EventType.SECTION_ENTER
         )
-        event_dataset = PythonEventDataset()
-        for offset, section_group in sections_grouped_by_offset.items():
-            result = self.__do_intersect(
-                track_dataset, section_group, offset, event_builder
-            )
-            event_dataset.extend(result)
-        return event_dataset
+        return concat_event_datasets(
+            self.__do_intersect(track_dataset, section_group, offset, event_builder)
+            for offset, section_group in sections_grouped_by_offset.items()
+        )
 
     def __do_intersect(
         self,
@@ -196,19 +191,17 @@ class RunCreateIntersectionEvents:
         self._event_builder = event_builder
 
     def create(self) -> EventDataset:
-        event_dataset = PythonEventDataset()
         line_sections, area_sections = separate_sections(self._sections)
-        event_dataset.extend(
-            self._intersect_line_section.intersect(
-                self._track_dataset, line_sections, self._event_builder
-            )
-        )
-        event_dataset.extend(
-            self._intersect_area_section.intersect(
-                self._track_dataset, area_sections, self._event_builder
-            )
+        return concat_event_datasets(
+            [
+                self._intersect_line_section.intersect(
+                    self._track_dataset, line_sections, self._event_builder
+                ),
+                self._intersect_area_section.intersect(
+                    self._track_dataset, area_sections, self._event_builder
+                ),
+            ]
         )
-        return event_dataset
 
 
 class GetTracks(Protocol):
@@ -237,7 +230,6 @@ class BatchedTracksRunIntersect(RunIntersect):
 
 
 def _create_events(tracks: TrackDataset, sections: Iterable[Section]) -> EventDataset:
-    event_dataset = PythonEventDataset()
     event_builder = SectionEventBuilder()
 
     create_intersection_events = RunCreateIntersectionEvents(
@@ -247,8 +239,7 @@ def _create_events(tracks: TrackDataset, sections: Iterable[Section]) -> EventDa
         sections=sections,
         event_builder=event_builder,
     )
-    event_dataset.extend(create_intersection_events.create())
-    return event_dataset
+    return create_intersection_events.create()
 
 
 def separate_sections(
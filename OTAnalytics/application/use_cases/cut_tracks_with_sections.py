@@ -9,15 +9,15 @@ from OTAnalytics.domain.track import Track, TrackId
 
 @dataclass(frozen=True)
 class CutTracksDto:
-    """Holds information tracks that have been cut with a section.
+    """Holds information tracks that have been cut with sections.
 
     Args:
-        section (str): name of the cutting section.
+        sections (list[Section]): the cutting sections.
         original_tracks (list[TrackId]): ids of original tracks that have been
             cut.
     """
 
-    section: str
+    sections: list[Section]
     original_tracks: list[TrackId]
 
 
@@ -41,6 +41,20 @@ class CutTracksIntersectingSection(SectionListObserver):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def cut_all(
+        self, cutting_sections: list[Section], preserve_cutting_sections: bool = False
+    ) -> None:
+        """Cut tracks intersecting any of the given sections in one pass and save
+        the cut tracks to the track repository while removing the original tracks.
+
+        Args:
+            cutting_sections (list[Section]): the sections to cut the tracks with.
+            preserve_cutting_sections (bool): Whether to preserve or discard the
+                cutting sections after cut. Defaults to False.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def register(self, observer: OBSERVER[CutTracksDto]) -> None:
         """Register to this use case.
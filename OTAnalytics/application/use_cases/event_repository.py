@@ -1,7 +1,7 @@
 from typing import Iterable
 
 from OTAnalytics.application.use_cases.cut_tracks_with_sections import CutTracksDto
-from OTAnalytics.domain.event import Event, EventRepository
+from OTAnalytics.domain.event import Event, EventDataset, EventRepository
 from OTAnalytics.domain.section import (
     SectionId,
     SectionListObserver,
@@ -62,8 +62,8 @@ class GetAllEnterSectionEvents:
     def __init__(self, event_repository: EventRepository) -> None:
         self._event_repository = event_repository
 
-    def get(self) -> Iterable[Event]:
-        return self._event_repository.get(event_types=[EventType.SECTION_ENTER])
+    def get(self) -> EventDataset:
+        return self._event_repository.get_dataset(event_types=[EventType.SECTION_ENTER])
 
 
 class RemoveEventsByRoadUserId(TrackListObserver):
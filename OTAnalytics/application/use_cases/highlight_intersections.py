@@ -1,6 +1,5 @@
 from abc import ABC
-from datetime import datetime
-from typing import Iterable, Optional
+from typing import Optional
 
 from OTAnalytics.application.analysis.intersect import TracksIntersectingSections
 from OTAnalytics.application.state import FlowState, SectionState, TrackViewState
@@ -14,7 +13,6 @@ from OTAnalytics.application.use_cases.section_repository import (
 )
 from OTAnalytics.domain.flow import FlowId, FlowRepository
 from OTAnalytics.domain.section import SectionId
-from OTAnalytics.domain.track import Track, TrackId
 from OTAnalytics.domain.track_dataset.track_dataset import (
     TrackIdSet,
     TrackIdSetFactory,
@@ -303,7 +301,6 @@ class TracksOverlapOccurrenceWindow(TrackIdProvider):
         self,
         track_repository: TrackRepository,
         track_view_state: TrackViewState,
-        track_id_set_factory: TrackIdSetFactory,
         other: Optional[TrackIdProvider] = None,
     ) -> None:
         """Returns track ids that overlap with the current date range filter.
@@ -318,77 +315,12 @@ class TracksOverlapOccurrenceWindow(TrackIdProvider):
         self._other = other
         self._track_repository = track_repository
         self._track_view_state = track_view_state
-        self._factory = track_id_set_factory
 
     def get_ids(self) -> TrackIdSet:
-        if self._other:
-            tracks = self._get_other_track()
-        else:
-            tracks = self._track_repository.get_all()
-
-        return self._factory.create(self._filter(tracks))
-
-    def _get_other_track(self) -> Iterable[Track]:
-        if self._other:
-            track_ids = self._other.get_ids()
-            tracks: list[Track] = []
-            for track_id in track_ids:
-                if track := self._track_repository.get_for(track_id):
-                    tracks.append(track)
-            return tracks
-        return []
-
-    def _filter(self, tracks: Iterable[Track]) -> set[TrackId]:
         date_range = self._track_view_state.filter_element.get().date_range
-        start_date_filter = date_range.start_date
-        end_date_filter = date_range.end_date
-
-        match (start_date_filter, end_date_filter):
-            case (datetime() as start_date_filter, datetime() as end_date_filter):
-                return {
-                    track.id
-                    for track in tracks
-                    if self._has_overlap(
-                        start_date_filter,
-                        end_date_filter,
-                        track.start,
-                        track.end,
-                    )
-                }
-            case (None, datetime() as end_date_filter):
-                return {
-                    track.id
-                    for track in tracks
-                    if self._has_overlap(
-                        datetime.min,
-                        end_date_filter,
-                        track.start,
-                        track.end,
-                    )
-                }
-            case (datetime() as start_date_filter, None):
-                return {
-                    track.id
-                    for track in tracks
-                    if self._has_overlap(
-                        start_date_filter,
-                        datetime.max,
-                        track.start,
-                        track.end,
-                    )
-                }
-            case _:
-                return {track.id for track in tracks}
-
-    @staticmethod
-    def _has_overlap(
-        start_1: datetime, end_1: datetime, start_2: datetime, end_2: datetime
-    ) -> bool:
-        if not start_1 <= end_1:
-            raise ValueError("start_1 needs to be lesser equal than end_1.")
-        if not start_2 <= end_2:
-            raise ValueError("start_2 needs to be lesser equal than end_2.")
-        latest_start = max(start_1, start_2)
-        earliest_end = min(end_1, end_2)
-
-        return latest_start <= earliest_end
+        ids = self._track_repository.get_all().ids_overlapping(
+            date_range.start_date, date_range.end_date
+        )
+        if self._other:
+            return ids.intersection(self._other.get_ids())
+        return ids
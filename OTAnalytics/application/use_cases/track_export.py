@@ -7,11 +7,15 @@ from OTAnalytics.application.export_formats.export_mode import ExportMode
 
 CSV: str = "csv"
 OTTRK: str = "ottrk"
+PARQUET: str = "parquet"
+ARROW: str = "arrow"
 
 
 class TrackFileFormat(Enum):
     CSV = CSV
     OTTRK = OTTRK
+    PARQUET = PARQUET
+    ARROW = ARROW
 
 
 @dataclass(frozen=True)
@@ -1,4 +1,4 @@
-from collections import defaultdict
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -69,7 +69,34 @@ class TrackStatistics:
         )
 
 
-class CalculateTrackStatistics:
+class TrackStatisticsCalculator(ABC):
+    """Calculates the statistics of the tracks."""
+
+    @abstractmethod
+    def get_statistics(self) -> TrackStatistics:
+        raise NotImplementedError
+
+
+class CalculateTrackStatistics(TrackStatisticsCalculator):
+    """Calculate the statistics of the tracks using track id set operations.
+
+    Each id provider is asked exactly once per calculation. All counts are restricted
+    to the ids of `all_tracks`. Thus, the other providers do not need to be filtered
+    by the same ids beforehand.
+
+    Args:
+        intersection_all_non_cutting_sections (TrackIdProvider): tracks intersecting
+            any non cutting section.
+        assigned_to_all_flows (TrackIdProvider): tracks assigned to any flow.
+        all_tracks (TrackIdProvider): tracks to calculate the statistics for.
+        track_ids_inside_cutting_sections (TrackIdProvider): tracks inside the
+            cutting sections.
+        number_of_tracks_to_be_validated (NumberOfTracksToBeValidated): calculates
+            the number of tracks to be validated.
+        get_all_enter_section_events (GetAllEnterSectionEvents): provides the enter
+            section events.
+    """
+
     def __init__(
         self,
         intersection_all_non_cutting_sections: TrackIdProvider,
@@ -90,7 +117,9 @@ class CalculateTrackStatistics:
 
     def get_statistics(self) -> TrackStatistics:
         ids_all = self._all_tracks.get_ids()
-        ids_inside_cutting_sections = self._track_ids_inside_cutting_sections.get_ids()
+        ids_inside_cutting_sections = (
+            self._track_ids_inside_cutting_sections.get_ids().intersection(ids_all)
+        )
 
         track_count_inside = len(ids_inside_cutting_sections)
         track_count = len(ids_all)
@@ -136,27 +165,19 @@ class CalculateTrackStatistics:
         )
 
     def get_number_of_tracks_with_simultaneous_events(self) -> int:
-        # Group events by road_user_id and occurrence
-        event_counts = self._count_simultaneous_events()
-
-        # Count tracks with simultaneous events
-        return sum(
-            1
-            for occurrences in event_counts.values()
-            if any(count > 1 for count in occurrences.values())
-        )
-
-    def _count_simultaneous_events(self) -> dict[str, dict[datetime, int]]:
         """
-        Count occurrences of events per road user and timestamp.
+        Count tracks entering several sections at the same time. A track is counted
+        as soon as a second event with the same road user and occurrence is seen.
         """
-        events = self._get_all_enter_section_events.get()
-        event_counts: dict[str, dict[datetime, int]] = defaultdict(
-            lambda: defaultdict(int)
-        )
-        for event in events:
-            event_counts[event.road_user_id][event.occurrence] += 1
-        return event_counts
+        seen: set[tuple[str, datetime]] = set()
+        tracks_with_simultaneous_events: set[str] = set()
+        for event in self._get_all_enter_section_events.get():
+            key = (event.road_user_id, event.occurrence)
+            if key in seen:
+                tracks_with_simultaneous_events.add(event.road_user_id)
+            else:
+                seen.add(key)
+        return len(tracks_with_simultaneous_events)
 
 
 def percentage(track_count: int, all_tracks: int) -> float:
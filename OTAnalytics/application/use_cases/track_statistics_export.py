@@ -7,8 +7,8 @@ from OTAnalytics.application.analysis.traffic_counting_specification import Expo
 from OTAnalytics.application.export_formats import track_statistics as ts
 from OTAnalytics.application.export_formats.export_mode import ExportMode
 from OTAnalytics.application.use_cases.track_statistics import (
-    CalculateTrackStatistics,
     TrackStatistics,
+    TrackStatisticsCalculator,
 )
 
 
@@ -119,7 +119,7 @@ class ExportTrackStatistics:
 
     def __init__(
         self,
-        calculate_track_statistics: CalculateTrackStatistics,
+        calculate_track_statistics: TrackStatisticsCalculator,
         exporter_factory: TrackStatisticsExporterFactory,
     ) -> None:
         self._calculate_track_statistics = calculate_track_statistics
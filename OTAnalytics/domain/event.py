@@ -1,6 +1,8 @@
+import heapq
 import itertools
 import re
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
@@ -372,6 +374,58 @@ class SceneEventBuilder(EventBuilder):
         )
 
 
+class OccurrenceSortedEvents:
+    """Events sorted by their occurrence supporting binary search.
+
+    Events with the same occurrence retain the order they were given in.
+
+    Args:
+        events (Iterable[Event]): the events to sort.
+    """
+
+    def __init__(self, events: Iterable[Event]) -> None:
+        self._events = sorted(events, key=lambda event: event.occurrence)
+        self._occurrences = [event.occurrence for event in self._events]
+
+    def first_after(self, date: datetime) -> Optional[Event]:
+        """Returns the first event occurring after the given date."""
+        position = bisect_right(self._occurrences, date)
+        if position < len(self._events):
+            return self._events[position]
+        return None
+
+    def last_before(self, date: datetime) -> Optional[Event]:
+        """Returns the last event occurring before the given date. If several events
+        share this occurrence, the first of them is returned."""
+        position = bisect_left(self._occurrences, date)
+        if position == 0:
+            return None
+        first_with_occurrence = bisect_left(
+            self._occurrences, self._occurrences[position - 1]
+        )
+        return self._events[first_with_occurrence]
+
+    def between(
+        self, start_date: datetime | None, end_date: datetime | None
+    ) -> list[Event]:
+        """Returns all events occurring between the given dates (inclusive).
+
+        Args:
+            start_date (datetime | None): start of the range. None means unbounded.
+            end_date (datetime | None): end of the range. None means unbounded.
+
+        Returns:
+            list[Event]: the events sorted by occurrence.
+        """
+        start = 0 if start_date is None else bisect_left(self._occurrences, start_date)
+        end = (
+            len(self._events)
+            if end_date is None
+            else bisect_right(self._occurrences, end_date)
+        )
+        return self._events[start:end]
+
+
 @dataclass
 class EventRepositoryEvent:
     """Holds information on changes made in the event repository.
@@ -388,16 +442,33 @@ class EventRepositoryEvent:
 
 
 class EventRepository:
-    """The repository to store events."""
+    """The repository to store events.
+
+    Event datasets are stored as they are until a caller requires event objects.
+    Only then, the events are indexed by section and road user. Thus, columnar
+    datasets stay columnar if they are only read as datasets, e.g. for exports.
+
+    Args:
+        subject (Subject[EventRepositoryEvent]): notifies observers about changes.
+        dataset (EventDataset | None): empty dataset defining how added datasets are
+            stored. Defaults to a PythonEventDataset.
+    """
 
     def __init__(
-        self, subject: Subject[EventRepositoryEvent] = Subject[EventRepositoryEvent]()
+        self,
+        subject: Subject[EventRepositoryEvent] = Subject[EventRepositoryEvent](),
+        dataset: "EventDataset | None" = None,
     ) -> None:
         self._subject = subject
+        self._empty_dataset = dataset if dataset is not None else PythonEventDataset()
+        self._dataset = self._empty_dataset
         self._events: dict[SectionId, dict[str, list[Event]]] = defaultdict(
             lambda: defaultdict(list)
         )
         self._non_section_events: dict[str, list[Event]] = defaultdict(list)
+        self._index: dict[SectionId | None, dict[EventType, OccurrenceSortedEvents]] = (
+            {}
+        )
 
     def register_observer(self, observer: OBSERVER[EventRepositoryEvent]) -> None:
         """Register observer to listen to repository changes.
@@ -416,6 +487,7 @@ class EventRepository:
         self.__do_add(event)
         self.__discard_duplicates([event])
         self.__sort([event])
+        self.__invalidate_index([event.section_id or None])
         self._subject.notify(EventRepositoryEvent([event], []))
 
     def __do_add(self, event: Event) -> None:
@@ -469,13 +541,61 @@ class EventRepository:
         """
         if sections is None:
             sections = []
-        for event in events:
-            self.__do_add(event)
+        if isinstance(events, EventDataset):
+            self._dataset = self._dataset + events
+            added: Iterable[Event] = events
+        else:
+            added = list(events)
+            self.__store(added, is_prepared=False)
         for section in sections:
             self._events[section]
-        self.__discard_duplicates(events)
-        self.__sort(events)
-        self._subject.notify(EventRepositoryEvent(events, []))
+        self._subject.notify(EventRepositoryEvent(added, []))
+
+    def __index_dataset(self) -> None:
+        """Index the events of the stored dataset by section and road user."""
+        if self._dataset.is_empty():
+            return
+        dataset = self._dataset
+        self._dataset = self._empty_dataset
+        self.__store(list(dataset.unique_sorted_by_occurrence()), is_prepared=True)
+
+    def __store(self, events: list[Event], is_prepared: bool) -> None:
+        grouped = self.__group(events)
+        for (section_id, road_user_id), new_events in grouped.items():
+            self.__do_add_all(section_id, road_user_id, new_events, is_prepared)
+        self.__invalidate_index({section_id for section_id, _ in grouped.keys()})
+
+    @staticmethod
+    def __group(
+        events: Iterable[Event],
+    ) -> dict[tuple[SectionId | None, str], list[Event]]:
+        """Group events by their section and road user while retaining their order."""
+        grouped: dict[tuple[SectionId | None, str], list[Event]] = defaultdict(list)
+        for event in events:
+            grouped[(event.section_id or None, event.road_user_id)].append(event)
+        return grouped
+
+    def __do_add_all(
+        self,
+        section_id: SectionId | None,
+        road_user_id: str,
+        events: list[Event],
+        is_prepared: bool,
+    ) -> None:
+        """Add the events of a single road user and section.
+
+        Events of an event dataset are already unique and sorted. They are only
+        merged if the repository already contains events of the same key.
+        """
+        storage = self._events[section_id] if section_id else self._non_section_events
+        if existing := storage.get(road_user_id):
+            events = existing + events
+        elif is_prepared:
+            storage[road_user_id] = events
+            return
+        storage[road_user_id] = sorted(
+            self.__remove_duplicates(events), key=self.comparator
+        )
 
     @staticmethod
     def comparator(event: Event) -> datetime:
@@ -507,15 +627,57 @@ class EventRepository:
         Returns:
             Iterable[Event]: the events
         """
+        self.__index_dataset()
+        return self.__indexed_events()
 
+    def __indexed_events(self) -> list[Event]:
         return list(
             itertools.chain(
-                self.get_non_section_events_iterator(),
-                self.get_section_events_iterator(),
+                self.__non_section_events(),
+                self.__section_events(),
             )
         )
 
+    def get_dataset(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        sections: Sequence[SectionId] | None = None,
+        event_types: Sequence[EventType] | None = None,
+    ) -> "EventDataset":
+        """Get the events matching the given criteria as dataset.
+
+        Stored datasets are filtered as they are. No event objects are created for
+        them.
+
+        Args:
+            start_date (datetime | None): start of the range (inclusive). None means
+                unbounded.
+            end_date (datetime | None): end of the range (inclusive). None means
+                unbounded.
+            sections (Sequence[SectionId] | None): sections to get the events for.
+                All events are considered if no sections are given.
+            event_types (Sequence[EventType] | None): event types to get the events
+                for. All event types are considered if none are given.
+
+        Returns:
+            EventDataset: the unique events sorted by occurrence.
+        """
+        dataset = self._dataset.filter(start_date, end_date, sections, event_types)
+        if indexed := self.__filter(
+            self.__create_indexed_event_list(sections or []),
+            start_date,
+            end_date,
+            event_types or [],
+        ):
+            dataset = dataset + PythonEventDataset(indexed)
+        return dataset.unique_sorted_by_occurrence()
+
     def get_section_events_iterator(self) -> Iterator[Event]:
+        self.__index_dataset()
+        return self.__section_events()
+
+    def __section_events(self) -> Iterator[Event]:
         return (
             event
             for events_by_section in self._events.values()
@@ -524,6 +686,10 @@ class EventRepository:
         )
 
     def get_non_section_events_iterator(self) -> Iterator[Event]:
+        self.__index_dataset()
+        return self.__non_section_events()
+
+    def __non_section_events(self) -> Iterator[Event]:
         return (
             event
             for track_dict in self._non_section_events.values()
@@ -534,13 +700,25 @@ class EventRepository:
         """
         Clear the repository and notify observers only if repository was filled.
         """
-        if self._events or self._non_section_events:  # also clear non section events
-            removed = list(self.get_all())
+        if self._events or self._non_section_events or not self._dataset.is_empty():
+            removed = self.__all_events()
+            self._dataset = self._empty_dataset
             self._events = defaultdict(lambda: defaultdict(list))
             self._non_section_events = defaultdict(list)
+            self._index.clear()
             self._subject.notify(EventRepositoryEvent([], removed))
 
+    def __all_events(self) -> Iterable[Event]:
+        """Returns all events without indexing the stored dataset."""
+        indexed = self.__indexed_events()
+        if self._dataset.is_empty():
+            return indexed
+        if not indexed:
+            return self._dataset
+        return list(itertools.chain(indexed, self._dataset))
+
     def remove(self, sections: list[SectionId]) -> None:
+        self.__index_dataset()
         if self._events:
             removed = [
                 event for event in self.get_all() if event.section_id in sections
@@ -548,17 +726,19 @@ class EventRepository:
             for section in sections:
                 if section in self._events.keys():
                     del self._events[section]
+            self.__invalidate_index(sections)
             self._subject.notify((EventRepositoryEvent([], removed)))
 
     def is_empty(self) -> bool:
         """Whether repository is empty."""
-        return not self._events
+        return not self._events and self._dataset.is_empty()
 
     def retain_missing(self, all: list[Section]) -> list[Section]:
         """
         Returns a new list of sections. The list contains all Sections from the input
         except the ones event have been generated for.
         """
+        self.__index_dataset()
         return [section for section in all if section.id not in self._events.keys()]
 
     def get_next_after(
@@ -567,15 +747,15 @@ class EventRepository:
         sections: Sequence[SectionId] | None = None,
         event_types: Sequence[EventType] | None = None,
     ) -> Optional[Event]:
-        if sections is None:
-            sections = []
-        for event in sorted(
-            self.get(sections=sections, event_types=event_types),
-            key=lambda actual: actual.occurrence,
-        ):
-            if event.occurrence > date:
-                return event
-        return None
+        self.__index_dataset()
+        next_event: Optional[Event] = None
+        for sorted_events in self.__sorted_events_for(sections, event_types):
+            candidate = sorted_events.first_after(date)
+            if candidate and (
+                next_event is None or candidate.occurrence < next_event.occurrence
+            ):
+                next_event = candidate
+        return next_event
 
     def get_previous_before(
         self,
@@ -583,16 +763,100 @@ class EventRepository:
         sections: Sequence[SectionId] | None = None,
         event_types: Sequence[EventType] | None = None,
     ) -> Optional[Event]:
-        if sections is None:
-            sections = []
-        for event in sorted(
-            self.get(sections=sections, event_types=event_types),
-            key=lambda actual: actual.occurrence,
-            reverse=True,
-        ):
-            if event.occurrence < date:
-                return event
-        return None
+        self.__index_dataset()
+        previous_event: Optional[Event] = None
+        for sorted_events in self.__sorted_events_for(sections, event_types):
+            candidate = sorted_events.last_before(date)
+            if candidate and (
+                previous_event is None
+                or candidate.occurrence > previous_event.occurrence
+            ):
+                previous_event = candidate
+        return previous_event
+
+    def get_sorted_by_occurrence(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        sections: Sequence[SectionId] | None = None,
+        event_types: Sequence[EventType] | None = None,
+    ) -> list[Event]:
+        """Get the events within the given time range sorted by their occurrence.
+
+        Args:
+            start_date (datetime | None): start of the range (inclusive). None means
+                unbounded.
+            end_date (datetime | None): end of the range (inclusive). None means
+                unbounded.
+            sections (Sequence[SectionId] | None): sections to get the events for.
+                All events are considered if no sections are given.
+            event_types (Sequence[EventType] | None): event types to get the events
+                for. All event types are considered if none are given.
+
+        Returns:
+            list[Event]: the events sorted by occurrence.
+        """
+        self.__index_dataset()
+        return list(
+            heapq.merge(
+                *(
+                    sorted_events.between(start_date, end_date)
+                    for sorted_events in self.__sorted_events_for(sections, event_types)
+                ),
+                key=lambda event: event.occurrence,
+            )
+        )
+
+    def __sorted_events_for(
+        self,
+        sections: Sequence[SectionId] | None,
+        event_types: Sequence[EventType] | None,
+    ) -> Iterator[OccurrenceSortedEvents]:
+        """Iterate the occurrence index of the given sections and event types.
+
+        Events without section are only considered if no sections are given.
+        """
+        section_ids: Iterable[SectionId | None] = (
+            dict.fromkeys(sections)
+            if sections
+            else itertools.chain([None], self._events.keys())
+        )
+        for section_id in section_ids:
+            by_type = self.__index_for(section_id)
+            if event_types:
+                yield from (
+                    by_type[event_type]
+                    for event_type in dict.fromkeys(event_types)
+                    if event_type in by_type
+                )
+            else:
+                yield from by_type.values()
+
+    def __index_for(
+        self, section_id: SectionId | None
+    ) -> dict[EventType, OccurrenceSortedEvents]:
+        """Returns the occurrence index of the given section. The index is built on
+        first access after the events of the section changed."""
+        if (by_type := self._index.get(section_id)) is not None:
+            return by_type
+        if section_id is None:
+            storage = self._non_section_events
+        else:
+            storage = self._events.get(section_id, {})
+        grouped: dict[EventType, list[Event]] = defaultdict(list)
+        for events in storage.values():
+            for event in events:
+                grouped[event.event_type].append(event)
+        by_type = {
+            event_type: OccurrenceSortedEvents(events)
+            for event_type, events in grouped.items()
+        }
+        self._index[section_id] = by_type
+        return by_type
+
+    def __invalidate_index(self, section_ids: Iterable[SectionId | None]) -> None:
+        for section_id in section_ids:
+            self._index.pop(section_id, None)
 
     def get(
         self,
@@ -605,25 +869,37 @@ class EventRepository:
             event_types = []
         if sections is None:
             sections = []
+        self.__index_dataset()
+        events = self.__create_indexed_event_list(sections)
+        return self.__filter(events, start_date, end_date, event_types)
+
+    def __filter(
+        self,
+        events: Iterable[Event],
+        start_date: datetime | None,
+        end_date: datetime | None,
+        event_types: Sequence[EventType],
+    ) -> list[Event]:
         type_filter = self.__create_type_filter(event_types)
         start_filter = self.__create_start_filter(start_date)
         end_filter = self.__create_end_filter(end_date)
-        events = self.__create_event_list(sections)
         return list(
             filter(start_filter, filter(end_filter, filter(type_filter, events)))
         )
 
-    def __create_event_list(self, sections: Sequence[SectionId]) -> Iterable[Event]:
+    def __create_indexed_event_list(
+        self, sections: Sequence[SectionId]
+    ) -> Iterable[Event]:
         if sections:
             return list(
                 (
                     event
                     for section in sections
-                    for events_by_id in self._events[section].values()
+                    for events_by_id in self._events.get(section, {}).values()
                     for event in events_by_id
                 )
             )
-        return self.get_all()
+        return self.__indexed_events()
 
     def remove_events_by_road_user_ids(self, road_user_ids: Iterable[TrackId]) -> None:
         """
@@ -640,6 +916,7 @@ class EventRepository:
         Returns:
             None
         """
+        self.__index_dataset()
         removed = []
         for road_user_id in road_user_ids:
             removed.extend(
@@ -648,7 +925,7 @@ class EventRepository:
             removed.extend(
                 self.__remove_section_events_by_road_user_id(road_user_id.id)
             )
-
+        self._index.clear()
         self._subject.notify((EventRepositoryEvent([], removed)))
 
     def __remove_section_events_by_road_user_id(self, road_user_id: str) -> list[Event]:
@@ -784,6 +1061,42 @@ class EventDataset(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def unique_sorted_by_occurrence(self) -> "EventDataset":
+        """Discard duplicate events and sort the remaining events by occurrence.
+
+        The order of events with the same occurrence is retained.
+
+        Returns:
+            A new EventDataset containing the unique and sorted events.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def filter(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        sections: Sequence[SectionId] | None = None,
+        event_types: Sequence[EventType] | None = None,
+    ) -> "EventDataset":
+        """Keep the events matching all given criteria.
+
+        Args:
+            start_date (datetime | None): start of the range (inclusive). None means
+                unbounded.
+            end_date (datetime | None): end of the range (inclusive). None means
+                unbounded.
+            sections (Sequence[SectionId] | None): keep the events of these sections
+                only. All events are kept if no sections are given.
+            event_types (Sequence[EventType] | None): keep the events of these types
+                only. All events are kept if no event types are given.
+
+        Returns:
+            A new EventDataset containing the matching events.
+        """
+        raise NotImplementedError
+
 
 class PythonEventDataset(EventDataset):
     """A dataset wrapper for a collection of events.
@@ -818,7 +1131,7 @@ class PythonEventDataset(EventDataset):
             A new EventDataset containing events from both datasets.
         """
         if not isinstance(other, PythonEventDataset):
-            raise TypeError()
+            return NotImplemented
         return PythonEventDataset(self._events + other._events)
 
     def __eq__(self, other: object) -> bool:
@@ -853,3 +1166,46 @@ class PythonEventDataset(EventDataset):
             True if the dataset is empty, False otherwise.
         """
         return len(self._events) == 0
+
+    def unique_sorted_by_occurrence(self) -> "EventDataset":
+        unique_events = dict.fromkeys(self._events)
+        return PythonEventDataset(sorted(unique_events, key=lambda e: e.occurrence))
+
+    def filter(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        sections: Sequence[SectionId] | None = None,
+        event_types: Sequence[EventType] | None = None,
+    ) -> "EventDataset":
+        return PythonEventDataset(
+            [
+                event
+                for event in self._events
+                if (start_date is None or event.occurrence >= start_date)
+                and (end_date is None or event.occurrence <= end_date)
+                and (not sections or event.section_id in sections)
+                and (not event_types or event.event_type in event_types)
+            ]
+        )
+
+
+def concat_event_datasets(datasets: Iterable[EventDataset]) -> EventDataset:
+    """Combine the given event datasets.
+
+    Empty datasets are skipped. The non-empty datasets are combined using their own
+    implementation of `+`. Thus, columnar datasets are not converted into event
+    objects.
+
+    Args:
+        datasets (Iterable[EventDataset]): the datasets to combine.
+
+    Returns:
+        EventDataset: the combined dataset. Might be one of the given datasets.
+    """
+    combined: EventDataset = PythonEventDataset()
+    for dataset in datasets:
+        if dataset.is_empty():
+            continue
+        combined = dataset if combined.is_empty() else combined + dataset
+    return combined
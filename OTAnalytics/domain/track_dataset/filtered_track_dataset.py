@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Iterator, Optional
 
 from OTAnalytics.domain.geometry import RelativeOffsetCoordinate
@@ -50,6 +50,11 @@ class FilteredTrackDataset(TrackDataset):
     def as_list(self) -> list[Track]:
         return self._filter().as_list()
 
+    def ids_overlapping(
+        self, start: datetime | None, end: datetime | None
+    ) -> TrackIdSet:
+        return self._filter().ids_overlapping(start, end)
+
     def intersecting_tracks(
         self, sections: list[Section], offset: RelativeOffsetCoordinate
     ) -> TrackIdSet:
@@ -80,6 +85,11 @@ class FilteredTrackDataset(TrackDataset):
     def split_finished(self) -> tuple[TrackDataset, TrackDataset]:
         return self._filter().split_finished()
 
+    def split_by_end_window(
+        self, window: timedelta
+    ) -> list[tuple[datetime, TrackDataset]]:
+        return self._filter().split_by_end_window(window)
+
 
 class FilterByClassTrackDataset(FilteredTrackDataset):
     @property
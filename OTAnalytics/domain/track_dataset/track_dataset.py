@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
 
 from OTAnalytics.domain.event import (
@@ -43,6 +43,13 @@ class TrackDoesNotExistError(Exception):
     pass
 
 
+def end_of_window(occurrence: datetime, window: timedelta) -> datetime:
+    """Returns the end of the window containing the given occurrence. Windows are
+    aligned to multiples of the window length since the epoch."""
+    epoch = datetime(1970, 1, 1, tzinfo=occurrence.tzinfo)
+    return epoch + ((occurrence - epoch) // window + 1) * window
+
+
 def contains_true(section_data: list[tuple[SectionId, list[bool]]]) -> bool:
     for _, bool_list in section_data:
         if any(bool_list):
@@ -222,10 +229,59 @@ class TrackDataset(ABC):
         """
         raise NotImplementedError
 
+    def split_by_end_window(
+        self, window: timedelta
+    ) -> list[tuple[datetime, "TrackDataset"]]:
+        """
+        Split this dataset by the time window the last detection of each track falls
+        into. Windows are aligned to multiples of the window length since the epoch.
+
+        This default implementation iterates over all tracks. Subclasses should
+        override it to split their data at once.
+
+        Args:
+            window (timedelta): length of the windows.
+
+        Returns:
+            list[tuple[datetime, TrackDataset]]: the end of each window containing
+                tracks together with these tracks, sorted by the end of the window.
+        """
+        tracks_by_window: dict[datetime, list[Track]] = {}
+        for current in self:
+            window_end = end_of_window(current.last_detection.occurrence, window)
+            tracks_by_window.setdefault(window_end, []).append(current)
+        if len(tracks_by_window) == 1:
+            return [(window_end, self) for window_end in tracks_by_window]
+        return [
+            (window_end, self.clear().add_all(tracks_by_window[window_end]))
+            for window_end in sorted(tracks_by_window)
+        ]
+
     @abstractmethod
     def as_list(self) -> list[Track]:
         raise NotImplementedError
 
+    @abstractmethod
+    def ids_overlapping(
+        self, start: datetime | None, end: datetime | None
+    ) -> TrackIdSet:
+        """Return the ids of all tracks overlapping the given time window.
+
+        A track overlaps the window if its first occurrence is at or before the end
+        and its last occurrence is at or after the start of the window.
+
+        Args:
+            start (datetime | None): start of the window. None means unbounded.
+            end (datetime | None): end of the window. None means unbounded.
+
+        Returns:
+            TrackIdSet: the ids of the overlapping tracks.
+
+        Raises:
+            ValueError: if start is after end.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def intersecting_tracks(
         self, sections: list[Section], offset: RelativeOffsetCoordinate
@@ -321,6 +377,25 @@ class TrackDataset(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def cut_with_sections(
+        self, sections: list[Section]
+    ) -> tuple["TrackDataset", TrackIdSet]:
+        """Use all sections at once to cut tracks of the TrackDataset.
+
+        The tracks are cut with each section using its section enter offset. A
+        track is cut once per segment intersecting any of the sections. The parts
+        of a cut track are numbered consecutively, e.g. `1_0`, `1_1`, `1_2`.
+
+        Args:
+            sections (list[Section]): the sections to cut the TrackDataset with.
+
+        Returns:
+            tuple[TrackDataset, TrackIdSet]: the dataset containing the cut tracks
+                and the original track ids that have been cut.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def get_max_confidences_for(self, track_ids: TrackIdSet) -> dict[str, float]:
         """Get max confidences for given track ids.
@@ -0,0 +1,71 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from OTAnalytics.domain.track import TrackId
+
+
+def validate_time_window(start: datetime | None, end: datetime | None) -> None:
+    """Validate the bounds of a time window.
+
+    Args:
+        start (datetime | None): start of the window. None means unbounded.
+        end (datetime | None): end of the window. None means unbounded.
+
+    Raises:
+        ValueError: if start is after end.
+    """
+    if start is not None and end is not None and not start <= end:
+        raise ValueError("start needs to be lesser equal than end.")
+
+
+class TrackIntervalIndex:
+    """Index over the first and last occurrence of tracks.
+
+    The intervals are sorted by their start. All intervals overlapping a time
+    window start at or before the end of the window and at or after the start of the
+    window minus the longest interval. Both bounds are found by binary search. Only
+    the intervals in between have to be checked for their end.
+
+    Args:
+        intervals (Iterable[tuple[TrackId, datetime, datetime]]): track ids with the
+            first and last occurrence of their track.
+    """
+
+    def __init__(self, intervals: Iterable[tuple[TrackId, datetime, datetime]]):
+        sorted_intervals = sorted(intervals, key=lambda interval: interval[1])
+        self._ids = [track_id for track_id, _, _ in sorted_intervals]
+        self._starts = [start for _, start, _ in sorted_intervals]
+        self._ends = [end for _, _, end in sorted_intervals]
+        self._max_duration = max(
+            (end - start for _, start, end in sorted_intervals), default=timedelta(0)
+        )
+
+    def overlapping(
+        self, start: datetime | None, end: datetime | None
+    ) -> list[TrackId]:
+        """Returns the ids of all tracks overlapping the given time window.
+
+        Bounds are inclusive.
+
+        Args:
+            start (datetime | None): start of the window. None means unbounded.
+            end (datetime | None): end of the window. None means unbounded.
+
+        Returns:
+            list[TrackId]: ids of the overlapping tracks.
+        """
+        validate_time_window(start, end)
+        lower = 0 if start is None else self._lower_bound(start)
+        upper = len(self._starts) if end is None else bisect_right(self._starts, end)
+        return [
+            self._ids[position]
+            for position in range(lower, upper)
+            if start is None or self._ends[position] >= start
+        ]
+
+    def _lower_bound(self, start: datetime) -> int:
+        try:
+            return bisect_left(self._starts, start - self._max_duration)
+        except OverflowError:
+            return 0
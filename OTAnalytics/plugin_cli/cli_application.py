@@ -6,9 +6,16 @@ from OTAnalytics.application.use_cases.create_events import (
     FilterOutCuttingSections,
     SectionProvider,
 )
+from OTAnalytics.application.use_cases.track_export import (
+    ExportTracks,
+    MultiExportTracks,
+    TrackFileFormat,
+)
 from OTAnalytics.application.use_cases.track_repository import AllTrackIdsProvider
 from OTAnalytics.domain.progress import ProgressbarBuilder
 from OTAnalytics.domain.track_id_provider import TrackIdProvider
+from OTAnalytics.plugin_parser.multiprocessing_parser import MultiprocessingTrackParser
+from OTAnalytics.plugin_parser.track_export import ColumnarTrackExport
 from OTAnalytics.plugin_progress.tqdm_progressbar import TqdmBuilder
 from OTAnalytics.plugin_prototypes.eventlist_exporter.eventlist_exporter import (
     provide_available_eventlist_exporter,
@@ -22,6 +29,7 @@ from OTAnalytics.plugin_ui.cli import (
     OTAnalyticsBulkCli,
     OTAnalyticsCli,
     OTAnalyticsStreamCli,
+    StreamEventCreation,
 )
 
 
@@ -39,7 +47,12 @@ class OtAnalyticsCliApplicationStarter(BaseOtAnalyticsApplicationStarter):
         return self.create_stream_cli()
 
     def create_bulk_cli(self) -> OTAnalyticsCli:
-        track_parser = self._create_track_parser()
+        track_parser = MultiprocessingTrackParser(
+            self._create_track_parser(),
+            self.track_geometry_factory,
+            self.polars_by_max_confidence,
+            num_processes=self.run_config.num_processes,
+        )
         cli = OTAnalyticsBulkCli(
             self.run_config,
             self.event_repository,
@@ -56,7 +69,7 @@ class OtAnalyticsCliApplicationStarter(BaseOtAnalyticsApplicationStarter):
             self.clear_all_tracks,
             self.tracks_metadata,
             self.videos_metadata,
-            self.csv_track_export,
+            self.cli_track_export,
             self.export_road_user_assignments,
             self.export_track_statistics,
             track_parser,
@@ -83,12 +96,53 @@ class OtAnalyticsCliApplicationStarter(BaseOtAnalyticsApplicationStarter):
             self.clear_all_tracks,
             self.tracks_metadata,
             self.videos_metadata,
-            self.csv_track_export,
+            self.cli_track_export,
             self.export_road_user_assignments,
             stream_track_parser,
+            self._create_stream_event_creation(),
         )
         return cli
 
+    def _create_stream_event_creation(self) -> StreamEventCreation:
+        """Events are created in repositories of a separate application context.
+        Thus, event creation does not interfere with the export of the previous
+        chunk."""
+        context = OtAnalyticsCliApplicationStarter(self.run_config)
+        return StreamEventCreation(
+            context.add_section,
+            context.get_all_sections,
+            context.apply_cli_cuts,
+            context.add_all_tracks,
+            context.get_all_tracks,
+            context.clear_all_tracks,
+            context.create_events,
+            context.event_repository,
+        )
+
+    @cached_property
+    def cli_track_export(self) -> ExportTracks:
+        return MultiExportTracks(
+            {
+                TrackFileFormat.CSV: self.csv_track_export,
+                TrackFileFormat.PARQUET: self._create_columnar_track_export(
+                    TrackFileFormat.PARQUET
+                ),
+                TrackFileFormat.ARROW: self._create_columnar_track_export(
+                    TrackFileFormat.ARROW
+                ),
+            }
+        )
+
+    def _create_columnar_track_export(
+        self, file_format: TrackFileFormat
+    ) -> ColumnarTrackExport:
+        return ColumnarTrackExport(
+            self.track_repository,
+            self.tracks_metadata,
+            self.videos_metadata,
+            file_format,
+        )
+
     @cached_property
     def all_filtered_track_ids(self) -> TrackIdProvider:
         return AllTrackIdsProvider(self.track_repository)
@@ -68,6 +68,12 @@ class FilteredPandasTrackDataset(
         dataset, original_track_ids = self._other.cut_with_section(section, offset)
         return self.wrap(dataset), original_track_ids
 
+    def cut_with_sections(
+        self, sections: list[Section]
+    ) -> tuple[PandasTrackDataset, TrackIdSet]:
+        dataset, original_track_ids = self._other.cut_with_sections(sections)
+        return self.wrap(dataset), original_track_ids
+
     @abstractmethod
     def _filter(self) -> PandasTrackDataset:
         raise NotImplementedError
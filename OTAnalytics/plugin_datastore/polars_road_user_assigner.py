@@ -0,0 +1,172 @@
+from typing import Iterable
+
+import polars as pl
+
+from OTAnalytics.application.analysis.road_user_assignment import (
+    EventPair,
+    RoadUserAssigner,
+    RoadUserAssignment,
+    RoadUserAssignments,
+)
+from OTAnalytics.domain import event
+from OTAnalytics.domain.event import Event
+from OTAnalytics.domain.flow import Flow
+from OTAnalytics.domain.track_dataset.track_dataset import TrackIdSetFactory
+from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store import (
+    PolarsEventDataset,
+)
+
+EVENT_INDEX = "event_index"
+ORDER = "order"
+IDENTITY = "identity"
+ROAD_USER_ORDER = "road_user_order"
+FLOW_INDEX = "flow_index"
+FLOW_START = "flow_start"
+FLOW_END = "flow_end"
+DURATION = "duration"
+END_SUFFIX = "_end"
+ROAD_USER = [event.ROAD_USER_ID, event.ROAD_USER_TYPE]
+
+
+class PolarsRoadUserAssigner(RoadUserAssigner):
+    """Assign each road user to the flow with the longest duration between its
+    start and end event.
+
+    Produces the same assignments as SimpleRoadUserAssigner using the
+    MaxDurationFlowSelection. Instead of creating event pairs and flow candidates
+    per road user, the events are paired using a self join per road user. The pairs
+    are joined with the flows by their start and end section and the candidate with
+    the longest duration is selected per road user. Event objects are only created
+    for the selected pairs.
+
+    Args:
+        track_id_set_factory (TrackIdSetFactory): factory to create the road user
+            ids of the assignments.
+    """
+
+    def __init__(self, track_id_set_factory: TrackIdSetFactory) -> None:
+        self._track_id_set_factory = track_id_set_factory
+
+    def assign(self, events: Iterable[Event], flows: list[Flow]) -> RoadUserAssignments:
+        """
+        Assign each track to exactly one flow.
+
+        Args:
+            events (Iterable[Event]): events to be used during assignment
+            flows (list[Flow]): flows to assign tracks to
+
+        Returns:
+            RoadUserAssignments: group of RoadUserAssignment objects
+        """
+        if not isinstance(events, PolarsEventDataset):
+            events = list(events)
+        event_data = PolarsEventDataset.from_events(events).get_data()
+        if event_data.is_empty() or not flows:
+            return RoadUserAssignments([], self._track_id_set_factory)
+        candidates = self.__create_candidates(self.__prepare(event_data), flows)
+        selected = self.__select_max_duration(candidates)
+        return self.__create_assignments(events, flows, selected)
+
+    def __prepare(self, event_data: pl.DataFrame) -> pl.DataFrame:
+        """
+        Keep the columns required for pairing of section events only and sort them
+        by interpolated occurrence.
+
+        Equal events share the same identity. Road users are ordered by their first
+        event.
+        """
+        return (
+            event_data.with_row_index(EVENT_INDEX)
+            .with_columns(pl.struct(event_data.columns).rank("dense").alias(IDENTITY))
+            .filter(
+                pl.col(event.SECTION_ID).is_not_null()
+                & (pl.col(event.SECTION_ID) != "")
+            )
+            .sort(event.INTERPOLATED_OCCURRENCE, maintain_order=True)
+            .with_row_index(ORDER)
+            .select(
+                ROAD_USER
+                + [
+                    EVENT_INDEX,
+                    ORDER,
+                    IDENTITY,
+                    pl.col(event.SECTION_ID).cast(pl.String),
+                    event.INTERPOLATED_OCCURRENCE,
+                    pl.col(ORDER).min().over(ROAD_USER).alias(ROAD_USER_ORDER),
+                ]
+            )
+        )
+
+    def __create_candidates(
+        self, event_data: pl.DataFrame, flows: list[Flow]
+    ) -> pl.DataFrame:
+        """
+        Pair each event with all later, different events of the same road user and
+        join the pairs with the flows of matching start and end section.
+        """
+        pairs = (
+            event_data.join(event_data, on=ROAD_USER, suffix=END_SUFFIX)
+            .filter(pl.col(ORDER) < pl.col(ORDER + END_SUFFIX))
+            .filter(pl.col(IDENTITY) != pl.col(IDENTITY + END_SUFFIX))
+        )
+        flow_data = pl.DataFrame(
+            {
+                FLOW_INDEX: range(len(flows)),
+                FLOW_START: [flow.start.serialize() for flow in flows],
+                FLOW_END: [flow.end.serialize() for flow in flows],
+            },
+            schema={FLOW_INDEX: pl.UInt32, FLOW_START: pl.String, FLOW_END: pl.String},
+        )
+        return pairs.join(
+            flow_data,
+            left_on=[event.SECTION_ID, event.SECTION_ID + END_SUFFIX],
+            right_on=[FLOW_START, FLOW_END],
+        ).with_columns(
+            (
+                pl.col(event.INTERPOLATED_OCCURRENCE + END_SUFFIX)
+                - pl.col(event.INTERPOLATED_OCCURRENCE)
+            ).alias(DURATION)
+        )
+
+    def __select_max_duration(self, candidates: pl.DataFrame) -> pl.DataFrame:
+        """
+        Select the first candidate with the longest duration per road user.
+
+        Candidates are ordered like the flow candidates of SimpleRoadUserAssigner:
+        by start event, end event and flow.
+        """
+        return (
+            candidates.sort([ROAD_USER_ORDER, ORDER, ORDER + END_SUFFIX, FLOW_INDEX])
+            .filter(pl.col(DURATION) == pl.col(DURATION).max().over(ROAD_USER_ORDER))
+            .unique(subset=ROAD_USER_ORDER, keep="first", maintain_order=True)
+            .select(ROAD_USER + [EVENT_INDEX, EVENT_INDEX + END_SUFFIX, FLOW_INDEX])
+        )
+
+    def __create_assignments(
+        self,
+        events: Iterable[Event],
+        flows: list[Flow],
+        selected: pl.DataFrame,
+    ) -> RoadUserAssignments:
+        starts = self.__get_events(events, selected[EVENT_INDEX])
+        ends = self.__get_events(events, selected[EVENT_INDEX + END_SUFFIX])
+        assignments = [
+            RoadUserAssignment(
+                road_user=road_user_id,
+                road_user_type=road_user_type,
+                assignment=flows[flow_index],
+                events=EventPair(start=start, end=end),
+            )
+            for (road_user_id, road_user_type, _, _, flow_index), start, end in zip(
+                selected.iter_rows(), starts, ends
+            )
+        ]
+        return RoadUserAssignments(assignments, self._track_id_set_factory)
+
+    def __get_events(self, events: Iterable[Event], indices: pl.Series) -> list[Event]:
+        """Get the events at the given positions. Polars events are only created for
+        the given positions."""
+        if isinstance(events, PolarsEventDataset):
+            return list(PolarsEventDataset(events.get_data()[indices]))
+        event_list = events if isinstance(events, list) else list(events)
+        return [event_list[index] for index in indices]
@@ -0,0 +1,148 @@
+import polars as pl
+
+from OTAnalytics.application.use_cases.event_repository import GetAllEnterSectionEvents
+from OTAnalytics.application.use_cases.number_of_tracks_to_be_validated import (
+    NumberOfTracksToBeValidated,
+)
+from OTAnalytics.application.use_cases.track_statistics import (
+    TrackStatistics,
+    TrackStatisticsCalculator,
+    percentage,
+)
+from OTAnalytics.domain.track import unpack
+from OTAnalytics.domain.track_dataset.track_dataset import TrackIdSet
+from OTAnalytics.domain.track_id_provider import TrackIdProvider
+from OTAnalytics.plugin_datastore.polars_track_id_set import PolarsTrackIdSet
+
+TRACK_ID = "track_id"
+OCCURRENCE = "occurrence"
+INSIDE = "inside"
+INTERSECTING = "intersecting"
+ASSIGNED = "assigned"
+TRACK_COUNT = "track_count"
+TRACK_COUNT_INSIDE = "track_count_inside"
+TRACK_COUNT_INSIDE_NOT_INTERSECTING = "track_count_inside_not_intersecting"
+TRACK_COUNT_INSIDE_ASSIGNED = "track_count_inside_assigned"
+
+
+class PolarsCalculateTrackStatistics(TrackStatisticsCalculator):
+    """Calculate the statistics of the tracks on polars tables.
+
+    The ids of all tracks are joined with the ids of the other providers into one
+    table of flags. All counts are aggregated from this table in a single select.
+    Simultaneous enter events are counted by a group by on road user and occurrence.
+    Each id provider is asked exactly once per calculation.
+
+    Args:
+        intersection_all_non_cutting_sections (TrackIdProvider): tracks intersecting
+            any non cutting section.
+        assigned_to_all_flows (TrackIdProvider): tracks assigned to any flow.
+        all_tracks (TrackIdProvider): tracks to calculate the statistics for.
+        track_ids_inside_cutting_sections (TrackIdProvider): tracks inside the
+            cutting sections.
+        number_of_tracks_to_be_validated (NumberOfTracksToBeValidated): calculates
+            the number of tracks to be validated.
+        get_all_enter_section_events (GetAllEnterSectionEvents): provides the enter
+            section events.
+    """
+
+    def __init__(
+        self,
+        intersection_all_non_cutting_sections: TrackIdProvider,
+        assigned_to_all_flows: TrackIdProvider,
+        all_tracks: TrackIdProvider,
+        track_ids_inside_cutting_sections: TrackIdProvider,
+        number_of_tracks_to_be_validated: NumberOfTracksToBeValidated,
+        get_all_enter_section_events: GetAllEnterSectionEvents,
+    ) -> None:
+        self._intersection_all_non_cutting_sections = (
+            intersection_all_non_cutting_sections
+        )
+        self._assigned_to_all_flows = assigned_to_all_flows
+        self._all_tracks = all_tracks
+        self._track_ids_inside_cutting_sections = track_ids_inside_cutting_sections
+        self._number_of_tracks_to_be_validated = number_of_tracks_to_be_validated
+        self._get_all_enter_section_events = get_all_enter_section_events
+
+    def get_statistics(self) -> TrackStatistics:
+        counts = self._count_tracks()
+        track_count = counts[TRACK_COUNT]
+        track_count_inside = counts[TRACK_COUNT_INSIDE]
+        track_count_inside_not_intersecting = counts[
+            TRACK_COUNT_INSIDE_NOT_INTERSECTING
+        ]
+        track_count_inside_assigned = counts[TRACK_COUNT_INSIDE_ASSIGNED]
+        track_count_inside_intersecting_but_unassigned = (
+            track_count_inside
+            - track_count_inside_not_intersecting
+            - track_count_inside_assigned
+        )
+        return TrackStatistics(
+            track_count,
+            track_count - track_count_inside,
+            track_count_inside,
+            track_count_inside_not_intersecting,
+            track_count_inside_intersecting_but_unassigned,
+            track_count_inside_assigned,
+            percentage(track_count_inside_assigned, track_count_inside),
+            percentage(track_count_inside_not_intersecting, track_count_inside),
+            percentage(
+                track_count_inside_intersecting_but_unassigned, track_count_inside
+            ),
+            self._number_of_tracks_to_be_validated.calculate(),
+            self.get_number_of_tracks_with_simultaneous_events(),
+        )
+
+    def _count_tracks(self) -> dict[str, int]:
+        tracks = pl.DataFrame(
+            {TRACK_ID: _to_series(self._all_tracks.get_ids())}
+        ).with_columns(
+            pl.col(TRACK_ID)
+            .is_in(_to_series(self._track_ids_inside_cutting_sections.get_ids()))
+            .alias(INSIDE),
+            pl.col(TRACK_ID)
+            .is_in(_to_series(self._intersection_all_non_cutting_sections.get_ids()))
+            .alias(INTERSECTING),
+            pl.col(TRACK_ID)
+            .is_in(_to_series(self._assigned_to_all_flows.get_ids()))
+            .alias(ASSIGNED),
+        )
+        return tracks.select(
+            pl.len().alias(TRACK_COUNT),
+            pl.col(INSIDE).sum().alias(TRACK_COUNT_INSIDE),
+            (pl.col(INSIDE) & ~pl.col(INTERSECTING))
+            .sum()
+            .alias(TRACK_COUNT_INSIDE_NOT_INTERSECTING),
+            (pl.col(INSIDE) & pl.col(ASSIGNED))
+            .sum()
+            .alias(TRACK_COUNT_INSIDE_ASSIGNED),
+        ).row(0, named=True)
+
+    def get_number_of_tracks_with_simultaneous_events(self) -> int:
+        """
+        Count tracks entering several sections at the same time.
+        """
+        road_user_ids: list[str] = []
+        occurrences = []
+        for event in self._get_all_enter_section_events.get():
+            road_user_ids.append(event.road_user_id)
+            occurrences.append(event.occurrence)
+        events = pl.DataFrame(
+            {TRACK_ID: road_user_ids, OCCURRENCE: occurrences},
+            schema_overrides={TRACK_ID: pl.String},
+        )
+        return (
+            events.group_by(TRACK_ID, OCCURRENCE)
+            .len()
+            .filter(pl.col("len") > 1)
+            .select(pl.col(TRACK_ID).n_unique())
+            .item()
+        )
+
+
+def _to_series(track_ids: TrackIdSet) -> pl.Series:
+    if isinstance(track_ids, PolarsTrackIdSet):
+        return track_ids._series
+    return pl.Series(
+        TRACK_ID, [unpack(track_id) for track_id in track_ids], dtype=pl.String
+    )
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from math import ceil
 from typing import (
     Any,
@@ -45,6 +45,9 @@ from OTAnalytics.domain.track_dataset.track_dataset import (
     TrackIdSet,
     TrackSegmentDataset,
 )
+from OTAnalytics.domain.track_dataset.track_interval_index import (
+    validate_time_window,
+)
 from OTAnalytics.domain.types import EventType
 from OTAnalytics.plugin_datastore.polars_track_id_set import PolarsTrackIdSet
 from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store import (
@@ -239,6 +242,7 @@ LEVEL_TRACK_ID = track.TRACK_ID
 LEVEL_OCCURRENCE = track.OCCURRENCE
 CUT_INDICES = "CUT_INDICES"
 TRACK_LENGTH = "TRACK_LENGTH"
+END_WINDOW = "END_WINDOW"
 
 
 class PolarsTrackSegmentDataset(TrackSegmentDataset):
@@ -358,6 +362,8 @@ class PolarsTrackDataset(TrackDataset, PolarsDataFrameProvider):
             ]()
         else:
             self._geometry_datasets = geometry_datasets
+        self._intervals: pl.DataFrame | None = None
+        self._max_track_duration = timedelta(0)
 
     def __iter__(self) -> Iterator[Track]:
         yield from self.as_generator()
@@ -481,6 +487,43 @@ class PolarsTrackDataset(TrackDataset, PolarsDataFrameProvider):
         remaining_dataset = self._subset_by_ids(remaining_ids)
         return finished_dataset, remaining_dataset
 
+    def split_by_end_window(
+        self, window: timedelta
+    ) -> list[tuple[datetime, TrackDataset]]:
+        if self._dataset.is_empty():
+            return []
+        window_in_us = window // timedelta(microseconds=1)
+        window_of_tracks = self._dataset.group_by(LEVEL_TRACK_ID).agg(
+            (pl.col(LEVEL_OCCURRENCE).max().dt.epoch("us") // window_in_us + 1).alias(
+                END_WINDOW
+            )
+        )
+        epoch = datetime(
+            1970, 1, 1, tzinfo=cast(datetime, self.first_occurrence).tzinfo
+        )
+        if window_of_tracks.get_column(END_WINDOW).n_unique() == 1:
+            end_window = cast(int, window_of_tracks.item(0, END_WINDOW))
+            return [(epoch + end_window * window, self)]
+        partitions = self._dataset.join(
+            window_of_tracks, on=LEVEL_TRACK_ID, how="left"
+        ).partition_by(END_WINDOW, as_dict=True, include_key=False)
+        return [
+            (
+                epoch + cast(int, key[0]) * window,
+                self._subset_of(partitions[key]),
+            )
+            for key in sorted(partitions, key=lambda key: cast(int, key[0]))
+        ]
+
+    def _subset_of(self, tracks: pl.DataFrame) -> "PolarsTrackDataset":
+        track_ids = tracks.get_column(LEVEL_TRACK_ID).unique().to_list()
+        return PolarsTrackDataset.from_dataframe(
+            tracks,
+            self.track_geometry_factory,
+            self._get_geometries_for(track_ids),
+            calculator=self.calculator,
+        )
+
     def _create_track_flyweight(self, track_id: str) -> Track:
         """Create a Track flyweight object for the given track_id."""
         track_data = self._dataset.filter(pl.col(LEVEL_TRACK_ID) == track_id)
@@ -521,6 +564,60 @@ class PolarsTrackDataset(TrackDataset, PolarsDataFrameProvider):
     def __len__(self) -> int:
         return self._dataset.get_column(LEVEL_TRACK_ID).n_unique()
 
+    def ids_overlapping(
+        self, start: datetime | None, end: datetime | None
+    ) -> TrackIdSet:
+        """Return the ids of all tracks overlapping the given time window.
+
+        Uses a per-track table of first and last occurrences sorted by the first
+        occurrence. Overlapping tracks start at or before the end of the window and
+        at or after the start of the window minus the longest track duration. Both
+        bounds are found by binary search. Only the tracks in between are filtered
+        by their last occurrence.
+
+        Args:
+            start (datetime | None): start of the window. None means unbounded.
+            end (datetime | None): end of the window. None means unbounded.
+
+        Returns:
+            TrackIdSet: the ids of the overlapping tracks.
+        """
+        validate_time_window(start, end)
+        intervals = self._get_intervals()
+        starts = intervals.get_column(START_OCCURRENCE)
+        lower = 0 if start is None else self._lower_bound(starts, start)
+        upper = len(starts) if end is None else starts.search_sorted(end, side="right")
+        candidates = intervals.slice(lower, upper - lower)
+        if start is not None:
+            candidates = candidates.filter(pl.col(END_OCCURRENCE) >= start)
+        return PolarsTrackIdSet(candidates.get_column(track.TRACK_ID))
+
+    def _lower_bound(self, starts: pl.Series, start: datetime) -> int:
+        try:
+            return starts.search_sorted(start - self._max_track_duration, side="left")
+        except OverflowError:
+            return 0
+
+    def _get_intervals(self) -> pl.DataFrame:
+        if self._intervals is None:
+            self._intervals = (
+                self._dataset.group_by(track.TRACK_ID)
+                .agg(
+                    pl.col(track.OCCURRENCE).min().alias(START_OCCURRENCE),
+                    pl.col(track.OCCURRENCE).max().alias(END_OCCURRENCE),
+                )
+                .sort(START_OCCURRENCE)
+            )
+            if not self._intervals.is_empty():
+                self._max_track_duration = cast(
+                    timedelta,
+                    (
+                        self._intervals.get_column(END_OCCURRENCE)
+                        - self._intervals.get_column(START_OCCURRENCE)
+                    ).max(),
+                )
+        return self._intervals
+
     def intersecting_tracks(
         self, sections: list[Section], offset: RelativeOffsetCoordinate
     ) -> TrackIdSet:
@@ -729,7 +826,40 @@ class PolarsTrackDataset(TrackDataset, PolarsDataFrameProvider):
             return self, EmptyTrackIdSet()
 
         geometry_dataset = self._get_geometry_dataset_for(offset)
-        new_track_ids = geometry_dataset.track_ids_after_cut(section)
+        return self._apply_track_ids(geometry_dataset.track_ids_after_cut(section))
+
+    def cut_with_sections(
+        self, sections: list[Section]
+    ) -> tuple["PolarsTrackDataset", TrackIdSet]:
+        if len(self) == 0 or not sections:
+            logger().info("No tracks to cut")
+            return self, EmptyTrackIdSet()
+
+        sections_by_offset: dict[RelativeOffsetCoordinate, list[Section]] = defaultdict(
+            list
+        )
+        for section in sections:
+            sections_by_offset[section.get_offset(EventType.SECTION_ENTER)].append(
+                section
+            )
+        geometry_datasets = [
+            (self._get_geometry_dataset_for(offset), offset_sections)
+            for offset, offset_sections in sections_by_offset.items()
+        ]
+        # All geometry datasets contain the same segments, only their coordinates
+        # differ. Thus, the cut points of all offsets can be combined.
+        cut_rows = pl.concat(
+            [
+                geometry_dataset.cut_rows(offset_sections)
+                for geometry_dataset, offset_sections in geometry_datasets
+            ]
+        ).unique()
+        geometry_dataset, _ = geometry_datasets[0]
+        return self._apply_track_ids(geometry_dataset.track_ids_after_cuts(cut_rows))
+
+    def _apply_track_ids(
+        self, new_track_ids: pl.DataFrame
+    ) -> tuple["PolarsTrackDataset", TrackIdSet]:
         original_track_ids = PolarsTrackIdSet(
             self._dataset.get_column(track.TRACK_ID).unique()
         )
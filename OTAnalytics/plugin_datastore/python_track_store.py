@@ -46,6 +46,7 @@ from OTAnalytics.domain.track_dataset.track_dataset import (
     TrackSegmentDataset,
     contains_true,
 )
+from OTAnalytics.domain.track_dataset.track_interval_index import TrackIntervalIndex
 from OTAnalytics.domain.types import EventType
 from OTAnalytics.plugin_intersect.shapely.mapping import ShapelyMapper
 
@@ -343,20 +344,49 @@ def cut_track_with_section(
     offset: RelativeOffsetCoordinate,
     shapely_mapper: ShapelyMapper = ShapelyMapper(),
 ) -> list[Track]:
-    section_geometry = shapely_mapper.map_coordinates_to_line_string(
-        section.get_coordinates()
-    )
+    return cut_track_with_sections(track_to_cut, [(section, offset)], shapely_mapper)
+
+
+def cut_track_with_sections(
+    track_to_cut: Track,
+    sections: list[tuple[Section, RelativeOffsetCoordinate]],
+    shapely_mapper: ShapelyMapper = ShapelyMapper(),
+) -> list[Track]:
+    """Cut a track at every segment intersecting any of the given sections.
+
+    A segment intersecting several sections cuts the track only once. The parts
+    are numbered consecutively, e.g. `1_0`, `1_1`, `1_2`.
+
+    Args:
+        track_to_cut (Track): the track to cut.
+        sections (list[tuple[Section, RelativeOffsetCoordinate]]): the sections
+            to cut with and the offset to apply to the track for each of them.
+        shapely_mapper (ShapelyMapper): maps coordinates to shapely geometries.
+
+    Returns:
+        list[Track]: the parts of the cut track.
+    """
+    section_geometries = [
+        (
+            shapely_mapper.map_coordinates_to_line_string(section.get_coordinates()),
+            offset,
+        )
+        for section, offset in sections
+    ]
     cut_track_parts: list[Track] = []
     track_builder = SimpleCutTrackPartBuilder()
     for current_detection, next_detection in zip(
         track_to_cut.detections[0:-1], track_to_cut.detections[1:]
     ):
-        current_coordinate = current_detection.get_coordinate(offset)
-        next_coordinate = next_detection.get_coordinate(offset)
-        track_part_geometry = shapely_mapper.map_domain_coordinates_to_line_string(
-            [current_coordinate, next_coordinate]
-        )
-        if track_part_geometry.intersects(section_geometry):
+        if any(
+            shapely_mapper.map_domain_coordinates_to_line_string(
+                [
+                    current_detection.get_coordinate(offset),
+                    next_detection.get_coordinate(offset),
+                ]
+            ).intersects(section_geometry)
+            for section_geometry, offset in section_geometries
+        ):
             new_track_part = build_track(
                 track_builder,
                 track_id=f"{track_to_cut.id.id}_{len(cut_track_parts)}",
@@ -439,6 +469,7 @@ class PythonTrackDataset(TrackDataset):
             ]()
         else:
             self._geometry_datasets = geometry_datasets
+        self._interval_index: TrackIntervalIndex | None = None
 
     @staticmethod
     def from_list(
@@ -628,6 +659,16 @@ class PythonTrackDataset(TrackDataset):
             self.track_geometry_factory, filtered_tracks, calculator=self.calculator
         )
 
+    def ids_overlapping(
+        self, start: datetime | None, end: datetime | None
+    ) -> TrackIdSet:
+        if self._interval_index is None:
+            self._interval_index = TrackIntervalIndex(
+                (track_id, track.start, track.end)
+                for track_id, track in self._tracks.items()
+            )
+        return PythonTrackIdSet(self._interval_index.overlapping(start, end))
+
     def intersecting_tracks(
         self, sections: list[Section], offset: RelativeOffsetCoordinate
     ) -> TrackIdSet:
@@ -735,6 +776,36 @@ class PythonTrackDataset(TrackDataset):
             intersecting_track_ids,
         )
 
+    def cut_with_sections(
+        self, sections: list[Section]
+    ) -> tuple["PythonTrackDataset", TrackIdSet]:
+        if len(self) == 0:
+            logger().info("No tracks to cut")
+            return self, EmptyTrackIdSet()
+        shapely_mapper = ShapelyMapper()
+
+        sections_with_offsets = [
+            (section, section.get_offset(EventType.SECTION_ENTER))
+            for section in sections
+        ]
+        intersecting_track_ids: TrackIdSet = EmptyTrackIdSet()
+        for section, offset in sections_with_offsets:
+            intersecting_track_ids = intersecting_track_ids.union(
+                self.intersecting_tracks([section], offset)
+            )
+
+        cut_tracks = []
+        for track_id in intersecting_track_ids:
+            cut_tracks.extend(
+                cut_track_with_sections(
+                    self._tracks[track_id], sections_with_offsets, shapely_mapper
+                )
+            )
+        return (
+            PythonTrackDataset.from_list(cut_tracks, self.track_geometry_factory),
+            intersecting_track_ids,
+        )
+
     def get_max_confidences_for(self, track_ids: TrackIdSet) -> dict[str, float]:
         result: dict[str, float] = {}
         for track_id in track_ids:
@@ -947,6 +1018,12 @@ class FilteredPythonTrackDataset(FilterByClassTrackDataset):
         dataset, original_track_ids = self._other.cut_with_section(section, offset)
         return self.wrap(dataset), original_track_ids
 
+    def cut_with_sections(
+        self, sections: list[Section]
+    ) -> tuple["TrackDataset", TrackIdSet]:
+        dataset, original_track_ids = self._other.cut_with_sections(sections)
+        return self.wrap(dataset), original_track_ids
+
     def revert_cuts_for(
         self, original_track_ids: TrackIdSet
     ) -> tuple[TrackDataset, TrackIdSet, TrackIdSet]:
@@ -1,6 +1,6 @@
-import math
 from dataclasses import dataclass
-from typing import Any, Iterable, Iterator, Optional, Sequence
+from datetime import datetime
+from typing import Any, Iterable, Iterator, Optional, Sequence, cast
 
 import polars as pl
 
@@ -58,18 +58,15 @@ from OTAnalytics.domain.track_dataset.track_dataset import (
 )
 from OTAnalytics.domain.types import EventType
 from OTAnalytics.plugin_datastore.polars_track_id_set import PolarsTrackIdSet
+from OTAnalytics.plugin_datastore.track_geometry_store.segment_grid_index import (
+    SegmentGridIndex,
+)
 
 MAGNITUDE = "magnitude"
 CUM_SUM = "cum_sum"
 ORDER = "order"
 TRACK_ID_SUFFIX = f"{TRACK_ID}_suffix"
 
-SEGMENT_LENGTH_X = "segment_length_x"
-SEGMENT_LENGTH_Y = "segment_length_y"
-SEGMENT_LENGTH = "segment_length"
-INTERSECTION_LENGTH_X = "intersection_length_x"
-INTERSECTION_LENGTH_Y = "intersection_length_y"
-INTERSECTION_LENGTH = "intersection_length"
 RELATIVE_POSITION = "relative_position"
 
 # Column names for track segments
@@ -81,6 +78,7 @@ INTERSECTION_X = "intersection_x"
 INTERSECTION_Y = "intersection_y"
 INTERSECTION_LINE_ID = "intersection_line_id"
 INTERSECTS_POLYGON = "intersects-polygon"
+SEGMENT_POSITION = "segment_position"
 
 # Column names for intersection parameters
 DENOMINATOR = "denominator"
@@ -457,8 +455,10 @@ def check_polygon_intersections(
     if segments_df.is_empty():
         return segments_df
 
-    # Initialize intersection column
-    result_df = segments_df.with_columns([pl.lit(False).alias(INTERSECTS_POLYGON)])
+    # Initialize intersection column and remember the position of each segment
+    result_df = segments_df.with_columns(
+        [pl.lit(False).alias(INTERSECTS_POLYGON)]
+    ).with_row_index(SEGMENT_POSITION)
 
     # Get polygon coordinates
     polygon_coordinates = polygon.coordinates
@@ -499,11 +499,8 @@ def check_polygon_intersections(
 
     candidates_df = result_df.filter(candidate_mask)
 
-    if candidates_df.is_empty():
-        return result_df
-
     # Check intersections with each line segment of the polygon
-    intersecting_indices = set()
+    intersecting_positions: list[pl.Series] = []
 
     for i in range(len(polygon_coordinates) - 1):
         # Get the start and end points of the current line segment
@@ -533,40 +530,72 @@ def check_polygon_intersections(
             line_candidates, start_x, start_y, end_x, end_y, offset
         )
 
-        # Collect indices of intersecting segments
-        intersecting_rows = intersects_df.filter(pl.col(INTERSECTS))
-        if not intersecting_rows.is_empty():
-            # Get original indices from the filtered dataframe
-            for row in intersecting_rows.iter_rows(named=True):
-                # Find matching rows in original dataframe to get correct indices
-                matching_indices = (
-                    result_df.with_row_index()
-                    .filter(
-                        (pl.col(TRACK_ID) == row[TRACK_ID])
-                        & (pl.col(START_OCCURRENCE) == row[START_OCCURRENCE])
-                        & (pl.col(END_OCCURRENCE) == row[END_OCCURRENCE])
-                    )
-                    .select("index")
-                    .to_series()
-                    .to_list()
-                )
-                intersecting_indices.update(matching_indices)
+        # Collect positions of intersecting segments
+        intersecting_positions.append(
+            intersects_df.filter(pl.col(INTERSECTS)).get_column(SEGMENT_POSITION)
+        )
 
     # Update intersection column for identified segments
-    if intersecting_indices:
-        # Create a boolean mask for intersecting rows
-        mask_values = [i in intersecting_indices for i in range(len(result_df))]
+    if intersecting_positions:
         result_df = result_df.with_columns(
-            [
-                pl.when(pl.Series(mask_values))
-                .then(True)
-                .otherwise(pl.col(INTERSECTS_POLYGON))
-                .alias(INTERSECTS_POLYGON)
-            ]
+            pl.col(SEGMENT_POSITION)
+            .is_in(pl.concat(intersecting_positions).implode())
+            .alias(INTERSECTS_POLYGON)
         )
 
     return result_df.drop(
-        ["sxa", "sya", "exa", "eya", "seg_min_x", "seg_max_x", "seg_min_y", "seg_max_y"]
+        [
+            SEGMENT_POSITION,
+            "sxa",
+            "sya",
+            "exa",
+            "eya",
+            "seg_min_x",
+            "seg_max_x",
+            "seg_min_y",
+            "seg_max_y",
+        ]
+    )
+
+
+def calculate_relative_positions(
+    intersecting_segments: pl.DataFrame, offset: RelativeOffsetCoordinate
+) -> pl.DataFrame:
+    """
+    Calculate the relative position of the intersection point along each segment.
+
+    Args:
+        intersecting_segments (pl.DataFrame): segments intersecting a line with
+            columns INTERSECTION_X and INTERSECTION_Y.
+        offset (RelativeOffsetCoordinate): Offset applied to segment endpoints.
+
+    Returns:
+        pl.DataFrame: DataFrame with the segment end points including the offset
+            (CURRENT_X, CURRENT_Y, PREVIOUS_X, PREVIOUS_Y) and RELATIVE_POSITION.
+            Segments of length zero are removed.
+    """
+    segment_length_x = pl.col(CURRENT_X) - pl.col(PREVIOUS_X)
+    segment_length_y = pl.col(CURRENT_Y) - pl.col(PREVIOUS_Y)
+    intersection_length_x = pl.col(INTERSECTION_X) - pl.col(PREVIOUS_X)
+    intersection_length_y = pl.col(INTERSECTION_Y) - pl.col(PREVIOUS_Y)
+    segment_length = (segment_length_x**2 + segment_length_y**2).sqrt()
+    intersection_length = (intersection_length_x**2 + intersection_length_y**2).sqrt()
+    return (
+        intersecting_segments.with_columns(
+            [
+                (pl.col(END_X) + pl.col(END_W) * offset.x).alias(CURRENT_X),
+                (pl.col(END_Y) + pl.col(END_H) * offset.y).alias(CURRENT_Y),
+                (pl.col(START_X) + pl.col(START_W) * offset.x).alias(PREVIOUS_X),
+                (pl.col(START_Y) + pl.col(START_H) * offset.y).alias(PREVIOUS_Y),
+            ]
+        )
+        .with_columns(
+            pl.when((segment_length_x == 0) & (segment_length_y == 0))
+            .then(None)
+            .otherwise(intersection_length / segment_length)
+            .alias(RELATIVE_POSITION)
+        )
+        .filter(pl.col(RELATIVE_POSITION).is_not_null())
     )
 
 
@@ -584,6 +613,56 @@ class PolarsEventDataset(EventDataset):
         else:
             self._events = events
 
+    @staticmethod
+    def from_events(events: Iterable[Event]) -> "PolarsEventDataset":
+        if isinstance(events, PolarsEventDataset):
+            return events
+        columns: dict[str, list] = {
+            event.ROAD_USER_ID: [],
+            event.ROAD_USER_TYPE: [],
+            event.HOSTNAME: [],
+            event.OCCURRENCE: [],
+            event.FRAME_NUMBER: [],
+            event.SECTION_ID: [],
+            EVENT_COORDINATE_X: [],
+            EVENT_COORDINATE_Y: [],
+            event.EVENT_TYPE: [],
+            DIRECTION_VECTOR_X: [],
+            DIRECTION_VECTOR_Y: [],
+            event.VIDEO_NAME: [],
+            event.INTERPOLATED_OCCURRENCE: [],
+            INTERPOLATED_EVENT_COORDINATE_X: [],
+            INTERPOLATED_EVENT_COORDINATE_Y: [],
+        }
+        for _event in events:
+            columns[event.ROAD_USER_ID].append(_event.road_user_id)
+            columns[event.ROAD_USER_TYPE].append(_event.road_user_type)
+            columns[event.HOSTNAME].append(_event.hostname)
+            columns[event.OCCURRENCE].append(_event.occurrence)
+            columns[event.FRAME_NUMBER].append(_event.frame_number)
+            columns[event.SECTION_ID].append(_event._serialized_section_id())
+            columns[EVENT_COORDINATE_X].append(_event.event_coordinate.x)
+            columns[EVENT_COORDINATE_Y].append(_event.event_coordinate.y)
+            columns[event.EVENT_TYPE].append(_event.event_type.value)
+            columns[DIRECTION_VECTOR_X].append(_event.direction_vector.x1)
+            columns[DIRECTION_VECTOR_Y].append(_event.direction_vector.x2)
+            columns[event.VIDEO_NAME].append(_event.video_name)
+            columns[event.INTERPOLATED_OCCURRENCE].append(
+                _event.interpolated_occurrence
+            )
+            columns[INTERPOLATED_EVENT_COORDINATE_X].append(
+                _event.interpolated_event_coordinate.x
+            )
+            columns[INTERPOLATED_EVENT_COORDINATE_Y].append(
+                _event.interpolated_event_coordinate.y
+            )
+        if not columns[event.ROAD_USER_ID]:
+            return PolarsEventDataset()
+        return PolarsEventDataset(pl.DataFrame(columns))
+
+    def get_data(self) -> pl.DataFrame:
+        return self._events
+
     def __iter__(self) -> Iterator[Event]:
         for row in self._events.iter_rows(named=True):
             yield Event(
@@ -613,25 +692,76 @@ class PolarsEventDataset(EventDataset):
     def __len__(self) -> int:
         return len(self._events)
 
-    def __add__(self, other: "EventDataset") -> "EventDataset":
-        # TODO: Check to remove
-        raise NotImplementedError
+    def __add__(self, other: "EventDataset") -> "PolarsEventDataset":
+        if other.is_empty():
+            return PolarsEventDataset(self._events)
+        other_events = PolarsEventDataset.from_events(other).get_data()
+        if self.is_empty():
+            return PolarsEventDataset(other_events)
+        return PolarsEventDataset(
+            pl.concat(
+                [self._events, other_events],
+                how="vertical_relaxed",
+                rechunk=False,
+            )
+        )
+
+    def __radd__(self, other: "EventDataset") -> "PolarsEventDataset":
+        return PolarsEventDataset.from_events(other) + self
 
     def __eq__(self, other: object) -> bool:
-        # TODO: Check to remove
-        raise NotImplementedError
+        if not isinstance(other, PolarsEventDataset):
+            return False
+        return self._events.equals(other._events)
 
     def extend(self, other: "EventDataset") -> None:
-        # TODO: Check to remove
-        raise NotImplementedError
+        self._events = (self + other).get_data()
 
     def append(self, event: Event) -> None:
-        # TODO: Check to remove
-        raise NotImplementedError
+        self.extend(PolarsEventDataset.from_events([event]))
 
     def is_empty(self) -> bool:
         return self._events.is_empty()
 
+    def unique_sorted_by_occurrence(self) -> "EventDataset":
+        if self.is_empty():
+            return PolarsEventDataset()
+        return PolarsEventDataset(
+            self._events.unique(maintain_order=True).sort(
+                event.OCCURRENCE, maintain_order=True
+            )
+        )
+
+    def filter(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        sections: Sequence[SectionId] | None = None,
+        event_types: Sequence[EventType] | None = None,
+    ) -> "PolarsEventDataset":
+        if self.is_empty():
+            return PolarsEventDataset()
+        predicates: list[pl.Expr] = []
+        if start_date is not None:
+            predicates.append(pl.col(event.OCCURRENCE) >= start_date)
+        if end_date is not None:
+            predicates.append(pl.col(event.OCCURRENCE) <= end_date)
+        if sections:
+            predicates.append(
+                pl.col(event.SECTION_ID).is_in(
+                    [section.serialize() for section in sections]
+                )
+            )
+        if event_types:
+            predicates.append(
+                pl.col(event.EVENT_TYPE).is_in(
+                    [event_type.value for event_type in event_types]
+                )
+            )
+        if not predicates:
+            return PolarsEventDataset(self._events)
+        return PolarsEventDataset(self._events.filter(*predicates))
+
 
 class PolarsIntersectionPointsDataset(IntersectionPointsDataset):
 
@@ -644,13 +774,44 @@ class PolarsIntersectionPointsDataset(IntersectionPointsDataset):
     def items(
         self,
     ) -> Iterator[tuple[TrackId, list[tuple[SectionId, IntersectionPoint]]]]:
-        raise NotImplementedError
+        if self.empty:
+            return
+        grouped = self._points.group_by(TRACK_ID, maintain_order=True).agg(
+            SECTION_ID, RELATIVE_POSITION
+        )
+        for track_id, section_ids, relative_positions in grouped.iter_rows():
+            yield TrackId(track_id), self._to_intersection_points(
+                section_ids, relative_positions
+            )
 
     def keys(self) -> Iterator[TrackId]:
-        raise NotImplementedError
+        if self.empty:
+            return iter([])
+        return (
+            TrackId(track_id)
+            for track_id in self._points.get_column(TRACK_ID).unique(
+                maintain_order=True
+            )
+        )
 
     def get(self, track_id: TrackId) -> list[tuple[SectionId, IntersectionPoint]]:
-        raise NotImplementedError
+        if self.empty:
+            return []
+        points = self._points.filter(pl.col(TRACK_ID) == track_id.id)
+        return self._to_intersection_points(
+            points.get_column(SECTION_ID), points.get_column(RELATIVE_POSITION)
+        )
+
+    @staticmethod
+    def _to_intersection_points(
+        section_ids: Iterable[str], relative_positions: Iterable[float]
+    ) -> list[tuple[SectionId, IntersectionPoint]]:
+        # Intersection points are calculated per segment. Thus, the upper index
+        # is always 1.
+        return [
+            (SectionId(section_id), IntersectionPoint(1, relative_position))
+            for section_id, relative_position in zip(section_ids, relative_positions)
+        ]
 
     @property
     def empty(self) -> bool:
@@ -660,7 +821,9 @@ class PolarsIntersectionPointsDataset(IntersectionPointsDataset):
         return len(self._points)
 
     def __contains__(self, track_id: TrackId) -> bool:
-        raise NotImplementedError
+        if self.empty:
+            return False
+        return track_id.id in self._points.get_column(TRACK_ID)
 
     def create_events(
         self,
@@ -755,6 +918,7 @@ class PolarsTrackGeometryDataset(TrackGeometryDataset):
         self,
         offset: RelativeOffsetCoordinate,
         segments_df: Optional[pl.DataFrame] = None,
+        grid_indexes: Optional[dict[RelativeOffsetCoordinate, SegmentGridIndex]] = None,
     ):
         """Initialize a PolarsTrackGeometryDataset.
 
@@ -762,8 +926,12 @@ class PolarsTrackGeometryDataset(TrackGeometryDataset):
             offset (RelativeOffsetCoordinate): Relative offset to apply to track points.
             segments_df (Optional[pl.DataFrame], optional): DataFrame with track
                 segments. If None, an empty DataFrame will be created. Defaults to None.
+            grid_indexes (Optional[dict[RelativeOffsetCoordinate, SegmentGridIndex]],
+                optional): spatial indexes of the segments per offset. Missing
+                indexes are built on first use. Defaults to None.
         """
         self._offset = offset
+        self._grid_indexes = grid_indexes if grid_indexes is not None else {}
         if segments_df is None:
             self._segments_df = pl.DataFrame()
         else:
@@ -870,7 +1038,10 @@ class PolarsTrackGeometryDataset(TrackGeometryDataset):
             PolarsTrackGeometryDataset: the dataset with tracks added.
         """
         # Convert tracks to DataFrame format
-        track_data = self._convert_tracks_to_dataframe(tracks)
+        first_row_id = (
+            0 if self.empty else cast(int, self._segments_df[ROW_ID].max()) + 1
+        )
+        track_data = self._convert_tracks_to_dataframe(tracks, first_row_id)
         if track_data.is_empty():
             return self
 
@@ -886,46 +1057,57 @@ class PolarsTrackGeometryDataset(TrackGeometryDataset):
         # Merge with existing segments, overwriting duplicates
         # Remove existing segments for tracks that are being added
         new_track_ids = new_segments[TRACK_ID].unique().to_list()
-        existing_without_new = self._segments_df.filter(
-            ~pl.col(TRACK_ID).is_in(new_track_ids)
-        )
+        keep_mask = ~self._segments_df[TRACK_ID].is_in(new_track_ids)
+        existing_without_new = self._segments_df.filter(keep_mask)
 
         # Combine existing (without overlaps) and new segments
-        if not existing_without_new.is_empty() and not new_segments.is_empty():
-            combined_segments = pl.concat([existing_without_new, new_segments])
-        elif not existing_without_new.is_empty():
-            combined_segments = existing_without_new
-        elif not new_segments.is_empty():
-            combined_segments = new_segments
-        else:
-            combined_segments = pl.DataFrame()
+        if existing_without_new.is_empty():
+            return PolarsTrackGeometryDataset(self._offset, new_segments)
+        combined_segments = pl.concat([existing_without_new, new_segments])
 
-        return PolarsTrackGeometryDataset(self._offset, combined_segments)
+        # Update the spatial indexes instead of rebuilding them
+        grid_indexes = {
+            offset: index.keep(keep_mask).extend(
+                SegmentGridIndex.build(
+                    new_segments, offset, first_index=len(existing_without_new)
+                )
+            )
+            for offset, index in self._grid_indexes.items()
+        }
+        return PolarsTrackGeometryDataset(self._offset, combined_segments, grid_indexes)
 
-    def _convert_tracks_to_dataframe(self, tracks: Iterable[Track]) -> pl.DataFrame:
+    def _convert_tracks_to_dataframe(
+        self, tracks: Iterable[Track], first_row_id: int = 0
+    ) -> pl.DataFrame:
         """Convert tracks to DataFrame format.
 
         Args:
             tracks (Iterable[Track]): tracks to convert.
+            first_row_id (int): row id of the first detection.
 
         Returns:
-            pl.DataFrame: tracks as dataframe with TRACK_ID, OCCURRENCE, X, Y, W, H.
+            pl.DataFrame: tracks as dataframe with ROW_ID, TRACK_ID,
+                TRACK_CLASSIFICATION, OCCURRENCE, X, Y, W, H, FRAME, VIDEO_NAME.
         """
         if not tracks:
             return pl.DataFrame()
 
-        data = []
+        data: list[dict] = []
         for current in tracks:
             track_id = current.id.id
             for detection in current.detections:
                 data.append(
                     {
+                        ROW_ID: first_row_id + len(data),
                         TRACK_ID: track_id,
+                        TRACK_CLASSIFICATION: current.classification,
                         OCCURRENCE: detection.occurrence,
                         X: detection.x,
                         Y: detection.y,
                         W: detection.w,
                         H: detection.h,
+                        FRAME: detection.frame,
+                        VIDEO_NAME: detection.video_name,
                     }
                 )
 
@@ -947,9 +1129,7 @@ class PolarsTrackGeometryDataset(TrackGeometryDataset):
             return self
 
         # Filter out segments with track IDs in the removal list
-        remaining_segments = self._segments_df.filter(~pl.col(TRACK_ID).is_in(ids))
-
-        return PolarsTrackGeometryDataset(self._offset, remaining_segments)
+        return self._filter_segments(~self._segments_df[TRACK_ID].is_in(ids))
 
     def get_for(self, track_ids: list[str]) -> "PolarsTrackGeometryDataset":
         """Get geometries for given track ids if they exist.
@@ -966,9 +1146,34 @@ class PolarsTrackGeometryDataset(TrackGeometryDataset):
             return PolarsTrackGeometryDataset(self._offset)
 
         # Filter segments to include only those with track IDs in the provided list
-        filtered_segments = self._segments_df.filter(pl.col(TRACK_ID).is_in(track_ids))
+        return self._filter_segments(self._segments_df[TRACK_ID].is_in(track_ids))
+
+    def _filter_segments(self, mask: pl.Series) -> "PolarsTrackGeometryDataset":
+        """Keep the segments selected by the mask together with their spatial
+        indexes."""
+        return PolarsTrackGeometryDataset(
+            self._offset,
+            self._segments_df.filter(mask),
+            {offset: index.keep(mask) for offset, index in self._grid_indexes.items()},
+        )
+
+    def _segments_near(
+        self, coordinates: list[Coordinate], offset: RelativeOffsetCoordinate
+    ) -> pl.DataFrame:
+        """Get the segments whose bounding box may overlap the bounding box of the
+        given coordinates using the spatial index of the given offset.
 
-        return PolarsTrackGeometryDataset(self._offset, filtered_segments)
+        Args:
+            coordinates (list[Coordinate]): coordinates of a section or section leg.
+            offset (RelativeOffsetCoordinate): offset applied to the segments.
+
+        Returns:
+            pl.DataFrame: the candidate segments in their original order.
+        """
+        if (index := self._grid_indexes.get(offset)) is None:
+            index = SegmentGridIndex.build(self._segments_df, offset)
+            self._grid_indexes[offset] = index
+        return self._segments_df.select(pl.all().gather(index.candidates(coordinates)))
 
     def intersecting_tracks(self, sections: list[Section]) -> TrackIdSet:
         """Return a set of tracks intersecting a set of sections.
@@ -1002,8 +1207,11 @@ class PolarsTrackGeometryDataset(TrackGeometryDataset):
                     end_x, end_y = coordinates[i + 1].x, coordinates[i + 1].y
 
                     # Find intersections with this leg of the line
+                    candidates = self._segments_near(coordinates[i : i + 2], offset)
+                    if candidates.is_empty():
+                        continue
                     intersections = find_line_intersections(
-                        self._segments_df,
+                        candidates,
                         section.id.serialize(),
                         start_x,
                         start_y,
@@ -1027,9 +1235,10 @@ class PolarsTrackGeometryDataset(TrackGeometryDataset):
                 polygon = Polygon(coordinates)
 
                 # Check polygon intersections
-                intersections = check_polygon_intersections(
-                    self._segments_df, polygon, offset
-                )
+                candidates = self._segments_near(coordinates, offset)
+                if candidates.is_empty():
+                    continue
+                intersections = check_polygon_intersections(candidates, polygon, offset)
 
                 # Add track IDs that intersect with the polygon to the result set
                 intersecting_segments = intersections.filter(pl.col(INTERSECTS_POLYGON))
@@ -1055,91 +1264,7 @@ class PolarsTrackGeometryDataset(TrackGeometryDataset):
             dict[TrackId, list[tuple[SectionId, IntersectionPoint]]]:
                 the intersection points.
         """
-        if self.empty or not sections:
-            return {}
-
-        # Create a dictionary to store the intersection points for each track
-        result: dict[TrackId, list[tuple[SectionId, IntersectionPoint]]] = {}
-
-        # Process only line sections
-        # (area sections don't have specific intersection points)
-        line_sections = [
-            section
-            for section in sections
-            if section.get_type() == SectionType.LINE
-            or section.get_type() == SectionType.CUTTING
-        ]
-
-        if not line_sections:
-            return {}
-
-        # For each line section, find intersections with track segments
-        for section in line_sections:
-            # Get the coordinates of the section
-            coordinates = section.get_coordinates()
-            offset = get_section_offset(section)
-
-            # Process each leg of the section (consecutive pair of coordinates)
-            for i in range(len(coordinates) - 1):
-                start_x, start_y = coordinates[i].x, coordinates[i].y
-                end_x, end_y = coordinates[i + 1].x, coordinates[i + 1].y
-
-                # Find intersections with this leg of the line
-                intersections = find_line_intersections(
-                    self._segments_df,
-                    section.id.serialize(),
-                    start_x,
-                    start_y,
-                    end_x,
-                    end_y,
-                    offset,
-                )
-
-                # Filter to only include segments that intersect with the line
-                intersecting_segments = intersections.filter(pl.col(INTERSECTS))
-
-                # Process each intersecting segment using polars iteration
-                for row in intersecting_segments.iter_rows(named=True):
-                    track_id = row[TRACK_ID]
-
-                    # Calculate the relative position of the intersection point
-                    # along the segment
-                    segment_length_x = (row[END_X] + row[END_W] * offset.x) - (
-                        row[START_X] + row[START_W] * offset.x
-                    )
-                    segment_length_y = (row[END_Y] + row[END_H] * offset.y) - (
-                        row[START_Y] + row[START_H] * offset.y
-                    )
-                    segment_length = math.sqrt(
-                        segment_length_x**2 + segment_length_y**2
-                    )
-                    # Avoid division by zero
-                    if segment_length_x == 0 and segment_length_y == 0:
-                        continue
-
-                    # Calculate the relative position (0 to 1) along the segment
-                    intersection_length_x = row[INTERSECTION_X] - (
-                        row[START_X] + row[START_W] * offset.x
-                    )
-                    intersection_length_y = row[INTERSECTION_Y] - (
-                        row[START_Y] + row[START_H] * offset.y
-                    )
-                    intersection_length = math.sqrt(
-                        intersection_length_x**2 + intersection_length_y**2
-                    )
-                    relative_position = intersection_length / segment_length
-
-                    # Create an IntersectionPoint
-                    # The upper_index is 1 because we're dealing with segments
-                    intersection_point = IntersectionPoint(
-                        upper_index=1, relative_position=relative_position
-                    )
-
-                    # Add to the result dictionary
-                    if track_id not in result:
-                        result[track_id] = []
-                    result[track_id].append((section.id, intersection_point))
-        return result
+        return dict(self.wrap_intersection_points(sections).items())
 
     def wrap_intersection_points(
         self, sections: list[Section]
@@ -1164,9 +1289,6 @@ class PolarsTrackGeometryDataset(TrackGeometryDataset):
             or section.get_type() == SectionType.CUTTING
         ]
 
-        if not line_sections:
-            return PolarsIntersectionPointsDataset()
-
         result_df: list[pl.DataFrame] = []
         # For each line section, find intersections with track segments
         for section in line_sections:
@@ -1180,8 +1302,11 @@ class PolarsTrackGeometryDataset(TrackGeometryDataset):
                 end_x, end_y = coordinates[i + 1].x, coordinates[i + 1].y
 
                 # Find intersections with this leg of the line
+                candidates = self._segments_near(coordinates[i : i + 2], offset)
+                if candidates.is_empty():
+                    continue
                 intersections = find_line_intersections(
-                    self._segments_df,
+                    candidates,
                     section.id.serialize(),
                     start_x,
                     start_y,
@@ -1192,92 +1317,15 @@ class PolarsTrackGeometryDataset(TrackGeometryDataset):
 
                 # Filter to only include segments that intersect with the line
                 intersecting_segments = intersections.filter(pl.col(INTERSECTS))
+                if intersecting_segments.is_empty():
+                    continue
 
-                intersection_points = (
-                    intersecting_segments.with_columns(
-                        [
-                            (pl.col(END_X) + pl.col(END_W) * offset.x).alias(CURRENT_X),
-                            (pl.col(END_Y) + pl.col(END_H) * offset.y).alias(CURRENT_Y),
-                            (pl.col(START_X) + pl.col(START_W) * offset.x).alias(
-                                PREVIOUS_X
-                            ),
-                            (pl.col(START_Y) + pl.col(START_H) * offset.y).alias(
-                                PREVIOUS_Y
-                            ),
-                        ]
-                    )
-                    .with_columns(
-                        [
-                            (pl.col(CURRENT_X) - pl.col(PREVIOUS_X)).alias(
-                                SEGMENT_LENGTH_X
-                            ),
-                            (pl.col(CURRENT_Y) - pl.col(PREVIOUS_Y)).alias(
-                                SEGMENT_LENGTH_Y
-                            ),
-                        ]
-                    )
-                    .with_columns(
-                        [
-                            (
-                                pl.col(SEGMENT_LENGTH_X) ** 2
-                                + pl.col(SEGMENT_LENGTH_Y) ** 2
-                            )
-                            .sqrt()
-                            .alias(SEGMENT_LENGTH)
-                        ]
-                    )
-                    .with_columns(
-                        [
-                            (
-                                pl.col(INTERSECTION_X)
-                                - (pl.col(START_X) + pl.col(START_W) * offset.x)
-                            ).alias(INTERSECTION_LENGTH_X),
-                            (
-                                pl.col(INTERSECTION_Y)
-                                - (pl.col(START_Y) + pl.col(START_H) * offset.y)
-                            ).alias(INTERSECTION_LENGTH_Y),
-                        ]
-                    )
-                    .with_columns(
-                        [
-                            (
-                                pl.col(INTERSECTION_LENGTH_X) ** 2
-                                + pl.col(INTERSECTION_LENGTH_Y) ** 2
-                            )
-                            .sqrt()
-                            .alias(INTERSECTION_LENGTH)
-                        ]
-                    )
-                    .with_columns(
-                        [
-                            pl.when(
-                                (pl.col(SEGMENT_LENGTH_X) == 0)
-                                & (pl.col(SEGMENT_LENGTH_Y) == 0)
-                            )
-                            .then(None)
-                            .otherwise(
-                                pl.col(INTERSECTION_LENGTH) / pl.col(SEGMENT_LENGTH)
-                            )
-                            .alias(RELATIVE_POSITION)
-                        ]
-                    )
-                    .filter(pl.col(RELATIVE_POSITION).is_not_null())
-                    .drop(
-                        [
-                            SEGMENT_LENGTH_X,
-                            SEGMENT_LENGTH_Y,
-                            SEGMENT_LENGTH,
-                            INTERSECTION_LENGTH_X,
-                            INTERSECTION_LENGTH_Y,
-                            INTERSECTION_LENGTH,
-                        ]
-                    )
-                    .with_columns(pl.lit(section.id.id).alias(SECTION_ID))
+                result_df.append(
+                    calculate_relative_positions(
+                        intersecting_segments, offset
+                    ).with_columns(pl.lit(section.id.id).alias(SECTION_ID))
                 )
 
-                if len(intersecting_segments) > 0:
-                    result_df.append(intersection_points)
-
         if result_df:
             return PolarsIntersectionPointsDataset(pl.concat(result_df))
         return PolarsIntersectionPointsDataset()
@@ -1333,50 +1381,65 @@ class PolarsTrackGeometryDataset(TrackGeometryDataset):
     def track_ids_after_cut(self, section: Section) -> pl.DataFrame:
         if not section:
             return pl.DataFrame()
+        return self.track_ids_after_cuts(self.cut_rows([section]))
 
-        # Create a set to store the track IDs that intersect with any section
-        result = self._segments_df.select([ROW_ID, track.TRACK_ID]).with_columns(
-            pl.lit(False).alias(INTERSECTS)
-        )
+    def cut_rows(self, sections: list[Section]) -> pl.Series:
+        """Returns the row ids of all segments intersecting any of the given cutting
+        sections.
 
-        # Get the coordinates of the section
-        coordinates = section.get_coordinates()
-        offset = get_section_offset(section)
+        Only cutting and line sections are considered.
 
-        if section.get_type() in [SectionType.CUTTING, SectionType.LINE]:
-            # For line sections, check if any track segment intersects with any leg
-            # of the line. A leg is formed by each consecutive pair of coordinates.
-            for i in range(len(coordinates) - 1):
-                start_x, start_y = coordinates[i].x, coordinates[i].y
-                end_x, end_y = coordinates[i + 1].x, coordinates[i + 1].y
+        Args:
+            sections (list[Section]): the sections to cut with.
 
-                # Find intersections with this leg of the line
+        Returns:
+            pl.Series: unique row ids of the intersecting segments.
+        """
+        rows: list[pl.Series] = [pl.Series(ROW_ID, [], dtype=pl.Int64)]
+        for section in sections:
+            if section.get_type() not in [SectionType.CUTTING, SectionType.LINE]:
+                continue
+            coordinates = section.get_coordinates()
+            offset = get_section_offset(section)
+            # Check if any track segment intersects with any leg of the line. A leg
+            # is formed by each consecutive pair of coordinates.
+            for i in range(len(coordinates) - 1):
+                candidates = self._segments_near(coordinates[i : i + 2], offset)
+                if candidates.is_empty():
+                    continue
                 intersections = find_line_intersections(
-                    self._segments_df,
+                    candidates,
                     section.id.serialize(),
-                    start_x,
-                    start_y,
-                    end_x,
-                    end_y,
+                    coordinates[i].x,
+                    coordinates[i].y,
+                    coordinates[i + 1].x,
+                    coordinates[i + 1].y,
                     offset,
                 )
-
-                # Add track IDs that intersect with the line to the result set
                 if not intersections.is_empty():
-                    result = (
-                        result.join(
-                            intersections.select([ROW_ID, TRACK_ID, INTERSECTS]),
-                            on=ROW_ID,
-                        )
-                        .with_columns(
-                            pl.col(INTERSECTS).or_(
-                                pl.col(f"{INTERSECTS}_right")
-                                .fill_null(False)
-                                .alias(INTERSECTS)
-                            )
-                        )
-                        .select([ROW_ID, TRACK_ID, INTERSECTS])
+                    rows.append(
+                        intersections.filter(pl.col(INTERSECTS))
+                        .get_column(ROW_ID)
+                        .cast(pl.Int64)
                     )
+        return pl.concat(rows).unique()
+
+    def track_ids_after_cuts(self, cut_rows: pl.Series) -> pl.DataFrame:
+        """Assigns new track ids to all segments of the dataset. Tracks are cut after
+        each segment in the given rows. The parts of a cut track get the suffixes
+        `_0`, `_1`, ... in the order of their occurrence.
+
+        Args:
+            cut_rows (pl.Series): row ids of the segments to cut the tracks at.
+
+        Returns:
+            pl.DataFrame: the row ids with their new track ids.
+        """
+        result = self._segments_df.select([ROW_ID, track.TRACK_ID]).with_columns(
+            pl.col(ROW_ID)
+            .is_in(cut_rows.cast(self._segments_df.schema[ROW_ID]).implode())
+            .alias(INTERSECTS)
+        )
 
         COLUMN_ORDER = [ROW_ID, TRACK_ID, INTERSECTS, CUM_SUM, ORDER]
         results = (
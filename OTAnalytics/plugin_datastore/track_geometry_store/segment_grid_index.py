@@ -0,0 +1,199 @@
+import math
+from dataclasses import dataclass
+
+import polars as pl
+
+from OTAnalytics.domain.geometry import Coordinate, RelativeOffsetCoordinate
+from OTAnalytics.domain.track_dataset.track_dataset import (
+    END_H,
+    END_W,
+    END_X,
+    END_Y,
+    START_H,
+    START_W,
+    START_X,
+    START_Y,
+)
+
+GRID_CELL_SIZE = 64.0
+"""Edge length of a grid cell in pixels."""
+
+MAX_CELL_SPAN = 16
+"""Segments spanning more cells per axis are not assigned to cells but are
+candidates of every query. Avoids exploding the index for long jumps of tracks."""
+
+CELL_X = "cell_x"
+CELL_Y = "cell_y"
+SEGMENT_INDEX = "segment_index"
+MIN_CELL_X = "min_cell_x"
+MAX_CELL_X = "max_cell_x"
+MIN_CELL_Y = "min_cell_y"
+MAX_CELL_Y = "max_cell_y"
+
+CELL_SCHEMA = {CELL_X: pl.Int64, CELL_Y: pl.Int64, SEGMENT_INDEX: pl.UInt32}
+
+
+def _cell_of(value: pl.Expr, cell_size: float) -> pl.Expr:
+    return (value.fill_nan(None) / cell_size).floor().cast(pl.Int64)
+
+
+@dataclass(frozen=True)
+class SegmentGridIndex:
+    """Uniform grid over the bounding boxes of track segments.
+
+    Each segment is assigned to every grid cell its bounding box overlaps. The
+    bounding boxes are calculated after applying the offset of the index to the
+    segment end points. The cells are sorted by their x index. Thus, the segments
+    near a query box are found by a binary search over the x range followed by a
+    filter on the y range.
+
+    Segments are referenced by their position in the segments DataFrame the index
+    was built for.
+
+    Attributes:
+        cells (pl.DataFrame): cells of the segments sorted by CELL_X.
+        large_segments (pl.Series): positions of segments spanning too many cells.
+        cell_size (float): edge length of a grid cell.
+    """
+
+    cells: pl.DataFrame
+    large_segments: pl.Series
+    cell_size: float = GRID_CELL_SIZE
+
+    @staticmethod
+    def build(
+        segments: pl.DataFrame,
+        offset: RelativeOffsetCoordinate,
+        first_index: int = 0,
+        cell_size: float = GRID_CELL_SIZE,
+    ) -> "SegmentGridIndex":
+        """Build the index for the given segments.
+
+        Args:
+            segments (pl.DataFrame): track segments to index.
+            offset (RelativeOffsetCoordinate): offset applied to the segment end
+                points.
+            first_index (int): position of the first segment.
+            cell_size (float): edge length of a grid cell.
+
+        Returns:
+            SegmentGridIndex: the index of the given segments.
+        """
+        if segments.is_empty():
+            return SegmentGridIndex(
+                pl.DataFrame(schema=CELL_SCHEMA),
+                pl.Series(SEGMENT_INDEX, [], dtype=pl.UInt32),
+                cell_size,
+            )
+        start_x = pl.col(START_X) + pl.col(START_W) * offset.x
+        start_y = pl.col(START_Y) + pl.col(START_H) * offset.y
+        end_x = pl.col(END_X) + pl.col(END_W) * offset.x
+        end_y = pl.col(END_Y) + pl.col(END_H) * offset.y
+        bounds = (
+            segments.select(
+                (pl.int_range(pl.len(), dtype=pl.UInt32) + first_index).alias(
+                    SEGMENT_INDEX
+                ),
+                _cell_of(pl.min_horizontal(start_x, end_x), cell_size).alias(
+                    MIN_CELL_X
+                ),
+                _cell_of(pl.max_horizontal(start_x, end_x), cell_size).alias(
+                    MAX_CELL_X
+                ),
+                _cell_of(pl.min_horizontal(start_y, end_y), cell_size).alias(
+                    MIN_CELL_Y
+                ),
+                _cell_of(pl.max_horizontal(start_y, end_y), cell_size).alias(
+                    MAX_CELL_Y
+                ),
+            )
+            # Segments with invalid coordinates never intersect anything.
+            .drop_nulls()
+        )
+        is_large = (pl.col(MAX_CELL_X) - pl.col(MIN_CELL_X) >= MAX_CELL_SPAN) | (
+            pl.col(MAX_CELL_Y) - pl.col(MIN_CELL_Y) >= MAX_CELL_SPAN
+        )
+        large_segments = bounds.filter(is_large).get_column(SEGMENT_INDEX)
+        cells = (
+            bounds.filter(~is_large)
+            .select(
+                SEGMENT_INDEX,
+                pl.int_ranges(pl.col(MIN_CELL_X), pl.col(MAX_CELL_X) + 1).alias(CELL_X),
+                pl.int_ranges(pl.col(MIN_CELL_Y), pl.col(MAX_CELL_Y) + 1).alias(CELL_Y),
+            )
+            .explode(CELL_X)
+            .explode(CELL_Y)
+            .select(CELL_X, CELL_Y, SEGMENT_INDEX)
+            .cast(CELL_SCHEMA)  # type: ignore[arg-type]
+            .sort(CELL_X)
+        )
+        return SegmentGridIndex(cells, large_segments, cell_size)
+
+    def candidates(self, coordinates: list[Coordinate]) -> pl.Series:
+        """Returns the positions of all segments whose bounding box may overlap the
+        bounding box of the given coordinates.
+
+        Args:
+            coordinates (list[Coordinate]): coordinates of a section or a section
+                leg.
+
+        Returns:
+            pl.Series: sorted positions of the candidate segments.
+        """
+        min_x = self._cell(min(coordinate.x for coordinate in coordinates))
+        max_x = self._cell(max(coordinate.x for coordinate in coordinates))
+        min_y = self._cell(min(coordinate.y for coordinate in coordinates))
+        max_y = self._cell(max(coordinate.y for coordinate in coordinates))
+        cell_x = self.cells.get_column(CELL_X)
+        start = cell_x.search_sorted(min_x, side="left")
+        end = cell_x.search_sorted(max_x, side="right")
+        in_cells = (
+            self.cells.slice(start, end - start)
+            .filter(pl.col(CELL_Y).is_between(min_y, max_y))
+            .get_column(SEGMENT_INDEX)
+        )
+        return pl.concat([in_cells, self.large_segments]).unique().sort()
+
+    def _cell(self, value: float) -> int:
+        return math.floor(value / self.cell_size)
+
+    def keep(self, mask: pl.Series) -> "SegmentGridIndex":
+        """Keep the segments selected by the given mask.
+
+        The positions of the remaining segments are updated to their positions
+        after filtering the segments with the same mask.
+
+        Args:
+            mask (pl.Series): boolean mask over the indexed segments.
+
+        Returns:
+            SegmentGridIndex: index of the remaining segments.
+        """
+        new_positions = mask.cast(pl.UInt32).cum_sum() - 1
+        cells = self.cells.filter(mask.gather(self.cells.get_column(SEGMENT_INDEX)))
+        cells = cells.with_columns(
+            new_positions.gather(cells.get_column(SEGMENT_INDEX)).alias(SEGMENT_INDEX)
+        )
+        large_segments = self.large_segments.filter(mask.gather(self.large_segments))
+        return SegmentGridIndex(
+            cells,
+            new_positions.gather(large_segments).alias(SEGMENT_INDEX),
+            self.cell_size,
+        )
+
+    def extend(self, other: "SegmentGridIndex") -> "SegmentGridIndex":
+        """Combine this index with the index of segments appended to the indexed
+        segments.
+
+        Args:
+            other (SegmentGridIndex): index of the appended segments. Its positions
+                must start after the positions of this index.
+
+        Returns:
+            SegmentGridIndex: index of all segments.
+        """
+        return SegmentGridIndex(
+            self.cells.merge_sorted(other.cells, key=CELL_X),
+            pl.concat([self.large_segments, other.large_segments]),
+            self.cell_size,
+        )
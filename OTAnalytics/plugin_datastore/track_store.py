@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from bisect import bisect
+from collections import defaultdict
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from math import ceil
 from typing import Any, Callable, Generator, Iterable, Iterator, Optional, Sequence
 
@@ -29,6 +29,7 @@ from OTAnalytics.domain.track_dataset.track_dataset import (
     START_Y,
     TRACK_GEOMETRY_FACTORY,
     EmptyTrackIdSet,
+    IntersectionPoint,
     IntersectionPointsDataset,
     PythonIntersectionPointsDataset,
     TrackDataset,
@@ -37,7 +38,9 @@ from OTAnalytics.domain.track_dataset.track_dataset import (
     TrackIdSet,
     TrackSegmentDataset,
     contains_true,
+    end_of_window,
 )
+from OTAnalytics.domain.track_dataset.track_interval_index import TrackIntervalIndex
 from OTAnalytics.domain.types import EventType
 from OTAnalytics.plugin_datastore.python_track_store import PythonTrackIdSet
 from OTAnalytics.plugin_parser import ottrk_dataformat
@@ -322,6 +325,7 @@ class PandasTrackDataset(TrackDataset, PandasDataFrameProvider):
             ]()
         else:
             self._geometry_datasets = geometry_datasets
+        self._interval_index: TrackIntervalIndex | None = None
 
     def __iter__(self) -> Iterator[Track]:
         yield from self.as_generator()
@@ -442,6 +446,28 @@ class PandasTrackDataset(TrackDataset, PandasDataFrameProvider):
         remaining_dataset = self._subset_by_ids(remaining_ids_list)
         return finished_dataset, remaining_dataset
 
+    def split_by_end_window(
+        self, window: timedelta
+    ) -> list[tuple[datetime, TrackDataset]]:
+        if self._dataset.empty:
+            return []
+        track_ends = (
+            self._dataset.index.get_level_values(LEVEL_OCCURRENCE)
+            .to_series(index=self._dataset.index.get_level_values(LEVEL_TRACK_ID))
+            .groupby(level=LEVEL_TRACK_ID)
+            .max()
+        )
+        track_ids_by_window: dict[datetime, list[str]] = {}
+        for track_id, track_end in track_ends.items():
+            window_end = end_of_window(track_end.to_pydatetime(), window)
+            track_ids_by_window.setdefault(window_end, []).append(str(track_id))
+        if len(track_ids_by_window) == 1:
+            return [(window_end, self) for window_end in track_ids_by_window]
+        return [
+            (window_end, self._subset_by_ids(track_ids_by_window[window_end]))
+            for window_end in sorted(track_ids_by_window)
+        ]
+
     def remove(self, track_id: TrackId) -> "PandasTrackDataset":
         remaining_tracks = self._dataset.drop(unpack(track_id), errors="ignore")
         updated_geometry_datasets = self._remove_from_geometry_dataset([track_id.id])
@@ -554,6 +580,29 @@ class PandasTrackDataset(TrackDataset, PandasDataFrameProvider):
             self.track_geometry_factory, filtered_dataset, calculator=self.calculator
         )
 
+    def ids_overlapping(
+        self, start: datetime | None, end: datetime | None
+    ) -> TrackIdSet:
+        if self._interval_index is None:
+            self._interval_index = self._create_interval_index()
+        return PythonTrackIdSet(self._interval_index.overlapping(start, end))
+
+    def _create_interval_index(self) -> TrackIntervalIndex:
+        if self._dataset.empty:
+            return TrackIntervalIndex([])
+        occurrences = Series(
+            self._dataset.index.get_level_values(LEVEL_OCCURRENCE),
+            index=self._dataset.index.get_level_values(LEVEL_TRACK_ID),
+        )
+        bounds = occurrences.groupby(level=LEVEL_TRACK_ID).agg(["min", "max"])
+        return TrackIntervalIndex(
+            zip(
+                (TrackId(track_id) for track_id in bounds.index),
+                bounds["min"].dt.to_pydatetime(),
+                bounds["max"].dt.to_pydatetime(),
+            )
+        )
+
     def intersecting_tracks(
         self, sections: list[Section], offset: RelativeOffsetCoordinate
     ) -> TrackIdSet:
@@ -684,43 +733,80 @@ class PandasTrackDataset(TrackDataset, PandasDataFrameProvider):
             logger().info("No tracks to cut")
             return self, EmptyTrackIdSet()
 
-        # TODO is this only:
-        # - groupby trackid
-        # - shift by 1
-        # - calculate intersects per segment
-        # - cumcount per intersects by track id
-        # - add cumcount to track id
-        intersection_points = self.intersection_points([section], offset)
-        cut_indices = {
-            unpack(track_id): [
-                ip[1].upper_index
-                for ip in sorted(intersection_points, key=lambda ip: ip[1])
-            ]
-            for track_id, intersection_points in intersection_points.items()
-        }
-        tracks_to_cut = list(cut_indices.keys())
-        cut_tracks_df = self._dataset.loc[tracks_to_cut].copy()
-        index_as_df = cut_tracks_df.index.to_frame(
-            name=[track.TRACK_ID, track.OCCURRENCE]
-        )
-        index_as_df["cumcount"] = index_as_df.groupby(level=LEVEL_TRACK_ID).transform(
-            "cumcount"
-        )
-        index_as_df[track.TRACK_ID] = index_as_df.apply(
-            lambda row: self._create_cut_track_id(row, cut_indices), axis=1
-        )
-        cut_tracks_df.index = MultiIndex.from_frame(
-            index_as_df[[track.TRACK_ID, track.OCCURRENCE]]
+        return self._cut_at(self.intersection_points([section], offset).items())
+
+    def cut_with_sections(
+        self, sections: list[Section]
+    ) -> tuple["PandasTrackDataset", TrackIdSet]:
+        if len(self) == 0:
+            logger().info("No tracks to cut")
+            return self, EmptyTrackIdSet()
+
+        sections_by_offset: dict[RelativeOffsetCoordinate, list[Section]] = defaultdict(
+            list
         )
+        for section in sections:
+            sections_by_offset[section.get_offset(EventType.SECTION_ENTER)].append(
+                section
+            )
+        intersections: list[tuple[TrackId, list[tuple[SectionId, IntersectionPoint]]]]
+        intersections = []
+        for offset, offset_sections in sections_by_offset.items():
+            intersections.extend(
+                self.intersection_points(offset_sections, offset).items()
+            )
+        return self._cut_at(intersections)
+
+    def _cut_at(
+        self,
+        intersections: Iterable[
+            tuple[TrackId, list[tuple[SectionId, IntersectionPoint]]]
+        ],
+    ) -> tuple["PandasTrackDataset", TrackIdSet]:
+        """Cut the tracks at the given intersection points.
+
+        A track is cut once per intersected segment, even if several sections
+        intersect the same segment. The parts of a track are numbered
+        consecutively, e.g. `1_0`, `1_1`, `1_2`.
+
+        Args:
+            intersections (Iterable[tuple[TrackId, list[tuple[SectionId,
+                IntersectionPoint]]]]): intersection points per track.
+
+        Returns:
+            tuple[PandasTrackDataset, TrackIdSet]: the dataset containing the cut
+                tracks and the original track ids that have been cut.
+        """
+        cuts: dict[tuple[str, int], None] = {}
+        for track_id, points in intersections:
+            for _, point in points:
+                cuts[(unpack(track_id), point.upper_index)] = None
+        cut_track_ids = [track_id for track_id, _ in cuts]
+        cut_indices = [index for _, index in cuts]
+        tracks_to_cut = list(dict.fromkeys(cut_track_ids))
+        cut_tracks_df = self._dataset.loc[tracks_to_cut].copy()
+        if not cut_tracks_df.empty:
+            track_ids = cut_tracks_df.index.get_level_values(LEVEL_TRACK_ID)
+            cut_tracks_df.index = MultiIndex.from_arrays(
+                [
+                    _create_cut_track_ids(
+                        track_ids.to_numpy(dtype=str),
+                        cut_tracks_df.groupby(level=LEVEL_TRACK_ID)
+                        .cumcount()
+                        .to_numpy(),
+                        pandas.Categorical(track_ids, categories=tracks_to_cut).codes,
+                        pandas.Categorical(
+                            cut_track_ids, categories=tracks_to_cut
+                        ).codes,
+                        numpy.array(cut_indices, dtype=numpy.int64),
+                    ),
+                    cut_tracks_df.index.get_level_values(LEVEL_OCCURRENCE),
+                ],
+                names=[track.TRACK_ID, track.OCCURRENCE],
+            )
         return PandasTrackDataset(
             self.track_geometry_factory, cut_tracks_df
-        ), PythonTrackIdSet(intersection_points.keys())
-
-    def _create_cut_track_id(self, row: Series, cut_info: dict[str, list[int]]) -> str:
-        if (track_id := row[track.TRACK_ID]) in cut_info.keys():
-            cut_segment_index = bisect(cut_info[track_id], row["cumcount"])
-            return f"{track_id}_{cut_segment_index}"
-        return row[track.TRACK_ID]
+        ), to_domain_ids(tracks_to_cut)
 
     def get_max_confidences_for(self, track_ids: TrackIdSet) -> dict[str, float]:
         track_id_strings = [track_id.id for track_id in track_ids]
@@ -838,6 +924,39 @@ def _drop_track_classification(data: DataFrame) -> DataFrame:
     return data
 
 
+def _create_cut_track_ids(
+    track_ids: numpy.ndarray,
+    positions: numpy.ndarray,
+    track_codes: numpy.ndarray,
+    cut_track_codes: numpy.ndarray,
+    cut_positions: numpy.ndarray,
+) -> numpy.ndarray:
+    """Create the track ids of the detections of cut tracks.
+
+    A detection belongs to the part of its track whose number equals the number
+    of cuts at or before the position of the detection within its track. Tracks and
+    cuts are combined to one sortable key per track and position. Thus, the parts
+    of all detections are found with a single binary search.
+
+    Args:
+        track_ids (numpy.ndarray): track id of each detection.
+        positions (numpy.ndarray): position of each detection within its track.
+        track_codes (numpy.ndarray): integer code of the track of each detection.
+        cut_track_codes (numpy.ndarray): integer code of the track of each cut.
+        cut_positions (numpy.ndarray): position within its track of each cut.
+
+    Returns:
+        numpy.ndarray: the ids of the cut tracks, e.g. `1_0`, for each detection.
+    """
+    stride = max(int(positions.max()), int(cut_positions.max())) + 1
+    track_offsets = track_codes.astype(numpy.int64) * stride
+    cut_keys = numpy.sort(cut_track_codes.astype(numpy.int64) * stride + cut_positions)
+    parts = numpy.searchsorted(
+        cut_keys, track_offsets + positions, side="right"
+    ) - numpy.searchsorted(cut_keys, track_offsets, side="left")
+    return numpy.char.add(numpy.char.add(track_ids, "_"), parts.astype(str))
+
+
 def _convert_tracks(tracks: Iterable[Track]) -> DataFrame:
     """
     Convert tracks into a dataframe.
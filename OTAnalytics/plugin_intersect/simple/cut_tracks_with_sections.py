@@ -59,8 +59,24 @@ class SimpleCutTracksIntersectingSection(CutTracksIntersectingSection):
         self._add_all_tracks(cut_tracks_dataset)
         if not preserve_cutting_section:
             self._remove_section(cutting_section.id)
+        self._subject.notify(CutTracksDto([cutting_section], list(ids_of_cut_tracks)))
+
+    def cut_all(
+        self, cutting_sections: list[Section], preserve_cutting_sections: bool = False
+    ) -> None:
+        if not cutting_sections:
+            return
+        track_dataset = self._get_tracks.as_dataset()
+        cut_tracks_dataset, ids_of_cut_tracks = track_dataset.cut_with_sections(
+            cutting_sections
+        )
+        self._clear_all_tracks()
+        self._add_all_tracks(cut_tracks_dataset)
+        if not preserve_cutting_sections:
+            for cutting_section in cutting_sections:
+                self._remove_section(cutting_section.id)
         self._subject.notify(
-            CutTracksDto(cutting_section.name, list(ids_of_cut_tracks))
+            CutTracksDto(list(cutting_sections), list(ids_of_cut_tracks))
         )
 
     def register(self, observer: OBSERVER[CutTracksDto]) -> None:
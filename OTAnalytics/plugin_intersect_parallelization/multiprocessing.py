@@ -1,21 +1,100 @@
-from multiprocessing import Pool
+from dataclasses import dataclass
+from io import BytesIO
+from multiprocessing import get_context
+from multiprocessing.pool import Pool
+from pathlib import Path
+from tempfile import NamedTemporaryFile
 from typing import Callable, Iterable, Sequence
 
+import polars as pl
+
 from OTAnalytics.application.config import DEFAULT_NUM_PROCESSES
 from OTAnalytics.application.logger import logger
-from OTAnalytics.domain.event import EventDataset, PythonEventDataset
+from OTAnalytics.domain.event import EventDataset, concat_event_datasets
 from OTAnalytics.domain.intersect import IntersectParallelizationStrategy
 from OTAnalytics.domain.section import Section
 from OTAnalytics.domain.track_dataset.track_dataset import TrackDataset
+from OTAnalytics.plugin_datastore.polars_track_store import (
+    POLARS_TRACK_GEOMETRY_FACTORY,
+    PolarsTrackClassificationCalculator,
+    PolarsTrackDataset,
+)
+from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store import (
+    PolarsEventDataset,
+)
+
+SHARED_MEMORY_DIR = Path("/dev/shm")
+"""In-memory file system to share track data with worker processes. Falls back to
+the default temporary directory if not available."""
+
+START_METHOD = "spawn"
+"""Forking a process using polars may deadlock. Thus, workers are spawned."""
+
+INTERSECT = Callable[[TrackDataset, Iterable[Section]], EventDataset]
+
+
+@dataclass(frozen=True)
+class SharedTrackBatch:
+    """Range of rows of the tracks shared with the worker processes.
+
+    Attributes:
+        file (Path): Arrow IPC file containing the tracks of all batches.
+        offset (int): first row of the batch.
+        length (int): number of rows of the batch.
+        track_geometry_factory (POLARS_TRACK_GEOMETRY_FACTORY): factory of the
+            restored track dataset.
+        calculator (PolarsTrackClassificationCalculator): classification calculator
+            of the restored track dataset.
+    """
+
+    file: Path
+    offset: int
+    length: int
+    track_geometry_factory: POLARS_TRACK_GEOMETRY_FACTORY
+    calculator: PolarsTrackClassificationCalculator
+
+    def load(self) -> PolarsTrackDataset:
+        tracks = pl.read_ipc(self.file, memory_map=True).slice(self.offset, self.length)
+        return PolarsTrackDataset(
+            self.track_geometry_factory, tracks, calculator=self.calculator
+        )
+
+
+def serialize_events(events: EventDataset) -> bytes:
+    buffer = BytesIO()
+    PolarsEventDataset.from_events(events).get_data().write_ipc(buffer)
+    return buffer.getvalue()
+
+
+def deserialize_events(events: bytes) -> EventDataset:
+    return PolarsEventDataset(pl.read_ipc(BytesIO(events)))
+
+
+def intersect_shared_batch(
+    intersect: INTERSECT, batch: SharedTrackBatch, sections: Iterable[Section]
+) -> bytes:
+    """Intersect a batch of shared tracks with the given sections.
+
+    Runs inside the worker processes and must therefore be defined on module level.
+    Only the row range of the batch is sent to the worker. The resulting events are
+    sent back as Arrow IPC buffer.
+    """
+    return serialize_events(intersect(batch.load(), sections))
 
 
 class MultiprocessingIntersectParallelization(IntersectParallelizationStrategy):
     """Executes the intersection of tracks and sections in parallel if num_processes
-    is greater than 1. Otherwise, executes sequentially"""
+    is greater than 1. Otherwise, executes sequentially.
+
+    The worker pool is created on first use and reused for further intersections.
+    Polars track datasets are written once into shared memory. Workers receive only
+    the row range of their batch and return their events as Arrow IPC buffers.
+    """
 
     def __init__(self, num_processes: int = DEFAULT_NUM_PROCESSES):
         self._validate_num_processes(num_processes)
         self._num_processes = num_processes
+        self._pool: Pool | None = None
 
     @property
     def num_processes(self) -> int:
@@ -27,28 +106,91 @@ class MultiprocessingIntersectParallelization(IntersectParallelizationStrategy):
 
     def set_num_processes(self, value: int) -> None:
         self._validate_num_processes(value)
+        if value != self._num_processes:
+            self.close()
         self._num_processes = value
 
+    def close(self) -> None:
+        """Terminate the worker pool. A new pool is created on the next execution."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def _get_pool(self) -> Pool:
+        if self._pool is None:
+            context = get_context(START_METHOD)
+            self._pool = context.Pool(processes=self._num_processes)
+        return self._pool
+
     def execute(
         self,
-        intersect: Callable[[TrackDataset, Iterable[Section]], EventDataset],
+        intersect: INTERSECT,
         tasks: Sequence[tuple[TrackDataset, Iterable[Section]]],
     ) -> EventDataset:
         logger().debug(
             f"Start intersection in parallel with {self._num_processes} processes."
         )
         if self._num_processes > 1:
-            with Pool(processes=self._num_processes) as pool:
-                event_datasets = pool.starmap(intersect, tasks)
+            event_datasets = self._execute_in_pool(intersect, tasks)
         else:
             event_datasets = [intersect(tracks, sections) for tracks, sections in tasks]
 
         return self._combine_event_datasets(event_datasets)
 
+    def _execute_in_pool(
+        self,
+        intersect: INTERSECT,
+        tasks: Sequence[tuple[TrackDataset, Iterable[Section]]],
+    ) -> Iterable[EventDataset]:
+        pool = self._get_pool()
+        polars_tasks = [
+            (tracks, sections)
+            for tracks, sections in tasks
+            if isinstance(tracks, PolarsTrackDataset)
+        ]
+        if not tasks or len(polars_tasks) != len(tasks):
+            return pool.starmap(intersect, tasks)
+
+        with NamedTemporaryFile(
+            suffix=".arrow", dir=self._shared_dir(), delete_on_close=False
+        ) as file:
+            file.close()
+            shared_file = Path(file.name)
+            shared_tasks = self._share(shared_file, polars_tasks)
+            results = pool.starmap(
+                intersect_shared_batch,
+                [(intersect, batch, sections) for batch, sections in shared_tasks],
+            )
+        return [deserialize_events(result) for result in results]
+
+    def _shared_dir(self) -> Path | None:
+        return SHARED_MEMORY_DIR if SHARED_MEMORY_DIR.is_dir() else None
+
+    def _share(
+        self,
+        file: Path,
+        tasks: Sequence[tuple[PolarsTrackDataset, Iterable[Section]]],
+    ) -> list[tuple[SharedTrackBatch, Iterable[Section]]]:
+        shared_tasks = []
+        offset = 0
+        for tracks, sections in tasks:
+            length = len(tracks.get_data())
+            batch = SharedTrackBatch(
+                file=file,
+                offset=offset,
+                length=length,
+                track_geometry_factory=tracks.track_geometry_factory,
+                calculator=tracks.calculator,
+            )
+            shared_tasks.append((batch, sections))
+            offset += length
+        pl.concat([tracks.get_data() for tracks, _ in tasks], rechunk=False).write_ipc(
+            file
+        )
+        return shared_tasks
+
     def _combine_event_datasets(
         self, event_datasets: Iterable[EventDataset]
     ) -> EventDataset:
-        combined = PythonEventDataset()
-        for dataset in event_datasets:
-            combined.extend(dataset)
-        return combined
+        return concat_event_datasets(event_datasets)
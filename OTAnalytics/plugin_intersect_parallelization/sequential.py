@@ -1,6 +1,6 @@
 from typing import Callable, Iterable, Sequence
 
-from OTAnalytics.domain.event import EventDataset, PythonEventDataset
+from OTAnalytics.domain.event import EventDataset, concat_event_datasets
 from OTAnalytics.domain.intersect import IntersectParallelizationStrategy
 from OTAnalytics.domain.section import Section
 from OTAnalytics.domain.track_dataset.track_dataset import TrackDataset
@@ -18,11 +18,9 @@ class SequentialIntersect(IntersectParallelizationStrategy):
         intersect: Callable[[TrackDataset, Iterable[Section]], EventDataset],
         tasks: Sequence[tuple[TrackDataset, Iterable[Section]]],
     ) -> EventDataset:
-        event_dataset = PythonEventDataset()
-        for task in tasks:
-            track_dataset, sections = task
-            event_dataset.extend(intersect(track_dataset, sections))
-        return event_dataset
+        return concat_event_datasets(
+            intersect(track_dataset, sections) for track_dataset, sections in tasks
+        )
 
     def set_num_processes(self, value: int) -> None:
         pass
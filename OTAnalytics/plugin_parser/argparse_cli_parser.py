@@ -132,6 +132,16 @@ class ArgparseCliParser(CliParser):
             help="Do not export tracks as csv",
             required=False,
         )
+        self._parser.add_argument(
+            "--track-formats",
+            nargs="+",
+            type=str,
+            help=(
+                "Formats to export the tracks with '--track-export' "
+                "('csv' (default), 'parquet', 'arrow')."
+            ),
+            required=False,
+        )
         self._parser.add_argument(
             "--track-statistics-export",
             action="store_true",
@@ -168,6 +178,46 @@ class ArgparseCliParser(CliParser):
             help="Blacklist filter to exclude tracks with given classes.",
             required=False,
         )
+        self._parser.add_argument(
+            "--num-processes",
+            type=int,
+            help=(
+                "Number of processes used to parse track files and to intersect "
+                "tracks with sections."
+            ),
+            required=False,
+        )
+        self._parser.add_argument(
+            "--track-cache-dir",
+            type=str,
+            help="Directory to cache parsed ottrk files in.",
+            required=False,
+        )
+        self._parser.add_argument(
+            "--no-track-cache",
+            action="store_true",
+            help="Do not cache parsed ottrk files.",
+            required=False,
+        )
+        self._parser.add_argument(
+            "--stream-window",
+            type=int,
+            help=(
+                "Time window in minutes to analyse the tracks in stream mode. Tracks "
+                "are assigned to the window they end in. Windows span ottrk files. "
+                "Defaults to one ottrk file at a time."
+            ),
+            required=False,
+        )
+        self._parser.add_argument(
+            "--resume",
+            action="store_true",
+            help=(
+                "Save a checkpoint after each processed chunk in stream mode and "
+                "continue an interrupted run from its checkpoint."
+            ),
+            required=False,
+        )
 
     def parse(self) -> CliArguments:
         """Parse and checks for cli arg
@@ -194,8 +244,14 @@ class ArgparseCliParser(CliParser):
             count_intervals=args.count_intervals,
             counting_event=args.counting_event,
             track_export=args.track_export,
+            track_formats=args.track_formats,
             track_statistics_export=args.track_statistics_export,
             log_file=args.logfile,
             include_classes=args.include_classes,
             exclude_classes=args.exclude_classes,
+            num_processes=args.num_processes,
+            track_cache_dir=args.track_cache_dir,
+            no_track_cache=args.no_track_cache,
+            stream_window_in_minutes=args.stream_window,
+            resume=args.resume,
         )
@@ -0,0 +1,362 @@
+"""
+Incremental parser for ottrk files.
+
+The detections of an ottrk file are read from the bzip2 compressed json stream in
+chunks of fixed size. Each chunk is converted into a Polars DataFrame right away and
+the format fixes are applied column-wise. Thus, only a single chunk of detections is
+held as Python objects at any time, regardless of the length of the file.
+
+The parser still returns all detections of a file as one track dataset. The chunks
+are concatenated without copying, but the columnar table of the whole file is held
+in memory. Peak memory therefore grows with the file length, just without the
+overhead of Python objects per detection.
+"""
+
+import bz2
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Iterator
+
+import ijson
+import polars as pl
+from more_itertools import batched
+
+from OTAnalytics.application.datastore import TrackParser, TrackParseResult
+from OTAnalytics.application.logger import logger
+from OTAnalytics.domain import track
+from OTAnalytics.plugin_datastore.polars_track_store import (
+    POLARS_TRACK_GEOMETRY_FACTORY,
+    PolarsByMaxConfidence,
+    PolarsTrackClassificationCalculator,
+    PolarsTrackDataset,
+)
+from OTAnalytics.plugin_parser import ottrk_dataformat as ottrk_format
+from OTAnalytics.plugin_parser.json_parser import (
+    metadata_from_json_events,
+    parse_json_bz2_events,
+)
+from OTAnalytics.plugin_parser.otvision_parser import (
+    DEFAULT_TRACK_LENGTH_LIMIT,
+    VERSION_1_0,
+    VERSION_1_2,
+    OttrkFormatFixer,
+    OttrkParser,
+    TrackLengthLimit,
+    Version,
+)
+
+DEFAULT_CHUNK_SIZE = 100_000
+DETECTIONS_PREFIX = f"{ottrk_format.DATA}.{ottrk_format.DATA_DETECTIONS}.item"
+TRACK_LENGTH = "track_length"
+
+RAW_DETECTION_SCHEMA: dict[str, type[pl.DataType]] = {
+    ottrk_format.CLASS: pl.Utf8,
+    ottrk_format.CONFIDENCE: pl.Float64,
+    ottrk_format.X: pl.Float64,
+    ottrk_format.Y: pl.Float64,
+    ottrk_format.W: pl.Float64,
+    ottrk_format.H: pl.Float64,
+    ottrk_format.FRAME: pl.Int64,
+    ottrk_format.OCCURRENCE: pl.Float64,
+    ottrk_format.INTERPOLATED_DETECTION: pl.Boolean,
+    ottrk_format.FIRST: pl.Boolean,
+    ottrk_format.FINISHED: pl.Boolean,
+    ottrk_format.TRACK_ID: pl.Utf8,
+}
+RENAMED_COLUMNS: dict[str, str] = {
+    ottrk_format.CLASS: track.CLASSIFICATION,
+    ottrk_format.CONFIDENCE: track.CONFIDENCE,
+    ottrk_format.X: track.X,
+    ottrk_format.Y: track.Y,
+    ottrk_format.W: track.W,
+    ottrk_format.H: track.H,
+    ottrk_format.FRAME: track.FRAME,
+    ottrk_format.OCCURRENCE: track.OCCURRENCE,
+    ottrk_format.INTERPOLATED_DETECTION: track.INTERPOLATED_DETECTION,
+    ottrk_format.TRACK_ID: track.TRACK_ID,
+}
+POLARS_DATE_FORMAT: str = ottrk_format.DATE_FORMAT.replace(".%f", "%.f")
+
+
+class ColumnarDetectionFixer(ABC):
+    """Column-wise counterpart of the `DetectionFixer`.
+
+    Fixes a whole chunk of detections at once instead of a single detection dict.
+    """
+
+    def __init__(
+        self,
+        from_otdet_version: Version,
+        to_otdet_version: Version,
+    ) -> None:
+        self._from_otdet_version: Version = from_otdet_version
+        self._to_otdet_version: Version = to_otdet_version
+
+    def from_version(self) -> Version:
+        return self._from_otdet_version
+
+    def to_version(self) -> Version:
+        return self._to_otdet_version
+
+    @abstractmethod
+    def fix(self, detections: pl.DataFrame, current_version: Version) -> pl.DataFrame:
+        raise NotImplementedError
+
+
+class ColumnarOtdet_Version_1_0_to_1_1(ColumnarDetectionFixer):
+    def __init__(self) -> None:
+        super().__init__(VERSION_1_0, VERSION_1_0)
+
+    def fix(self, detections: pl.DataFrame, current_version: Version) -> pl.DataFrame:
+        """Convert center coordinates of otdet format version <= 1.0 into the
+        top left corner of the bounding box."""
+        if current_version <= self.to_version():
+            return detections.with_columns(
+                (pl.col(ottrk_format.X) - pl.col(ottrk_format.W) / 2).alias(
+                    ottrk_format.X
+                ),
+                (pl.col(ottrk_format.Y) - pl.col(ottrk_format.H) / 2).alias(
+                    ottrk_format.Y
+                ),
+            )
+        return detections
+
+
+class ColumnarOtdet_Version_1_0_To_1_2(ColumnarDetectionFixer):
+    def __init__(self) -> None:
+        super().__init__(VERSION_1_0, VERSION_1_2)
+
+    def fix(self, detections: pl.DataFrame, current_version: Version) -> pl.DataFrame:
+        """Convert the date strings of otdet format version <= 1.1 into UTC
+        timestamps."""
+        if current_version < self.to_version():
+            return detections.with_columns(
+                pl.col(ottrk_format.OCCURRENCE)
+                .cast(pl.Utf8)
+                .str.strptime(pl.Datetime("us"), POLARS_DATE_FORMAT)
+                .dt.replace_time_zone("UTC")
+                .dt.epoch("us")
+                .truediv(1_000_000)
+                .alias(ottrk_format.OCCURRENCE)
+            )
+        return detections
+
+
+ALL_COLUMNAR_DETECTION_FIXES: list[ColumnarDetectionFixer] = [
+    ColumnarOtdet_Version_1_0_to_1_1(),
+    ColumnarOtdet_Version_1_0_To_1_2(),
+]
+
+
+class ColumnarOttrkFormatFixer:
+    """Fix format changes of older ottrk files on chunks of detections.
+
+    Metadata is still fixed by the dict based `OttrkFormatFixer` because it is
+    small and read only once per file.
+    """
+
+    def __init__(
+        self,
+        detection_fixes: list[ColumnarDetectionFixer] = ALL_COLUMNAR_DETECTION_FIXES,
+        metadata_fixer: OttrkFormatFixer = OttrkFormatFixer(detection_fixes=[]),
+    ) -> None:
+        self._detection_fixes = detection_fixes
+        self._metadata_fixer = metadata_fixer
+
+    def fix_metadata(self, metadata: dict) -> dict:
+        return self._metadata_fixer.fix_metadata(metadata)
+
+    def fix_detections(
+        self, detections: pl.DataFrame, current_otdet_version: Version
+    ) -> pl.DataFrame:
+        for fixer in self._detection_fixes:
+            detections = fixer.fix(detections, current_otdet_version)
+        return detections
+
+
+def read_detection_chunks(
+    ottrk_file: Path, otdet_version: Version, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[pl.DataFrame]:
+    """
+    Lazily read the detections of the given ottrk file in chunks of at most
+    `chunk_size` detections each.
+
+    Only the columns required by OTAnalytics are kept. Optional columns, e.g.
+    `finished`, are only part of a chunk if at least one detection of the chunk
+    contains them. Detections without them get null values.
+
+    Args:
+        ottrk_file (Path): the ottrk file to read.
+        otdet_version (Version): otdet format version of the file.
+        chunk_size (int): maximum number of detections per chunk.
+
+    Returns:
+        Iterator[pl.DataFrame]: chunks of raw detections.
+    """
+    schema = _raw_schema_for(otdet_version)
+    with bz2.BZ2File(ottrk_file) as stream:
+        detections = ijson.items(stream, DETECTIONS_PREFIX, use_float=True)
+        for chunk in batched(detections, chunk_size):
+            present_columns: set[str] = set()
+            for detection in chunk:
+                present_columns.update(detection.keys())
+            chunk_schema = {
+                column: dtype
+                for column, dtype in schema.items()
+                if column in present_columns
+            }
+            yield pl.from_dicts(chunk, schema=chunk_schema, strict=False)
+
+
+def _raw_schema_for(otdet_version: Version) -> dict[str, type[pl.DataType]]:
+    if otdet_version < VERSION_1_2:
+        return RAW_DETECTION_SCHEMA | {ottrk_format.OCCURRENCE: pl.Utf8}
+    return RAW_DETECTION_SCHEMA
+
+
+class ChunkedOttrkParser(TrackParser):
+    """Parse an ottrk file incrementally into a `PolarsTrackDataset`.
+
+    In contrast to the `OttrkParser` the file content is never materialized as
+    Python objects as a whole. Detections are decoded in chunks of `chunk_size` and
+    directly converted into columnar buffers, which together form the returned
+    dataset.
+
+    Args:
+        track_geometry_factory (POLARS_TRACK_GEOMETRY_FACTORY): factory to create
+            geometry datasets of the parsed tracks.
+        calculator (PolarsTrackClassificationCalculator): calculates the track
+            classification.
+        format_fixer (ColumnarOttrkFormatFixer): to fix older ottrk version files.
+        track_length_limit (TrackLengthLimit): tracks with a number of detections
+            outside of this limit are dropped.
+        chunk_size (int): number of detections decoded at once.
+    """
+
+    def __init__(
+        self,
+        track_geometry_factory: POLARS_TRACK_GEOMETRY_FACTORY,
+        calculator: PolarsTrackClassificationCalculator = PolarsByMaxConfidence(),
+        format_fixer: ColumnarOttrkFormatFixer = ColumnarOttrkFormatFixer(),
+        track_length_limit: TrackLengthLimit = DEFAULT_TRACK_LENGTH_LIMIT,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self._track_geometry_factory = track_geometry_factory
+        self._calculator = calculator
+        self._format_fixer = format_fixer
+        self._track_length_limit = track_length_limit
+        self._chunk_size = chunk_size
+
+    def parse(self, ottrk_file: Path) -> TrackParseResult:
+        """Parse ottrk file chunk by chunk.
+
+        Args:
+            ottrk_file (Path): the track file.
+
+        Returns:
+            TrackParseResult: contains tracks and track metadata.
+        """
+        metadata = self._format_fixer.fix_metadata(
+            metadata_from_json_events(parse_json_bz2_events(ottrk_file))
+        )
+        metadata_video = metadata[ottrk_format.VIDEO]
+        detections = self.parse_detections(ottrk_file, metadata)
+        tracks = self._create_dataset(detections)
+        return TrackParseResult(
+            tracks,
+            OttrkParser.parse_metadata(metadata),
+            OttrkParser.parse_video_metadata(metadata_video),
+        )
+
+    def parse_detections(self, ottrk_file: Path, metadata: dict) -> pl.DataFrame:
+        """Read all detections of the given file into a single DataFrame using the
+        column names of the track datasets.
+
+        Args:
+            ottrk_file (Path): the track file.
+            metadata (dict): the already fixed metadata of the track file.
+
+        Returns:
+            pl.DataFrame: fixed detections of the file. The chunks are not
+                rechunked into contiguous memory.
+        """
+        otdet_version = Version.from_str(metadata[ottrk_format.OTDET_VERSION])
+        tracking_metadata = metadata[ottrk_format.TRACKING]
+        id_prefix = (
+            f"{tracking_metadata[ottrk_format.TRACKING_RUN_ID]}"
+            f"#{tracking_metadata[ottrk_format.FRAME_GROUP]}#"
+        )
+        metadata_video = metadata[ottrk_format.VIDEO]
+        video_name = (
+            metadata_video[ottrk_format.FILENAME]
+            + metadata_video[ottrk_format.FILETYPE]
+        )
+        chunks = [
+            self._convert_chunk(
+                self._format_fixer.fix_detections(chunk, otdet_version),
+                id_prefix=id_prefix,
+                video_name=video_name,
+                input_file=str(ottrk_file),
+            )
+            for chunk in read_detection_chunks(
+                ottrk_file, otdet_version, self._chunk_size
+            )
+        ]
+        if not chunks:
+            return pl.DataFrame()
+        return pl.concat(chunks, how="diagonal_relaxed", rechunk=False)
+
+    @staticmethod
+    def _convert_chunk(
+        chunk: pl.DataFrame, id_prefix: str, video_name: str, input_file: str
+    ) -> pl.DataFrame:
+        return (
+            chunk.rename(RENAMED_COLUMNS, strict=False)
+            .with_columns(
+                (pl.lit(id_prefix) + pl.col(track.TRACK_ID)).alias(track.TRACK_ID),
+                pl.from_epoch(
+                    pl.col(track.OCCURRENCE)
+                    .cast(pl.Float64)
+                    .mul(1_000_000)
+                    .round(0)
+                    .cast(pl.Int64),
+                    time_unit="us",
+                )
+                .dt.replace_time_zone("UTC")
+                .alias(track.OCCURRENCE),
+                pl.lit(video_name).alias(track.VIDEO_NAME),
+                pl.lit(input_file).alias(track.INPUT_FILE),
+            )
+            .with_columns(pl.col(track.TRACK_ID).alias(track.ORIGINAL_TRACK_ID))
+        )
+
+    def _create_dataset(self, detections: pl.DataFrame) -> PolarsTrackDataset:
+        if detections.is_empty():
+            return PolarsTrackDataset(
+                self._track_geometry_factory, calculator=self._calculator
+            )
+        track_lengths = detections.group_by(track.TRACK_ID).agg(
+            pl.len().alias(TRACK_LENGTH)
+        )
+        track_ids_to_remain = track_lengths.filter(
+            pl.col(TRACK_LENGTH).is_between(
+                self._track_length_limit.lower_bound,
+                self._track_length_limit.upper_bound,
+            )
+        ).select(track.TRACK_ID)
+        number_of_tracks_outside_bounds = len(track_lengths) - len(track_ids_to_remain)
+        if number_of_tracks_outside_bounds > 0:
+            percentage_of_tracks_outside_bounds = (
+                number_of_tracks_outside_bounds / len(track_lengths) * 100
+            )
+            logger().warning(
+                f"Number of detections of {number_of_tracks_outside_bounds} "
+                f"({percentage_of_tracks_outside_bounds:.2f}%) tracks "
+                f"exceeds the allowed bounds ({self._track_length_limit})."
+            )
+        tracks_to_remain = detections.join(
+            track_ids_to_remain, on=track.TRACK_ID, how="semi"
+        )
+        return PolarsTrackDataset.from_dataframe(
+            tracks_to_remain, self._track_geometry_factory, calculator=self._calculator
+        )
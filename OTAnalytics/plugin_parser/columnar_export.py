@@ -0,0 +1,194 @@
+"""
+Columnar export of tables to Parquet and Arrow IPC files.
+
+Exporting large datasets as CSV converts every value to text and produces huge
+files. Parquet and Arrow IPC store the columns in their binary representation and
+compress them. Tables are written batch by batch. The file stays open after a
+table has been written. Thus, the stream CLI can append the results of each chunk
+to the same file. The file is only complete after the writer has been closed.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+PARQUET = "parquet"
+ARROW = "arrow"
+COLUMNAR_FORMATS = {PARQUET, ARROW}
+
+DEFAULT_COMPRESSION = "zstd"
+DEFAULT_BATCH_SIZE = 65_536
+"""Maximum number of rows written at once."""
+
+
+class ColumnarWriter(ABC):
+    """Writes tables batch by batch to a single file.
+
+    The schema of the first table with rows is the schema of the file. Columns of
+    later tables are cast to it. Missing columns are filled with nulls.
+
+    Args:
+        file (Path): file to write to. An existing file is overwritten.
+        batch_size (int): maximum number of rows written at once.
+    """
+
+    def __init__(self, file: Path, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        self._file = file
+        self._batch_size = batch_size
+        self._schema: pa.Schema | None = None
+        self._empty_table: pa.Table | None = None
+
+    @property
+    def file(self) -> Path:
+        return self._file
+
+    def write(self, table: pa.Table) -> None:
+        """Append the given table to the file.
+
+        Args:
+            table (pa.Table): the table to write.
+        """
+        if self._schema is None:
+            if table.num_rows == 0:
+                # Types of empty tables are often unknown.
+                self._empty_table = table
+                return
+            self._start(table.schema)
+        for batch in _conform(table, self._schema).to_batches(
+            max_chunksize=self._batch_size
+        ):
+            self._write_batch(batch)
+
+    def close(self) -> None:
+        """Finish the file. Without any written table, no file is created."""
+        if self._schema is None and self._empty_table is not None:
+            self._start(self._empty_table.schema)
+        if self._schema is not None:
+            self._close()
+
+    def _start(self, schema: pa.Schema) -> None:
+        self._schema = _replace_null_types(schema)
+        self._file.parent.mkdir(parents=True, exist_ok=True)
+        self._open(self._schema)
+
+    @abstractmethod
+    def _open(self, schema: pa.Schema) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _write_batch(self, batch: pa.RecordBatch) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _close(self) -> None:
+        raise NotImplementedError
+
+
+class ParquetColumnarWriter(ColumnarWriter):
+    """Writes each batch as row group of a Parquet file."""
+
+    def __init__(
+        self,
+        file: Path,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        compression: str = DEFAULT_COMPRESSION,
+    ) -> None:
+        super().__init__(file, batch_size)
+        self._compression = compression
+        self._writer: pq.ParquetWriter | None = None
+
+    def _open(self, schema: pa.Schema) -> None:
+        self._writer = pq.ParquetWriter(
+            self._file, schema, compression=self._compression
+        )
+
+    def _write_batch(self, batch: pa.RecordBatch) -> None:
+        if self._writer is not None:
+            self._writer.write_batch(batch)
+
+    def _close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class ArrowColumnarWriter(ColumnarWriter):
+    """Writes each batch as record batch of an Arrow IPC file."""
+
+    def __init__(
+        self,
+        file: Path,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        compression: str = DEFAULT_COMPRESSION,
+    ) -> None:
+        super().__init__(file, batch_size)
+        self._compression = compression
+        self._sink: pa.OSFile | None = None
+        self._writer: ipc.RecordBatchFileWriter | None = None
+
+    def _open(self, schema: pa.Schema) -> None:
+        self._sink = pa.OSFile(str(self._file), "wb")
+        self._writer = ipc.new_file(
+            self._sink,
+            schema,
+            options=ipc.IpcWriteOptions(compression=self._compression),
+        )
+
+    def _write_batch(self, batch: pa.RecordBatch) -> None:
+        if self._writer is not None:
+            self._writer.write_batch(batch)
+
+    def _close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+
+
+def create_columnar_writer(file_format: str, file: Path) -> ColumnarWriter:
+    """Create a writer for the given columnar format.
+
+    Args:
+        file_format (str): either `parquet` or `arrow`.
+        file (Path): file to write to.
+
+    Raises:
+        ValueError: if the format is not a columnar format.
+
+    Returns:
+        ColumnarWriter: the writer.
+    """
+    if file_format == PARQUET:
+        return ParquetColumnarWriter(file)
+    if file_format == ARROW:
+        return ArrowColumnarWriter(file)
+    raise ValueError(
+        f"{file_format} is not a columnar format. "
+        f"Supported formats are: {sorted(COLUMNAR_FORMATS)}"
+    )
+
+
+def _replace_null_types(schema: pa.Schema) -> pa.Schema:
+    """Columns without any value in the first table are stored as strings. Thus,
+    values of later tables can be written."""
+    for index, field in enumerate(schema):
+        if pa.types.is_null(field.type):
+            schema = schema.set(index, field.with_type(pa.string()))
+    return schema
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    columns = [
+        (
+            table.column(field.name).cast(field.type)
+            if field.name in table.column_names
+            else pa.nulls(len(table), field.type)
+        )
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
@@ -1,23 +1,23 @@
 from pathlib import Path
 from typing import Any, Dict
 
-from OTAnalytics.application.datastore import TrackParseResult
+from OTAnalytics.application.datastore import TrackParser, TrackParseResult
 from OTAnalytics.application.logger import logger
 from OTAnalytics.domain.track_dataset.track_dataset import TRACK_GEOMETRY_FACTORY
+from OTAnalytics.plugin_datastore.polars_track_store import (
+    POLARS_TRACK_GEOMETRY_FACTORY,
+    PolarsByMaxConfidence,
+    PolarsTrackDataset,
+    drop_row_id,
+)
 from OTAnalytics.plugin_datastore.python_track_store import PythonTrackDataset
 from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store import (
     PolarsTrackGeometryDataset,
 )
-from OTAnalytics.plugin_datastore.track_store import (
-    PandasByMaxConfidence,
-    PandasTrackDataset,
-)
+from OTAnalytics.plugin_datastore.track_store import PandasTrackDataset
+from OTAnalytics.plugin_parser.chunked_ottrk_parser import ChunkedOttrkParser
 from OTAnalytics.plugin_parser.json_parser import write_json
-from OTAnalytics.plugin_parser.otvision_parser import (
-    DEFAULT_TRACK_LENGTH_LIMIT,
-    OttrkParser,
-)
-from OTAnalytics.plugin_parser.pandas_parser import PandasDetectionParser
+from OTAnalytics.plugin_parser.otvision_parser import DEFAULT_TRACK_LENGTH_LIMIT
 
 METADATA_SUFFIX = "_metadata.json"
 FEATHER_FILETYPE = ".feather"
@@ -26,22 +26,19 @@ KEY_DETECTION_CLASSES = "detection_classes"
 KEY_VIDEO_METADATA = "video_metadata"
 
 
-def create_track_geometry_factory() -> TRACK_GEOMETRY_FACTORY:
-    """Create a track geometry factory for PandasTrackDataset."""
+def create_track_geometry_factory() -> POLARS_TRACK_GEOMETRY_FACTORY:
+    """Create a track geometry factory for PolarsTrackDataset."""
     return PolarsTrackGeometryDataset.from_track_dataset
 
 
-def create_ottrk_parser() -> OttrkParser:
-    """Create an OttrkParser with the required detection parser."""
-    track_classification_calculator = PandasByMaxConfidence()
-    track_geometry_factory = create_track_geometry_factory()
-
-    detection_parser = PandasDetectionParser(
-        calculator=track_classification_calculator,
-        track_geometry_factory=track_geometry_factory,
+def create_ottrk_parser() -> TrackParser:
+    """Create a parser reading ottrk files chunk by chunk into a
+    PolarsTrackDataset."""
+    return ChunkedOttrkParser(
+        track_geometry_factory=create_track_geometry_factory(),
+        calculator=PolarsByMaxConfidence(),
         track_length_limit=DEFAULT_TRACK_LENGTH_LIMIT,
     )
-    return OttrkParser(detection_parser)
 
 
 def convert_to_pandas_dataset(
@@ -65,12 +62,16 @@ def create_metadata_dict(parse_result: TrackParseResult) -> Dict[str, Any]:
     return metadata
 
 
-def convert_ottrk_to_feather(input_file: Path) -> None:
+def convert_ottrk_to_feather(
+    input_file: Path, feather_file: Path | None = None
+) -> None:
     """
     Convert an ottrk file to Apache Arrow/Feather format with metadata export.
 
     Args:
         input_file: Path to the input ottrk file
+        feather_file: Path to the output feather file. The metadata file is written
+            next to it. Defaults to the input file with feather extension.
     """
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
@@ -78,11 +79,10 @@ def convert_ottrk_to_feather(input_file: Path) -> None:
     if not input_file.suffix.lower() == ".ottrk":
         raise ValueError(f"Input file must have .ottrk extension: {input_file}")
 
-    # Create output file paths using the same stem as input
-    output_stem = input_file.stem
-    output_dir = input_file.parent
-    feather_file = output_dir / f"{output_stem}{FEATHER_FILETYPE}"
-    metadata_file = output_dir / f"{output_stem}{METADATA_SUFFIX}"
+    # Create output file paths using the same stem as input by default
+    if feather_file is None:
+        feather_file = input_file.with_suffix(FEATHER_FILETYPE)
+    metadata_file = feather_file.parent / f"{feather_file.stem}{METADATA_SUFFIX}"
 
     logger().info(f"Reading ottrk file: {input_file}")
 
@@ -92,19 +92,20 @@ def convert_ottrk_to_feather(input_file: Path) -> None:
 
     logger().info(f"Parsed {len(parse_result.tracks)} tracks")
 
-    if isinstance(parse_result.tracks, PandasTrackDataset):
-        pandas_dataset = parse_result.tracks
+    if isinstance(parse_result.tracks, PolarsTrackDataset):
+        polars_dataset = parse_result.tracks
     else:
         raise TypeError(f"Unsupported track dataset type: {type(parse_result.tracks)}")
 
-    # Get the pandas DataFrame
-    df = pandas_dataset.get_data()
-    df = df[sorted(df.columns)]
+    # Get the polars DataFrame
+    df = drop_row_id(polars_dataset.get_data())
+    df = df.select(sorted(df.columns))
     logger().info(f"DataFrame shape: {df.shape}")
 
     # Save DataFrame to feather format
     logger().info(f"Saving DataFrame to: {feather_file}")
-    df.to_feather(feather_file)
+    # Uncompressed files can be memory-mapped without copying the data on load.
+    df.write_ipc(feather_file, compression="uncompressed")
 
     # Create and save metadata
     metadata = create_metadata_dict(parse_result)
@@ -0,0 +1,166 @@
+"""
+Disk backed accumulator of traffic counts.
+
+Counting a stream of track chunks produces counts per chunk which have to be summed
+up until the stream ends. Keeping the sums in memory grows with the number of flows,
+modes and time intervals and loses all counts if the process crashes. The
+accumulator appends the counts of each chunk as Parquet spill file to a directory
+and periodically compacts the spill files into a single aggregated file.
+
+Spill files are numbered. A compacted file contains the sum of all spill files with
+a number lesser or equal to its own number. Thus, an accumulator opened on an
+existing directory continues with the counts written before, even if a previous
+process stopped during compaction.
+"""
+
+import os
+import re
+from pathlib import Path
+
+import polars as pl
+
+from OTAnalytics.application.analysis.traffic_counting import Tag
+
+COUNT = "count"
+SPILL_PREFIX = "part"
+COMPACTED_PREFIX = "compacted"
+SPILL_FILE_ENDING = ".parquet"
+DEFAULT_COMPACTION_THRESHOLD = 16
+"""Number of spill files after which the spill files are compacted."""
+
+_FILE_PATTERN = re.compile(
+    rf"^(?P<prefix>{SPILL_PREFIX}|{COMPACTED_PREFIX})-(?P<number>\d+)"
+    rf"{re.escape(SPILL_FILE_ENDING)}$"
+)
+
+
+class ParquetCountAccumulator:
+    """Sums up counts by their tag in Parquet files of a directory.
+
+    Args:
+        directory (Path): directory to store the spill files in.
+        compaction_threshold (int): number of spill files after which all files
+            are compacted into one.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        compaction_threshold: int = DEFAULT_COMPACTION_THRESHOLD,
+    ) -> None:
+        if compaction_threshold < 1:
+            raise ValueError("compaction_threshold must be greater than zero.")
+        self._directory = directory
+        self._compaction_threshold = compaction_threshold
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def add(self, counts: dict[Tag, int]) -> None:
+        """Append the given counts as new spill file.
+
+        Args:
+            counts (dict[Tag, int]): counts to add.
+        """
+        if not counts:
+            return
+        rows: list[dict] = []
+        for tag, value in counts.items():
+            row: dict = tag.as_dict()
+            row[COUNT] = value
+            rows.append(row)
+        compacted, spills = self._current_files()
+        number = max((number for number, _ in [*compacted, *spills]), default=0) + 1
+        spill_file = self._file_for(SPILL_PREFIX, number)
+        self._write(pl.DataFrame(rows, infer_schema_length=None), spill_file)
+        spills.append((number, spill_file))
+        if len(spills) >= self._compaction_threshold:
+            self._compact(compacted, spills)
+
+    def collect(self) -> list[dict]:
+        """Returns the summed up counts.
+
+        Tags are ordered by their first occurrence.
+
+        Returns:
+            list[dict]: one dict per tag containing the tag levels and the count.
+        """
+        return self._aggregate(self._readable_files()).to_dicts()
+
+    def clear(self) -> None:
+        """Delete all spill files."""
+        if not self._directory.exists():
+            return
+        for file in self._directory.iterdir():
+            if _FILE_PATTERN.match(file.name) or file.name.endswith(".tmp"):
+                file.unlink(missing_ok=True)
+        if not any(self._directory.iterdir()):
+            self._directory.rmdir()
+
+    def _compact(
+        self, compacted: list[tuple[int, Path]], spills: list[tuple[int, Path]]
+    ) -> None:
+        files = [*compacted, *spills]
+        number = max(number for number, _ in files)
+        self._write(
+            self._aggregate([file for _, file in files]),
+            self._file_for(COMPACTED_PREFIX, number),
+        )
+        for _, file in files:
+            file.unlink(missing_ok=True)
+
+    def _readable_files(self) -> list[Path]:
+        compacted, spills = self._current_files()
+        return [file for _, file in [*compacted, *spills]]
+
+    def _current_files(self) -> tuple[list[tuple[int, Path]], list[tuple[int, Path]]]:
+        """Returns the latest compacted file and all spill files written after it.
+
+        Files already contained in the latest compacted file are left overs of an
+        interrupted compaction and are deleted.
+        """
+        compacted: list[tuple[int, Path]] = []
+        spills: list[tuple[int, Path]] = []
+        if not self._directory.exists():
+            return compacted, spills
+        for file in self._directory.iterdir():
+            if match := _FILE_PATTERN.match(file.name):
+                entry = (int(match.group("number")), file)
+                if match.group("prefix") == COMPACTED_PREFIX:
+                    compacted.append(entry)
+                else:
+                    spills.append(entry)
+        compacted.sort()
+        spills.sort()
+        if not compacted:
+            return compacted, spills
+        latest_number, latest = compacted[-1]
+        for number, file in [*compacted[:-1], *spills]:
+            if number <= latest_number:
+                file.unlink(missing_ok=True)
+        return [(latest_number, latest)], [
+            (number, file) for number, file in spills if number > latest_number
+        ]
+
+    @staticmethod
+    def _aggregate(files: list[Path]) -> pl.DataFrame:
+        if not files:
+            return pl.DataFrame()
+        counts = pl.concat(
+            [pl.read_parquet(file) for file in files], how="diagonal_relaxed"
+        )
+        levels = [column for column in counts.columns if column != COUNT]
+        return counts.group_by(levels, maintain_order=True).agg(pl.col(COUNT).sum())
+
+    def _file_for(self, prefix: str, number: int) -> Path:
+        return self._directory / f"{prefix}-{number:08d}{SPILL_FILE_ENDING}"
+
+    def _write(self, counts: pl.DataFrame, file: Path) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        temporary_file = file.with_name(f"{file.name}.tmp")
+        try:
+            counts.write_parquet(temporary_file)
+            os.replace(temporary_file, file)
+        finally:
+            temporary_file.unlink(missing_ok=True)
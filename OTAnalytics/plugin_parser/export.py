@@ -1,4 +1,3 @@
-from collections import defaultdict
 from datetime import timedelta
 from pathlib import Path
 from typing import Iterable
@@ -29,6 +28,11 @@ from OTAnalytics.application.analysis.traffic_counting_specification import (
 )
 from OTAnalytics.application.export_formats.export_mode import ExportMode
 from OTAnalytics.application.logger import logger
+from OTAnalytics.plugin_parser.count_accumulator import (
+    COUNT,
+    DEFAULT_COMPACTION_THRESHOLD,
+    ParquetCountAccumulator,
+)
 
 START_DATE = "start occurrence date"
 START_TIME = "start occurrence time"
@@ -61,9 +65,13 @@ def count_dict_to_dataframe(count_dict: dict[Tag, int]) -> DataFrame:
     indexed: list[dict] = []
     for tag, value in count_dict.items():
         result_dict: dict = tag.as_dict()
-        result_dict["count"] = value
+        result_dict[COUNT] = value
         indexed.append(result_dict)
-    dataframe = DataFrame(indexed)
+    return count_records_to_dataframe(indexed)
+
+
+def count_records_to_dataframe(records: list[dict]) -> DataFrame:
+    dataframe = DataFrame(records)
 
     if dataframe.empty:
         return dataframe
@@ -87,6 +95,12 @@ def count_dict_to_dataframe(count_dict: dict[Tag, int]) -> DataFrame:
     return dataframe
 
 
+def spill_directory_of(output_file: Path) -> Path:
+    """Returns the directory incrementally exported counts of the given output file
+    are collected in."""
+    return output_file.with_name(f".{output_file.name}.counts")
+
+
 class CsvExport(Exporter):
     """
     A counts Exporter exporting to .csv format.
@@ -94,29 +108,47 @@ class CsvExport(Exporter):
 
     Incrementally exporting count data turns this CsvExporter
     into a stateful exporter. Counts are aggregated until ExportMode.FLUSH
-    is provided.
+    is provided. The aggregated counts are kept on disk in a directory next to the
+    output file and are removed after the final write.
+
+    Args:
+        output_file (str): the csv file to write.
+        compaction_threshold (int): number of incremental exports after which the
+            collected counts are compacted.
     """
 
-    def __init__(self, output_file: str) -> None:
+    def __init__(
+        self,
+        output_file: str,
+        compaction_threshold: int = DEFAULT_COMPACTION_THRESHOLD,
+    ) -> None:
         self._output_file = output_file
-        self._counts: dict[Tag, int] = defaultdict(int)
+        self._accumulator = ParquetCountAccumulator(
+            spill_directory_of(Path(output_file)), compaction_threshold
+        )
 
     def export(self, counts: Count, export_mode: ExportMode) -> None:
         logger().info(f"Exporting counts to {self._output_file}")
 
-        for tag, value in counts.to_dict().items():
-            self._counts[tag] += value
+        if export_mode.is_first_write() and export_mode.is_final_write():
+            self.__write(count_dict_to_dataframe(counts.to_dict()))
+            return
+
+        if export_mode.is_first_write():
+            self._accumulator.clear()
+        self._accumulator.add(counts.to_dict())
 
         if export_mode.is_final_write():
-            dataframe = count_dict_to_dataframe(self._counts)
-            if dataframe.empty:
-                logger().info("Nothing to count.")
-                return
+            self.__write(count_records_to_dataframe(self._accumulator.collect()))
+            self._accumulator.clear()
 
-            dataframe.to_csv(self.__create_path(), index=False)
-            logger().info(f"Counts saved at {self._output_file}")
+    def __write(self, dataframe: DataFrame) -> None:
+        if dataframe.empty:
+            logger().info("Nothing to count.")
+            return
 
-            self._counts.clear()
+        dataframe.to_csv(self.__create_path(), index=False)
+        logger().info(f"Counts saved at {self._output_file}")
 
     def __create_path(self) -> Path:
         fixed_file_ending = (
@@ -204,6 +236,11 @@ class FillZerosExporter(Exporter):
         self._tag_exploder = tag_exploder
 
     def export(self, counts: Count, export_mode: ExportMode) -> None:
+        if not export_mode.is_final_write():
+            # The tags of the final write cover all previous writes, because the
+            # end of the counting only grows.
+            self._other.export(counts, export_mode)
+            return
         tags = self._tag_exploder.explode()
         self._other.export(FillEmptyCount(counts, tags), export_mode)
 
@@ -287,10 +324,11 @@ class CachedExporterFactory(ExporterFactory):
         key_exists = key in self._cache.keys()
 
         exporter: Exporter
-        if export_mode.is_first_write():
+        if export_mode.is_first_write() or export_mode.is_resumed_write():
             if key_exists:
                 raise CacheException(
-                    "Exporter already exists for format+file upon first write!"
+                    "Exporter already exists for format+file upon first"
+                    + " or resumed write!"
                     + " Maybe previous export was not finished or cache was not"
                     + "cleared properly.",
                     count_specification.output_format,
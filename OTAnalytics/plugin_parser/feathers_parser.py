@@ -5,6 +5,7 @@ This module provides a TrackParser implementation that reads track data from
 feather files and their accompanying metadata JSON files to create TrackParseResult.
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional
@@ -18,11 +19,13 @@ from OTAnalytics.application.datastore import (
     TracksParseResult,
 )
 from OTAnalytics.application.logger import logger
+from OTAnalytics.domain import track
 from OTAnalytics.domain.video import VideoMetadata
 from OTAnalytics.plugin_datastore.polars_track_store import (
     POLARS_TRACK_GEOMETRY_FACTORY,
     PolarsByMaxConfidence,
     PolarsTrackDataset,
+    drop_row_id,
 )
 from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store import (
     PolarsTrackGeometryDataset,
@@ -33,37 +36,48 @@ from OTAnalytics.plugin_parser.convert_ottrk_to_feathers import (
     KEY_DETECTION_METADATA,
     KEY_VIDEO_METADATA,
     METADATA_SUFFIX,
-    convert_ottrk_to_feather,
+    create_ottrk_parser,
 )
 from OTAnalytics.plugin_parser.json_parser import parse_json
+from OTAnalytics.plugin_parser.track_parse_cache import TrackParseCache
 
+OTTRK_FILETYPE = ".ottrk"
 
-def use_feathers_files(files: list[Path]) -> list[Path]:
-    raised_exceptions: list[Exception] = []
-    result = []
-    for file in files:
-        try:
-            result.append(use_feather_file(file))
-        except Exception as cause:
-            raised_exceptions.append(cause)
-    if raised_exceptions:
-        raise ExceptionGroup(
-            "Errors occurred while loading the track files:", raised_exceptions
-        )
-    return result
 
+@dataclass(frozen=True)
+class ScanFilter:
+    """Filter pushed down into the scan of feather files.
 
-def use_feather_file(file: Path) -> Path:
-    if not file.suffix.lower() == FEATHER_FILETYPE:
-        if file.suffix.lower() == ".ottrk":
-            if not file.with_suffix(FEATHER_FILETYPE).exists():
-                convert_ottrk_to_feather(file)
-            return file.with_suffix(FEATHER_FILETYPE)
-        else:
-            raise ValueError(
-                f"Input file must have {FEATHER_FILETYPE} or .ottrk extension: {file}"
+    Tracks are removed before they are loaded into memory if they can not pass the
+    class filter of the track repository. The track classification is calculated
+    after loading. Thus, the filter only removes tracks without any detection of the
+    included classes or with only detections of the excluded classes. The exact
+    filtering by track classification is still applied by the track repository.
+
+    Classes in `include_classes` are always kept. `exclude_classes` is not used if
+    `include_classes` is not empty.
+    """
+
+    include_classes: frozenset[str] = frozenset()
+    exclude_classes: frozenset[str] = frozenset()
+
+    def apply(self, detections: pl.LazyFrame) -> pl.LazyFrame:
+        if self.include_classes:
+            return detections.filter(
+                pl.col(track.CLASSIFICATION)
+                .is_in(list(self.include_classes))
+                .any()
+                .over(track.TRACK_ID)
+            )
+        if self.exclude_classes:
+            return detections.filter(
+                pl.col(track.CLASSIFICATION)
+                .is_in(list(self.exclude_classes))
+                .not_()
+                .any()
+                .over(track.TRACK_ID)
             )
-    return file
+        return detections
 
 
 class FeathersParser(TrackParser):
@@ -76,21 +90,35 @@ class FeathersParser(TrackParser):
 
     For example, if the input file is "data.feather", the parser will also
     look for "data_metadata.json" in the same directory.
+
+    Ottrk files are read from the given track parse cache. Without cache, ottrk files
+    are parsed directly.
+
+    Feather files are scanned lazily and memory-mapped. The scan filter is pushed
+    down into the scan and files are concatenated without rechunking. Thus, only the
+    remaining tracks are materialized.
     """
 
     def __init__(
         self,
         track_geometry_factory: Optional[POLARS_TRACK_GEOMETRY_FACTORY] = None,
+        track_parse_cache: Optional[TrackParseCache] = None,
+        scan_filter: ScanFilter = ScanFilter(),
     ) -> None:
         """
         Initialize the FeathersParser.
 
         Args: track_geometry_factory: Factory for creating track geometry datasets.
             If None, uses PandasTrackGeometryDataset.from_track_dataset.
+            track_parse_cache: Cache to read parsed ottrk files from. If None,
+            ottrk files are parsed on every load.
+            scan_filter: Filter applied while scanning the track files.
         """
         if track_geometry_factory is None:
             track_geometry_factory = PolarsTrackGeometryDataset.from_track_dataset
         self._track_geometry_factory = track_geometry_factory
+        self._track_parse_cache = track_parse_cache
+        self._scan_filter = scan_filter
 
     def parse_files(self, files: list[Path]) -> TracksParseResult:
         """
@@ -107,43 +135,39 @@ class FeathersParser(TrackParser):
             ValueError: If the file extension is not .feather
         """
         logger().info(f"Parsing {len(files)} track files...")
-        files_to_process = use_feathers_files(files)
         videos_metadata = []
         detections_metadata = []
         data_frames = []
-        for file in files_to_process:
-            if not file.exists():
-                raise FileNotFoundError(f"Feather file not found: {file}")
-            # Construct metadata file path
-            metadata_file = file.parent / f"{file.stem}{METADATA_SUFFIX}"
-            if not metadata_file.exists():
-                raise FileNotFoundError(f"Metadata file not found: {metadata_file}")
-
-            # Read the feather file
-            df = pl.read_ipc(file)
+        raised_exceptions: list[Exception] = []
+        for file in files:
+            try:
+                df, detection_metadata, video_metadata = self._scan(file)
+            except Exception as cause:
+                raised_exceptions.append(cause)
+                continue
             data_frames.append(df)
-
-            # Read the metadata
-            metadata = parse_json(metadata_file)
-
-            # Parse video metadata
-            video_metadata = self._parse_video_metadata(metadata["video_metadata"])
             videos_metadata.append(video_metadata)
-
-            # Parse detection metadata
-            detection_metadata = self._parse_detection_metadata(
-                metadata["detection_metadata"]
-            )
             detections_metadata.append(detection_metadata)
-        logger().info(f"{len(files)} track files parsed.")
+        if raised_exceptions:
+            raise ExceptionGroup(
+                "Errors occurred while loading the track files:", raised_exceptions
+            )
 
-        columns = data_frames[0].columns
-        data_frames = [df.select(columns) for df in data_frames]
-        df = pl.concat(data_frames)
+        # Feather files converted by older versions may contain additional columns
+        schemas = [df.collect_schema().names() for df in data_frames]
+        columns = [
+            column
+            for column in schemas[0]
+            if all(column in schema for schema in schemas)
+        ]
+        detections = self._collect(
+            pl.concat([df.select(columns) for df in data_frames], rechunk=False)
+        )
+        logger().info(f"{len(files)} track files parsed.")
         # Create TrackDataset from DataFrame
         calculator = PolarsByMaxConfidence()
         tracks = PolarsTrackDataset.from_dataframe(
-            df, self._track_geometry_factory, calculator=calculator
+            detections, self._track_geometry_factory, calculator=calculator
         )
         logger().info("TrackDataset created.")
         return TracksParseResult(tracks, detections_metadata, videos_metadata)
@@ -162,8 +186,57 @@ class FeathersParser(TrackParser):
             FileNotFoundError: If the feather file or metadata file is not found
             ValueError: If the file extension is not .feather
         """
-        file = use_feather_file(file)
+        df, detection_metadata, video_metadata = self._scan(file)
 
+        # Create TrackDataset from DataFrame
+        calculator = PolarsByMaxConfidence()
+        tracks = PolarsTrackDataset.from_dataframe(
+            self._collect(df), self._track_geometry_factory, calculator=calculator
+        )
+        return TrackParseResult(tracks, detection_metadata, video_metadata)
+
+    def _collect(self, detections: pl.LazyFrame) -> pl.DataFrame:
+        return self._scan_filter.apply(detections).collect()
+
+    def _scan(
+        self, file: Path
+    ) -> tuple[pl.LazyFrame, DetectionMetadata, VideoMetadata]:
+        suffix = file.suffix.lower()
+        if suffix == OTTRK_FILETYPE:
+            if self._track_parse_cache is None:
+                return self._parse_ottrk(file)
+            return self._track_parse_cache.read(file, self._read_feather)
+        if suffix != FEATHER_FILETYPE:
+            raise ValueError(
+                f"Input file must have {FEATHER_FILETYPE} or .ottrk extension: {file}"
+            )
+        return self._scan_feather(file)
+
+    def _parse_ottrk(
+        self, file: Path
+    ) -> tuple[pl.LazyFrame, DetectionMetadata, VideoMetadata]:
+        parse_result = create_ottrk_parser().parse(file)
+        if not isinstance(parse_result.tracks, PolarsTrackDataset):
+            raise TypeError(
+                f"Unsupported track dataset type: {type(parse_result.tracks)}"
+            )
+        return (
+            drop_row_id(parse_result.tracks.get_data()).lazy(),
+            parse_result.detection_metadata,
+            parse_result.video_metadata,
+        )
+
+    def _read_feather(
+        self, file: Path
+    ) -> tuple[pl.LazyFrame, DetectionMetadata, VideoMetadata]:
+        """Read a cached feather file eagerly. Cached entries might be evicted by
+        other processes, so the file must not be scanned later on."""
+        df, detection_metadata, video_metadata = self._scan_feather(file)
+        return df.collect().lazy(), detection_metadata, video_metadata
+
+    def _scan_feather(
+        self, file: Path
+    ) -> tuple[pl.LazyFrame, DetectionMetadata, VideoMetadata]:
         if not file.exists():
             raise FileNotFoundError(f"Feather file not found: {file}")
         # Construct metadata file path
@@ -171,18 +244,12 @@ class FeathersParser(TrackParser):
         if not metadata_file.exists():
             raise FileNotFoundError(f"Metadata file not found: {metadata_file}")
 
-        # Read the feather file
-        df = pl.read_ipc(file)
+        # Scan the feather file, data is read from the memory-mapped file on collect
+        df = pl.scan_ipc(file, memory_map=True)
 
         # Read the metadata
         metadata = parse_json(metadata_file)
 
-        # Create TrackDataset from DataFrame
-        calculator = PolarsByMaxConfidence()
-        tracks = PolarsTrackDataset.from_dataframe(
-            df, self._track_geometry_factory, calculator=calculator
-        )
-
         # Parse video metadata
         video_metadata = self._parse_video_metadata(metadata[KEY_VIDEO_METADATA])
 
@@ -190,8 +257,7 @@ class FeathersParser(TrackParser):
         detection_metadata = self._parse_detection_metadata(
             metadata[KEY_DETECTION_METADATA]
         )
-
-        return TrackParseResult(tracks, detection_metadata, video_metadata)
+        return df, detection_metadata, video_metadata
 
     def _parse_video_metadata(self, metadata: dict) -> VideoMetadata:
         """
@@ -1,6 +1,8 @@
 import bz2
 from pathlib import Path
+from typing import Iterable
 
+import ijson
 import ujson
 
 ENCODING: str = "UTF-8"
@@ -68,3 +70,27 @@ def write_json(data: dict, path: Path) -> None:
     """
     with open(path, "wt", encoding=ENCODING) as file:
         ujson.dump(data, file, indent=4)
+
+
+def parse_json_bz2_events(
+    path: Path, use_float: bool = False
+) -> Iterable[tuple[str, str, str]]:
+    """
+    Provide lazy data stream reading the bzip2 compressed file
+    at the given path and interpreting it as json objects.
+    Numbers are provided as Decimal unless use_float is set.
+    """
+    with bz2.BZ2File(path) as stream:
+        yield from ijson.parse(stream, use_float=use_float)
+
+
+def metadata_from_json_events(parse_events: Iterable[tuple[str, str, str]]) -> dict:
+    """
+    Extract the metadata block of the ottrk data format
+    from the given json parser event stream.
+    """
+    result: dict
+    for data in ijson.items(parse_events, "metadata"):
+        result = data
+        break
+    return result
@@ -0,0 +1,131 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+from itertools import repeat
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Iterator, Sequence
+
+import polars as pl
+
+from OTAnalytics.application.config import DEFAULT_NUM_PROCESSES
+from OTAnalytics.application.datastore import (
+    DetectionMetadata,
+    TrackParser,
+    TrackParseResult,
+)
+from OTAnalytics.application.logger import logger
+from OTAnalytics.domain.track_dataset.track_dataset import TrackDataset
+from OTAnalytics.domain.video import VideoMetadata
+from OTAnalytics.plugin_datastore.polars_track_store import (
+    POLARS_TRACK_GEOMETRY_FACTORY,
+    PolarsByMaxConfidence,
+    PolarsDataFrameProvider,
+    PolarsTrackClassificationCalculator,
+    PolarsTrackDataset,
+)
+
+START_METHOD = "spawn"
+
+
+@dataclass(frozen=True)
+class IpcTrackParseResult:
+    """Result of parsing a track file in a worker process.
+
+    The tracks are serialized as Arrow IPC buffer to avoid pickling python objects
+    when sending them back to the main process.
+    """
+
+    tracks: bytes
+    detection_metadata: DetectionMetadata
+    video_metadata: VideoMetadata
+
+
+def serialize_tracks(tracks: TrackDataset) -> bytes:
+    if not isinstance(tracks, PolarsDataFrameProvider):
+        raise TypeError(f"Unsupported track dataset type: {type(tracks)}")
+    buffer = BytesIO()
+    tracks.get_data().write_ipc(buffer)
+    return buffer.getvalue()
+
+
+def parse_as_ipc(track_parser: TrackParser, file: Path) -> IpcTrackParseResult:
+    """Parse the given file and serialize the parsed tracks as Arrow IPC.
+
+    Runs inside the worker processes and must therefore be defined on module level.
+    """
+    result = track_parser.parse(file)
+    return IpcTrackParseResult(
+        tracks=serialize_tracks(result.tracks),
+        detection_metadata=result.detection_metadata,
+        video_metadata=result.video_metadata,
+    )
+
+
+class MultiprocessingTrackParser(TrackParser):
+    """Parses multiple track files in parallel if num_processes is greater than 1.
+    Otherwise, parses sequentially.
+
+    Each file is parsed by the given track parser inside a worker process. Parsed
+    tracks are sent back as Arrow IPC buffers and restored into
+    `PolarsTrackDataset`s. Results are provided in the order of the given files.
+
+    Args:
+        track_parser (TrackParser): parser used per file. Must create
+            `PolarsTrackDataset`s and be picklable.
+        track_geometry_factory (POLARS_TRACK_GEOMETRY_FACTORY): factory of the
+            restored track datasets.
+        calculator (PolarsTrackClassificationCalculator): classification calculator
+            of the restored track datasets.
+        num_processes (int): number of worker processes.
+    """
+
+    def __init__(
+        self,
+        track_parser: TrackParser,
+        track_geometry_factory: POLARS_TRACK_GEOMETRY_FACTORY,
+        calculator: PolarsTrackClassificationCalculator = PolarsByMaxConfidence(),
+        num_processes: int = DEFAULT_NUM_PROCESSES,
+    ) -> None:
+        self._validate_num_processes(num_processes)
+        self._track_parser = track_parser
+        self._track_geometry_factory = track_geometry_factory
+        self._calculator = calculator
+        self._num_processes = num_processes
+
+    @property
+    def num_processes(self) -> int:
+        return self._num_processes
+
+    def _validate_num_processes(self, value: int) -> None:
+        if value < 1:
+            raise ValueError("Number of processes must be greater than zero.")
+
+    def parse(self, file: Path) -> TrackParseResult:
+        return self._track_parser.parse(file)
+
+    def parse_each(self, files: Sequence[Path]) -> Iterator[TrackParseResult]:
+        number_of_workers = min(self._num_processes, len(files))
+        if number_of_workers <= 1:
+            yield from self._track_parser.parse_each(files)
+            return
+
+        logger().debug(
+            f"Start parsing track files in parallel with {number_of_workers} "
+            "processes."
+        )
+        with ProcessPoolExecutor(
+            max_workers=number_of_workers, mp_context=get_context(START_METHOD)
+        ) as executor:
+            for result in executor.map(parse_as_ipc, repeat(self._track_parser), files):
+                yield self._deserialize(result)
+
+    def _deserialize(self, result: IpcTrackParseResult) -> TrackParseResult:
+        tracks = PolarsTrackDataset(
+            self._track_geometry_factory,
+            pl.read_ipc(BytesIO(result.tracks)),
+            calculator=self._calculator,
+        )
+        return TrackParseResult(
+            tracks, result.detection_metadata, result.video_metadata
+        )
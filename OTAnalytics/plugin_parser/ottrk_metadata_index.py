@@ -0,0 +1,164 @@
+"""
+Persistent index of ottrk metadata.
+
+Reading the metadata block of an ottrk file requires decompressing the start of the
+bz2 compressed file. On network shares with many files this is slow, e.g. when
+sorting the files by their recorded start date. The index stores the format fixed
+metadata block of each ottrk file in a JSON file. Entries are invalidated if the
+size or modification time of the ottrk file changes.
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+from uuid import uuid4
+
+import ujson
+
+from OTAnalytics.application.logger import logger
+from OTAnalytics.plugin_parser import ottrk_dataformat
+from OTAnalytics.plugin_parser.json_parser import (
+    ENCODING,
+    metadata_from_json_events,
+    parse_json_bz2_events,
+)
+from OTAnalytics.plugin_parser.otvision_parser import OttrkFormatFixer
+
+METADATA_INDEX_FILE = "ottrk_metadata_index.json"
+METADATA_INDEX_VERSION = "1"
+"""Version of the index file. Increase if the stored metadata changes."""
+
+KEY_VERSION = "version"
+KEY_ENTRIES = "entries"
+KEY_SIZE = "size"
+KEY_MODIFIED = "modified_ns"
+KEY_METADATA = "metadata"
+
+MetadataReader = Callable[[Path], dict]
+
+
+def read_ottrk_metadata(ottrk_file: Path) -> dict:
+    """Read only the metadata block of the given bz2 compressed ottrk file."""
+    return metadata_from_json_events(parse_json_bz2_events(ottrk_file, use_float=True))
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    size: int
+    modified_ns: int
+    metadata: dict
+
+    def is_valid_for(self, stat: os.stat_result) -> bool:
+        return self.size == stat.st_size and self.modified_ns == stat.st_mtime_ns
+
+    def to_dict(self) -> dict:
+        return {
+            KEY_SIZE: self.size,
+            KEY_MODIFIED: self.modified_ns,
+            KEY_METADATA: self.metadata,
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "IndexEntry":
+        return IndexEntry(
+            size=data[KEY_SIZE],
+            modified_ns=data[KEY_MODIFIED],
+            metadata=data[KEY_METADATA],
+        )
+
+
+class OttrkMetadataIndex:
+    """Index of the format fixed metadata of ottrk files.
+
+    Args:
+        index_file (Path | None): JSON file to persist the index in. The index is
+            only kept in memory if no file is given.
+        format_fixer (OttrkFormatFixer): fixes the metadata of older ottrk versions.
+        reader (MetadataReader): reads the metadata block of an ottrk file.
+    """
+
+    def __init__(
+        self,
+        index_file: Path | None = None,
+        format_fixer: OttrkFormatFixer = OttrkFormatFixer(),
+        reader: MetadataReader = read_ottrk_metadata,
+    ) -> None:
+        self._index_file = index_file
+        self._format_fixer = format_fixer
+        self._reader = reader
+        self._entries: dict[str, IndexEntry] | None = None
+        self._changed = False
+
+    def get(self, ottrk_file: Path) -> dict:
+        """Returns the format fixed metadata of the given ottrk file.
+
+        The metadata is read from the ottrk file if it is not indexed yet or if the
+        file changed since it was indexed.
+
+        Args:
+            ottrk_file (Path): the ottrk file to get the metadata for.
+
+        Returns:
+            dict: the metadata block of the ottrk file.
+        """
+        entries = self._load()
+        key = str(ottrk_file.resolve())
+        stat = ottrk_file.stat()
+        if (entry := entries.get(key)) is not None and entry.is_valid_for(stat):
+            return entry.metadata
+
+        metadata = self._format_fixer.fix_metadata(self._reader(ottrk_file))
+        entries[key] = IndexEntry(stat.st_size, stat.st_mtime_ns, metadata)
+        self._changed = True
+        return metadata
+
+    def recorded_start_date(self, ottrk_file: Path) -> float:
+        """Returns the recorded start date of the given ottrk file as timestamp."""
+        metadata = self.get(ottrk_file)
+        return float(
+            metadata[ottrk_dataformat.VIDEO][ottrk_dataformat.RECORDED_START_DATE]
+        )
+
+    def save(self) -> None:
+        """Persist new or updated entries in the index file."""
+        if self._index_file is None or self._entries is None or not self._changed:
+            return
+        content = {
+            KEY_VERSION: METADATA_INDEX_VERSION,
+            KEY_ENTRIES: {key: entry.to_dict() for key, entry in self._entries.items()},
+        }
+        temporary_file = self._index_file.with_name(f"{uuid4().hex}.tmp")
+        try:
+            self._index_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(temporary_file, "wt", encoding=ENCODING) as file:
+                ujson.dump(content, file)
+            os.replace(temporary_file, self._index_file)
+            self._changed = False
+        except OSError as cause:
+            logger().warning(f"Could not save ottrk metadata index: {cause}")
+        finally:
+            temporary_file.unlink(missing_ok=True)
+
+    def _load(self) -> dict[str, IndexEntry]:
+        if self._entries is None:
+            self._entries = self._read_index_file()
+        return self._entries
+
+    def _read_index_file(self) -> dict[str, IndexEntry]:
+        if self._index_file is None or not self._index_file.exists():
+            return {}
+        try:
+            with open(self._index_file, "rt", encoding=ENCODING) as file:
+                content: dict[str, Any] = ujson.load(file)
+            if content.get(KEY_VERSION) != METADATA_INDEX_VERSION:
+                return {}
+            return {
+                key: IndexEntry.from_dict(entry)
+                for key, entry in content[KEY_ENTRIES].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as cause:
+            logger().warning(
+                f"Ignore invalid ottrk metadata index {self._index_file}: {cause}"
+            )
+            return {}
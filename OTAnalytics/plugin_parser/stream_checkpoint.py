@@ -0,0 +1,195 @@
+"""
+Checkpoints of the stream CLI.
+
+The stream CLI exports the results of each chunk of tracks before it continues with
+the next chunk. A checkpoint is saved after each exported chunk. It contains the
+position of the track stream, i.e. the processed ottrk files and the unfinished
+tracks carried over to the next file, and the state of the exported files:
+
+- Files the results are appended to are truncated to their size at the checkpoint.
+- Directories collecting results, e.g. incrementally exported counts, are restored
+  from a snapshot. The snapshot hard links the immutable files of the directory.
+
+Thus, a run can be continued after the last exported chunk if it was interrupted.
+"""
+
+import os
+import pickle
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import uuid4
+
+from OTAnalytics.application.logger import logger
+from OTAnalytics.plugin_parser.streaming_parser import StreamPosition
+
+CHECKPOINT_VERSION = "2"
+"""Version of the checkpoint file. Increase if the stored state changes."""
+
+CHECKPOINT_SUFFIX = ".checkpoint"
+SNAPSHOT_SUFFIX = ".checkpoint_snapshots"
+
+
+class CheckpointError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class StreamCheckpoint:
+    """State of a stream CLI run after a chunk has been exported.
+
+    Attributes:
+        run_key (str): identifies the configuration of the run. A checkpoint is only
+            used by runs with the same configuration.
+        position (StreamPosition): position of the track stream.
+        file_sizes (dict[Path, int]): sizes of the files results are appended to.
+        snapshots (dict[Path, str | None]): names of the snapshots of directories
+            collecting results. None if the directory did not exist.
+    """
+
+    run_key: str
+    position: StreamPosition
+    file_sizes: dict[Path, int]
+    snapshots: dict[Path, str | None]
+
+
+class StreamCheckpointStore:
+    """Saves and restores checkpoints of the stream CLI.
+
+    Args:
+        checkpoint_file (Path): file to store the checkpoint in. Snapshots are
+            stored in a directory next to it.
+    """
+
+    def __init__(self, checkpoint_file: Path) -> None:
+        self._checkpoint_file = checkpoint_file
+        self._snapshot_directory = checkpoint_file.with_suffix(SNAPSHOT_SUFFIX)
+
+    def save(
+        self,
+        run_key: str,
+        position: StreamPosition,
+        appended_files: list[Path],
+        directories: list[Path],
+    ) -> None:
+        """Save a checkpoint replacing the previous one.
+
+        The checkpoint file is replaced last. Thus, the previous checkpoint stays
+        valid until the new one is complete.
+
+        Args:
+            run_key (str): identifies the configuration of the run.
+            position (StreamPosition): position of the track stream.
+            appended_files (list[Path]): files results are appended to. Missing
+                files are ignored.
+            directories (list[Path]): directories collecting results.
+        """
+        snapshots = {
+            directory: self._snapshot(directory) if directory.is_dir() else None
+            for directory in directories
+        }
+        checkpoint = StreamCheckpoint(
+            run_key=run_key,
+            position=position,
+            file_sizes={
+                file: file.stat().st_size for file in appended_files if file.exists()
+            },
+            snapshots=snapshots,
+        )
+        temporary_file = self._checkpoint_file.with_name(f"{uuid4().hex}.tmp")
+        try:
+            with open(temporary_file, "wb") as stream:
+                pickle.dump((CHECKPOINT_VERSION, checkpoint), stream)
+            os.replace(temporary_file, self._checkpoint_file)
+        finally:
+            temporary_file.unlink(missing_ok=True)
+        self._delete_snapshots(
+            keep={snapshot for snapshot in snapshots.values() if snapshot}
+        )
+
+    def load(self, run_key: str) -> StreamCheckpoint | None:
+        """Load the checkpoint of a run with the given configuration.
+
+        Args:
+            run_key (str): identifies the configuration of the run.
+
+        Returns:
+            StreamCheckpoint | None: the checkpoint or None if there is no valid
+                checkpoint for the given configuration.
+        """
+        if not self._checkpoint_file.exists():
+            return None
+        try:
+            with open(self._checkpoint_file, "rb") as stream:
+                version, checkpoint = pickle.load(stream)
+        except Exception as cause:
+            logger().warning(
+                f"Ignore invalid checkpoint {self._checkpoint_file}: {cause}"
+            )
+            return None
+        if version != CHECKPOINT_VERSION:
+            logger().warning(
+                f"Ignore checkpoint {self._checkpoint_file} of version {version}."
+            )
+            return None
+        if checkpoint.run_key != run_key:
+            logger().warning(
+                f"Ignore checkpoint {self._checkpoint_file} of a run with a "
+                "different configuration."
+            )
+            return None
+        return checkpoint
+
+    def restore(self, checkpoint: StreamCheckpoint) -> None:
+        """Reset the exported files to their state at the given checkpoint.
+
+        Args:
+            checkpoint (StreamCheckpoint): the checkpoint to restore.
+
+        Raises:
+            CheckpointError: if an exported file is missing or shorter than at the
+                checkpoint.
+        """
+        for file, size in checkpoint.file_sizes.items():
+            if not file.exists() or file.stat().st_size < size:
+                raise CheckpointError(
+                    f"Exported file {file} changed since the checkpoint was saved."
+                )
+        for file, size in checkpoint.file_sizes.items():
+            os.truncate(file, size)
+        for directory, snapshot in checkpoint.snapshots.items():
+            shutil.rmtree(directory, ignore_errors=True)
+            if snapshot is not None:
+                self._link_files(self._snapshot_directory / snapshot, directory)
+
+    def delete(self) -> None:
+        """Delete the checkpoint and its snapshots."""
+        self._checkpoint_file.unlink(missing_ok=True)
+        shutil.rmtree(self._snapshot_directory, ignore_errors=True)
+
+    def _snapshot(self, directory: Path) -> str:
+        name = uuid4().hex
+        self._link_files(directory, self._snapshot_directory / name)
+        return name
+
+    def _delete_snapshots(self, keep: set[str]) -> None:
+        if not self._snapshot_directory.exists():
+            return
+        for snapshot in self._snapshot_directory.iterdir():
+            if snapshot.name not in keep:
+                shutil.rmtree(snapshot, ignore_errors=True)
+
+    @staticmethod
+    def _link_files(source: Path, target: Path) -> None:
+        """Hard link the files of the source directory into the target directory.
+
+        Files are copied if the file system does not support hard links.
+        """
+        target.mkdir(parents=True, exist_ok=True)
+        for file in source.iterdir():
+            if not file.is_file():
+                continue
+            try:
+                os.link(file, target / file.name)
+            except OSError:
+                shutil.copy2(file, target / file.name)
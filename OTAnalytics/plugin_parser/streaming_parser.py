@@ -1,5 +1,10 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import AsyncIterator
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import AsyncIterator, Iterable
 
 from tqdm.asyncio import tqdm
 
@@ -8,6 +13,7 @@ from OTAnalytics.application.datastore import (
     TrackParser,
     VideoMetadata,
 )
+from OTAnalytics.application.logger import logger
 from OTAnalytics.application.state import TracksMetadata, VideosMetadata
 from OTAnalytics.application.track_input_source import OttrkFileInputSource
 from OTAnalytics.domain.progress import LazyProgressbarBuilder
@@ -15,6 +21,31 @@ from OTAnalytics.domain.track_dataset.track_dataset import TrackDataset
 from OTAnalytics.plugin_progress.lazy_tqdm_progressbar import LazyTqdmBuilder
 
 
+@dataclass(frozen=True)
+class StreamPosition:
+    """Position of a track stream after a dataset has been provided.
+
+    Attributes:
+        processed_files (tuple[Path, ...]): resolved paths of the track files whose
+            tracks are contained in the provided datasets, in the pending windows or
+            in the remaining tracks.
+        remaining_tracks (TrackDataset | None): unfinished tracks and tracks of
+            incomplete windows carried over to the next file.
+        video_metadata (tuple[VideoMetadata, ...]): metadata of the videos of the
+            processed files.
+        detection_classes (frozenset[str]): detection classes of the processed
+            files.
+        pending_windows (tuple[TrackDataset, ...]): tracks of complete windows not
+            provided yet.
+    """
+
+    processed_files: tuple[Path, ...] = ()
+    remaining_tracks: TrackDataset | None = None
+    video_metadata: tuple[VideoMetadata, ...] = ()
+    detection_classes: frozenset[str] = frozenset()
+    pending_windows: tuple[TrackDataset, ...] = ()
+
+
 class StreamTrackParser(ABC):
     @abstractmethod
     def parse(self, input_source: OttrkFileInputSource) -> AsyncIterator[TrackDataset]:
@@ -24,6 +55,17 @@ class StreamTrackParser(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def parse_from(
+        self, input_source: OttrkFileInputSource, position: StreamPosition | None
+    ) -> AsyncIterator[tuple[TrackDataset, StreamPosition]]:
+        """
+        Parse multiple track files continuing after the given position. Each
+        dataset is provided together with the position of the stream after it.
+        Thus, a stream can be continued from any provided dataset.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def register_tracks_metadata(self, tracks_metadata: TracksMetadata) -> None:
         """Register TracksMetadata to be updated when a new ottrk file is parsed."""
@@ -43,6 +85,14 @@ class StreamOttrkParser(StreamTrackParser):
     Allows to register TracksMetadata and VideosMetadata objects to be updated
     with new metadata every time a new ottrk file is parsed.
 
+    If a window is given, the finished tracks are split by the time window their
+    last detection falls into. Windows are aligned to multiples of the window length.
+    A dataset is provided per window as soon as the window is complete, i.e. no
+    track of a later file can end in it anymore. Tracks of incomplete windows are
+    carried over to the next file together with the unfinished tracks. Thus, windows
+    span files and the tracks analysed at once span at most one window plus the
+    duration of the tracks ending in it.
+
     Args:
         track_parser (TrackParser): a track parser used per file.
         registered_tracks_metadata (list[TracksMetadata], optional):
@@ -54,6 +104,9 @@ class StreamOttrkParser(StreamTrackParser):
         progressbar (LazyProgressbarBuilder, optional):
             a progressbar builder to show progress of processed files.
             Defaults to LazyTqdmProgressbarBuilder().
+        window (timedelta | None, optional): time span of the windows the
+            provided datasets are split into. Defaults to None: provide one dataset
+            per file.
     """
 
     def __init__(
@@ -62,7 +115,10 @@ class StreamOttrkParser(StreamTrackParser):
         registered_tracks_metadata: list[TracksMetadata] = [],
         registered_videos_metadata: list[VideosMetadata] = [],
         progressbar: LazyProgressbarBuilder = LazyTqdmBuilder(),
+        window: timedelta | None = None,
     ) -> None:
+        if window is not None and window <= timedelta(0):
+            raise ValueError("Stream window must be greater than zero.")
         self._track_parser = track_parser
         self._registered_tracks_metadata: set[TracksMetadata] = set(
             registered_tracks_metadata
@@ -71,6 +127,7 @@ class StreamOttrkParser(StreamTrackParser):
             registered_videos_metadata
         )
         self._progressbar = progressbar
+        self._window = window
 
     def register_tracks_metadata(self, tracks_metadata: TracksMetadata) -> None:
         """Register TracksMetadata to be updated when a new ottrk file is parsed."""
@@ -97,26 +154,130 @@ class StreamOttrkParser(StreamTrackParser):
     async def parse(
         self, input_source: OttrkFileInputSource
     ) -> AsyncIterator[TrackDataset]:
-        async for track_dataset in self._parse_tracks(input_source):
+        async for track_dataset, _ in self._parse_tracks(input_source, None):
             yield track_dataset
 
+    async def parse_from(
+        self, input_source: OttrkFileInputSource, position: StreamPosition | None
+    ) -> AsyncIterator[tuple[TrackDataset, StreamPosition]]:
+        async for track_dataset, next_position in self._parse_tracks(
+            input_source, position
+        ):
+            yield track_dataset, next_position
+
     async def _parse_tracks(
-        self, input_source: OttrkFileInputSource
-    ) -> AsyncIterator[TrackDataset]:
-        remaining_tracks: TrackDataset | None = None
+        self, input_source: OttrkFileInputSource, position: StreamPosition | None
+    ) -> AsyncIterator[tuple[TrackDataset, StreamPosition]]:
+        if position is None:
+            position = StreamPosition()
+        self._restore_metadata(position)
+        processed_files = list(position.processed_files)
+        video_metadata = list(position.video_metadata)
+        detection_classes = position.detection_classes
+        remaining_tracks: TrackDataset | None = _combine_all(
+            [*position.pending_windows, position.remaining_tracks]
+        )
         async for ottrk_file in tqdm(
             input_source.produce(), unit="files", desc="Processed ottrk files: "
         ):
-            parse_result = self._track_parser.parse(ottrk_file)
+            resolved_file = ottrk_file.resolve()
+            if resolved_file in position.processed_files:
+                logger().info(f"Skip already processed ottrk file {ottrk_file}")
+                continue
+            parse_result = await asyncio.to_thread(self._track_parser.parse, ottrk_file)
             self._update_registered_metadata_collections(
                 parse_result.detection_metadata, parse_result.video_metadata
             )
+            processed_files.append(resolved_file)
+            video_metadata.append(parse_result.video_metadata)
+            detection_classes = detection_classes.union(
+                parse_result.detection_metadata.detection_classes
+            )
             combined_tracks = parse_result.tracks
             if remaining_tracks is not None and not remaining_tracks.empty:
                 combined_tracks = remaining_tracks.add_all(parse_result.tracks)
-            finished_tracks, remaining_tracks = combined_tracks.split_finished()
-            if not finished_tracks.empty:
-                yield finished_tracks
+            del parse_result
+            complete_until = combined_tracks.last_occurrence
+            finished_tracks, unfinished_tracks = combined_tracks.split_finished()
+            del combined_tracks
+            windows, incomplete_tracks = self._split_into_windows(
+                finished_tracks, complete_until
+            )
+            del finished_tracks
+            remaining_tracks = _combine(incomplete_tracks, unfinished_tracks)
+            while windows:
+                yield windows.popleft(), StreamPosition(
+                    tuple(processed_files),
+                    remaining_tracks,
+                    tuple(video_metadata),
+                    detection_classes,
+                    tuple(windows),
+                )
+
+        if remaining_tracks is None:
+            return
+        windows, _ = self._split_into_windows(remaining_tracks, None)
+        del remaining_tracks
+        while windows:
+            yield windows.popleft(), StreamPosition(
+                tuple(processed_files),
+                None,
+                tuple(video_metadata),
+                detection_classes,
+                tuple(windows),
+            )
+
+    def _restore_metadata(self, position: StreamPosition) -> None:
+        """Update the registered metadata with the metadata of already processed
+        files."""
+        for tracks_metadata in self._registered_tracks_metadata:
+            tracks_metadata.update_detection_classes(position.detection_classes)
+        for videos_metadata in self._registered_videos_metadata:
+            for metadata in position.video_metadata:
+                videos_metadata.update(metadata)
+
+    def _split_into_windows(
+        self, tracks: TrackDataset, complete_until: datetime | None
+    ) -> tuple[deque[TrackDataset], TrackDataset | None]:
+        """Split the given tracks by the window their last detection falls into.
+
+        The end of each track is calculated once for all windows.
+
+        Args:
+            tracks (TrackDataset): the finished tracks to split.
+            complete_until (datetime | None): windows ending after this time are
+                incomplete. None means all windows are complete.
+
+        Returns:
+            tuple[deque[TrackDataset], TrackDataset | None]: the tracks of the
+                complete windows in order and the tracks of the incomplete windows.
+        """
+        if tracks.empty:
+            return deque(), None
+        if self._window is None:
+            return deque([tracks]), None
+        complete: deque[TrackDataset] = deque()
+        incomplete: list[TrackDataset] = []
+        for window_end, window_tracks in tracks.split_by_end_window(self._window):
+            if complete_until is None or window_end <= complete_until:
+                complete.append(window_tracks)
+            else:
+                incomplete.append(window_tracks)
+        return complete, _combine_all(incomplete)
+
+
+def _combine(
+    tracks: TrackDataset | None, other: TrackDataset | None
+) -> TrackDataset | None:
+    if tracks is None or tracks.empty:
+        return other
+    if other is None or other.empty:
+        return tracks
+    return tracks.add_all(other)
+
 
-        if remaining_tracks is not None and not remaining_tracks.empty:
-            yield remaining_tracks
+def _combine_all(datasets: Iterable[TrackDataset | None]) -> TrackDataset | None:
+    combined: TrackDataset | None = None
+    for dataset in datasets:
+        combined = _combine(combined, dataset)
+    return combined
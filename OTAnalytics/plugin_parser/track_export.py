@@ -1,27 +1,47 @@
+from abc import ABC, abstractmethod
 from typing import Literal
 
+import polars as pl
+import pyarrow as pa
 from pandas import DataFrame
 
+from OTAnalytics.application.logger import logger
 from OTAnalytics.application.state import TracksMetadata, VideosMetadata
 from OTAnalytics.application.use_cases.track_export import (
     ExportTracks,
     TrackExportSpecification,
+    TrackFileFormat,
 )
 from OTAnalytics.domain import track
 from OTAnalytics.domain.track_repository import TrackRepository
+from OTAnalytics.plugin_datastore.polars_track_store import (
+    PolarsDataFrameProvider,
+    drop_row_id,
+)
 from OTAnalytics.plugin_datastore.track_store import PandasDataFrameProvider
+from OTAnalytics.plugin_parser.columnar_export import (
+    ColumnarWriter,
+    create_columnar_writer,
+)
 from OTAnalytics.plugin_parser.json_parser import write_json
 
+TRACKS_CSV_SUFFIX = ".tracks.csv"
+TRACKS_PARQUET_SUFFIX = ".tracks.parquet"
+TRACKS_ARROW_SUFFIX = ".tracks.arrow"
+COLUMNAR_TRACK_SUFFIXES: dict[TrackFileFormat, str] = {
+    TrackFileFormat.PARQUET: TRACKS_PARQUET_SUFFIX,
+    TrackFileFormat.ARROW: TRACKS_ARROW_SUFFIX,
+}
+
 
-class CsvTrackExport(ExportTracks):
+class TrackExportWithMetadata(ExportTracks, ABC):
     """
-    A CsvTrackExport exports tracks to .csv format.
-    Moreover, TracksMetadata and VideosMetadata are exported in json format.
-    Allows to either overwrite csv file or append tracks to existing csv file.
+    Base class of track exporters also exporting TracksMetadata and VideosMetadata
+    in json format.
 
-    Incrementally exporting tracks turns this CsvTrackExport into a
-    stateful ExportTracks. TracksMetadata and VideosMetadata are incrementally merged
-    until ExportMode.FLUSH is provided.
+    Incrementally exporting tracks turns this exporter into a stateful ExportTracks.
+    TracksMetadata and VideosMetadata are incrementally merged until ExportMode.FLUSH
+    is provided.
     (Cached metadata are not cleared upon flush,
     this exporter should not be reused afterwards!)
     """
@@ -46,15 +66,10 @@ class CsvTrackExport(ExportTracks):
     def export(self, specification: TrackExportSpecification) -> None:
         self._update_iterative_metadata()
 
-        append = specification.export_mode.is_subsequent_write()
-        dataframe = self._get_data()
-        dataframe = set_column_order(dataframe)
-        path = specification.save_path
-        output_path = path.with_suffix(".tracks.csv")
-        write_mode: Literal["w", "a"] = "a" if append else "w"
-        dataframe.to_csv(output_path, index=False, header=not append, mode=write_mode)
+        self._export_tracks(specification)
 
         if specification.export_mode.is_final_write():
+            path = specification.save_path
             tracks_metadata_path = path.with_suffix(".tracks_metadata.json")
             write_json(self._iterative_tracks_metadata, tracks_metadata_path)
 
@@ -64,6 +79,10 @@ class CsvTrackExport(ExportTracks):
             self._iterative_tracks_metadata.clear()
             self._iterative_videos_metadata.clear()
 
+    @abstractmethod
+    def _export_tracks(self, specification: TrackExportSpecification) -> None:
+        raise NotImplementedError
+
     def _get_data(self) -> DataFrame:
         dataset = self._track_repository.get_all()
         if isinstance(dataset, PandasDataFrameProvider):
@@ -79,7 +98,83 @@ class CsvTrackExport(ExportTracks):
         return DataFrame(detections)
 
 
+class CsvTrackExport(TrackExportWithMetadata):
+    """
+    A CsvTrackExport exports tracks to .csv format.
+    Moreover, TracksMetadata and VideosMetadata are exported in json format.
+    Allows to either overwrite csv file or append tracks to existing csv file.
+    """
+
+    def _export_tracks(self, specification: TrackExportSpecification) -> None:
+        append = specification.export_mode.is_subsequent_write()
+        dataframe = self._get_data()
+        dataframe = set_column_order(dataframe)
+        output_path = specification.save_path.with_suffix(TRACKS_CSV_SUFFIX)
+        write_mode: Literal["w", "a"] = "a" if append else "w"
+        dataframe.to_csv(output_path, index=False, header=not append, mode=write_mode)
+
+
+class ColumnarTrackExport(TrackExportWithMetadata):
+    """
+    A ColumnarTrackExport exports tracks to .parquet or .arrow (Arrow IPC) format.
+    Moreover, TracksMetadata and VideosMetadata are exported in json format.
+
+    Tracks are written batch by batch directly from the table backing the track
+    dataset. Incrementally exported tracks are appended to the open file, which is
+    finished when ExportMode.FLUSH is provided. Thus, the file can not be continued
+    by another process.
+    """
+
+    def __init__(
+        self,
+        track_repository: TrackRepository,
+        tracks_metadata: TracksMetadata,
+        videos_metadata: VideosMetadata,
+        file_format: TrackFileFormat,
+    ) -> None:
+        super().__init__(track_repository, tracks_metadata, videos_metadata)
+        if file_format not in COLUMNAR_TRACK_SUFFIXES:
+            raise ValueError(f"{file_format} is not a columnar track format.")
+        self._file_format = file_format
+        self._writer: ColumnarWriter | None = None
+
+    def _export_tracks(self, specification: TrackExportSpecification) -> None:
+        output_path = specification.save_path.with_suffix(
+            COLUMNAR_TRACK_SUFFIXES[self._file_format]
+        )
+        export_mode = specification.export_mode
+        if export_mode.is_first_write() or self._writer is None:
+            if export_mode.is_subsequent_write():
+                logger().warning(
+                    f"Can not append to {output_path}. The file is overwritten."
+                )
+            self._close_writer()
+            self._writer = create_columnar_writer(self._file_format.value, output_path)
+        self._writer.write(self._get_table())
+        if export_mode.is_final_write():
+            self._close_writer()
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _get_table(self) -> pa.Table:
+        dataset = self._track_repository.get_all()
+        if isinstance(dataset, PolarsDataFrameProvider):
+            table = drop_row_id(dataset.get_data()).to_arrow(
+                compat_level=pl.CompatLevel.oldest()
+            )
+        else:
+            table = pa.Table.from_pandas(self._get_data(), preserve_index=False)
+        return table.select(order_columns(table.column_names))
+
+
 def set_column_order(dataframe: DataFrame) -> DataFrame:
+    return dataframe[order_columns(dataframe.columns.tolist())]
+
+
+def order_columns(columns: list[str]) -> list[str]:
     desired_columns_order = [
         track.TRACK_ID,
         track.CLASSIFICATION,
@@ -94,9 +189,6 @@ def set_column_order(dataframe: DataFrame) -> DataFrame:
         track.VIDEO_NAME,
         track.INPUT_FILE,
     ]
-    dataframe = dataframe[
-        desired_columns_order
-        + [col for col in dataframe.columns if col not in desired_columns_order]
+    return desired_columns_order + [
+        column for column in columns if column not in desired_columns_order
     ]
-
-    return dataframe
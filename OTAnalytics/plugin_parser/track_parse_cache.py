@@ -0,0 +1,184 @@
+"""
+Persistent cache of parsed ottrk files.
+
+Parsing bz2 compressed ottrk files is expensive. The cache stores the parsed and
+format fixed tracks of an ottrk file as Apache Arrow/Feather file together with its
+metadata in a cache directory. Entries are keyed by the content hash of the ottrk
+file and the cache version. Thus, changed ottrk files or changes of the parser
+invalidate the corresponding entries. The total size of the cache is bounded by
+evicting the least recently used entries.
+
+Several processes may share the cache directory, e.g. the workers of the
+multiprocessing track parser. Entries evicted by another process are treated as
+cache misses.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Callable, TypeVar
+from uuid import uuid4
+
+from OTAnalytics.application.logger import logger
+from OTAnalytics.plugin_parser.convert_ottrk_to_feathers import (
+    FEATHER_FILETYPE,
+    METADATA_SUFFIX,
+    convert_ottrk_to_feather,
+)
+
+TRACK_CACHE_VERSION = "2"
+"""Version of the cached data. Increase if the parsed track format changes."""
+
+TEMPORARY_DIRECTORY = "tmp"
+BYTES_PER_MEGABYTE = 1024 * 1024
+
+OttrkConverter = Callable[[Path, Path], None]
+T = TypeVar("T")
+
+
+def metadata_file_of(feather_file: Path) -> Path:
+    return feather_file.parent / f"{feather_file.stem}{METADATA_SUFFIX}"
+
+
+def hash_file(file: Path) -> str:
+    with open(file, "rb") as stream:
+        digest = hashlib.file_digest(stream, "sha256")
+    digest.update(TRACK_CACHE_VERSION.encode())
+    return digest.hexdigest()
+
+
+class TrackParseCache:
+    """Cache of ottrk files converted to feather files.
+
+    Args:
+        cache_dir (Path): directory to store the cached files in.
+        max_size_in_mb (int): maximum size of the cache. The least recently used
+            entries are evicted if the cache exceeds this size.
+        converter (OttrkConverter): converts the given ottrk file into the given
+            feather file and writes its metadata next to it.
+    """
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_size_in_mb: int,
+        converter: OttrkConverter = convert_ottrk_to_feather,
+    ) -> None:
+        if max_size_in_mb < 0:
+            raise ValueError("Maximum cache size must not be negative.")
+        self._cache_dir = cache_dir
+        self._max_size = max_size_in_mb * BYTES_PER_MEGABYTE
+        self._converter = converter
+
+    def get(self, ottrk_file: Path) -> Path:
+        """Returns the cached feather file of the given ottrk file.
+
+        The ottrk file is converted and added to the cache if it is not cached yet.
+
+        Args:
+            ottrk_file (Path): the ottrk file to get the cached feather file for.
+
+        Returns:
+            Path: the cached feather file. The metadata file is stored next to it.
+        """
+        if not ottrk_file.exists():
+            raise FileNotFoundError(f"Input file not found: {ottrk_file}")
+        feather_file = self._cache_dir / f"{hash_file(ottrk_file)}{FEATHER_FILETYPE}"
+        if self._mark_as_used(feather_file):
+            logger().debug(f"Use cached tracks of {ottrk_file}: {feather_file}")
+            return feather_file
+
+        logger().info(f"Add tracks of {ottrk_file} to cache: {feather_file}")
+        self._add(ottrk_file, feather_file)
+        self._evict(keep=feather_file)
+        return feather_file
+
+    def read(self, ottrk_file: Path, reader: Callable[[Path], T]) -> T:
+        """Read the cached feather file of the given ottrk file.
+
+        If another process evicts the entry before it is read, the ottrk file is
+        added to the cache again.
+
+        Args:
+            ottrk_file (Path): the ottrk file to read the cached feather file of.
+            reader (Callable[[Path], T]): reads the given feather file.
+
+        Returns:
+            T: the result of the reader.
+        """
+        try:
+            return reader(self.get(ottrk_file))
+        except FileNotFoundError:
+            if not ottrk_file.exists():
+                raise
+            logger().debug(f"Cached tracks of {ottrk_file} evicted while reading")
+            return reader(self.get(ottrk_file))
+
+    def _mark_as_used(self, feather_file: Path) -> bool:
+        """Update the access time of the given entry.
+
+        Returns:
+            bool: whether the entry exists.
+        """
+        try:
+            os.utime(feather_file)
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as cause:
+            logger().warning(f"Could not update access time of {feather_file}: {cause}")
+            return feather_file.exists()
+
+    def _add(self, ottrk_file: Path, feather_file: Path) -> None:
+        temporary_directory = self._cache_dir / TEMPORARY_DIRECTORY
+        temporary_directory.mkdir(parents=True, exist_ok=True)
+        temporary_file = temporary_directory / f"{uuid4().hex}{FEATHER_FILETYPE}"
+        try:
+            self._converter(ottrk_file, temporary_file)
+            # The feather file marks a complete entry. Thus, it is moved last.
+            os.replace(metadata_file_of(temporary_file), metadata_file_of(feather_file))
+            os.replace(temporary_file, feather_file)
+        finally:
+            temporary_file.unlink(missing_ok=True)
+            metadata_file_of(temporary_file).unlink(missing_ok=True)
+
+    def _evict(self, keep: Path) -> None:
+        entries = sorted(
+            (
+                (stat.st_mtime, self._size_of(entry, stat), entry)
+                for entry in self._cache_dir.glob(f"*{FEATHER_FILETYPE}")
+                if (stat := _stat_of(entry)) is not None
+            ),
+            key=lambda mtime_size_entry: mtime_size_entry[0],
+        )
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, entry in entries:
+            if size <= self._max_size:
+                return
+            if entry == keep:
+                continue
+            size -= entry_size
+            logger().debug(f"Evict cached tracks {entry}")
+            try:
+                entry.unlink(missing_ok=True)
+                metadata_file_of(entry).unlink(missing_ok=True)
+            except OSError as cause:
+                # The entry might still be open in another process.
+                logger().debug(f"Could not evict cached tracks {entry}: {cause}")
+
+    def _size_of(self, feather_file: Path, stat: os.stat_result) -> int:
+        metadata_stat = _stat_of(metadata_file_of(feather_file))
+        metadata_size = metadata_stat.st_size if metadata_stat is not None else 0
+        return stat.st_size + metadata_size
+
+
+def _stat_of(file: Path) -> os.stat_result | None:
+    """Returns the stat of the given file or None if it does not exist (anymore)."""
+    try:
+        return file.stat()
+    except FileNotFoundError:
+        return None
@@ -1,6 +1,9 @@
-from typing import Iterable, Literal
+from functools import partial
+from typing import Callable, Iterable, Literal
 
 import pandas as pd
+import polars as pl
+import pyarrow as pa
 
 from OTAnalytics.application.config import DEFAULT_EVENTLIST_FILE_TYPE
 from OTAnalytics.application.datastore import EventListParser
@@ -33,17 +36,32 @@ from OTAnalytics.application.use_cases.export_events import (
     EventListExporter,
     ExporterNotFoundError,
 )
+from OTAnalytics.domain import event
 from OTAnalytics.domain.event import Event
 from OTAnalytics.domain.section import Section
+from OTAnalytics.plugin_datastore.track_geometry_store import polars_geometry_store
+from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store import (
+    PolarsEventDataset,
+)
+from OTAnalytics.plugin_parser.columnar_export import (
+    ARROW,
+    PARQUET,
+    ColumnarWriter,
+    create_columnar_writer,
+)
 from OTAnalytics.plugin_parser.otvision_parser import OtEventListParser
 
 EXTENSION_CSV = "csv"
 EXTENSION_EXCEL = "xlsx"
 EXTENSION_OTEVENTS = DEFAULT_EVENTLIST_FILE_TYPE
+EXTENSION_PARQUET = PARQUET
+EXTENSION_ARROW = ARROW
 
 OTC_EXCEL_FORMAT_NAME = "Excel (OpenTrafficCam)"
 OTC_CSV_FORMAT_NAME = "CSV (OpenTrafficCam)"
 OTC_OTEVENTS_FORMAT_NAME = "OTEvents (OpenTrafficCam)"
+OTC_PARQUET_FORMAT_NAME = "Parquet (OpenTrafficCam)"
+OTC_ARROW_FORMAT_NAME = "Arrow IPC (OpenTrafficCam)"
 
 OCCURRENCE_SEC = f"{OCCURRENCE}_sec"
 
@@ -83,6 +101,19 @@ EXPORT_COLUMNS = [
     INTERPOLATED_EVENT_COORDINATE_Y,
 ]
 
+POLARS_EVENT_COLUMNS = {
+    polars_geometry_store.EVENT_COORDINATE_X: EVENT_COORDINATE_X,
+    polars_geometry_store.EVENT_COORDINATE_Y: EVENT_COORDINATE_Y,
+    polars_geometry_store.DIRECTION_VECTOR_X: DIRECTION_VECTOR_X,
+    polars_geometry_store.DIRECTION_VECTOR_Y: DIRECTION_VECTOR_Y,
+    polars_geometry_store.INTERPOLATED_EVENT_COORDINATE_X: (
+        INTERPOLATED_EVENT_COORDINATE_X
+    ),
+    polars_geometry_store.INTERPOLATED_EVENT_COORDINATE_Y: (
+        INTERPOLATED_EVENT_COORDINATE_Y
+    ),
+}
+
 
 class EventListDataFrameBuilder:
     def __init__(self, events: Iterable[Event], sections: Iterable[Section]):
@@ -91,13 +122,32 @@ class EventListDataFrameBuilder:
         self._df = self._convert_to_dataframe(events)
 
     def _convert_to_dataframe(self, events: Iterable[Event]) -> pd.DataFrame:
-        return pd.DataFrame([event.to_dict() for event in events])
+        if isinstance(events, PolarsEventDataset):
+            return self._convert_columnar(events)
+        df = pd.DataFrame([event.to_dict() for event in events])
+        if len(df) == 0:
+            return df
+        return self._split_columns_with_lists(df)
+
+    def _convert_columnar(self, events: PolarsEventDataset) -> pd.DataFrame:
+        """Convert the columns of the dataset without creating event objects."""
+        if events.is_empty():
+            return pd.DataFrame()
+        return (
+            events.get_data()
+            .with_columns(
+                pl.col(event.OCCURRENCE, event.INTERPOLATED_OCCURRENCE)
+                .dt.replace_time_zone(None)
+                .dt.cast_time_unit("ns")
+            )
+            .rename(POLARS_EVENT_COLUMNS)
+            .to_pandas()
+        )
 
     def build(self) -> pd.DataFrame:
         if len(self._df) == 0:
             return pd.DataFrame()
         self._convert_occurrence_to_seconds_since_epoch()
-        self._split_columns_with_lists()
         self._add_section_names()
         self._add_detailed_date_time_columns()
         self._round()
@@ -109,7 +159,7 @@ class EventListDataFrameBuilder:
                 self._df.loc[:, column] = self._df.loc[:, column].round(decimals)
         for column, freq in DATETIME_ROUNDED_COLUMNS.items():
             if column in self._df.columns:
-                self._df.loc[:, column] = (
+                self._df[column] = (
                     pd.to_datetime(self._df.loc[:, column])
                     .dt.round(freq)
                     .dt.strftime(DATE_TIME_FORMAT)
@@ -132,27 +182,23 @@ class EventListDataFrameBuilder:
             occurrence - epoch
         ).dt.total_seconds()
 
-    def _split_columns_with_lists(self) -> None:
-        self._df[[event_list.EVENT_COORDINATE_X, event_list.EVENT_COORDINATE_Y]] = (
-            pd.DataFrame(
-                self._df[event_list.EVENT_COORDINATE].tolist(), index=self._df.index
-            )
+    def _split_columns_with_lists(self, df: pd.DataFrame) -> pd.DataFrame:
+        df[[event_list.EVENT_COORDINATE_X, event_list.EVENT_COORDINATE_Y]] = (
+            pd.DataFrame(df[event_list.EVENT_COORDINATE].tolist(), index=df.index)
         )
-        self._df[[event_list.DIRECTION_VECTOR_X, event_list.DIRECTION_VECTOR_Y]] = (
-            pd.DataFrame(
-                self._df[event_list.DIRECTION_VECTOR].tolist(), index=self._df.index
-            )
+        df[[event_list.DIRECTION_VECTOR_X, event_list.DIRECTION_VECTOR_Y]] = (
+            pd.DataFrame(df[event_list.DIRECTION_VECTOR].tolist(), index=df.index)
         )
-        self._df[
+        df[
             [
                 event_list.INTERPOLATED_EVENT_COORDINATE_X,
                 event_list.INTERPOLATED_EVENT_COORDINATE_Y,
             ]
         ] = pd.DataFrame(
-            self._df[event_list.INTERPOLATED_EVENT_COORDINATE].tolist(),
-            index=self._df.index,
+            df[event_list.INTERPOLATED_EVENT_COORDINATE].tolist(),
+            index=df.index,
         )
-        self._df = self._df.drop(
+        return df.drop(
             columns=[
                 event_list.EVENT_COORDINATE,
                 event_list.DIRECTION_VECTOR,
@@ -278,6 +324,74 @@ class EventListCSVExporter(EventListExporter):
         return OTC_CSV_FORMAT_NAME
 
 
+class EventListColumnarExporter(EventListExporter):
+    """
+    A EventListExporter exporting to a columnar format.
+    Export mode OVERWRITE writes the given events to a new file.
+
+    Export modes INITIAL_MERGE and MERGE transform this exporter into a
+    stateful exporter appending events to the open file until ExportMode FLUSH
+    is provided. Only then the file is finished.
+    """
+
+    def __init__(self, file_format: str) -> None:
+        self._file_format = file_format
+        self._writer: ColumnarWriter | None = None
+
+    def export(
+        self,
+        events: Iterable[Event],
+        sections: Iterable[Section],
+        export_specification: EventExportSpecification,
+    ) -> None:
+        file = export_specification.file
+        export_mode = export_specification.export_mode
+        if (
+            export_mode.is_first_write()
+            or self._writer is None
+            or self._writer.file != file
+        ):
+            if export_mode.is_subsequent_write():
+                logger().warning(f"Can not append to {file}. The file is overwritten.")
+            self._close_writer()
+            self._writer = create_columnar_writer(self._file_format, file)
+        df_events = EventListDataFrameBuilder(events=events, sections=sections).build()
+        self._writer.write(pa.Table.from_pandas(df_events, preserve_index=False))
+        if export_mode.is_final_write():
+            self._close_writer()
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class EventListParquetExporter(EventListColumnarExporter):
+    """A EventListColumnarExporter exporting to .parquet format."""
+
+    def __init__(self) -> None:
+        super().__init__(PARQUET)
+
+    def get_extension(self) -> str:
+        return f".{EXTENSION_PARQUET}"
+
+    def get_name(self) -> str:
+        return OTC_PARQUET_FORMAT_NAME
+
+
+class EventListArrowExporter(EventListColumnarExporter):
+    """A EventListColumnarExporter exporting to .arrow (Arrow IPC) format."""
+
+    def __init__(self) -> None:
+        super().__init__(ARROW)
+
+    def get_extension(self) -> str:
+        return f".{EXTENSION_ARROW}"
+
+    def get_name(self) -> str:
+        return OTC_ARROW_FORMAT_NAME
+
+
 class EventListOteventsExporter(EventListExporter):
     """
     A EventListExporter exporting to .otevents format.
@@ -418,14 +532,25 @@ class EventListDataFramePrinter(EventListExporter):
         return "print Dataframe to console"
 
 
-AVAILABLE_EVENTLIST_EXPORTERS: dict[str, EventListExporter] = {
-    OTC_CSV_FORMAT_NAME: EventListCSVExporter(),
-    OTC_EXCEL_FORMAT_NAME: EventListExcelExporter(),
-    OTC_OTEVENTS_FORMAT_NAME: EventListOteventsExporter(OtEventListParser()),
+EventListExporterFactory = Callable[[], EventListExporter]
+
+AVAILABLE_EVENTLIST_EXPORTERS: dict[str, EventListExporterFactory] = {
+    OTC_CSV_FORMAT_NAME: EventListCSVExporter,
+    OTC_EXCEL_FORMAT_NAME: EventListExcelExporter,
+    OTC_OTEVENTS_FORMAT_NAME: partial(EventListOteventsExporter, OtEventListParser()),
+    OTC_PARQUET_FORMAT_NAME: EventListParquetExporter,
+    OTC_ARROW_FORMAT_NAME: EventListArrowExporter,
 }
+"""Factories of the available event list exporters. Exporters of incremental exports
+keep state between calls, thus each export gets its own exporter."""
 
 
 def provide_available_eventlist_exporter(event_format: str) -> EventListExporter:
+    """Create a new event list exporter for the given file extension."""
+    return _provide_eventlist_exporter_factory(event_format)()
+
+
+def _provide_eventlist_exporter_factory(event_format: str) -> EventListExporterFactory:
     _format = event_format.lower()
     if _format == EXTENSION_CSV or _format == f".{EXTENSION_CSV}":
         return AVAILABLE_EVENTLIST_EXPORTERS[OTC_CSV_FORMAT_NAME]
@@ -433,9 +558,14 @@ def provide_available_eventlist_exporter(event_format: str) -> EventListExporter
         return AVAILABLE_EVENTLIST_EXPORTERS[OTC_EXCEL_FORMAT_NAME]
     elif _format == EXTENSION_OTEVENTS or _format == f".{EXTENSION_OTEVENTS}":
         return AVAILABLE_EVENTLIST_EXPORTERS[OTC_OTEVENTS_FORMAT_NAME]
+    elif _format == EXTENSION_PARQUET or _format == f".{EXTENSION_PARQUET}":
+        return AVAILABLE_EVENTLIST_EXPORTERS[OTC_PARQUET_FORMAT_NAME]
+    elif _format == EXTENSION_ARROW or _format == f".{EXTENSION_ARROW}":
+        return AVAILABLE_EVENTLIST_EXPORTERS[OTC_ARROW_FORMAT_NAME]
     else:
         raise ExporterNotFoundError(
             f"{event_format} is a not supported eventlist format. "
             f"Supported formats are: [{EXTENSION_CSV}, "
-            f"{EXTENSION_EXCEL}, {EXTENSION_OTEVENTS}]"
+            f"{EXTENSION_EXCEL}, {EXTENSION_OTEVENTS}, {EXTENSION_PARQUET}, "
+            f"{EXTENSION_ARROW}]"
         )
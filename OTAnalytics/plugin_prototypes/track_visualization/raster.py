@@ -0,0 +1,611 @@
+"""
+Rasterization of tracks into NumPy RGBA buffers.
+
+Plotting many tracks with matplotlib creates one artist per line and renders the
+whole figure on every change. The raster plotters draw track segments and start and
+end points directly into a NumPy buffer. Segments are sampled at pixel resolution in
+a vectorized way.
+
+Track lines are one pixel wide. To match the matplotlib plotters, each track is
+blended on its own, so the opacity builds up where tracks overlap. The opacity of a
+single track is scaled by the share of a pixel covered by an anti-aliased matplotlib
+line of width LINEWIDTH_TRACK.
+
+The covered pixels of the segments are cached as tiles per classification and time
+bucket. Changing a filter only changes the segments of some classes or time
+buckets. All other tiles are composited from the cache without rasterizing their
+segments again.
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import timedelta
+from functools import partial
+from hashlib import blake2b
+from typing import Callable, Hashable, Iterable, Sequence, cast
+
+import numpy
+import pandas
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from numpy import ndarray
+from pandas import DataFrame
+
+from OTAnalytics.adapter_visualization.color_provider import ColorPaletteProvider
+from OTAnalytics.domain import track
+from OTAnalytics.domain.track import TrackImage
+from OTAnalytics.plugin_datastore.track_store import PandasDataFrameProvider
+from OTAnalytics.plugin_prototypes.track_visualization.track_viz import (
+    DPI,
+    LINEWIDTH_TRACK,
+    RenderTrackImage,
+    TrackImageFactory,
+    TrackPlotter,
+)
+
+DEFAULT_COLOR = "black"
+DEFAULT_TIME_BUCKET = timedelta(minutes=1)
+DEFAULT_MAX_TILES = 4096
+LINE_PIXEL_COVERAGE = min(1.0, LINEWIDTH_TRACK * DPI / 72)
+"""Share of a pixel covered by an anti-aliased matplotlib track line of width
+LINEWIDTH_TRACK points."""
+SEGMENT_CHUNK_SIZE = 500_000
+"""Number of segments rasterized at once. Limits the memory of the samples."""
+
+PREVIOUS_X = "previous_x"
+PREVIOUS_Y = "previous_y"
+TIME_BUCKET = "time_bucket"
+
+RGBA = tuple[float, float, float, float]
+
+END_MARKER = numpy.array(
+    [(dx, dy) for dx in range(-2, 3) for dy in range(-2, 3)], dtype=numpy.int64
+)
+"""Pixel offsets of the square marking the end of a track."""
+
+START_MARKER = numpy.array(
+    [(dx, dy) for dx in range(-2, 3) for dy in range(-2, 3) if abs(dy) <= (2 - dx) / 2],
+    dtype=numpy.int64,
+)
+"""Pixel offsets of the triangle pointing right marking the start of a track."""
+
+
+def segment_coverage(
+    tracks: ndarray,
+    start_x: ndarray,
+    start_y: ndarray,
+    end_x: ndarray,
+    end_y: ndarray,
+    width: int,
+    height: int,
+) -> ndarray:
+    """Returns the pixels covered by the given line segments of tracks.
+
+    Each segment is sampled once per pixel of its longer axis. Samples outside of
+    the image are dropped. A pixel covered by several segments of the same track
+    is counted once for this track.
+
+    Args:
+        tracks (ndarray): integer codes of the tracks the segments belong to.
+        start_x (ndarray): x coordinates of the segment starts.
+        start_y (ndarray): y coordinates of the segment starts.
+        end_x (ndarray): x coordinates of the segment ends.
+        end_y (ndarray): y coordinates of the segment ends.
+        width (int): width of the image.
+        height (int): height of the image.
+
+    Returns:
+        ndarray: array with two rows. The first row contains the sorted unique flat
+            indices of the covered pixels, the second row the number of tracks
+            covering each of these pixels.
+    """
+    chunks = [
+        _track_pixels(
+            tracks[first : first + SEGMENT_CHUNK_SIZE],
+            start_x[first : first + SEGMENT_CHUNK_SIZE],
+            start_y[first : first + SEGMENT_CHUNK_SIZE],
+            end_x[first : first + SEGMENT_CHUNK_SIZE],
+            end_y[first : first + SEGMENT_CHUNK_SIZE],
+            width,
+            height,
+        )
+        for first in range(0, len(start_x), SEGMENT_CHUNK_SIZE)
+    ]
+    if not chunks:
+        return numpy.empty((2, 0), dtype=numpy.int64)
+    track_pixels = numpy.unique(numpy.concatenate(chunks))
+    pixels, counts = numpy.unique(track_pixels % (width * height), return_counts=True)
+    return numpy.stack([pixels, counts.astype(numpy.int64)])
+
+
+def _track_pixels(
+    tracks: ndarray,
+    start_x: ndarray,
+    start_y: ndarray,
+    end_x: ndarray,
+    end_y: ndarray,
+    width: int,
+    height: int,
+) -> ndarray:
+    """Returns the covered pixels combined with the track code as
+    track * width * height + pixel."""
+    delta_x = end_x - start_x
+    delta_y = end_y - start_y
+    # Segments leaving the image are sampled at most once per pixel of the image
+    # diagonal.
+    samples = (
+        numpy.minimum(
+            numpy.ceil(numpy.maximum(numpy.abs(delta_x), numpy.abs(delta_y))),
+            width + height,
+        ).astype(numpy.int64)
+        + 1
+    )
+    segment = numpy.repeat(numpy.arange(len(samples)), samples)
+    first_sample = numpy.cumsum(samples) - samples
+    step = numpy.arange(samples.sum()) - numpy.repeat(first_sample, samples)
+    fraction = step / numpy.maximum(samples - 1, 1)[segment]
+    x = numpy.floor(start_x[segment] + delta_x[segment] * fraction).astype(numpy.int64)
+    y = numpy.floor(start_y[segment] + delta_y[segment] * fraction).astype(numpy.int64)
+    inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    owner = tracks[segment].astype(numpy.int64)
+    return numpy.unique(
+        owner[inside] * (width * height) + y[inside] * width + x[inside]
+    )
+
+
+def marker_pixels(
+    x: ndarray, y: ndarray, marker: ndarray, width: int, height: int
+) -> ndarray:
+    """Returns the pixels covered by markers centered at the given coordinates.
+
+    Args:
+        x (ndarray): x coordinates of the marker centers.
+        y (ndarray): y coordinates of the marker centers.
+        marker (ndarray): pixel offsets of the marker.
+        width (int): width of the image.
+        height (int): height of the image.
+
+    Returns:
+        ndarray: sorted unique flat indices of the covered pixels.
+    """
+    center_x = numpy.floor(x).astype(numpy.int64)
+    center_y = numpy.floor(y).astype(numpy.int64)
+    marker_x = (center_x[:, numpy.newaxis] + marker[:, 0]).ravel()
+    marker_y = (center_y[:, numpy.newaxis] + marker[:, 1]).ravel()
+    return numpy.unique(_flat_pixels(marker_x, marker_y, width, height))
+
+
+def _flat_pixels(x: ndarray, y: ndarray, width: int, height: int) -> ndarray:
+    inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    return y[inside] * width + x[inside]
+
+
+class RasterCanvas:
+    """RGBA buffer to paint pixels on.
+
+    Colors are composited using the over operator.
+
+    Args:
+        width (int): width of the buffer.
+        height (int): height of the buffer.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self._rgb = numpy.zeros((height * width, 3), dtype=numpy.float32)
+        self._alpha = numpy.zeros(height * width, dtype=numpy.float32)
+
+    def paint_coverage(self, pixels: ndarray, counts: ndarray, color: RGBA) -> None:
+        """Paint the given pixels as if each was painted count times with the given
+        color.
+
+        Args:
+            pixels (ndarray): flat indices of the pixels to paint.
+            counts (ndarray): number of times each pixel is painted.
+            color (RGBA): color with red, green, blue and alpha between 0 and 1.
+        """
+        if len(pixels) == 0:
+            return
+        *rgb, alpha = color
+        self._composite(
+            pixels,
+            numpy.asarray(rgb, dtype=numpy.float32)[numpy.newaxis, :],
+            (1 - (1 - numpy.float32(alpha)) ** counts).astype(numpy.float32),
+        )
+
+    def paint(self, pixels: ndarray, color: RGBA) -> None:
+        """Paint the given pixels with the given color.
+
+        Args:
+            pixels (ndarray): flat indices of the pixels to paint.
+            color (RGBA): color with red, green, blue and alpha between 0 and 1.
+        """
+        if len(pixels) == 0:
+            return
+        *rgb, alpha = color
+        self._composite(
+            pixels,
+            numpy.asarray(rgb, dtype=numpy.float32)[numpy.newaxis, :],
+            numpy.float32(alpha),
+        )
+
+    def overlay(self, image: ndarray) -> None:
+        """Paint the given RGBA image with 8 bit per channel over the canvas.
+
+        Args:
+            image (ndarray): image with the same width and height as the canvas.
+        """
+        flat = image.reshape(-1, 4)
+        pixels = numpy.flatnonzero(flat[:, 3])
+        colors = flat[pixels].astype(numpy.float32) / 255
+        self._composite(pixels, colors[:, :3], colors[:, 3])
+
+    def _composite(
+        self, pixels: ndarray, rgb: ndarray, alpha: ndarray | numpy.float32
+    ) -> None:
+        destination_alpha = self._alpha[pixels] * (1 - alpha)
+        combined_alpha = alpha + destination_alpha
+        source = numpy.reshape(alpha, (-1, 1)) * rgb
+        destination = self._rgb[pixels] * destination_alpha[:, numpy.newaxis]
+        self._rgb[pixels] = (source + destination) / numpy.maximum(
+            combined_alpha, numpy.finfo(numpy.float32).tiny
+        )[:, numpy.newaxis]
+        self._alpha[pixels] = combined_alpha
+
+    def to_array(self) -> ndarray:
+        """Returns the canvas as RGBA image with 8 bit per channel."""
+        image = numpy.concatenate([self._rgb, self._alpha[:, numpy.newaxis]], axis=1)
+        return (
+            numpy.clip(numpy.rint(image * 255), 0, 255)
+            .astype(numpy.uint8)
+            .reshape(self.height, self.width, 4)
+        )
+
+
+PaintCanvas = Callable[[RasterCanvas], None]
+
+
+class RasterPlotterImplementation(ABC):
+    """Abstraction to plot on a raster canvas."""
+
+    def plot(self, canvas: RasterCanvas) -> None:
+        self.snapshot()(canvas)
+
+    @abstractmethod
+    def snapshot(self) -> PaintCanvas:
+        """Read the data to plot.
+
+        Returns:
+            PaintCanvas: paints the data read onto a canvas without reading shared
+                state.
+        """
+        raise NotImplementedError
+
+
+def _paint_nothing(_: RasterCanvas) -> None:
+    pass
+
+
+class RasterTrackPlotter(TrackPlotter):
+    """Implementation of the TrackPlotter interface drawing into a NumPy buffer."""
+
+    def __init__(
+        self,
+        plotter: RasterPlotterImplementation,
+        track_image_factory: TrackImageFactory,
+    ) -> None:
+        self._plotter = plotter
+        self._track_image_factory = track_image_factory
+
+    def plot(self, width: int, height: int) -> TrackImage:
+        canvas = RasterCanvas(width, height)
+        self._plotter.plot(canvas)
+        return self._track_image_factory.create(canvas.to_array())
+
+    def snapshot(self, width: int, height: int) -> RenderTrackImage:
+        return partial(self._render, self._plotter.snapshot(), width, height)
+
+    def _render(self, paint: PaintCanvas, width: int, height: int) -> TrackImage:
+        canvas = RasterCanvas(width, height)
+        paint(canvas)
+        return self._track_image_factory.create(canvas.to_array())
+
+
+class TileCache:
+    """Size bounded LRU cache of rasterized tiles.
+
+    Args:
+        max_tiles (int): number of tiles to keep.
+    """
+
+    def __init__(self, max_tiles: int = DEFAULT_MAX_TILES) -> None:
+        self._max_tiles = max_tiles
+        self._tiles: OrderedDict[Hashable, ndarray] = OrderedDict()
+
+    def get(self, key: Hashable) -> ndarray | None:
+        if (tile := self._tiles.get(key)) is not None:
+            self._tiles.move_to_end(key)
+        return tile
+
+    def put(self, key: Hashable, tile: ndarray) -> None:
+        self._tiles[key] = tile
+        self._tiles.move_to_end(key)
+        while len(self._tiles) > self._max_tiles:
+            self._tiles.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+
+def _color_of(classification: str, palette: dict[str, str], alpha: float) -> RGBA:
+    return to_rgba(palette.get(classification, DEFAULT_COLOR), alpha)
+
+
+def render_legend(
+    entries: Sequence[tuple[str, RGBA]], width: int, height: int
+) -> ndarray:
+    """Render a legend in the upper right corner of a transparent image.
+
+    Args:
+        entries (Sequence[tuple[str, RGBA]]): labels and line colors of the legend.
+        width (int): width of the image.
+        height (int): height of the image.
+
+    Returns:
+        ndarray: RGBA image with 8 bit per channel.
+    """
+    figure = Figure(figsize=(width / DPI, height / DPI), dpi=DPI)
+    figure.patch.set_alpha(0.0)
+    axes = figure.add_axes((0, 0, 1, 1))
+    axes.set_axis_off()
+    handles = [
+        Line2D([], [], color=color, linewidth=LINEWIDTH_TRACK, label=label)
+        for label, color in entries
+    ]
+    axes.legend(handles=handles, loc="upper right")
+    canvas = FigureCanvasAgg(figure)
+    canvas.draw()
+    return numpy.asarray(canvas.buffer_rgba()).copy()
+
+
+class LegendCache:
+    """Keeps the last rendered legend and renders it again only if it changes."""
+
+    def __init__(self) -> None:
+        self._legend: tuple[Hashable, ndarray] | None = None
+
+    def render(self, entries: list[tuple[str, RGBA]], canvas: RasterCanvas) -> ndarray:
+        key = (tuple(entries), canvas.width, canvas.height)
+        if self._legend is None or self._legend[0] != key:
+            self._legend = key, render_legend(entries, canvas.width, canvas.height)
+        return self._legend[1]
+
+
+def overlay_legend(
+    classifications: Iterable[str],
+    palette: dict[str, str],
+    legend_cache: LegendCache,
+    canvas: RasterCanvas,
+) -> None:
+    canvas.overlay(
+        legend_cache.render(
+            [
+                (classification, _color_of(classification, palette, 1))
+                for classification in classifications
+            ],
+            canvas,
+        )
+    )
+
+
+class RasterTrackGeometryPlotter(RasterPlotterImplementation):
+    """Plot geometry of tracks.
+
+    Tiles are identified by classification, time bucket, canvas size and a digest
+    of their segments, i.e. the track ids, occurrences and coordinates. A tile is
+    rasterized again only if one of its segments changes.
+
+    Args:
+        data_provider (PandasDataFrameProvider): provides the tracks to plot.
+        color_palette_provider (ColorPaletteProvider): colors of the classes.
+        enable_legend (bool): whether to show a legend of the plotted classes.
+        alpha (float): transparency of the tracks.
+        time_bucket (timedelta): duration of the time buckets of the tiles.
+        tile_cache (TileCache | None): cache of rasterized tiles.
+    """
+
+    def __init__(
+        self,
+        data_provider: PandasDataFrameProvider,
+        color_palette_provider: ColorPaletteProvider,
+        enable_legend: bool,
+        alpha: float = 0.5,
+        time_bucket: timedelta = DEFAULT_TIME_BUCKET,
+        tile_cache: TileCache | None = None,
+    ) -> None:
+        self._data_provider = data_provider
+        self._color_palette_provider = color_palette_provider
+        self._enable_legend = enable_legend
+        self._alpha = alpha
+        self._time_bucket = time_bucket
+        self._tile_cache = tile_cache if tile_cache is not None else TileCache()
+        self._legend_cache = LegendCache()
+
+    def snapshot(self) -> PaintCanvas:
+        data = self._data_provider.get_data()
+        if data.empty:
+            return _paint_nothing
+        return partial(
+            self._plot_dataframe, data, dict(self._color_palette_provider.get())
+        )
+
+    def _plot_dataframe(
+        self, track_df: DataFrame, palette: dict[str, str], canvas: RasterCanvas
+    ) -> None:
+        """
+        Plot given tracks on the given canvas with the given transparency (alpha)
+
+        Args:
+            track_df (DataFrame): tracks to plot
+            palette (dict[str, str]): colors of the classes
+            canvas (RasterCanvas): canvas to plot on
+        """
+        segments = self._create_segments(track_df)
+        start_x, start_y, end_x, end_y = (
+            segments[column].to_numpy()
+            for column in [PREVIOUS_X, PREVIOUS_Y, track.X, track.Y]
+        )
+        tracks = pandas.factorize(segments.index.get_level_values(track.TRACK_ID))[0]
+        classifications = list(track_df[track.TRACK_CLASSIFICATION].unique())
+        tiles: dict[str, list[ndarray]] = {}
+        for summary, positions in self._summarize(segments):
+            classification = summary[0]
+            tile_key = (*summary, canvas.width, canvas.height)
+            if (tile := self._tile_cache.get(tile_key)) is None:
+                tile = segment_coverage(
+                    tracks[positions],
+                    start_x[positions],
+                    start_y[positions],
+                    end_x[positions],
+                    end_y[positions],
+                    canvas.width,
+                    canvas.height,
+                )
+                self._tile_cache.put(tile_key, tile)
+            tiles.setdefault(classification, []).append(tile)
+        for classification in classifications:
+            if class_tiles := tiles.get(classification):
+                coverage = numpy.concatenate(class_tiles, axis=1)
+                pixels, position = numpy.unique(coverage[0], return_inverse=True)
+                canvas.paint_coverage(
+                    pixels,
+                    numpy.bincount(position, weights=coverage[1]),
+                    _color_of(
+                        classification, palette, self._alpha * LINE_PIXEL_COVERAGE
+                    ),
+                )
+        if self._enable_legend:
+            overlay_legend(classifications, palette, self._legend_cache, canvas)
+
+    def _create_segments(self, track_df: DataFrame) -> DataFrame:
+        grouped = track_df.groupby(level=track.TRACK_ID, sort=False)
+        segments = DataFrame(
+            {
+                track.TRACK_CLASSIFICATION: track_df[track.TRACK_CLASSIFICATION],
+                TIME_BUCKET: self._time_buckets_of(track_df),
+                PREVIOUS_X: grouped[track.X].shift(1),
+                PREVIOUS_Y: grouped[track.Y].shift(1),
+                track.X: track_df[track.X],
+                track.Y: track_df[track.Y],
+            }
+        )
+        return segments.dropna(subset=[PREVIOUS_X, PREVIOUS_Y, track.X, track.Y])
+
+    def _time_buckets_of(self, track_df: DataFrame) -> ndarray:
+        if track.OCCURRENCE not in track_df.index.names:
+            return numpy.zeros(len(track_df), dtype=numpy.int64)
+        occurrences = (
+            pandas.DatetimeIndex(track_df.index.get_level_values(track.OCCURRENCE))
+            .to_numpy(dtype="datetime64[ns]")
+            .astype(numpy.int64)
+        )
+        bucket_size = int(self._time_bucket.total_seconds() * 1_000_000_000)
+        return occurrences // bucket_size
+
+    @staticmethod
+    def _summarize(segments: DataFrame) -> Iterable[tuple[tuple, ndarray]]:
+        """Group the segments into tiles.
+
+        Returns:
+            Iterable[tuple[tuple, ndarray]]: summary and segment positions of each
+                tile.
+        """
+        # Row hashes include the index, i.e. the track id and occurrence of each
+        # segment end.
+        row_hashes = pandas.util.hash_pandas_object(
+            segments[[PREVIOUS_X, PREVIOUS_Y, track.X, track.Y]], index=True
+        ).to_numpy()
+        grouped = segments.groupby(
+            [track.TRACK_CLASSIFICATION, TIME_BUCKET], sort=False
+        )
+        for key, tile_positions in grouped.indices.items():
+            classification, time_bucket = cast(tuple[str, int], key)
+            positions = numpy.asarray(tile_positions)
+            digest = blake2b(
+                numpy.ascontiguousarray(row_hashes[positions]).tobytes(),
+                digest_size=16,
+            ).digest()
+            yield (classification, time_bucket, len(positions), digest), positions
+
+
+class RasterTrackStartEndPointPlotter(RasterPlotterImplementation):
+    """Plot start and end points of tracks.
+
+    Args:
+        data_provider (PandasDataFrameProvider): provides the tracks to plot.
+        color_palette_provider (ColorPaletteProvider): colors of the classes.
+        enable_legend (bool): whether to show a legend of the plotted classes.
+        alpha (float): transparency of the points.
+    """
+
+    def __init__(
+        self,
+        data_provider: PandasDataFrameProvider,
+        color_palette_provider: ColorPaletteProvider,
+        enable_legend: bool,
+        alpha: float = 0.5,
+    ) -> None:
+        self._data_provider = data_provider
+        self._color_palette_provider = color_palette_provider
+        self._enable_legend = enable_legend
+        self._alpha = alpha
+        self._legend_cache = LegendCache()
+
+    def snapshot(self) -> PaintCanvas:
+        data = self._data_provider.get_data()
+        if data.empty:
+            return _paint_nothing
+        return partial(
+            self._plot_dataframe, data, dict(self._color_palette_provider.get())
+        )
+
+    def _plot_dataframe(
+        self, track_df: DataFrame, palette: dict[str, str], canvas: RasterCanvas
+    ) -> None:
+        """
+        Plot start and end points of given tracks on the canvas.
+
+        Args:
+            track_df (DataFrame): tracks to plot start and end points of
+            palette (dict[str, str]): colors of the classes
+            canvas (RasterCanvas): canvas to plot on
+        """
+        track_df = track_df.dropna(subset=[track.X, track.Y])
+        grouped = track_df.groupby(level=track.TRACK_ID, sort=False)
+        for points, marker in [
+            (grouped.first(), START_MARKER),
+            (grouped.last(), END_MARKER),
+        ]:
+            for classification, class_points in points.groupby(
+                track.TRACK_CLASSIFICATION, sort=False
+            ):
+                canvas.paint(
+                    marker_pixels(
+                        class_points[track.X].to_numpy(),
+                        class_points[track.Y].to_numpy(),
+                        marker,
+                        canvas.width,
+                        canvas.height,
+                    ),
+                    _color_of(str(classification), palette, self._alpha),
+                )
+        if self._enable_legend:
+            overlay_legend(
+                track_df[track.TRACK_CLASSIFICATION].unique(),
+                palette,
+                self._legend_cache,
+                canvas,
+            )
@@ -0,0 +1,169 @@
+"""
+Background rendering of the track image.
+
+A single user action often notifies the track image updater several times, e.g.
+changing the filter updates the filter element and the selected videos. Rendering
+each of these requests on the UI thread blocks the UI for several full replots.
+The debounced render scheduler waits until no new request arrived for a short
+time and renders only the latest request. Requests superseded by a newer one are
+skipped. Images of renders, which were superseded while they were running, are
+dropped. Thus, only the image of the latest request is published.
+
+Repositories and states are modified on the event loop only. Hence, the plotters
+take a snapshot of their inputs on the event loop the request was scheduled from.
+Only painting the snapshot runs on the worker thread. Images are published on the
+event loop as well, because UI observers of the background image must not run on
+the worker thread.
+"""
+
+from asyncio import AbstractEventLoop, get_running_loop
+from concurrent.futures import Executor, ThreadPoolExecutor
+from threading import Lock, Timer
+from typing import Optional
+
+from OTAnalytics.application.logger import logger
+from OTAnalytics.application.state import (
+    Plotter,
+    PublishImage,
+    RenderImage,
+    RenderScheduler,
+)
+from OTAnalytics.domain.track import TrackImage
+
+DEFAULT_DEBOUNCE_IN_SECONDS = 0.05
+
+
+class DebouncedRenderScheduler(RenderScheduler):
+    """Coalesces bursts of render requests and renders them on a worker thread.
+
+    Snapshots are taken and images are published on the event loop the render was
+    scheduled from. Renders requested outside of an event loop use the event loop
+    seen last. Without any event loop, snapshots are taken on a timer thread and
+    images are published on the worker thread.
+
+    Args:
+        debounce_in_seconds (float): time to wait for further requests before
+            rendering.
+        executor (Executor | None): executor to render on. Renders must not run in
+            parallel. Defaults to a single worker thread.
+    """
+
+    def __init__(
+        self,
+        debounce_in_seconds: float = DEFAULT_DEBOUNCE_IN_SECONDS,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        self._debounce_in_seconds = debounce_in_seconds
+        self._executor = (
+            executor
+            if executor is not None
+            else ThreadPoolExecutor(max_workers=1, thread_name_prefix="render")
+        )
+        self._lock = Lock()
+        self._generation = 0
+        self._timer: Optional[Timer] = None
+        self._loop: Optional[AbstractEventLoop] = None
+
+    def schedule(self, plotter: Plotter, publish: PublishImage) -> None:
+        with self._lock:
+            if (loop := _running_loop()) is not None:
+                self._loop = loop
+            self._generation += 1
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = Timer(
+                self._debounce_in_seconds,
+                self._submit,
+                args=(self._generation, plotter, publish, self._loop),
+            )
+            self._timer.daemon = True
+            self._timer.start()
+
+    def shutdown(self) -> None:
+        """Cancel all pending renders and stop the worker thread."""
+        with self._lock:
+            self._generation += 1
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(
+        self,
+        generation: int,
+        plotter: Plotter,
+        publish: PublishImage,
+        loop: Optional[AbstractEventLoop],
+    ) -> None:
+        if self._is_superseded(generation):
+            return
+        if loop is None:
+            self._snapshot(generation, plotter, publish, loop)
+            return
+        try:
+            loop.call_soon_threadsafe(
+                self._snapshot, generation, plotter, publish, loop
+            )
+        except RuntimeError:
+            logger().debug("Event loop closed before the track image was rendered.")
+
+    def _snapshot(
+        self,
+        generation: int,
+        plotter: Plotter,
+        publish: PublishImage,
+        loop: Optional[AbstractEventLoop],
+    ) -> None:
+        if self._is_superseded(generation):
+            return
+        try:
+            render = plotter.snapshot()
+        except Exception as cause:
+            logger().exception(f"Could not render track image: {cause}")
+            return
+        try:
+            self._executor.submit(self._render, generation, render, publish, loop)
+        except RuntimeError:
+            logger().debug("Render scheduler shut down before rendering.")
+
+    def _render(
+        self,
+        generation: int,
+        render: RenderImage,
+        publish: PublishImage,
+        loop: Optional[AbstractEventLoop],
+    ) -> None:
+        if self._is_superseded(generation):
+            return
+        try:
+            image = render()
+        except Exception as cause:
+            logger().exception(f"Could not render track image: {cause}")
+            return
+        if loop is None:
+            self._publish(generation, publish, image)
+            return
+        try:
+            loop.call_soon_threadsafe(self._publish, generation, publish, image)
+        except RuntimeError:
+            logger().debug("Event loop closed before the track image was published.")
+
+    def _publish(
+        self, generation: int, publish: PublishImage, image: Optional[TrackImage]
+    ) -> None:
+        # Checked again on the event loop, a newer request might have been scheduled
+        # after rendering.
+        if self._is_superseded(generation):
+            return
+        publish(image)
+
+    def _is_superseded(self, generation: int) -> bool:
+        with self._lock:
+            return generation != self._generation
+
+
+def _running_loop() -> Optional[AbstractEventLoop]:
+    try:
+        return get_running_loop()
+    except RuntimeError:
+        return None
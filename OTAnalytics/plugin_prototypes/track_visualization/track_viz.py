@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Iterable, Optional
+from functools import partial
+from typing import Callable, Iterable, Optional
 
 import numpy
 import pandas
@@ -25,6 +26,7 @@ from OTAnalytics.application.plotting import (
 from OTAnalytics.application.state import (
     FlowState,
     Plotter,
+    RenderImage,
     SectionState,
     TrackViewState,
 )
@@ -63,6 +65,8 @@ LINEWIDTH_TRACK = 0.6
 TRACK_START_SYMBOL = ">"
 TRACK_END_SYMBOL = "s"
 
+RenderTrackImage = Callable[[], TrackImage]
+
 
 class EventToFlowResolver:
     def __init__(self, flow_repository: FlowRepository) -> None:
@@ -161,6 +165,19 @@ class TrackPlotter(ABC):
     ) -> TrackImage:
         pass
 
+    def snapshot(self, width: int, height: int) -> RenderTrackImage:
+        """Read the data to plot and defer the rendering.
+
+        Args:
+            width (int): width of the image
+            height (int): height of the image
+
+        Returns:
+            RenderTrackImage: renders the image without reading shared state.
+        """
+        image = self.plot(width, height)
+        return lambda: image
+
 
 class PlotterPrototype(Plotter):
     """Convenience Class to add prototype plotters to the layer structure."""
@@ -179,6 +196,12 @@ class PlotterPrototype(Plotter):
             height=self.__get_plotting_height(),
         )
 
+    def snapshot(self) -> RenderImage:
+        return self._track_plotter.snapshot(
+            width=self.__get_plotting_width(),
+            height=self.__get_plotting_height(),
+        )
+
     def __get_plotting_height(self) -> int:
         return self._track_view_state.view_height.get()
 
@@ -833,13 +856,26 @@ class MatplotlibTrackPlotter(TrackPlotter):
         Returns:
             TrackImage: image containing tracks and sections
         """
+        return self.snapshot(width, height)()
+
+    def snapshot(self, width: int, height: int) -> RenderTrackImage:
+        """
+        Add the tracks and sections to a new figure. Drawing the figure is deferred.
+
+        Args:
+            width (int): width of the image
+            height (int): height of the image
+
+        Returns:
+            RenderTrackImage: draws the figure as image.
+        """
         image_width = width / DPI
         image_height = height / DPI
         figure = self._create_figure(width=image_width, height=image_height)
         axes = self._create_axes(image_width, image_height, figure)
         self._plotter.plot(axes)
         self._style_axes(width, height, axes)
-        return self.convert_to_track_image(figure, axes)
+        return partial(self.convert_to_track_image, figure, axes)
 
     def _create_axes(self, width: float, height: float, figure: Figure) -> Axes:
         """
@@ -1,13 +1,19 @@
 from pathlib import Path
 from typing import AsyncIterator
 
+from OTAnalytics.plugin_parser.ottrk_metadata_index import OttrkMetadataIndex
 from OTAnalytics.plugin_parser.otvision_parser import OttrkFormatFixer
 from OTAnalytics.plugin_track_input_source.template import OttrkFileInputSourceTemplate
 
 
 class SingleBatchOttrkFileInputSource(OttrkFileInputSourceTemplate):
-    def __init__(self, format_fixer: OttrkFormatFixer, track_files: set[Path]) -> None:
-        super().__init__(format_fixer)
+    def __init__(
+        self,
+        format_fixer: OttrkFormatFixer,
+        track_files: set[Path],
+        metadata_index: OttrkMetadataIndex | None = None,
+    ) -> None:
+        super().__init__(format_fixer, metadata_index)
         self._track_files = track_files
 
     async def produce(self) -> AsyncIterator[Path]:
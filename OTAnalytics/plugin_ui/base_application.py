@@ -18,11 +18,11 @@ from OTAnalytics.application.analysis.road_user_assignment import (
 from OTAnalytics.application.analysis.traffic_counting import (
     ExportTrafficCounting,
     FilterBySectionEnterEvent,
-    SimpleRoadUserAssigner,
     SimpleTaggerFactory,
     TrafficCounting,
 )
 from OTAnalytics.application.analysis.traffic_counting_specification import ExportCounts
+from OTAnalytics.application.config import DEFAULT_TRACK_CACHE_SIZE_IN_MB
 from OTAnalytics.application.config_specification import OtConfigDefaultValueProvider
 from OTAnalytics.application.datastore import (
     Datastore,
@@ -42,8 +42,10 @@ from OTAnalytics.application.state import (
     ActionState,
     FileState,
     FlowState,
+    RenderScheduler,
     SectionState,
     SelectedVideoUpdate,
+    SynchronousRenderScheduler,
     TrackImageSizeUpdater,
     TrackImageUpdater,
     TracksMetadata,
@@ -174,7 +176,9 @@ from OTAnalytics.application.use_cases.track_repository import (
     RemoveTracksByOriginalIds,
     TrackRepositorySize,
 )
-from OTAnalytics.application.use_cases.track_statistics import CalculateTrackStatistics
+from OTAnalytics.application.use_cases.track_statistics import (
+    TrackStatisticsCalculator,
+)
 from OTAnalytics.application.use_cases.track_statistics_export import (
     ExportTrackStatistics,
     TrackStatisticsExporterFactory,
@@ -202,13 +206,20 @@ from OTAnalytics.domain.video import VideoRepository
 from OTAnalytics.plugin_datastore.filter_polars_track_dataset import (
     FilterByClassPolarsTrackDataset,
 )
+from OTAnalytics.plugin_datastore.polars_road_user_assigner import (
+    PolarsRoadUserAssigner,
+)
 from OTAnalytics.plugin_datastore.polars_track_id_set import PolarsTrackIdSetFactory
+from OTAnalytics.plugin_datastore.polars_track_statistics import (
+    PolarsCalculateTrackStatistics,
+)
 from OTAnalytics.plugin_datastore.polars_track_store import (
     POLARS_TRACK_GEOMETRY_FACTORY,
     PolarsByMaxConfidence,
     PolarsTrackDataset,
 )
 from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store import (
+    PolarsEventDataset,
     PolarsTrackGeometryDataset,
 )
 from OTAnalytics.plugin_intersect.simple.cut_tracks_with_sections import (
@@ -241,7 +252,7 @@ from OTAnalytics.plugin_parser.export import (
     FillZerosExporterFactory,
     SimpleExporterFactory,
 )
-from OTAnalytics.plugin_parser.feathers_parser import FeathersParser
+from OTAnalytics.plugin_parser.feathers_parser import FeathersParser, ScanFilter
 from OTAnalytics.plugin_parser.json_parser import parse_json
 from OTAnalytics.plugin_parser.otconfig_parser import (
     FixMissingAnalysis,
@@ -263,6 +274,7 @@ from OTAnalytics.plugin_parser.streaming_parser import (
     StreamTrackParser,
 )
 from OTAnalytics.plugin_parser.track_export import CsvTrackExport
+from OTAnalytics.plugin_parser.track_parse_cache import TrackParseCache
 from OTAnalytics.plugin_parser.track_statistics_export import (
     CachedTrackStatisticsExporterFactory,
     SimpleTrackStatisticsExporterFactory,
@@ -281,6 +293,10 @@ from OTAnalytics.plugin_ui.visualization.counts.counts_plotter import (
     MultipleCountPlotters,
 )
 from OTAnalytics.plugin_ui.visualization.visualization import VisualizationBuilder
+from OTAnalytics.plugin_video_processing.video_probe import (
+    VIDEO_PROBE_INDEX_FILE,
+    VideoProbeIndex,
+)
 from OTAnalytics.plugin_video_processing.video_reader import PyAvVideoReader
 
 DETECTION_RATE_PERCENTILE_VALUE = 0.9
@@ -546,8 +562,13 @@ class BaseOtAnalyticsApplicationStarter(ABC):
             self.section_state,
             self.flow_state,
             self.layered_plotter,
+            self.render_scheduler,
         )
 
+    @cached_property
+    def render_scheduler(self) -> RenderScheduler:
+        return SynchronousRenderScheduler()
+
     @cached_property
     def video_image_size_updater(self) -> VideoImageSizeUpdater:
         return VideoImageSizeUpdater(self.track_image_size_updater)
@@ -566,11 +587,11 @@ class BaseOtAnalyticsApplicationStarter(ABC):
 
     @cached_property
     def road_user_assigner(self) -> RoadUserAssigner:
-        return FilterBySectionEnterEvent(self.simple_road_user_assigner)
+        return FilterBySectionEnterEvent(self.polars_road_user_assigner)
 
     @cached_property
-    def simple_road_user_assigner(self) -> RoadUserAssigner:
-        return SimpleRoadUserAssigner(self.track_id_set_factory)
+    def polars_road_user_assigner(self) -> RoadUserAssigner:
+        return PolarsRoadUserAssigner(self.track_id_set_factory)
 
     @cached_property
     def file_state(self) -> FileState:
@@ -637,12 +658,25 @@ class BaseOtAnalyticsApplicationStarter(ABC):
         )
 
     def _create_track_parser(self) -> TrackParser:
-        return FeathersParser(self.track_geometry_factory)
+        return FeathersParser(
+            self.track_geometry_factory,
+            self.track_parse_cache,
+            ScanFilter(
+                self.run_config.include_classes, self.run_config.exclude_classes
+            ),
+        )
+
+    @cached_property
+    def track_parse_cache(self) -> TrackParseCache | None:
+        if cache_dir := self.run_config.track_cache_dir:
+            return TrackParseCache(cache_dir, DEFAULT_TRACK_CACHE_SIZE_IN_MB)
+        return None
 
     def _create_stream_track_parser(self) -> StreamTrackParser:
         return StreamOttrkParser(
             track_parser=self._create_track_parser(),
             progressbar=LazyTqdmBuilder(),
+            window=self.run_config.stream_window,
         )
 
     @cached_property
@@ -663,7 +697,7 @@ class BaseOtAnalyticsApplicationStarter(ABC):
 
     @cached_property
     def event_repository(self) -> EventRepository:
-        return EventRepository()
+        return EventRepository(dataset=PolarsEventDataset())
 
     def _create_event_list_parser(self) -> EventListParser:
         return OtEventListParser()
@@ -862,7 +896,18 @@ class BaseOtAnalyticsApplicationStarter(ABC):
 
     @cached_property
     def video_parser(self) -> VideoParser:
-        return create_video_parser(self.videos_metadata, self.track_image_factory)
+        return create_video_parser(
+            self.videos_metadata, self.track_image_factory, self.video_probe_index
+        )
+
+    @cached_property
+    def video_probe_index(self) -> VideoProbeIndex:
+        """Index of probed videos. The index is persisted in the track cache
+        directory if the cache is enabled."""
+        index_file = None
+        if cache_dir := self.run_config.track_cache_dir:
+            index_file = cache_dir / VIDEO_PROBE_INDEX_FILE
+        return VideoProbeIndex(index_file)
 
     @cached_property
     def remark_repository(self) -> RemarkRepository:
@@ -950,33 +995,26 @@ class BaseOtAnalyticsApplicationStarter(ABC):
         )
 
     @cached_property
-    def calculate_track_statistics(self) -> CalculateTrackStatistics:
-        tracks_intersecting_all_sections = FilteredTrackIdProviderByTrackIdProvider(
-            TracksIntersectingAllNonCuttingSections(
-                self.get_cutting_sections,
-                self.get_all_sections,
-                self.tracks_intersecting_sections,
-                self.get_sections_by_id,
-                self.intersection_repository,
-            ),
-            self.all_filtered_track_ids,
+    def calculate_track_statistics(self) -> TrackStatisticsCalculator:
+        tracks_intersecting_all_sections = TracksIntersectingAllNonCuttingSections(
+            self.get_cutting_sections,
+            self.get_all_sections,
+            self.tracks_intersecting_sections,
+            self.get_sections_by_id,
+            self.intersection_repository,
         )
-        tracks_assigned_to_all_flows = FilteredTrackIdProviderByTrackIdProvider(
-            TracksAssignedToAllFlows(
-                self.get_all_assignments,
-                self.flow_repository,
-                self.track_id_set_factory,
-            ),
-            self.all_filtered_track_ids,
+        tracks_assigned_to_all_flows = TracksAssignedToAllFlows(
+            self.get_all_assignments,
+            self.flow_repository,
+            self.track_id_set_factory,
         )
-        track_ids_inside_cutting_sections = FilteredTrackIdProviderByTrackIdProvider(
+        track_ids_inside_cutting_sections = (
             self._create_cached_track_ids_inside_cutting_sections(
                 self.get_all_tracks,
                 self.get_cutting_sections,
                 self.track_repository,
                 self.section_repository,
-            ),
-            self.all_filtered_track_ids,
+            )
         )
         tracks_as_dataframe_provider = TracksAsDataFrameProvider(
             get_all_tracks=self.get_all_tracks,
@@ -988,12 +1026,14 @@ class BaseOtAnalyticsApplicationStarter(ABC):
         metric_rates_builder = MetricRatesBuilder(SVZ_CLASSIFICATION)
         number_of_tracks_to_be_validated = SvzNumberOfTracksToBeValidated(
             tracks_provider=tracks_as_dataframe_provider,
-            tracks_assigned_to_all_flows=tracks_assigned_to_all_flows,
+            tracks_assigned_to_all_flows=FilteredTrackIdProviderByTrackIdProvider(
+                tracks_assigned_to_all_flows, self.all_filtered_track_ids
+            ),
             detection_rate_strategy=detection_rate_strategy,
             metric_rates_builder=metric_rates_builder,
         )
         get_events = GetAllEnterSectionEvents(event_repository=self.event_repository)
-        return CalculateTrackStatistics(
+        return PolarsCalculateTrackStatistics(
             tracks_intersecting_all_sections,
             tracks_assigned_to_all_flows,
             self.all_filtered_track_ids,
@@ -1129,10 +1169,14 @@ def create_format_fixer(
 
 
 def create_video_parser(
-    videos_metadata: VideosMetadata, track_image_factory: TrackImageFactory
+    videos_metadata: VideosMetadata,
+    track_image_factory: TrackImageFactory,
+    probe_index: VideoProbeIndex | None = None,
 ) -> VideoParser:
     return CachedVideoParser(
-        SimpleVideoParser(PyAvVideoReader(videos_metadata, track_image_factory))
+        SimpleVideoParser(
+            PyAvVideoReader(videos_metadata, track_image_factory, probe_index)
+        )
     )
 
 
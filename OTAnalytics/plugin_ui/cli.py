@@ -1,7 +1,7 @@
 import asyncio
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import AsyncIterator, Iterable
+from typing import AsyncIterator, Iterable, TypeVar
 
 from OTAnalytics.application.analysis.road_user_assignment import (
     RoadUserAssignmentRepository,
@@ -29,6 +29,7 @@ from OTAnalytics.application.use_cases.apply_cli_cuts import ApplyCliCuts
 from OTAnalytics.application.use_cases.create_events import CreateEvents
 from OTAnalytics.application.use_cases.export_events import (
     EventExportSpecification,
+    EventListExporter,
     EventListExporterProvider,
 )
 from OTAnalytics.application.use_cases.flow_repository import AddFlow
@@ -49,24 +50,64 @@ from OTAnalytics.application.use_cases.track_repository import (
     AddAllTracks,
     ClearAllTracks,
     GetAllTrackIds,
+    GetAllTracks,
 )
 from OTAnalytics.application.use_cases.track_statistics_export import (
     ExportTrackStatistics,
     TrackStatisticsExportSpecification,
 )
-from OTAnalytics.domain.event import EventRepository
+from OTAnalytics.domain.event import EventDataset, EventRepository
 from OTAnalytics.domain.flow import Flow
 from OTAnalytics.domain.progress import ProgressbarBuilder
 from OTAnalytics.domain.section import Section
 from OTAnalytics.domain.track_dataset.track_dataset import TrackDataset
 from OTAnalytics.domain.track_repository import TrackRepositoryEvent
+from OTAnalytics.plugin_parser.export import spill_directory_of
+from OTAnalytics.plugin_parser.ottrk_metadata_index import (
+    METADATA_INDEX_FILE,
+    OttrkMetadataIndex,
+)
 from OTAnalytics.plugin_parser.otvision_parser import OttrkFormatFixer
 from OTAnalytics.plugin_parser.road_user_assignment_export import CSV_FORMAT
-from OTAnalytics.plugin_parser.streaming_parser import StreamTrackParser
+from OTAnalytics.plugin_parser.stream_checkpoint import (
+    CHECKPOINT_SUFFIX,
+    CheckpointError,
+    StreamCheckpoint,
+    StreamCheckpointStore,
+)
+from OTAnalytics.plugin_parser.streaming_parser import (
+    StreamPosition,
+    StreamTrackParser,
+)
+from OTAnalytics.plugin_parser.track_export import TRACKS_CSV_SUFFIX
+from OTAnalytics.plugin_prototypes.eventlist_exporter.eventlist_exporter import (
+    EXTENSION_CSV,
+)
 from OTAnalytics.plugin_track_input_source.single_batch import (
     SingleBatchOttrkFileInputSource,
 )
 
+STREAM_PREFETCH_SIZE = 1
+"""Number of chunks buffered between two stages of the stream pipeline. A stage
+blocked on a full buffer holds one more chunk. Thus, parsing, event creation and
+export hold at most 3 * STREAM_PREFETCH_SIZE + 3 chunks at once."""
+
+RESUMABLE_EVENT_FORMATS = frozenset([EXTENSION_CSV])
+"""Event formats appending to the exported file. Other formats collect the events in
+memory and can not be continued after an interruption."""
+EXPORTABLE_TRACK_FORMATS = frozenset(
+    [
+        TrackFileFormat.CSV.value,
+        TrackFileFormat.PARQUET.value,
+        TrackFileFormat.ARROW.value,
+    ]
+)
+RESUMABLE_TRACK_FORMATS = frozenset([TrackFileFormat.CSV.value])
+"""Track formats appending to the exported file. Columnar formats keep their file
+open until the last chunk and can not be continued after an interruption."""
+
+T = TypeVar("T")
+
 
 class SectionsFileDoesNotExist(Exception):
     pass
@@ -111,6 +152,7 @@ class OTAnalyticsCli(ABC):
         self._create_events = create_events
         self._export_counts = export_counts
         self._provide_eventlist_exporter = provide_eventlist_exporter
+        self._event_list_exporters: dict[str, EventListExporter] = {}
 
         self._apply_cli_cuts = apply_cli_cuts
         self._add_all_tracks = add_all_tracks
@@ -192,6 +234,7 @@ class OTAnalyticsCli(ABC):
         Raises:
             CliParseError: if no track file has been passed.
             CliParseError: if no otflow file has been passed.
+            CliParseError: if an unknown track format has been passed.
         """
 
         if not run_config.track_files:
@@ -200,6 +243,20 @@ class OTAnalyticsCli(ABC):
         if not run_config.config_file and not run_config.otflow:
             raise CliParseError("No otflow or otconfig file passed. Abort analysis.")
 
+        if unknown := run_config.track_formats - EXPORTABLE_TRACK_FORMATS:
+            raise CliParseError(
+                f"Track formats {sorted(unknown)} are not supported. "
+                f"Supported formats are: {sorted(EXPORTABLE_TRACK_FORMATS)}"
+            )
+
+    def _create_ottrk_metadata_index(self) -> OttrkMetadataIndex:
+        """Create the index of ottrk metadata. The index is persisted in the track
+        cache directory if the cache is enabled."""
+        index_file = None
+        if cache_dir := self._run_config.track_cache_dir:
+            index_file = cache_dir / METADATA_INDEX_FILE
+        return OttrkMetadataIndex(index_file, OttrkFormatFixer())
+
     @staticmethod
     def _get_ottrk_files(files: Iterable[Path]) -> set[Path]:
         """Parse ottrk files.
@@ -259,18 +316,27 @@ class OTAnalyticsCli(ABC):
 
         return sections_file
 
+    def _get_event_list_exporter(self, event_format: str) -> EventListExporter:
+        """Returns the exporter of the given format. Incremental exports append to
+        the same file over several calls, thus the exporter is kept for the run."""
+        if event_format not in self._event_list_exporters:
+            self._event_list_exporters[event_format] = self._provide_eventlist_exporter(
+                event_format
+            )
+        return self._event_list_exporters[event_format]
+
     async def _export_events(
         self,
         sections: Iterable[Section],
         save_path: Path,
         export_mode: ExportMode,
     ) -> None:
-        events = self._event_repository.get_all()
+        events = self._event_repository.get_dataset()
 
         for event_format in self._run_config.event_formats:
-            event_list_exporter = self._provide_eventlist_exporter(event_format)
-            actual_save_path = save_path.with_suffix(
-                f".events{event_list_exporter.get_extension()}"
+            event_list_exporter = self._get_event_list_exporter(event_format)
+            actual_save_path = self._event_file_of(
+                save_path, event_list_exporter.get_extension()
             )
 
             event_export_specification = EventExportSpecification(
@@ -284,9 +350,7 @@ class OTAnalyticsCli(ABC):
             logger().info(f"Event list saved at '{actual_save_path}'")
             await self._after_event_file_export(actual_save_path)
 
-        assignment_path = save_path.with_suffix(
-            f".{CONTEXT_FILE_TYPE_ROAD_USER_ASSIGNMENTS}.csv"
-        )
+        assignment_path = self._road_user_assignment_file_of(save_path)
         specification = ExportSpecification(
             save_path=assignment_path, format=CSV_FORMAT.name, mode=export_mode
         )
@@ -296,6 +360,22 @@ class OTAnalyticsCli(ABC):
         logger().info(f"Road user assignment saved at '{assignment_path}'")
         await self._after_road_user_assignment_export(assignment_path)
 
+    @staticmethod
+    def _event_file_of(save_path: Path, extension: str) -> Path:
+        return save_path.with_suffix(f".events{extension}")
+
+    @staticmethod
+    def _road_user_assignment_file_of(save_path: Path) -> Path:
+        return save_path.with_suffix(f".{CONTEXT_FILE_TYPE_ROAD_USER_ASSIGNMENTS}.csv")
+
+    @staticmethod
+    def _count_file_of(save_path: Path, count_interval: int) -> Path:
+        return save_path.with_suffix(
+            f".{CONTEXT_FILE_TYPE_COUNTS}_{count_interval}"
+            f"{DEFAULT_COUNT_INTERVAL_TIME_UNIT}."
+            f"{DEFAULT_COUNTS_FILE_TYPE}"
+        )
+
     async def _after_event_file_export(self, event_file: Path) -> None:
         """Hook to execute after event file export."""
         pass
@@ -321,24 +401,24 @@ class OTAnalyticsCli(ABC):
             raise ValueError("end is None but has to be defined for exporting counts")
         if modes is None:
             raise ValueError("modes is None but has to be defined for exporting counts")
+        specifications: list[CountingSpecificationDto] = []
         for count_interval in self._run_config.count_intervals:
-            output_file = save_path.with_suffix(
-                f".{CONTEXT_FILE_TYPE_COUNTS}_{count_interval}"
-                f"{DEFAULT_COUNT_INTERVAL_TIME_UNIT}."
-                f"{DEFAULT_COUNTS_FILE_TYPE}"
-            )
-            counting_specification = CountingSpecificationDto(
-                start=start,
-                end=end,
-                modes=list(modes),
-                interval_in_minutes=count_interval,
-                output_file=str(output_file),
-                output_format="CSV",
-                export_mode=export_mode,
-                counting_event=self._run_config.counting_event,
+            output_file = self._count_file_of(save_path, count_interval)
+            specifications.append(
+                CountingSpecificationDto(
+                    start=start,
+                    end=end,
+                    modes=list(modes),
+                    interval_in_minutes=count_interval,
+                    output_file=str(output_file),
+                    output_format="CSV",
+                    export_mode=export_mode,
+                    counting_event=self._run_config.counting_event,
+                )
             )
-            await asyncio.to_thread(self._export_counts.export, counting_specification)
-            await self._after_count_export(output_file)
+        await asyncio.to_thread(self._export_counts.export_all, specifications)
+        for specification in specifications:
+            await self._after_count_export(Path(specification.output_file))
 
     async def _after_count_export(self, counts_file: Path) -> None:
         """Hook to execute after counts export."""
@@ -348,7 +428,10 @@ class OTAnalyticsCli(ABC):
         logger().info("Start tracks export")
         specification = TrackExportSpecification(
             save_path=save_path,
-            export_format=[TrackFileFormat.CSV, TrackFileFormat.OTTRK],
+            export_format=[
+                TrackFileFormat(track_format)
+                for track_format in sorted(self._run_config.track_formats)
+            ],
             export_mode=export_mode,
         )
         await asyncio.to_thread(self._export_tracks.export, specification)
@@ -387,7 +470,9 @@ class OTAnalyticsBulkCli(OTAnalyticsCli):
     @property
     def ottrk_file_input_source(self) -> OttrkFileInputSource:
         return SingleBatchOttrkFileInputSource(
-            format_fixer=OttrkFormatFixer(), track_files=self._run_config.track_files
+            format_fixer=OttrkFormatFixer(),
+            track_files=self._run_config.track_files,
+            metadata_index=self._create_ottrk_metadata_index(),
         )
 
     def __init__(
@@ -451,8 +536,11 @@ class OTAnalyticsBulkCli(OTAnalyticsCli):
         async for track_file in input_source.produce():
             track_files.append(track_file)
 
-        for track_file in self._progressbar(track_files, "Parsed track files", "files"):
-            parse_result = self._track_parser.parse(track_file)
+        parse_results = self._track_parser.parse_each(track_files)
+        for parse_result, _ in zip(
+            parse_results,
+            self._progressbar(track_files, "Parsed track files", "files"),
+        ):
             self._add_all_tracks(parse_result.tracks)
             self._tracks_metadata.update_detection_classes(
                 parse_result.detection_metadata.detection_classes
@@ -460,6 +548,65 @@ class OTAnalyticsBulkCli(OTAnalyticsCli):
             self._videos_metadata.update(parse_result.video_metadata)
 
 
+class StreamEventCreation:
+    """Creates the events of the track chunks of a stream.
+
+    The tracks are cut and analysed in repositories of their own. Thus, the events of
+    the next chunk can be created while the previous chunk is exported from the
+    repositories of the cli.
+    """
+
+    def __init__(
+        self,
+        add_section: AddSection,
+        get_all_sections: GetAllSections,
+        apply_cli_cuts: ApplyCliCuts,
+        add_all_tracks: AddAllTracks,
+        get_all_tracks: GetAllTracks,
+        clear_all_tracks: ClearAllTracks,
+        create_events: CreateEvents,
+        event_repository: EventRepository,
+    ) -> None:
+        self._add_section = add_section
+        self._get_all_sections = get_all_sections
+        self._apply_cli_cuts = apply_cli_cuts
+        self._add_all_tracks = add_all_tracks
+        self._get_all_tracks = get_all_tracks
+        self._clear_all_tracks = clear_all_tracks
+        self._create_events = create_events
+        self._event_repository = event_repository
+
+    def add_sections(self, sections: Iterable[Section]) -> None:
+        for section in sections:
+            self._add_section(section)
+
+    def create_events_of(
+        self, tracks: TrackDataset
+    ) -> tuple[TrackDataset, EventDataset]:
+        """Cut the given tracks and create their events.
+
+        Args:
+            tracks (TrackDataset): the tracks of a chunk.
+
+        Returns:
+            tuple[TrackDataset, EventDataset]: the cut tracks and their events.
+        """
+        self._add_all_tracks(tracks)
+        self._apply_cli_cuts.apply(
+            self._get_all_sections(), preserve_cutting_sections=True
+        )
+
+        logger().info("Create event list ...")
+        self._create_events()
+        logger().info("Event list created.")
+
+        cut_tracks = self._get_all_tracks.as_dataset()
+        events = self._event_repository.get_dataset()
+        self._clear_all_tracks()
+        self._event_repository.clear()
+        return cut_tracks, events
+
+
 class OTAnalyticsStreamCli(OTAnalyticsCli):
 
     @property
@@ -467,6 +614,7 @@ class OTAnalyticsStreamCli(OTAnalyticsCli):
         return SingleBatchOttrkFileInputSource(
             format_fixer=OttrkFormatFixer(),
             track_files=self._run_config.track_files,
+            metadata_index=self._create_ottrk_metadata_index(),
         )
 
     def __init__(
@@ -490,6 +638,7 @@ class OTAnalyticsStreamCli(OTAnalyticsCli):
         export_tracks: ExportTracks,
         export_road_user_assignments: ExportRoadUserAssignments,
         track_parser: StreamTrackParser,
+        event_creation: StreamEventCreation,
     ) -> None:
         super().__init__(
             run_config,
@@ -512,58 +661,216 @@ class OTAnalyticsStreamCli(OTAnalyticsCli):
             export_track_statistics,
         )
         self._track_parser = track_parser
+        self._event_creation = event_creation
 
     async def _parse_track_stream(
-        self, input_source: OttrkFileInputSource
-    ) -> AsyncIterator[TrackDataset]:
+        self, input_source: OttrkFileInputSource, position: StreamPosition | None
+    ) -> AsyncIterator[tuple[TrackDataset, StreamPosition]]:
         self._track_parser.register_tracks_metadata(self._tracks_metadata)
         self._track_parser.register_videos_metadata(self._videos_metadata)
 
-        return self._track_parser.parse(input_source)
+        return self._track_parser.parse_from(input_source, position)
+
+    def _prepare_analysis(
+        self, sections: Iterable[Section], flows: Iterable[Flow]
+    ) -> None:
+        super()._prepare_analysis(sections, flows)
+        self._event_creation.add_sections(sections)
 
     async def _run_analysis(self, input_source: OttrkFileInputSource) -> None:
-        """Run analysis."""
-        sections = self._run_config.sections
-        is_first = True
+        """Run analysis.
 
-        track_stream = await self._parse_track_stream(input_source)
+        Parsing, event creation and export of the chunks run as stages connected by
+        bounded queues. Thus, the next chunk is parsed and the events of the current
+        chunk are created while the previous chunk is exported.
+        """
+        sections = self._run_config.sections
+        checkpoint_store = self._create_checkpoint_store()
+        checkpoint = self._restore_checkpoint(checkpoint_store)
+        is_first = checkpoint is None
+        is_resumed = checkpoint is not None
+
+        track_stream = self._prefetch(
+            await self._parse_track_stream(
+                input_source, checkpoint.position if checkpoint else None
+            ),
+            STREAM_PREFETCH_SIZE,
+        )
+        event_stream = self._prefetch(
+            self._create_events_of(track_stream), STREAM_PREFETCH_SIZE
+        )
 
-        async for track_ds, is_last in self._iter_with_is_last(track_stream):
+        async for track_ds, events, position in event_stream:
             self._add_all_tracks(track_ds)
+            self._event_repository.add_all(events)
 
-            self._apply_cli_cuts.apply(
-                self._get_all_sections(), preserve_cutting_sections=True
-            )
+            export_mode = ExportMode.create(is_first, flush=False, resumed=is_resumed)
+            await super()._export_analysis(sections, export_mode)
+            self._clear_analysis()
 
-            logger().info("Create event list ...")
-            self._create_events()
-            logger().info("Event list created.")
+            if checkpoint_store is not None:
+                await asyncio.to_thread(
+                    self._save_checkpoint, checkpoint_store, position
+                )
 
-            export_mode = ExportMode.create(is_first, flush=is_last)
+            is_first = False
+            is_resumed = False
 
-            await super()._export_analysis(sections, export_mode)
+        if is_first:
+            return
+        export_mode = ExportMode.create(is_first, flush=True, resumed=is_resumed)
+        await super()._export_analysis(sections, export_mode)
+        if checkpoint_store is not None:
+            checkpoint_store.delete()
+        logger().info("Stream CLI reached last chunk.")
+
+    async def _create_events_of(
+        self, track_stream: AsyncIterator[tuple[TrackDataset, StreamPosition]]
+    ) -> AsyncIterator[tuple[TrackDataset, EventDataset, StreamPosition]]:
+        async for track_ds, position in track_stream:
+            cut_tracks, events = await asyncio.to_thread(
+                self._event_creation.create_events_of, track_ds
+            )
+            yield cut_tracks, events, position
 
-            self._clear_all_tracks()
-            self._event_repository.clear()
-            self._assignment_repository.clear()
+    def _clear_analysis(self) -> None:
+        self._clear_all_tracks()
+        self._event_repository.clear()
+        self._assignment_repository.clear()
+
+    def _create_checkpoint_store(self) -> StreamCheckpointStore | None:
+        """Create the checkpoint store if the run should be resumable."""
+        if not self._run_config.resume:
+            return None
+        if not self._is_resumable():
+            return None
+        save_path = self._run_config.save_dir / self._run_config.save_name
+        return StreamCheckpointStore(save_path.with_suffix(CHECKPOINT_SUFFIX))
+
+    def _is_resumable(self) -> bool:
+        event_formats = {
+            event_format.lower().lstrip(".")
+            for event_format in self._run_config.event_formats
+        }
+        if unsupported := event_formats - RESUMABLE_EVENT_FORMATS:
+            logger().warning(
+                f"Event formats {sorted(unsupported)} can not be resumed. "
+                "No checkpoints will be saved."
+            )
+            return False
+        if self._run_config.do_export_track_statistics:
+            logger().warning(
+                "Track statistics can not be resumed. No checkpoints will be saved."
+            )
+            return False
+        if self._run_config.do_export_tracks and (
+            unsupported := self._run_config.track_formats - RESUMABLE_TRACK_FORMATS
+        ):
+            logger().warning(
+                f"Track formats {sorted(unsupported)} can not be resumed. "
+                "No checkpoints will be saved."
+            )
+            return False
+        return True
+
+    def _restore_checkpoint(
+        self, checkpoint_store: StreamCheckpointStore | None
+    ) -> StreamCheckpoint | None:
+        """Load the checkpoint of an interrupted run and reset the exported files
+        to their state at the checkpoint."""
+        if checkpoint_store is None:
+            return None
+        checkpoint = checkpoint_store.load(self._checkpoint_run_key())
+        if checkpoint is None:
+            checkpoint_store.delete()
+            return None
+        try:
+            checkpoint_store.restore(checkpoint)
+        except CheckpointError as cause:
+            logger().warning(f"Could not resume from checkpoint: {cause}")
+            checkpoint_store.delete()
+            return None
+        logger().info(
+            "Resume analysis after "
+            f"{len(checkpoint.position.processed_files)} processed ottrk files."
+        )
+        return checkpoint
 
-            is_first = False
-            if is_last:
-                logger().info("Stream CLI reached last chunk.")
+    def _save_checkpoint(
+        self, checkpoint_store: StreamCheckpointStore, position: StreamPosition
+    ) -> None:
+        save_path = self._run_config.save_dir / self._run_config.save_name
+        checkpoint_store.save(
+            self._checkpoint_run_key(),
+            position,
+            appended_files=self._appended_files_of(save_path),
+            directories=[
+                spill_directory_of(self._count_file_of(save_path, count_interval))
+                for count_interval in self._run_config.count_intervals
+            ],
+        )
+
+    def _appended_files_of(self, save_path: Path) -> list[Path]:
+        """Returns the exported files results of each chunk are appended to."""
+        files = [
+            self._event_file_of(save_path, f".{event_format}")
+            for event_format in RESUMABLE_EVENT_FORMATS
+        ]
+        files.append(self._road_user_assignment_file_of(save_path))
+        if (
+            self._run_config.do_export_tracks
+            and TrackFileFormat.CSV.value in self._run_config.track_formats
+        ):
+            files.append(save_path.with_suffix(TRACKS_CSV_SUFFIX))
+        return files
+
+    def _checkpoint_run_key(self) -> str:
+        """Identifies the parts of the configuration a checkpoint depends on."""
+        config = self._run_config
+        return repr(
+            (
+                sorted(str(file.expanduser().resolve()) for file in config.track_files),
+                [section.to_dict() for section in config.sections],
+                [flow.to_dict() for flow in config.flows],
+                sorted(config.event_formats),
+                sorted(config.count_intervals),
+                str(config.counting_event),
+                config.stream_window,
+                config.do_export_tracks,
+                sorted(config.track_formats),
+                sorted(config.include_classes),
+                sorted(config.exclude_classes),
+            )
+        )
 
     @staticmethod
-    async def _iter_with_is_last(
-        stream: AsyncIterator[TrackDataset],
-    ) -> AsyncIterator[tuple[TrackDataset, bool]]:
-        iterator = aiter(stream)
+    async def _prefetch(stream: AsyncIterator[T], max_size: int) -> AsyncIterator[T]:
+        """Produce the next chunks of the stream while the current chunk is consumed.
+
+        The chunks are produced by a separate task into a bounded queue. Thus, at
+        most max_size chunks are buffered ahead of the consumer and one more chunk is
+        held by the producer while it waits for space in the queue. Errors of the
+        stream are raised by the consumer.
+        """
+        queue: asyncio.Queue[T | Exception | None] = asyncio.Queue(maxsize=max_size)
+
+        async def produce() -> None:
+            try:
+                async for item in stream:
+                    await queue.put(item)
+            except Exception as cause:
+                await queue.put(cause)
+            else:
+                await queue.put(None)
+
+        producer = asyncio.create_task(produce())
         try:
-            current = await anext(iterator)
-        except StopAsyncIteration:
-            return
-        async for item in iterator:
-            yield current, False
-            current = item
-        yield current, True
+            while (item := await queue.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
 
     async def _export_analysis(
         self, sections: Iterable[Section], export_mode: ExportMode
@@ -2,8 +2,12 @@ from functools import cached_property
 from typing import Protocol
 
 from OTAnalytics.adapter_ui.ui_factory import UiFactory
+from OTAnalytics.application.state import RenderScheduler
 from OTAnalytics.domain.progress import ProgressbarBuilder
 from OTAnalytics.plugin_progress.tqdm_progressbar import TqdmBuilder
+from OTAnalytics.plugin_prototypes.track_visualization.render_scheduler import (
+    DebouncedRenderScheduler,
+)
 from OTAnalytics.plugin_prototypes.track_visualization.track_viz import (
     PilImageFactory,
     TrackImageFactory,
@@ -81,7 +85,10 @@ class Webserver(Protocol):
 class OtAnalyticsNiceGuiApplicationStarter(OtAnalyticsGuiApplicationStarter):
 
     def start_ui(self) -> None:
-        self.webserver.run()
+        try:
+            self.webserver.run()
+        finally:
+            self.render_scheduler.shutdown()
 
     @cached_property
     def webserver(self) -> Webserver:
@@ -238,3 +245,7 @@ class OtAnalyticsNiceGuiApplicationStarter(OtAnalyticsGuiApplicationStarter):
     @cached_property
     def track_image_factory(self) -> TrackImageFactory:
         return PilImageFactory()
+
+    @cached_property
+    def render_scheduler(self) -> RenderScheduler:
+        return DebouncedRenderScheduler()
@@ -49,6 +49,11 @@ from OTAnalytics.plugin_intersect.simple_intersect import (
     SimpleTracksIntersectingSections,
 )
 from OTAnalytics.plugin_prototypes.event_visualization import PandasEventProvider
+from OTAnalytics.plugin_prototypes.track_visualization.raster import (
+    RasterTrackGeometryPlotter,
+    RasterTrackPlotter,
+    RasterTrackStartEndPointPlotter,
+)
 from OTAnalytics.plugin_prototypes.track_visualization.track_viz import (
     FRAME_OFFSET,
     EventToFlowResolver,
@@ -739,9 +744,12 @@ class VisualizationBuilder:
         alpha: float,
         enable_legend: bool,
     ) -> Plotter:
-        track_plotter = MatplotlibTrackPlotter(
-            create_track_geometry_plotter(
-                pandas_data_provider, color_palette_provider, alpha, enable_legend
+        track_plotter = RasterTrackPlotter(
+            RasterTrackGeometryPlotter(
+                pandas_data_provider,
+                color_palette_provider,
+                enable_legend=enable_legend,
+                alpha=alpha,
             ),
             track_image_factory=self._track_image_factory,
         )
@@ -758,7 +766,6 @@ class VisualizationBuilder:
                 other=id_filter,
                 track_repository=self._track_repository,
                 track_view_state=self._track_view_state,
-                track_id_set_factory=self._track_id_set_factory,
             ),
         )
 
@@ -769,8 +776,8 @@ class VisualizationBuilder:
         alpha: float,
         enable_legend: bool,
     ) -> Plotter:
-        track_plotter = MatplotlibTrackPlotter(
-            TrackStartEndPointPlotter(
+        track_plotter = RasterTrackPlotter(
+            RasterTrackStartEndPointPlotter(
                 data_provider,
                 color_palette_provider,
                 enable_legend=enable_legend,
@@ -840,7 +847,6 @@ class VisualizationBuilder:
                 ),
                 track_repository=self._track_repository,
                 track_view_state=self._track_view_state,
-                track_id_set_factory=self._track_id_set_factory,
             ),
         )
 
@@ -895,7 +901,6 @@ class VisualizationBuilder:
                 ),
                 track_repository=self._track_repository,
                 track_view_state=self._track_view_state,
-                track_id_set_factory=self._track_id_set_factory,
             ),
         )
 
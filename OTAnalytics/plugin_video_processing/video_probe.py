@@ -0,0 +1,313 @@
+"""
+Persistent index of video probe results.
+
+Reading frames of a video requires its frame rate, number of frames and rotation.
+Videos without a frame count in their header have to be read completely to count
+their frames. Seeking to a frame is only exact if the keyframes of the video are
+known. The index stores these probe results of each video in a JSON file. Thus,
+opening a project with many videos does not probe the videos again. Entries are
+invalidated if the size or modification time of the video changes.
+"""
+
+import os
+from bisect import bisect_right
+from dataclasses import dataclass
+from fractions import Fraction
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable
+from uuid import uuid4
+
+import av
+import ujson
+
+from OTAnalytics.application.logger import logger
+from OTAnalytics.domain.video import InvalidVideoError
+from OTAnalytics.plugin_parser.json_parser import ENCODING
+
+VIDEO_PROBE_INDEX_FILE = "video_probe_index.json"
+VIDEO_PROBE_INDEX_VERSION = "1"
+"""Version of the index file. Increase if the stored probe results change."""
+
+DISPLAYMATRIX = "DISPLAYMATRIX"
+
+KEY_VERSION = "version"
+KEY_ENTRIES = "entries"
+KEY_SIZE = "size"
+KEY_MODIFIED = "modified_ns"
+KEY_FRAMERATE = "framerate"
+KEY_TOTAL_FRAMES = "total_frames"
+KEY_SIDE_DATA = "side_data"
+KEY_KEYFRAMES = "keyframes"
+KEY_KEYFRAME_PTS = "keyframe_pts"
+
+
+@dataclass(frozen=True)
+class Keyframes:
+    """Keyframes of a video sorted by their frame number.
+
+    Attributes:
+        frames (tuple[int, ...]): frame numbers of the keyframes.
+        pts (tuple[int, ...]): presentation timestamps of the keyframes in the time
+            base of the video stream.
+    """
+
+    frames: tuple[int, ...]
+    pts: tuple[int, ...]
+
+    def nearest(self, frame: int) -> tuple[int, int] | None:
+        """Returns the frame number and timestamp of the last keyframe at or before
+        the given frame.
+
+        Args:
+            frame (int): the frame to find the keyframe for.
+
+        Returns:
+            tuple[int, int] | None: frame number and timestamp of the keyframe or None
+                if there is no keyframe before the given frame.
+        """
+        position = bisect_right(self.frames, frame) - 1
+        if position < 0:
+            return None
+        return self.frames[position], self.pts[position]
+
+
+@dataclass(frozen=True)
+class VideoProbe:
+    """Probe results of a video.
+
+    Attributes:
+        framerate (Fraction): average frame rate of the video.
+        total_frames (int): number of frames. Zero if the header of the video does
+            not contain the number of frames and the video has not been read
+            completely.
+        side_data (dict): rotation side data of the video stream.
+        keyframes (Keyframes | None): keyframes of the video. None if the video has
+            not been read completely.
+    """
+
+    framerate: Fraction
+    total_frames: int
+    side_data: dict
+    keyframes: Keyframes | None = None
+
+    def to_dict(self) -> dict:
+        data: dict = {
+            KEY_FRAMERATE: [self.framerate.numerator, self.framerate.denominator],
+            KEY_TOTAL_FRAMES: self.total_frames,
+            KEY_SIDE_DATA: self.side_data,
+        }
+        if self.keyframes is not None:
+            data[KEY_KEYFRAMES] = list(self.keyframes.frames)
+            data[KEY_KEYFRAME_PTS] = list(self.keyframes.pts)
+        return data
+
+    @staticmethod
+    def from_dict(data: dict) -> "VideoProbe":
+        numerator, denominator = data[KEY_FRAMERATE]
+        keyframes = None
+        if KEY_KEYFRAMES in data:
+            keyframes = Keyframes(
+                tuple(data[KEY_KEYFRAMES]), tuple(data[KEY_KEYFRAME_PTS])
+            )
+        return VideoProbe(
+            framerate=Fraction(numerator, denominator),
+            total_frames=data[KEY_TOTAL_FRAMES],
+            side_data=data[KEY_SIDE_DATA],
+            keyframes=keyframes,
+        )
+
+
+VideoProber = Callable[[Path, bool], VideoProbe]
+
+
+def probe_video(video_path: Path, with_keyframes: bool) -> VideoProbe:
+    """Probe the given video.
+
+    Without keyframes, only the header of the video is read. Otherwise, all packets
+    of the video stream are read without decoding them to count the frames and to
+    collect the keyframes.
+
+    Args:
+        video_path (Path): the video to probe.
+        with_keyframes (bool): whether to read the whole video.
+
+    Raises:
+        InvalidVideoError: if the file is not a valid video.
+        ValueError: if the frame rate of the video is unknown.
+
+    Returns:
+        VideoProbe: the probe results of the video.
+    """
+    try:
+        container = av.open(str(video_path.absolute()))
+    except IOError as e:
+        raise InvalidVideoError(f"{str(video_path)} is not a valid video") from e
+    try:
+        if len(container.streams.video) <= 0:
+            raise InvalidVideoError(f"{str(video_path)} is not a video")
+        stream = container.streams.video[0]
+        framerate = stream.average_rate
+        if framerate is None:
+            raise ValueError(f"Could not read frames per second from {str(video_path)}")
+        side_data = {
+            key: value
+            for key, value in stream.side_data.items()
+            if key == DISPLAYMATRIX
+        }
+        if not with_keyframes:
+            return VideoProbe(framerate, stream.frames, side_data)
+        time_base = stream.time_base if stream.time_base else Fraction(av.time_base, 1)
+        total_frames = 0
+        keyframes: list[tuple[int, int]] = []
+        for packet in container.demux(stream):
+            if packet.pts is None:
+                # Flush packets at the end of the stream do not contain a frame.
+                continue
+            total_frames += 1
+            if packet.is_keyframe:
+                frame = round(framerate * packet.pts * time_base)
+                keyframes.append((frame, packet.pts))
+        keyframes.sort()
+        return VideoProbe(
+            framerate,
+            total_frames,
+            side_data,
+            Keyframes(
+                tuple(frame for frame, _ in keyframes),
+                tuple(pts for _, pts in keyframes),
+            ),
+        )
+    finally:
+        container.close()
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    size: int
+    modified_ns: int
+    probe: VideoProbe
+
+    def is_valid_for(self, stat: os.stat_result) -> bool:
+        return self.size == stat.st_size and self.modified_ns == stat.st_mtime_ns
+
+    def to_dict(self) -> dict:
+        return {
+            KEY_SIZE: self.size,
+            KEY_MODIFIED: self.modified_ns,
+            **self.probe.to_dict(),
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "IndexEntry":
+        return IndexEntry(
+            size=data[KEY_SIZE],
+            modified_ns=data[KEY_MODIFIED],
+            probe=VideoProbe.from_dict(data),
+        )
+
+
+class VideoProbeIndex:
+    """Index of the probe results of videos.
+
+    New probe results are saved immediately, because probing a video may require
+    reading it completely.
+
+    Args:
+        index_file (Path | None): JSON file to persist the index in. The index is
+            only kept in memory if no file is given.
+        prober (VideoProber): probes a video.
+    """
+
+    def __init__(
+        self,
+        index_file: Path | None = None,
+        prober: VideoProber = probe_video,
+    ) -> None:
+        self._index_file = index_file
+        self._prober = prober
+        self._lock = Lock()
+        self._entries: dict[str, IndexEntry] | None = None
+
+    def get(self, video_path: Path, with_keyframes: bool = False) -> VideoProbe:
+        """Returns the probe results of the given video.
+
+        The video is probed if it is not indexed yet, if it changed since it was
+        indexed or if keyframes are requested but not indexed.
+
+        Args:
+            video_path (Path): the video to get the probe results for.
+            with_keyframes (bool): whether the keyframes and the exact number of
+                frames are required.
+
+        Returns:
+            VideoProbe: the probe results of the video.
+        """
+        key = str(video_path.resolve())
+        stat = video_path.stat()
+        with self._lock:
+            if (probe := self._get_valid(key, stat, with_keyframes)) is not None:
+                return probe
+
+        # Probing may read the whole video. Other videos can be looked up meanwhile.
+        probe = self._prober(video_path, with_keyframes)
+        with self._lock:
+            indexed = self._get_valid(key, stat, with_keyframes=True)
+            if probe.keyframes is None and indexed is not None:
+                # Keep keyframes indexed by another thread in the meantime.
+                return indexed
+            self._load()[key] = IndexEntry(stat.st_size, stat.st_mtime_ns, probe)
+            self._save()
+            return probe
+
+    def _get_valid(
+        self, key: str, stat: os.stat_result, with_keyframes: bool
+    ) -> VideoProbe | None:
+        if (
+            (entry := self._load().get(key)) is not None
+            and entry.is_valid_for(stat)
+            and (not with_keyframes or entry.probe.keyframes is not None)
+        ):
+            return entry.probe
+        return None
+
+    def _save(self) -> None:
+        if self._index_file is None or self._entries is None:
+            return
+        content = {
+            KEY_VERSION: VIDEO_PROBE_INDEX_VERSION,
+            KEY_ENTRIES: {key: entry.to_dict() for key, entry in self._entries.items()},
+        }
+        temporary_file = self._index_file.with_name(f"{uuid4().hex}.tmp")
+        try:
+            self._index_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(temporary_file, "wt", encoding=ENCODING) as file:
+                ujson.dump(content, file)
+            os.replace(temporary_file, self._index_file)
+        except OSError as cause:
+            logger().warning(f"Could not save video probe index: {cause}")
+        finally:
+            temporary_file.unlink(missing_ok=True)
+
+    def _load(self) -> dict[str, IndexEntry]:
+        if self._entries is None:
+            self._entries = self._read_index_file()
+        return self._entries
+
+    def _read_index_file(self) -> dict[str, IndexEntry]:
+        if self._index_file is None or not self._index_file.exists():
+            return {}
+        try:
+            with open(self._index_file, "rt", encoding=ENCODING) as file:
+                content: dict[str, Any] = ujson.load(file)
+            if content.get(KEY_VERSION) != VIDEO_PROBE_INDEX_VERSION:
+                return {}
+            return {
+                key: IndexEntry.from_dict(entry)
+                for key, entry in content[KEY_ENTRIES].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as cause:
+            logger().warning(
+                f"Ignore invalid video probe index {self._index_file}: {cause}"
+            )
+            return {}
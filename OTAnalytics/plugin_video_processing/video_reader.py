@@ -1,7 +1,11 @@
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import timedelta
 from fractions import Fraction
-from math import floor
+from math import ceil, floor
 from pathlib import Path
+from threading import RLock
+from typing import Iterator
 
 import av
 import numpy
@@ -10,17 +14,29 @@ from av.container import InputContainer
 from av.video.stream import VideoStream
 from numpy import ndarray
 
+from OTAnalytics.application.logger import logger
 from OTAnalytics.application.state import VideosMetadata
 from OTAnalytics.domain.track import TrackImage
 from OTAnalytics.domain.video import InvalidVideoError, VideoReader
 from OTAnalytics.plugin_prototypes.track_visualization.track_viz import (
     TrackImageFactory,
 )
+from OTAnalytics.plugin_video_processing.video_probe import (
+    DISPLAYMATRIX,
+    VideoProbe,
+    VideoProbeIndex,
+)
 
 FIRST_FRAME = 0
 OFFSET = 1
 GRAYSCALE = "L"
-DISPLAYMATRIX = "DISPLAYMATRIX"
+
+DEFAULT_MAX_OPEN_VIDEOS = 4
+DEFAULT_MAX_CACHED_FRAMES = 32
+DEFAULT_PREFETCH_SIZE = 8
+MAX_DECODE_AHEAD_IN_SECONDS = 2
+"""Frames up to this duration after the last decoded frame are decoded forward
+instead of seeking to the nearest keyframe."""
 
 
 def av_to_image(
@@ -54,32 +70,115 @@ def rotate(array: ndarray, side_data: dict) -> ndarray:
     return array
 
 
+class OpenVideo:
+    """Open container of a video together with the state of its decoder.
+
+    The decoder is kept after reading a frame. Thus, following frames can be
+    decoded without seeking to a keyframe again.
+
+    Args:
+        video_path (Path): path of the video.
+        container (InputContainer): the open container of the video.
+        probe (VideoProbe): probe results of the video including its keyframes.
+        total_frames (int): number of frames of the video.
+    """
+
+    def __init__(
+        self,
+        video_path: Path,
+        container: InputContainer,
+        probe: VideoProbe,
+        total_frames: int,
+    ) -> None:
+        self.video_path = video_path
+        self.container = container
+        self.probe = probe
+        self.framerate = probe.framerate
+        self.total_frames = total_frames
+        self.stream = container.streams.video[0]
+        self.time_base = (
+            self.stream.time_base
+            if self.stream.time_base
+            else Fraction(av.time_base, 1)
+        )
+        self.side_data = probe.side_data
+        self.decoder: Iterator[VideoFrame] | None = None
+        self.next_frame = FIRST_FRAME
+        self.last_requested: int | None = None
+
+    def close(self) -> None:
+        self.decoder = None
+        self.container.close()
+
+
 class PyAvVideoReader(VideoReader):
+    """Reads frames of videos using PyAV.
+
+    Frame rate, number of frames and rotation of a video are taken from the header
+    probe of the video probe index. Collecting the keyframes requires reading the
+    whole video. Thus, they are indexed in the background after a video has been
+    opened. Until then, frames are sought by their timestamp. Containers of
+    recently used videos are kept open. Decoded
+    frames are cached in a size bounded LRU cache. Frames following the last read
+    frame are decoded without seeking. If frames are requested sequentially, the
+    next frames are decoded in the background.
+
+    Args:
+        videos_metadata (VideosMetadata): metadata providing the number of frames if
+            the video does not contain it.
+        track_image_factory (TrackImageFactory): creates images of decoded frames.
+        probe_index (VideoProbeIndex | None): index of probed videos. Defaults to an
+            index kept in memory.
+        max_open_videos (int): number of video containers kept open.
+        max_cached_frames (int): number of decoded frames kept in the cache.
+        prefetch_size (int): number of frames decoded ahead on sequential access.
+            Zero disables prefetching.
+        prefetch_executor (Executor | None): executor to decode frames ahead in.
+            Defaults to a single background thread.
+        keyframe_executor (Executor | None): executor to index the keyframes of
+            opened videos in. Defaults to a single background thread.
+    """
 
     def __init__(
-        self, videos_metadata: VideosMetadata, track_image_factory: TrackImageFactory
+        self,
+        videos_metadata: VideosMetadata,
+        track_image_factory: TrackImageFactory,
+        probe_index: VideoProbeIndex | None = None,
+        max_open_videos: int = DEFAULT_MAX_OPEN_VIDEOS,
+        max_cached_frames: int = DEFAULT_MAX_CACHED_FRAMES,
+        prefetch_size: int = DEFAULT_PREFETCH_SIZE,
+        prefetch_executor: Executor | None = None,
+        keyframe_executor: Executor | None = None,
     ) -> None:
+        if max_open_videos < 1:
+            raise ValueError("max_open_videos must be greater than zero.")
+        if max_cached_frames < 0 or prefetch_size < 0:
+            raise ValueError("Cache and prefetch size must not be negative.")
         self._videos_metadata = videos_metadata
         self._track_image_factory = track_image_factory
+        self._probe_index = (
+            probe_index if probe_index is not None else VideoProbeIndex()
+        )
+        self._max_open_videos = max_open_videos
+        self._max_cached_frames = max_cached_frames
+        self._prefetch_size = prefetch_size
+        self._prefetch_executor = prefetch_executor
+        self._keyframe_executor = keyframe_executor
+        self._lock = RLock()
+        self._videos: OrderedDict[Path, OpenVideo] = OrderedDict()
+        self._frames: OrderedDict[tuple[Path, int], TrackImage] = OrderedDict()
 
     def get_fps(self, video_path: Path) -> float:
-        with self.__get_clip(video_path) as container:
-            rate = self.__get_fps(container, video_path)
-            return rate.numerator / rate.denominator
-        raise ValueError(f"Could not read frames per second from {str(video_path)}")
-
-    def __get_fps(self, container: InputContainer, video_path: Path) -> Fraction:
-        average_rate = container.streams.video[0].average_rate
-        if average_rate is None:
-            raise ValueError(f"Could not read frames per second from {str(video_path)}")
-        return average_rate
+        rate = self._probe_index.get(video_path).framerate
+        return rate.numerator / rate.denominator
 
     def get_frame(self, video_path: Path, frame_number: int) -> TrackImage:
         """Get image of video at position `frame_number`.
 
-        It uses PyAV to seek the closest keyframe. Afterwards, it iterates forward
-        through the video to find the correct frame. Given this implementation,
-        the complexity is O(n).
+        Cached frames are returned directly. Frames shortly after the last decoded
+        frame are decoded forward. Otherwise, PyAV is used to seek the closest
+        keyframe. Afterwards, it iterates forward through the video to find the
+        correct frame. Given this implementation, the complexity is O(n).
 
         Args:
             video_path (Path): path to the video_path.
@@ -89,53 +188,120 @@ class PyAvVideoReader(VideoReader):
         Returns:
             ndarray: the image as an multi-dimensional array.
         """
-        return self._read_frame(frame_number, video_path)
-
-    def _read_frame(
-        self,
-        frame_to_read: int,
-        video_path: Path,
-    ) -> TrackImage:
-        with self.__get_clip(video_path) as container:
-            if len(container.streams.video) <= 0:
-                raise InvalidVideoError(f"{str(video_path)} is not a video")
-            video = container.streams.video[0]
-            max_frames = self._get_total_frames(video, video_path)
-            frame_to_read = min(frame_to_read, max_frames - OFFSET)
+        with self._lock:
+            video = self._open(video_path)
+            frame_to_read = min(frame_number, video.total_frames - OFFSET)
             frame_to_read = max(frame_to_read, FIRST_FRAME)
-            framerate = self.__get_fps(container, video_path)
-            time_base = (
-                video.time_base if video.time_base else Fraction(av.time_base, 1)
+            image = self._read_frame(video, frame_to_read)
+            is_sequential = video.last_requested == frame_to_read - 1
+            video.last_requested = frame_to_read
+        if is_sequential:
+            self._prefetch(video, frame_to_read + 1)
+        return image
+
+    def _open(self, video_path: Path) -> OpenVideo:
+        """Returns the open video of the given path. Opens the video if necessary and
+        closes the least recently used video if too many videos are open."""
+        key = video_path.absolute()
+        if (video := self._videos.get(key)) is not None:
+            self._videos.move_to_end(key)
+            return video
+        probe = self._probe_index.get(video_path)
+        container = self.__get_clip(video_path)
+        try:
+            video = OpenVideo(
+                key,
+                container,
+                probe,
+                self._get_total_frames(container.streams.video[0], video_path),
             )
-            frame = self._do_read_frame(
-                container, frame_to_read, framerate, time_base, video_path
+        except Exception:
+            container.close()
+            raise
+        self._videos[key] = video
+        while len(self._videos) > self._max_open_videos:
+            _, evicted = self._videos.popitem(last=False)
+            evicted.close()
+        if probe.keyframes is None:
+            self._index_keyframes(video)
+        return video
+
+    def _index_keyframes(self, video: OpenVideo) -> None:
+        if self._keyframe_executor is None:
+            self._keyframe_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="video_keyframes"
             )
-            side_data = container.streams.video[0].side_data
-        return av_to_image(frame, side_data, self._track_image_factory)
+        self._keyframe_executor.submit(self._do_index_keyframes, video)
 
-    def _do_read_frame(
-        self,
-        container: InputContainer,
-        frame_to_read: int,
-        framerate: Fraction,
-        time_base: Fraction,
-        video_path: Path,
-    ) -> VideoFrame:
+    def _do_index_keyframes(self, video: OpenVideo) -> None:
+        """Probe the keyframes of the given video without holding the lock of the
+        reader. The keyframes are used by the video if it is still open."""
+        try:
+            probe = self._probe_index.get(video.video_path, with_keyframes=True)
+        except Exception as cause:
+            logger().debug(f"Could not index keyframes of {video.video_path}: {cause}")
+            return
+        with self._lock:
+            if self._videos.get(video.video_path) is video:
+                video.probe = probe
+
+    def _read_frame(self, video: OpenVideo, frame_to_read: int) -> TrackImage:
+        key = (video.video_path, frame_to_read)
+        if (image := self._frames.get(key)) is not None:
+            self._frames.move_to_end(key)
+            return image
+        frame = self._do_read_frame(video, frame_to_read)
+        image = av_to_image(frame, video.side_data, self._track_image_factory)
+        if self._max_cached_frames > 0:
+            self._frames[key] = image
+            while len(self._frames) > self._max_cached_frames:
+                self._frames.popitem(last=False)
+        return image
+
+    def _prefetch(self, video: OpenVideo, first_frame: int) -> None:
+        if self._prefetch_size <= 0 or self._max_cached_frames <= 0:
+            return
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="video_prefetch"
+            )
+        self._prefetch_executor.submit(self._prefetch_frames, video, first_frame)
+
+    def _prefetch_frames(self, video: OpenVideo, first_frame: int) -> None:
+        """Decode the frames following the given frame into the cache.
+
+        Prefetching stops if the video has been closed or if another frame has been
+        requested in the meantime.
+        """
+        prefetch_end = min(first_frame + self._prefetch_size, video.total_frames)
+        for frame_number in range(first_frame, prefetch_end):
+            with self._lock:
+                if self._videos.get(video.video_path) is not video:
+                    return
+                if video.last_requested != first_frame - 1:
+                    return
+                try:
+                    self._read_frame(video, frame_number)
+                except Exception as cause:
+                    logger().debug(
+                        f"Could not prefetch frame {frame_number} of "
+                        f"{video.video_path}: {cause}"
+                    )
+                    return
+
+    def _do_read_frame(self, video: OpenVideo, frame_to_read: int) -> VideoFrame:
         """
-        Reads a specific video frame from a container.
+        Reads a specific video frame from an open video.
 
-        This function attempts to read a specific frame from a video container based on
-        the given parameters. It first checks if the desired frame can be sought and,
-        if possible, seeks to that frame and decodes it. If direct seeking is not
-        possible, it iterates over the frames in the video until it finds the desired
-        one.
+        Frames shortly after the last decoded frame or before the next keyframe are
+        decoded forward using the decoder of the last read. Otherwise, the video is
+        sought to the nearest keyframe before the desired frame. If seeking is not
+        precise enough, the frames are decoded from the start of the video until the
+        desired one.
 
         Args:
-            container (InputContainer): The container object holding video streams.
+            video (OpenVideo): the open video to read from.
             frame_to_read (int): The index of the frame to be read.
-            framerate (Fraction): The framerate of the video.
-            time_base (Fraction): The time base used for frame time calculation.
-            video_path (Path): The file path to the video.
 
         Returns:
             VideoFrame: The decoded video frame corresponding to the specified
@@ -144,24 +310,80 @@ class PyAvVideoReader(VideoReader):
         Raises:
             ValueError: If the specified frame index does not exist in the video file.
         """
-        if self._can_look_ahead(video_path, frame_to_read, framerate, time_base):
-            self._seek_to_nearest_frame(container, frame_to_read, framerate)
-            return self._decode_frame(container, frame_to_read, framerate, time_base)
-        for index, frame in enumerate(container.decode(video=0)):
-            if index == frame_to_read:
+        if video.decoder is not None and self._can_decode_forward(video, frame_to_read):
+            try:
+                return self._decode_forward(video, video.decoder, frame_to_read)
+            except StopIteration:
+                video.decoder = None
+        try:
+            return self._seek_and_decode(video, frame_to_read)
+        except StopIteration:
+            video.decoder = None
+            raise ValueError(
+                f"Frame {frame_to_read} does not exist in {video.video_path}"
+            )
+
+    @staticmethod
+    def _can_decode_forward(video: OpenVideo, frame_to_read: int) -> bool:
+        """Whether decoding forward from the last decoded frame is cheaper than
+        seeking to the nearest keyframe."""
+        if frame_to_read < video.next_frame:
+            return False
+        decode_ahead_limit = ceil(video.framerate * MAX_DECODE_AHEAD_IN_SECONDS)
+        if frame_to_read < video.next_frame + decode_ahead_limit:
+            return True
+        if video.probe.keyframes is None:
+            return False
+        keyframe = video.probe.keyframes.nearest(frame_to_read)
+        return keyframe is None or keyframe[0] < video.next_frame
+
+    def _seek_and_decode(self, video: OpenVideo, frame_to_read: int) -> VideoFrame:
+        keyframe = (
+            video.probe.keyframes.nearest(frame_to_read)
+            if video.probe.keyframes is not None
+            else None
+        )
+        if keyframe is not None:
+            _, keyframe_pts = keyframe
+            video.container.seek(keyframe_pts, backward=True, stream=video.stream)
+        else:
+            self._seek_to_nearest_frame(video.container, frame_to_read, video.framerate)
+        decoder = video.container.decode(video=0)
+        frame = next(decoder)
+        current_frame = round(video.framerate * frame.pts * video.time_base)
+        if current_frame > frame_to_read:
+            # Seeking overshot the desired frame, decode from the start instead.
+            video.container.seek(0)
+            decoder = video.container.decode(video=0)
+            frame = next(decoder)
+            current_frame = FIRST_FRAME
+        video.decoder = decoder
+        video.next_frame = current_frame + 1
+        if current_frame == frame_to_read:
+            return frame
+        return self._decode_forward(video, decoder, frame_to_read)
+
+    @staticmethod
+    def _decode_forward(
+        video: OpenVideo, decoder: Iterator[VideoFrame], frame_to_read: int
+    ) -> VideoFrame:
+        """Decode the frames of the decoder until the given frame."""
+        while True:
+            frame = next(decoder)
+            video.next_frame += 1
+            if video.next_frame > frame_to_read:
                 return frame
-        raise ValueError(f"Frame {frame_to_read} does not exist in {video_path}")
 
     def _get_total_frames(self, video_stream: VideoStream, video_path: Path) -> int:
         """
         Calculates the total number of frames in a video by utilizing available metadata
-        or manually counting if necessary.
+        or the frames counted by the video probe if necessary.
 
         Args:
             video_stream (VideoStream): The source video stream object that may include
                 frame count details.
-            video_path (Path): The file path of the video to derive metadata or for
-                manual frame counting.
+            video_path (Path): The file path of the video to derive metadata or to
+                probe.
 
         Returns:
             int: The total number of frames present in the video.
@@ -170,89 +392,7 @@ class PyAvVideoReader(VideoReader):
             return frames
         if metadata := self._videos_metadata.get_by_video_name(video_path.name):
             return metadata.number_of_frames
-        return self._count_manually(video_path)
-
-    @staticmethod
-    def _count_manually(video_file: Path) -> int:
-        """
-        Counts the total number of frames in a given video file manually.
-
-        This method manually calculates the number of frames in a video file by
-        decoding each frame using the `av` library. It iterates through all the frames
-        in the video stream and maintains a counter. The function might be useful in
-        cases where frame count metadata is unavailable or unreliable.
-
-        Args:
-            video_file (Path): The path to the video file for which the frame count is
-                to be determined.
-
-        Returns:
-            int: The total number of frames in the video file.
-        """
-        # Todo we might update videos metadata here or when loading the video via
-        #  `AddVideo`
-        counter = 0
-        with av.open(str(video_file.absolute())) as container:
-            container.streams.video[0].thread_type = "AUTO"
-            for _ in container.decode(video=0):
-                counter += 1
-        return counter
-
-    def _can_look_ahead(
-        self,
-        video_path: Path,
-        frame_to_read: int,
-        framerate: Fraction,
-        time_base: Fraction,
-    ) -> bool:
-        """
-        Determines whether it is possible to look ahead in the video based on the given
-        frame and timing information.
-
-        Args:
-            video_path (Path): Path to the video file.
-            frame_to_read (int): Frame number to be read from the video.
-            framerate (Fraction): Frame rate of the video.
-            time_base (Fraction): Time base for timestamp calculations.
-
-        Returns:
-            bool: True if it's possible to look ahead to the given frame, False
-                otherwise.
-
-        """
-        look_ahead_container = self.__get_clip(video_path.absolute())
-        self._seek_to_nearest_frame(look_ahead_container, frame_to_read, framerate)
-        look_ahead_frame = self._decode_frame(
-            look_ahead_container, frame_to_read, framerate, time_base
-        )
-        sec_frame = round(framerate * look_ahead_frame.pts * time_base)
-        return sec_frame <= frame_to_read
-
-    def _decode_frame(
-        self,
-        container: InputContainer,
-        frame_to_read: int,
-        framerate: Fraction,
-        time_base: Fraction,
-    ) -> VideoFrame:
-        """
-        Args:
-            container (InputContainer): Container from which video frames will be
-                decoded.
-            frame_to_read (int): The specific frame number to read from the video.
-            framerate (Fraction): The framerate of the video.
-            time_base (Fraction): The time base used for converting frame presentation
-                timestamp to seconds.
-
-        Returns:
-            The requested video frame as a VideoFrame object.
-        """
-        decode = container.decode(video=0)
-        frame = next(decode)
-        sec_frame = round(framerate * frame.pts * time_base)
-        for _ in range(sec_frame, frame_to_read):
-            frame = next(decode)
-        return frame
+        return self._probe_index.get(video_path, with_keyframes=True).total_frames
 
     @staticmethod
     def _seek_to_nearest_frame(
@@ -2,8 +2,9 @@
 """
 Script to convert ottrk files to Apache Arrow/Feather format with metadata export.
 
-This script reads one or more ottrk files using the OttrkParser, extracts the pandas
-DataFrame, and saves it in Apache Arrow/Feather format. The metadata is saved as a
+This script reads one or more ottrk files chunk by chunk using the
+ChunkedOttrkParser, extracts the polars DataFrame, and saves it in Apache
+Arrow/Feather format. The metadata is saved as a
 separate JSON file. Both output files use the same stem as the input file.
 
 Requirements:
@@ -26,6 +26,7 @@ from OTAnalytics.application.analysis.traffic_counting import (
     CountableAssignments,
     CountByFlow,
     CountDecorator,
+    CountingCube,
     Exporter,
     ExporterFactory,
     ExportTrafficCounting,
@@ -1208,7 +1209,7 @@ class TestTrafficCounting:
 
         # Configure mocks
         event_repository.get_all.return_value = events
-        event_repository.get.return_value = events
+        event_repository.get_dataset.return_value = events
         event_repository.is_empty.return_value = True
         flow_repository.get_all.return_value = flows
         flow.id = FlowId("mock_flow")
@@ -1266,7 +1267,7 @@ class TestTrafficCounting:
         tagged_assignments.count.assert_called_once_with(flows)
 
         args = call(event_types=[EventType.SECTION_ENTER])
-        event_repository.get.assert_has_calls([args])
+        event_repository.get_dataset.assert_has_calls([args])
         event_repository.get_all.assert_not_called()
 
         # Verify assertions specific to count_all_events setting
@@ -1278,6 +1279,97 @@ class TestTrafficCounting:
             road_user_assigner.assign.assert_called_once()
 
 
+NORTH_SECTION = SectionId("north")
+SOUTH_SECTION = SectionId("south")
+NORTH_TO_SOUTH = Flow(
+    FlowId("north to south"), "north to south", NORTH_SECTION, SOUTH_SECTION
+)
+SOUTH_TO_NORTH = Flow(
+    FlowId("south to north"), "south to north", SOUTH_SECTION, NORTH_SECTION
+)
+CUBE_FLOWS = [NORTH_TO_SOUTH, SOUTH_TO_NORTH]
+
+
+def create_cube_assignment(
+    road_user: str, mode: str, flow: Flow, start_second: int, end_second: int
+) -> RoadUserAssignment:
+    track_id = TrackId(road_user)
+    return RoadUserAssignment(
+        road_user,
+        mode,
+        flow,
+        EventPair(
+            create_event(track_id, flow.start, start_second),
+            create_event(track_id, flow.end, end_second),
+        ),
+    )
+
+
+def create_cube_assignments() -> list[RoadUserAssignment]:
+    return [
+        create_cube_assignment("1", "car", NORTH_TO_SOUTH, 30, 90),
+        create_cube_assignment("2", "car", NORTH_TO_SOUTH, 200, 260),
+        create_cube_assignment("3", "bicycle", SOUTH_TO_NORTH, 400, 1000),
+        create_cube_assignment("4", "car", SOUTH_TO_NORTH, 1000, 1010),
+        create_cube_assignment("5", "bicycle", NORTH_TO_SOUTH, 1900, 3000),
+        create_cube_assignment("6", "car", NORTH_TO_SOUTH, 3500, 3590),
+    ]
+
+
+def count_with_tagger(
+    assignments: list[RoadUserAssignment],
+    interval_in_minutes: int,
+    counting_event: CountingEvent = CountingEvent.START,
+) -> dict[Tag, int]:
+    tagger = CombinedTagger(
+        ModeTagger(),
+        TimeslotTagger(timedelta(minutes=interval_in_minutes), counting_event),
+    )
+    return (
+        tagger.tag(RoadUserAssignments(assignments, mock_factory()))
+        .count(CUBE_FLOWS)
+        .to_dict()
+    )
+
+
+class TestCountingCube:
+    @pytest.mark.parametrize("counting_event", [CountingEvent.START, CountingEvent.END])
+    @pytest.mark.parametrize("interval_in_minutes", [1, 5, 15, 30, 60])
+    def test_count_derives_coarser_intervals(
+        self, counting_event: CountingEvent, interval_in_minutes: int
+    ) -> None:
+        assignments = create_cube_assignments()
+        cube = CountingCube.build(assignments, counting_event, timedelta(minutes=1))
+
+        actual = cube.count(timedelta(minutes=interval_in_minutes), CUBE_FLOWS)
+
+        assert actual.to_dict() == count_with_tagger(
+            assignments, interval_in_minutes, counting_event
+        )
+
+    def test_count_keeps_time_slots_of_filtered_assignments(self) -> None:
+        assignments = create_cube_assignments()
+        cube = CountingCube.build(
+            assignments,
+            CountingEvent.START,
+            timedelta(minutes=5),
+            condition=lambda assignment: assignment.road_user != "6",
+        )
+
+        actual = cube.count(timedelta(minutes=15), CUBE_FLOWS).to_dict()
+
+        assert set(actual) == set(count_with_tagger(assignments, 15))
+        assert sum(actual.values()) == len(assignments) - 1
+
+    def test_count_with_interval_not_multiple_of_resolution(self) -> None:
+        cube = CountingCube.build(
+            create_cube_assignments(), CountingEvent.START, timedelta(minutes=10)
+        )
+
+        with pytest.raises(ValueError):
+            cube.count(timedelta(minutes=15), CUBE_FLOWS)
+
+
 class TestTrafficCountingFilterOptions:
     START_1 = datetime(2000, 1, 1, 0, 0, 3, tzinfo=timezone.utc)
     START_2 = datetime(2000, 1, 1, 0, 0, 8, tzinfo=timezone.utc)
@@ -1373,6 +1465,70 @@ class TestTrafficCountingFilterOptions:
         )
 
 
+class TestTrafficCountingCountAll:
+    @pytest.mark.parametrize("count_all_events", [False, True])
+    @pytest.mark.parametrize(
+        "lower,upper", [(True, True), (True, False), (False, True), (False, False)]
+    )
+    def test_count_all_matches_count(
+        self, count_all_events: bool, lower: bool, upper: bool
+    ) -> None:
+        flow_repository = Mock(spec=FlowRepository)
+        flow_repository.get_all.return_value = CUBE_FLOWS
+        rua_repo = RoadUserAssignmentRepository(mock_factory())
+        rua_repo.add_road_user_assignments(
+            RoadUserAssignments(create_cube_assignments(), mock_factory())
+        )
+        get_assignments = GetRoadUserAssignments(
+            rua_repo, Mock(spec=CreateRoadUserAssignments)
+        )
+        target = TrafficCounting(
+            flow_repository,
+            Mock(spec=GetSectionsById),
+            get_assignments,
+            SimpleTaggerFactory(),
+            filter_lower_bound_strict=lower,
+            filter_upper_bound_strict=upper,
+        )
+        specifications = [
+            CountingSpecificationDto(
+                start=datetime(2000, 1, 1, 0, 3, tzinfo=timezone.utc),
+                end=datetime(2000, 1, 1, 0, 45, tzinfo=timezone.utc),
+                interval_in_minutes=interval,
+                modes=["car", "bicycle"],
+                output_format="csv",
+                output_file=f"counts_{interval}.csv",
+                export_mode=OVERWRITE,
+                count_all_events=count_all_events,
+                counting_event=counting_event,
+            )
+            for interval in [15, 30, 60]
+            for counting_event in [CountingEvent.START, CountingEvent.END]
+        ]
+
+        actual = target.count_all(specifications)
+
+        assert [count.to_dict() for count in actual] == [
+            target.count(specification).to_dict() for specification in specifications
+        ]
+
+    def test_count_all_with_custom_tagger_factory(self) -> None:
+        counts = [Mock(spec=Count), Mock(spec=Count)]
+        specifications = [Mock(spec=CountingSpecificationDto) for _ in counts]
+        target = TrafficCounting(
+            Mock(spec=FlowRepository),
+            Mock(spec=GetSectionsById),
+            Mock(spec=GetRoadUserAssignments),
+            Mock(spec=TaggerFactory),
+        )
+
+        with patch.object(TrafficCounting, "count", side_effect=counts) as count:
+            actual = target.count_all(specifications)
+
+        assert actual == counts
+        assert count.call_args_list == [call(current) for current in specifications]
+
+
 class TestExportTrafficCounting:
     def test_count_traffic(self) -> None:
         """Test traffic counting with different count_all_events settings."""
@@ -1424,3 +1580,41 @@ class TestExportTrafficCounting:
 
         exporter_factory.create_exporter.assert_called_once_with(export_specification)
         exporter.export.assert_called_once_with(counts, OVERWRITE)
+
+    def test_export_all(self) -> None:
+        traffic_counting = Mock(spec=TrafficCounting)
+        get_sections_by_id = Mock(spec=GetSectionsById)
+        exporter_factory = Mock(spec=ExporterFactory)
+        first_exporter = Mock(spec=Exporter)
+        second_exporter = Mock(spec=Exporter)
+        flows: list[Flow] = []
+        first_counts = Mock(spec=Count)
+        second_counts = Mock(spec=Count)
+        traffic_counting.get_flows.return_value = flows
+        traffic_counting.count_all.return_value = [first_counts, second_counts]
+        traffic_counting.provide_get_sections_by_id.return_value = get_sections_by_id
+        exporter_factory.create_exporter.side_effect = [first_exporter, second_exporter]
+        specifications = [
+            CountingSpecificationDto(
+                start=datetime(2023, 1, 1, 0, 0, 0),
+                end=datetime(2023, 1, 1, 1, 0, 0),
+                interval_in_minutes=interval,
+                modes=[],
+                output_format="csv",
+                output_file=f"counts_{interval}.csv",
+                export_mode=OVERWRITE,
+            )
+            for interval in [15, 60]
+        ]
+        target = ExportTrafficCounting(traffic_counting, exporter_factory)
+
+        target.export_all(specifications)
+
+        traffic_counting.count_all.assert_called_once_with(specifications)
+        traffic_counting.count.assert_not_called()
+        assert exporter_factory.create_exporter.call_args_list == [
+            call(create_export_specification(flows, specification, get_sections_by_id))
+            for specification in specifications
+        ]
+        first_exporter.export.assert_called_once_with(first_counts, OVERWRITE)
+        second_exporter.export.assert_called_once_with(second_counts, OVERWRITE)
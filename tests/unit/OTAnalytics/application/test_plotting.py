@@ -4,6 +4,7 @@ from unittest.mock import Mock, call
 import pytest
 
 from OTAnalytics.application.plotting import (
+    CachedPlotter,
     GetCurrentFrame,
     GetCurrentVideoPath,
     LayeredPlotter,
@@ -41,6 +42,27 @@ class TestLayeredPlotter:
         layer_1_image.add.assert_called_with(layer_2_image)
         layer_1_and_2.add.assert_called_with(layer_3_image)
 
+    def test_snapshot_all_layers_before_rendering(self) -> None:
+        first_image = Mock(spec=TrackImage)
+        second_image = Mock(spec=TrackImage)
+        combined_image = Mock(spec=TrackImage)
+        first_image.add.return_value = combined_image
+        render_first = Mock(return_value=first_image)
+        render_second = Mock(return_value=second_image)
+        first_layer = Mock(spec=Plotter)
+        second_layer = Mock(spec=Plotter)
+        first_layer.snapshot.return_value = render_first
+        second_layer.snapshot.return_value = render_second
+
+        render = LayeredPlotter(layers=[first_layer, second_layer]).snapshot()
+
+        first_layer.snapshot.assert_called_once()
+        second_layer.snapshot.assert_called_once()
+        render_first.assert_not_called()
+        render_second.assert_not_called()
+        assert render() is combined_image
+        first_image.add.assert_called_once_with(second_image)
+
 
 class TestPlottingLayer:
     @pytest.fixture
@@ -120,6 +142,65 @@ class TestBackgroundPlotter:
         visualization_time_provider.get_time.assert_not_called()
         assert result is None
 
+    def test_snapshot_defers_reading_frame(self) -> None:
+        expected_image = Mock()
+        single_video = Mock(spec=Video)
+        single_video.get_frame_number_for.return_value = 3
+        single_video.get_frame.return_value = expected_image
+        visualization_time_provider = Mock(spec=VisualizationTimeProvider)
+        background_plotter = TrackBackgroundPlotter(
+            video_provider=Mock(spec=VideoProvider, return_value=[single_video]),
+            visualization_time_provider=visualization_time_provider,
+        )
+
+        render = background_plotter.snapshot()
+
+        single_video.get_frame_number_for.assert_called_once()
+        single_video.get_frame.assert_not_called()
+        assert render() == expected_image
+        single_video.get_frame.assert_called_once_with(3)
+
+
+class TestCachedPlotter:
+    def test_cache_image(self) -> None:
+        image = Mock(spec=TrackImage)
+        other = Mock(spec=Plotter)
+        other.plot.return_value = image
+        plotter = CachedPlotter(other, [])
+
+        assert plotter.plot() is image
+        assert plotter.plot() is image
+        other.plot.assert_called_once()
+
+    def test_cache_image_of_snapshot(self) -> None:
+        image = Mock(spec=TrackImage)
+        other = Mock(spec=Plotter)
+        other.snapshot.return_value = Mock(return_value=image)
+        plotter = CachedPlotter(other, [])
+
+        assert plotter.snapshot()() is image
+        assert plotter.snapshot()() is image
+        other.snapshot.assert_called_once()
+
+    def test_do_not_cache_image_invalidated_while_plotting(self) -> None:
+        stale = Mock(spec=TrackImage)
+        latest = Mock(spec=TrackImage)
+        other = Mock(spec=Plotter)
+        plotter = CachedPlotter(other, [])
+
+        def plot_stale() -> TrackImage:
+            # The cache is invalidated on another thread while plotting.
+            plotter.invalidate_cache(None)
+            return stale
+
+        plots = iter([plot_stale, lambda: latest])
+        other.plot.side_effect = lambda: next(plots)()
+
+        assert plotter.plot() is stale
+        assert plotter.plot() is latest
+        assert plotter.plot() is latest
+        assert other.plot.call_count == 2
+
 
 class TestGetCurrentVideoPath:
     def test_get_video(self) -> None:
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -7,6 +7,8 @@ import pytest
 from OTAnalytics.application.config import (
     DEFAULT_COUNTING_INTERVAL_IN_MINUTES,
     DEFAULT_EVENTLIST_FILE_TYPE,
+    DEFAULT_NUM_PROCESSES,
+    DEFAULT_TRACK_CACHE_DIR,
 )
 from OTAnalytics.application.logger import DEFAULT_LOG_FILE
 from OTAnalytics.application.parser.cli_parser import CliArguments, CliMode
@@ -505,3 +507,32 @@ class TestRunConfiguration:
         assert build_config(cli_args, otconfig).exclude_classes == exclude_classes
         cli_args.exclude_classes = None
         assert build_config(cli_args, otconfig).exclude_classes == frozenset()
+
+    def test_num_processes(self, cli_args: Mock, otconfig: Mock) -> None:
+        cli_args.num_processes = 4
+        assert build_config(cli_args, otconfig).num_processes == 4
+        cli_args.num_processes = None
+        assert build_config(cli_args, otconfig).num_processes == DEFAULT_NUM_PROCESSES
+
+    def test_track_cache_dir(self, cli_args: Mock, otconfig: Mock) -> None:
+        cli_args.no_track_cache = False
+        cli_args.track_cache_dir = "path/to/cache"
+        assert build_config(cli_args, otconfig).track_cache_dir == Path("path/to/cache")
+        cli_args.track_cache_dir = None
+        assert build_config(cli_args, otconfig).track_cache_dir == (
+            DEFAULT_TRACK_CACHE_DIR
+        )
+        cli_args.no_track_cache = True
+        assert build_config(cli_args, otconfig).track_cache_dir is None
+
+    def test_stream_window(self, cli_args: Mock, otconfig: Mock) -> None:
+        cli_args.stream_window_in_minutes = 30
+        assert build_config(cli_args, otconfig).stream_window == timedelta(minutes=30)
+        cli_args.stream_window_in_minutes = None
+        assert build_config(cli_args, otconfig).stream_window is None
+
+    def test_resume(self, cli_args: Mock, otconfig: Mock) -> None:
+        cli_args.resume = True
+        assert build_config(cli_args, otconfig).resume is True
+        cli_args.resume = False
+        assert build_config(cli_args, otconfig).resume is False
@@ -15,6 +15,7 @@ from OTAnalytics.application.state import (
     ObservableOptionalProperty,
     ObservableProperty,
     Plotter,
+    RenderScheduler,
     SectionState,
     TrackImageUpdater,
     TracksMetadata,
@@ -252,6 +253,26 @@ class TestTrackImageUpdater:
 
         plotter.plot.assert_called_once()
 
+    def test_update_image_with_render_scheduler(self) -> None:
+        plotter = Mock(spec=Plotter)
+        render_scheduler = Mock(spec=RenderScheduler)
+        track_view_state = TrackViewState()
+        updater = TrackImageUpdater(
+            Mock(spec=Datastore),
+            track_view_state,
+            SectionState(Mock()),
+            FlowState(),
+            plotter,
+            render_scheduler,
+        )
+
+        updater.update_image()
+
+        render_scheduler.schedule.assert_called_once_with(
+            plotter, track_view_state.background_image.set
+        )
+        plotter.plot.assert_not_called()
+
 
 @pytest.fixture
 def first_full_metadata() -> VideoMetadata:
@@ -44,11 +44,15 @@ class TestApplyCliCuts:
         apply_cli_cuts.apply(sections, preserve_cutting_sections=True)
         apply_cli_cuts.apply(sections, preserve_cutting_sections=False)
 
-        assert cut_tracks.call_args_list == [
-            call(cli_cutting_section, preserve_cutting_section=True),
-            call(normal_cutting_section, preserve_cutting_section=True),
-            call(cli_cutting_section, preserve_cutting_section=False),
-            call(normal_cutting_section, preserve_cutting_section=False),
+        assert cut_tracks.cut_all.call_args_list == [
+            call(
+                [cli_cutting_section, normal_cutting_section],
+                preserve_cutting_sections=True,
+            ),
+            call(
+                [cli_cutting_section, normal_cutting_section],
+                preserve_cutting_sections=False,
+            ),
         ]
         assert track_repository_size.get.call_count == 4
 
@@ -61,5 +65,5 @@ class TestApplyCliCuts:
 
         apply_cli_cuts.apply([cli_cutting_section], preserve_cutting_sections=True)
 
-        cut_tracks.assert_not_called()
+        cut_tracks.cut_all.assert_not_called()
         assert track_repository_size.get.call_count == 2
@@ -1,5 +1,5 @@
 from datetime import datetime
-from unittest.mock import Mock, PropertyMock, call, patch
+from unittest.mock import Mock, call
 
 import pytest
 
@@ -44,9 +44,10 @@ from OTAnalytics.domain.event import Event, EventRepository
 from OTAnalytics.domain.filter import FilterElement
 from OTAnalytics.domain.flow import Flow, FlowId, FlowRepository
 from OTAnalytics.domain.section import Section, SectionId
-from OTAnalytics.domain.track import Detection, Track, TrackId
+from OTAnalytics.domain.track import Track, TrackId
 from OTAnalytics.domain.track_dataset.track_dataset import (
     EmptyTrackIdSet,
+    TrackDataset,
     TrackIdSet,
     TrackIdSetFactory,
 )
@@ -364,7 +365,7 @@ class TestTracksAssignedToSelectedFlows:
 
         event = Mock(spec=Event)
         event_repository = Mock(spec=EventRepository)
-        event_repository.get.return_value = [event]
+        event_repository.get_dataset.return_value = [event]
 
         create_events = Mock(spec=CreateEvents)
 
@@ -392,7 +393,7 @@ class TestTracksAssignedToSelectedFlows:
         track_ids = tracks_assigned_to_flow.get_ids()
 
         assert track_ids == track_id_set
-        event_repository.get.assert_has_calls(
+        event_repository.get_dataset.assert_has_calls(
             [call(event_types=[EventType.SECTION_ENTER])]
         )
         event_repository.get_all.assert_not_called()
@@ -405,219 +406,62 @@ class TestTracksAssignedToSelectedFlows:
 
 
 class TestTracksOverlapOccurrenceWindow:
+    def create_track_view_state(
+        self, start_date: datetime | None, end_date: datetime | None
+    ) -> Mock:
+        filter_element = Mock(spec=FilterElement)
+        filter_element.date_range = DateRange(start_date, end_date)
+        observable_property = Mock(spec=ObservableProperty)
+        observable_property.get.return_value = filter_element
+        track_view_state = Mock(spec=TrackViewState)
+        track_view_state.filter_element = observable_property
+        return track_view_state
+
     @pytest.mark.parametrize(
-        "start_1,end_1,start_2,end_2,expected",
+        "start_date,end_date",
         [
-            (
-                datetime(2020, 1, 1, 13),
-                datetime(2020, 1, 1, 14),
-                datetime(2020, 1, 1, 14, 30),
-                datetime(2020, 1, 1, 15),
-                False,
-            ),
-            (
-                datetime(2020, 1, 1, 13),
-                datetime(2020, 1, 1, 14),
-                datetime(2020, 1, 1, 13),
-                datetime(2020, 1, 1, 13, 30),
-                True,
-            ),
-            (
-                datetime(2020, 1, 1, 13),
-                datetime(2020, 1, 1, 14),
-                datetime(2020, 1, 1, 13, 30),
-                datetime(2020, 1, 1, 14),
-                True,
-            ),
-            (
-                datetime(2020, 1, 1, 13),
-                datetime(2020, 1, 1, 14),
-                datetime(2020, 1, 1, 13, 30),
-                datetime(2020, 1, 1, 14, 30),
-                True,
-            ),
-            (
-                datetime(2020, 1, 1, 13),
-                datetime(2020, 1, 1, 14),
-                datetime(2020, 1, 1, 14, 00),
-                datetime(2020, 1, 1, 14, 30),
-                True,
-            ),
+            (datetime(2020, 1, 1, 13), None),
+            (None, datetime(2020, 1, 1, 14)),
+            (datetime(2020, 1, 1, 13), datetime(2020, 1, 1, 14)),
+            (None, None),
         ],
     )
-    def test_has_overlap(
-        self,
-        start_1: datetime,
-        end_1: datetime,
-        start_2: datetime,
-        end_2: datetime,
-        expected: bool,
+    def test_get_ids(
+        self, start_date: datetime | None, end_date: datetime | None
     ) -> None:
-        assert (
-            TracksOverlapOccurrenceWindow._has_overlap(start_1, end_1, start_2, end_2)
-            == expected
-        )
-        assert (
-            TracksOverlapOccurrenceWindow._has_overlap(start_2, end_2, start_1, end_1)
-            == expected
-        )
+        overlapping_ids = Mock(spec=TrackIdSet)
+        dataset = Mock(spec=TrackDataset)
+        dataset.ids_overlapping.return_value = overlapping_ids
+        track_repository = Mock(spec=TrackRepository)
+        track_repository.get_all.return_value = dataset
+        track_view_state = self.create_track_view_state(start_date, end_date)
 
-    def test_has_overlap_wrong_order_of_arguments(self) -> None:
-        start_1 = datetime(2022, 1, 2)
-        start_2 = datetime(2022, 1, 1)
-        end_1 = datetime(2022, 1, 3)
-        end_2 = datetime(2022, 1, 4)
-        with pytest.raises(
-            ValueError, match="start_1 needs to be lesser equal than end_1."
-        ):
-            TracksOverlapOccurrenceWindow._has_overlap(
-                start_1,
-                start_2,
-                end_1,
-                end_2,
-            )
-        with pytest.raises(
-            ValueError, match="start_2 needs to be lesser equal than end_2."
-        ):
-            TracksOverlapOccurrenceWindow._has_overlap(
-                start_2,
-                start_1,
-                end_2,
-                end_1,
-            )
+        id_provider = TracksOverlapOccurrenceWindow(track_repository, track_view_state)
+        result_ids = id_provider.get_ids()
 
-    def test_get_ids(self) -> None:
-        track_repository = Mock(spec=TrackRepository)
-        track_view_state = Mock(spec=TrackViewState)
-        track_id_set = Mock(spec=TrackIdSet)
-        mock_factory = Mock(spec=TrackIdSetFactory)
-        mock_factory.create.return_value = track_id_set
-        first_id = Mock(spec=TrackId)
-        tracks = [Mock(spec=Track), None]
-        track_repository.get_all.return_value = tracks
-
-        with patch.object(
-            TracksOverlapOccurrenceWindow, "_filter", return_value={first_id}
-        ):
-            id_provider = TracksOverlapOccurrenceWindow(
-                track_repository, track_view_state, mock_factory
-            )
-            result_ids = id_provider.get_ids()
-
-            assert result_ids == track_id_set
-            track_repository.get_all.assert_called_once()
-            mock_factory.create.assert_called_once_with({first_id})
+        assert result_ids == overlapping_ids
+        dataset.ids_overlapping.assert_called_once_with(start_date, end_date)
 
     def test_get_ids_as_decorator(self) -> None:
+        start_date = datetime(2020, 1, 1, 13)
+        end_date = datetime(2020, 1, 1, 14)
+        overlapping_ids = Mock(spec=TrackIdSet)
+        intersected_ids = Mock(spec=TrackIdSet)
+        overlapping_ids.intersection.return_value = intersected_ids
+        dataset = Mock(spec=TrackDataset)
+        dataset.ids_overlapping.return_value = overlapping_ids
         track_repository = Mock(spec=TrackRepository)
-        track_view_state = Mock(spec=TrackViewState)
-        track_id_set = Mock(spec=TrackIdSet)
-        mock_factory = Mock(spec=TrackIdSetFactory)
-        mock_factory.create.return_value = track_id_set
-        first_id = Mock(spec=TrackId)
-        track_ids = [first_id, Mock(spec=TrackId)]
-        tracks = [Mock(spec=Track), None]
-        track_repository.get_for.side_effect = tracks
+        track_repository.get_all.return_value = dataset
+        track_view_state = self.create_track_view_state(start_date, end_date)
+        other_ids = Mock(spec=TrackIdSet)
         other = Mock(spec=TrackIdProvider)
-        other.get_ids.return_value = track_ids
-
-        with patch.object(
-            TracksOverlapOccurrenceWindow, "_filter", return_value={first_id}
-        ):
-            id_provider = TracksOverlapOccurrenceWindow(
-                track_repository,
-                track_view_state,
-                other=other,
-                track_id_set_factory=mock_factory,
-            )
-            result_ids = id_provider.get_ids()
-
-            assert result_ids == track_id_set
-            assert track_repository.get_for.call_args_list == [
-                call(id) for id in track_ids
-            ]
-            mock_factory.create.assert_called_once_with({first_id})
-
-    @pytest.mark.parametrize(
-        (
-            "filter_start,filter_end,"
-            "expected_has_overlap_filter_start,expected_has_overlap_filter_end,"
-        ),
-        [
-            (datetime(2020, 1, 1, 13), None, datetime(2020, 1, 1, 13), datetime.max),
-            (None, datetime(2020, 1, 1, 14), datetime.min, datetime(2020, 1, 1, 14)),
-            (
-                datetime(2020, 1, 1, 13),
-                datetime(2020, 1, 1, 14),
-                datetime(2020, 1, 1, 13),
-                datetime(2020, 1, 1, 14),
-            ),
-            (None, None, datetime.min, datetime.max),
-        ],
-    )
-    def test_filter(
-        self,
-        filter_start: datetime | None,
-        filter_end: datetime | None,
-        expected_has_overlap_filter_start: datetime,
-        expected_has_overlap_filter_end: datetime,
-    ) -> None:
-        track_repository = Mock(spec=TrackRepository)
+        other.get_ids.return_value = other_ids
 
-        filter_element = Mock(spec=FilterElement)
-        filter_element.date_range = DateRange(filter_start, filter_end)
-
-        track_view_state = Mock(spec=TrackViewState)
-        observable_property = Mock(spec=ObservableProperty)
-        observable_property.get.return_value = filter_element
-        track_view_state.filter_element = observable_property
-
-        mock_factory = Mock(spec=TrackIdSetFactory)
+        id_provider = TracksOverlapOccurrenceWindow(
+            track_repository, track_view_state, other=other
+        )
+        result_ids = id_provider.get_ids()
 
-        start_detection = Mock(spec=Detection)
-        start_time = datetime(2020, 1, 1, 13)
-        start_detection.occurrence = start_time
-
-        end_detection = Mock(spec=Detection)
-        end_time = datetime(2020, 1, 1, 13, 30)
-        end_detection.occurrence = end_time
-
-        with (
-            patch.object(
-                TracksOverlapOccurrenceWindow, "_has_overlap", return_value=True
-            ) as mock_has_overlap,
-            patch(
-                "OTAnalytics.application.use_cases.highlight_intersections.Track.start",
-                new_callable=PropertyMock,
-                return_value=start_time,
-            ) as mock_start,
-            patch(
-                "OTAnalytics.application.use_cases.highlight_intersections.Track.end",
-                new_callable=PropertyMock,
-                return_value=end_time,
-            ) as mock_end,
-        ):
-            track_id = TrackId("1")
-            track = Mock(spec=Track)
-            track.id = track_id
-            track.start.return_value = start_detection
-            track.end.return_value = end_detection
-
-            id_provider = TracksOverlapOccurrenceWindow(
-                track_repository, track_view_state, mock_factory
-            )
-            result_ids = id_provider._filter([track])
-
-            assert result_ids == {track_id}
-            mock_start.assert_called_once()
-            mock_end.assert_called_once()
-            if filter_start or filter_end:
-                mock_has_overlap.assert_called_once_with(
-                    expected_has_overlap_filter_start,
-                    expected_has_overlap_filter_end,
-                    track.start,
-                    track.end,
-                )
-            else:
-                mock_has_overlap.assert_not_called()
-            mock_factory.create.assert_not_called()
+        assert result_ids == intersected_ids
+        dataset.ids_overlapping.assert_called_once_with(start_date, end_date)
+        overlapping_ids.intersection.assert_called_once_with(other_ids)
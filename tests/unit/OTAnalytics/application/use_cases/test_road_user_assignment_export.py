@@ -103,7 +103,7 @@ class TestExportRoadUserAssignments:
         exporter_factory = Mock(spec=RoadUserAssignmentExporterFactory)
 
         events = Mock()
-        event_repository.get.return_value = events
+        event_repository.get_dataset.return_value = events
 
         flows = Mock()
         flow_repository.get_all.return_value = flows
@@ -143,7 +143,7 @@ class TestExportRoadUserAssignments:
             export_road_user_assignments.export(specification)
 
         args = call(event_types=[EventType.SECTION_ENTER])
-        event_repository.get.assert_has_calls([args])
+        event_repository.get_dataset.assert_has_calls([args])
         event_repository.get_all.assert_not_called()
 
         flow_repository.get_all.assert_called_once()
@@ -166,3 +166,46 @@ class TestCalculateTrackStatistics:
         )
 
         assert simultaneous_event_count == 1
+
+    def test_get_statistics_restricted_to_all_tracks(
+        self,
+        intersection_all_non_cutting_sections: Mock,
+        assigned_to_all_flows: Mock,
+        all_track_ids: Mock,
+        track_ids_inside_cutting_sections: Mock,
+        given_number_of_tracks_to_be_validated: Mock,
+        given_enter_section_events: Mock,
+    ) -> None:
+        intersection_all_non_cutting_sections.get_ids.return_value = (
+            create_trackids_set_with_list_of_ids(["1", "2", "8"])
+        )
+        assigned_to_all_flows.get_ids.return_value = (
+            create_trackids_set_with_list_of_ids(["1", "8"])
+        )
+        all_track_ids.get_ids.return_value = create_trackids_set_with_list_of_ids(
+            ["1", "2", "3", "4"]
+        )
+        track_ids_inside_cutting_sections.get_ids.return_value = (
+            create_trackids_set_with_list_of_ids(["1", "2", "3", "8", "9"])
+        )
+        calculator = CalculateTrackStatistics(
+            intersection_all_non_cutting_sections,
+            assigned_to_all_flows,
+            all_track_ids,
+            track_ids_inside_cutting_sections,
+            given_number_of_tracks_to_be_validated,
+            given_enter_section_events,
+        )
+
+        track_statistics = calculator.get_statistics()
+
+        assert track_statistics.track_count == 4
+        assert track_statistics.track_count_inside == 3
+        assert track_statistics.track_count_outside == 1
+        assert track_statistics.track_count_inside_not_intersecting == 1
+        assert track_statistics.track_count_inside_assigned == 1
+        assert track_statistics.track_count_inside_intersecting_but_unassigned == 1
+        all_track_ids.get_ids.assert_called_once()
+        intersection_all_non_cutting_sections.get_ids.assert_called_once()
+        assigned_to_all_flows.get_ids.assert_called_once()
+        track_ids_inside_cutting_sections.get_ids.assert_called_once()
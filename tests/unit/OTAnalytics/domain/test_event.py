@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import Mock
 
 import pytest
@@ -24,8 +24,10 @@ from OTAnalytics.domain.event import (
     EventRepositoryEvent,
     ImproperFormattedFilename,
     IncompleteEventBuilderSetup,
+    PythonEventDataset,
     SceneEventBuilder,
     SectionEventBuilder,
+    concat_event_datasets,
 )
 from OTAnalytics.domain.geometry import DirectionVector2D, ImageCoordinate
 from OTAnalytics.domain.section import Section, SectionId
@@ -482,6 +484,81 @@ class TestEventRepository:
         ]
         assert actual == expected
 
+    def test_add_all_event_dataset(self) -> None:
+        subject = Mock()
+        repository = EventRepository(subject)
+        repository.add(event_2_section_1())
+        dataset = PythonEventDataset(
+            [
+                event_2_section_2(),
+                event_1_section_2(),
+                event_2_section_1(),
+                event_1_section_1(),
+                event_1_section_2(),
+            ]
+        )
+
+        repository.add_all(dataset)
+
+        subject.notify.assert_called_with(EventRepositoryEvent(dataset, []))
+        expected = [
+            event_1_section_1(),
+            event_2_section_1(),
+            event_1_section_2(),
+            event_2_section_2(),
+        ]
+        assert repository.get_all() == expected
+
+    def test_get_dataset_of_stored_and_indexed_events(self) -> None:
+        repository = EventRepository(dataset=PythonEventDataset())
+        repository.add_all([event_2_section_1(), enter_scene_event_1()])
+        repository.add_all(
+            PythonEventDataset(
+                [event_2_section_2(), event_1_section_1(), event_2_section_1()]
+            )
+        )
+
+        actual = repository.get_dataset(
+            sections=[SECTION_ID_1], event_types=[EventType.SECTION_LEAVE]
+        )
+
+        assert not repository.is_empty()
+        assert list(actual) == [event_2_section_1()]
+        assert list(repository.get_dataset()) == [
+            event_1_section_1(),
+            enter_scene_event_1(),
+            event_2_section_1(),
+            event_2_section_2(),
+        ]
+
+    def test_get_dataset_does_not_index_stored_events(self) -> None:
+        stored = Mock(spec=PythonEventDataset)
+        stored.is_empty.return_value = False
+        dataset = Mock(spec=PythonEventDataset)
+        dataset.__add__ = Mock(return_value=stored)
+        repository = EventRepository(dataset=dataset)
+        repository.add_all(PythonEventDataset([event_1_section_1()]))
+
+        actual = repository.get_dataset(event_types=[EventType.SECTION_ENTER])
+
+        stored.filter.assert_called_once_with(
+            None, None, None, [EventType.SECTION_ENTER]
+        )
+        assert actual == stored.filter.return_value.unique_sorted_by_occurrence()
+        stored.unique_sorted_by_occurrence.assert_not_called()
+
+    def test_clear_stored_dataset(self) -> None:
+        subject = Mock()
+        repository = EventRepository(subject, dataset=PythonEventDataset())
+        dataset = PythonEventDataset([event_1_section_1()])
+        repository.add_all(dataset)
+
+        repository.clear()
+
+        assert repository.is_empty()
+        assert not list(repository.get_all())
+        subject.notify.assert_called_with(EventRepositoryEvent([], dataset))
+
     def test_sort_after_add(self) -> None:
         repository = EventRepository()
         repository.add(event_2_section_1())
@@ -627,6 +704,112 @@ class TestEventRepository:
 
         assert actual_event == expected_event
 
+    def test_get_next_after_and_previous_before_by_event_type(self) -> None:
+        repository = EventRepository()
+        repository.add_all(all_events())
+
+        next_event = repository.get_next_after(
+            event_1_section_1().occurrence, event_types=[EventType.SECTION_LEAVE]
+        )
+        previous_event = repository.get_previous_before(
+            event_2_section_2().occurrence, event_types=[EventType.SECTION_ENTER]
+        )
+
+        assert next_event == event_2_section_1()
+        assert previous_event == event_1_section_2()
+
+    def test_get_next_after_includes_events_without_section(self) -> None:
+        repository = EventRepository()
+        repository.add_all([event_1_section_2(), enter_scene_event_1()])
+
+        date = enter_scene_event_1().occurrence - timedelta(seconds=1)
+
+        actual = repository.get_next_after(date)
+
+        assert actual == enter_scene_event_1()
+        assert repository.get_next_after(date, [SECTION_ID_2]) == event_1_section_2()
+
+    def test_get_next_after_reflects_changes(self) -> None:
+        repository = EventRepository()
+        repository.add_all([event_2_section_1(), event_2_section_2()])
+        date = event_1_section_1().occurrence
+
+        assert repository.get_next_after(date) == event_2_section_1()
+
+        repository.add(event_1_section_2())
+        assert repository.get_next_after(date) == event_1_section_2()
+
+        repository.remove([SECTION_ID_2])
+        assert repository.get_next_after(date) == event_2_section_1()
+
+        repository.remove_events_by_road_user_ids([ROAD_USER_ID_1])
+        assert repository.get_next_after(date) is None
+
+    @pytest.mark.parametrize(
+        "start_date,end_date,sections,event_types,expected_events",
+        [
+            (
+                None,
+                None,
+                [],
+                [],
+                [
+                    event_1_section_1(),
+                    event_1_section_2(),
+                    event_2_section_1(),
+                    event_2_section_2(),
+                ],
+            ),
+            (
+                event_1_section_2().occurrence,
+                event_2_section_1().occurrence,
+                [],
+                [],
+                [event_1_section_2(), event_2_section_1()],
+            ),
+            (
+                None,
+                event_2_section_1().occurrence,
+                [SECTION_ID_1],
+                [],
+                [event_1_section_1(), event_2_section_1()],
+            ),
+            (
+                event_1_section_2().occurrence,
+                None,
+                [],
+                [EventType.SECTION_LEAVE],
+                [event_2_section_1(), event_2_section_2()],
+            ),
+            (
+                None,
+                None,
+                [SECTION_ID_2],
+                [EventType.SECTION_ENTER],
+                [event_1_section_2()],
+            ),
+        ],
+    )
+    def test_get_sorted_by_occurrence(
+        self,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        sections: list[SectionId],
+        event_types: list[EventType],
+        expected_events: list[Event],
+    ) -> None:
+        repository = EventRepository()
+        repository.add_all(all_events())
+
+        actual_events = repository.get_sorted_by_occurrence(
+            start_date=start_date,
+            end_date=end_date,
+            sections=sections,
+            event_types=event_types,
+        )
+
+        assert actual_events == expected_events
+
     @pytest.mark.parametrize(
         "start_date,end_date,sections,event_type,expected_events",
         [
@@ -756,3 +939,41 @@ class TestEventRepository:
             event_3_section_1_road_user_2(),
             event_3_section_2_road_user_2(),
         ]
+
+
+class TestPythonEventDataset:
+    def test_unique_sorted_by_occurrence(self) -> None:
+        dataset = PythonEventDataset(
+            [event_2_section_1(), event_1_section_1(), event_2_section_1()]
+        )
+
+        actual = dataset.unique_sorted_by_occurrence()
+
+        assert actual == PythonEventDataset([event_1_section_1(), event_2_section_1()])
+
+    def test_add_other_dataset_type(self) -> None:
+        other = Mock()
+        other.__radd__ = Mock(return_value=PythonEventDataset())
+
+        result = PythonEventDataset([event_1_section_1()]) + other
+
+        assert result == PythonEventDataset()
+        other.__radd__.assert_called_once()
+
+
+class TestConcatEventDatasets:
+    def test_concat(self) -> None:
+        first = PythonEventDataset([event_1_section_1()])
+        second = PythonEventDataset([event_2_section_1()])
+
+        actual = concat_event_datasets([PythonEventDataset(), first, second])
+
+        assert actual == PythonEventDataset([event_1_section_1(), event_2_section_1()])
+
+    def test_concat_skips_empty_datasets(self) -> None:
+        dataset = PythonEventDataset([event_1_section_1()])
+
+        assert concat_event_datasets([PythonEventDataset(), dataset]) is dataset
+
+    def test_concat_nothing(self) -> None:
+        assert concat_event_datasets([]).is_empty()
@@ -86,6 +86,15 @@ class TestFilteredTrackDataset:
                 == cargo_bike_track.last_detection.occurrence
             )
 
+    def test_ids_overlapping(self, car_track: Track, cargo_bike_track: Track) -> None:
+        filtered_datasets = self.get_datasets(
+            [cargo_bike_track, car_track], [OtcClasses.CARGO_BIKE_DRIVER], []
+        )
+        for filtered_dataset in filtered_datasets.values():
+            assert filtered_dataset.ids_overlapping(None, None) == PythonTrackIdSet(
+                [cargo_bike_track.id]
+            )
+
     @pytest.mark.parametrize(
         "include_classes,exclude_classes,expected",
         [
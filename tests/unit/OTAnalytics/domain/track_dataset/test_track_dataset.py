@@ -1,3 +1,7 @@
+from datetime import timedelta
+
+import pytest
+
 from OTAnalytics.domain.track import Track
 from OTAnalytics.domain.track_dataset.track_dataset import TrackDataset
 from OTAnalytics.plugin_datastore.python_track_store import PythonTrackIdSet
@@ -59,6 +63,29 @@ class TestTrackDataset:
             )
             assert len(actual_dataset) == 1
 
+    def test_ids_overlapping(
+        self, car_track: Track, pedestrian_track: Track, bicycle_track: Track
+    ) -> None:
+        targets = create_track_datasets([car_track, pedestrian_track, bicycle_track])
+        for target in targets:
+            assert target.ids_overlapping(None, None) == PythonTrackIdSet(
+                [car_track.id, pedestrian_track.id, bicycle_track.id]
+            )
+            assert target.ids_overlapping(None, car_track.end) == PythonTrackIdSet(
+                [car_track.id, pedestrian_track.id]
+            )
+            assert target.ids_overlapping(
+                pedestrian_track.end, None
+            ) == PythonTrackIdSet([pedestrian_track.id, bicycle_track.id])
+            assert target.ids_overlapping(
+                pedestrian_track.end, pedestrian_track.end
+            ) == PythonTrackIdSet([pedestrian_track.id])
+            assert target.ids_overlapping(
+                bicycle_track.end, bicycle_track.end + timedelta(seconds=1)
+            ) == PythonTrackIdSet([bicycle_track.id])
+            with pytest.raises(ValueError):
+                target.ids_overlapping(bicycle_track.end, car_track.start)
+
 
 def create_track_datasets(tracks: list[Track]) -> list[TrackDataset]:
     provider = TrackDatasetProvider()
@@ -0,0 +1,65 @@
+from datetime import datetime
+
+import pytest
+
+from OTAnalytics.domain.track import TrackId
+from OTAnalytics.domain.track_dataset.track_interval_index import TrackIntervalIndex
+
+FIRST = TrackId("1")
+SECOND = TrackId("2")
+THIRD = TrackId("3")
+LONG = TrackId("4")
+
+
+def create_index() -> TrackIntervalIndex:
+    return TrackIntervalIndex(
+        [
+            (THIRD, datetime(2020, 1, 1, 13, 30), datetime(2020, 1, 1, 13, 45)),
+            (FIRST, datetime(2020, 1, 1, 13), datetime(2020, 1, 1, 13, 10)),
+            (LONG, datetime(2020, 1, 1, 12), datetime(2020, 1, 1, 16)),
+            (SECOND, datetime(2020, 1, 1, 13, 10), datetime(2020, 1, 1, 13, 20)),
+        ]
+    )
+
+
+class TestTrackIntervalIndex:
+    @pytest.mark.parametrize(
+        "start,end,expected",
+        [
+            (None, None, {FIRST, SECOND, THIRD, LONG}),
+            (datetime(2020, 1, 1, 13, 10), None, {FIRST, SECOND, THIRD, LONG}),
+            (datetime(2020, 1, 1, 13, 11), None, {SECOND, THIRD, LONG}),
+            (None, datetime(2020, 1, 1, 13, 10), {FIRST, SECOND, LONG}),
+            (
+                datetime(2020, 1, 1, 13, 21),
+                datetime(2020, 1, 1, 13, 29),
+                {LONG},
+            ),
+            (
+                datetime(2020, 1, 1, 13, 20),
+                datetime(2020, 1, 1, 13, 30),
+                {SECOND, THIRD, LONG},
+            ),
+            (datetime(2020, 1, 1, 17), None, set()),
+            (datetime.min, datetime.max, {FIRST, SECOND, THIRD, LONG}),
+        ],
+    )
+    def test_overlapping(
+        self,
+        start: datetime | None,
+        end: datetime | None,
+        expected: set[TrackId],
+    ) -> None:
+        actual = create_index().overlapping(start, end)
+
+        assert set(actual) == expected
+        assert len(actual) == len(expected)
+
+    def test_overlapping_on_empty_index(self) -> None:
+        assert TrackIntervalIndex([]).overlapping(None, None) == []
+
+    def test_overlapping_with_start_after_end(self) -> None:
+        with pytest.raises(ValueError):
+            create_index().overlapping(
+                datetime(2020, 1, 1, 14), datetime(2020, 1, 1, 13)
+            )
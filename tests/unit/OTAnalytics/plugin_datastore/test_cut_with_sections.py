@@ -0,0 +1,83 @@
+from typing import Callable
+
+import pytest
+
+from OTAnalytics.domain.section import SectionType
+from OTAnalytics.domain.track import Track, TrackId
+from OTAnalytics.domain.track_dataset.track_dataset import TrackDataset
+from OTAnalytics.plugin_datastore.polars_track_store import PolarsTrackDataset
+from OTAnalytics.plugin_datastore.python_track_store import PythonTrackDataset
+from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store import (
+    PolarsTrackGeometryDataset,
+)
+from OTAnalytics.plugin_datastore.track_geometry_store.shapely_store import (
+    ShapelyTrackGeometryDataset,
+)
+from OTAnalytics.plugin_datastore.track_store import PandasTrackDataset
+from tests.unit.OTAnalytics.plugin_datastore.test_polars_track_store import (
+    create_line_section,
+)
+from tests.utils.builders.track_builder import create_track
+
+DatasetFactory = Callable[[list[Track]], TrackDataset]
+
+
+def create_polars_dataset(tracks: list[Track]) -> TrackDataset:
+    return PolarsTrackDataset.from_list(
+        tracks, PolarsTrackGeometryDataset.from_track_dataset
+    )
+
+
+def create_pandas_dataset(tracks: list[Track]) -> TrackDataset:
+    return PandasTrackDataset.from_list(
+        tracks, ShapelyTrackGeometryDataset.from_track_dataset
+    )
+
+
+def create_python_dataset(tracks: list[Track]) -> TrackDataset:
+    return PythonTrackDataset.from_list(
+        tracks, ShapelyTrackGeometryDataset.from_track_dataset
+    )
+
+
+@pytest.mark.parametrize(
+    "create_dataset",
+    [create_polars_dataset, create_pandas_dataset, create_python_dataset],
+    ids=["polars", "pandas", "python"],
+)
+class TestCutWithSections:
+    def test_number_parts_consecutively(self, create_dataset: DatasetFactory) -> None:
+        crossing_both = create_track(
+            "1", [(float(x), 1.0) for x in range(10)], start_second=1
+        )
+        crossing_second = create_track(
+            "2", [(float(x), 1.0) for x in range(5, 10)], start_second=1
+        )
+        sections = [
+            create_line_section(
+                "first", [(2.5, -10.0), (2.5, 10.0)], SectionType.CUTTING
+            ),
+            create_line_section(
+                "second", [(6.5, -10.0), (6.5, 10.0)], SectionType.CUTTING
+            ),
+            create_line_section(
+                "second copy", [(6.5, -10.0), (6.5, 10.0)], SectionType.CUTTING
+            ),
+        ]
+        dataset = create_dataset([crossing_both, crossing_second])
+
+        result_dataset, original_track_ids = dataset.cut_with_sections(sections)
+
+        actual = {
+            actual_track.id: len(actual_track.detections)
+            for actual_track in result_dataset.as_list()
+            if actual_track.id != actual_track.original_id
+        }
+        assert actual == {
+            TrackId("1_0"): 3,
+            TrackId("1_1"): 4,
+            TrackId("1_2"): 3,
+            TrackId("2_0"): 2,
+            TrackId("2_1"): 3,
+        }
+        assert {crossing_both.id, crossing_second.id} <= set(original_track_ids)
@@ -0,0 +1,107 @@
+import random
+from dataclasses import replace
+
+import pytest
+
+from OTAnalytics.application.analysis.road_user_assignment import RoadUserAssignments
+from OTAnalytics.application.analysis.traffic_counting import SimpleRoadUserAssigner
+from OTAnalytics.domain.event import Event
+from OTAnalytics.domain.flow import Flow, FlowId
+from OTAnalytics.domain.section import SectionId
+from OTAnalytics.domain.track import TrackId
+from OTAnalytics.plugin_datastore.polars_road_user_assigner import (
+    PolarsRoadUserAssigner,
+)
+from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store import (
+    PolarsEventDataset,
+)
+from tests.unit.OTAnalytics.application.analysis.test_traffic_counting import (
+    create_assignment_test_cases,
+    create_event,
+    mock_factory,
+)
+
+SECTIONS = [SectionId(name) for name in ["north", "east", "south", "west"]]
+
+
+def create_random_events(seed: int) -> list[Event]:
+    generator = random.Random(seed)
+    events = [
+        create_event(
+            TrackId(str(generator.randrange(20))),
+            generator.choice(SECTIONS),
+            generator.randrange(10),
+        )
+        for _ in range(200)
+    ]
+    duplicates = generator.sample(events, 20)
+    return events + duplicates
+
+
+def create_flows() -> list[Flow]:
+    flows = [
+        Flow(FlowId(f"{start.id}-{end.id}"), f"{start.id}-{end.id}", start, end)
+        for start in SECTIONS
+        for end in SECTIONS
+        if start != end
+    ]
+    duplicate_flow = Flow(FlowId("second"), "second", SECTIONS[0], SECTIONS[1])
+    return flows + [duplicate_flow]
+
+
+class TestPolarsRoadUserAssigner:
+    @pytest.mark.parametrize(
+        "events, flows, expected_result", create_assignment_test_cases(mock_factory())
+    )
+    def test_assign(
+        self,
+        events: list[Event],
+        flows: list[Flow],
+        expected_result: RoadUserAssignments,
+    ) -> None:
+        target = PolarsRoadUserAssigner(mock_factory())
+
+        result = target.assign(events, flows)
+
+        assert result == expected_result
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_assign_like_simple_road_user_assigner(self, seed: int) -> None:
+        events = create_random_events(seed)
+        flows = create_flows()
+        factory = mock_factory()
+        expected = SimpleRoadUserAssigner(factory).assign(events, flows)
+
+        result = PolarsRoadUserAssigner(factory).assign(events, flows)
+
+        assert result == expected
+        assert len(result.as_list()) > 0
+
+    def test_assign_without_events(self) -> None:
+        target = PolarsRoadUserAssigner(mock_factory())
+
+        result = target.assign([], create_flows())
+
+        assert result.as_list() == []
+
+    def test_assign_without_section_events(self) -> None:
+        events = [
+            replace(event, section_id=None) for event in create_random_events(seed=0)
+        ]
+        target = PolarsRoadUserAssigner(mock_factory())
+
+        result = target.assign(events, create_flows())
+
+        assert result.as_list() == []
+
+    def test_assign_polars_events(self) -> None:
+        events = create_random_events(seed=0)
+        flows = create_flows()
+        factory = mock_factory()
+        expected = SimpleRoadUserAssigner(factory).assign(events, flows)
+
+        result = PolarsRoadUserAssigner(factory).assign(
+            PolarsEventDataset.from_events(events), flows
+        )
+
+        assert result == expected
@@ -0,0 +1,107 @@
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from OTAnalytics.application.use_cases.track_statistics import (
+    CalculateTrackStatistics,
+    TrackStatistics,
+)
+from OTAnalytics.domain.track import TrackId
+from OTAnalytics.plugin_datastore.polars_track_id_set import PolarsTrackIdSet
+from OTAnalytics.plugin_datastore.polars_track_statistics import (
+    PolarsCalculateTrackStatistics,
+)
+
+NUMBER_OF_TRACKS_TO_BE_VALIDATED = 23
+FIRST_OCCURRENCE = datetime(2024, 12, 18, 9, 0, 23, 4, tzinfo=timezone.utc)
+SECOND_OCCURRENCE = datetime(2024, 12, 18, 10, 0, 21, 0, tzinfo=timezone.utc)
+
+
+def create_provider(ids: list[str]) -> Mock:
+    provider = Mock()
+    provider.get_ids.return_value = PolarsTrackIdSet(ids)
+    return provider
+
+
+def create_event(road_user_id: str, occurrence: datetime) -> Mock:
+    event = Mock()
+    event.road_user_id = road_user_id
+    event.occurrence = occurrence
+    return event
+
+
+def create_arguments() -> list[Mock]:
+    number_of_tracks_to_be_validated = Mock()
+    number_of_tracks_to_be_validated.calculate.return_value = (
+        NUMBER_OF_TRACKS_TO_BE_VALIDATED
+    )
+    get_all_enter_section_events = Mock()
+    get_all_enter_section_events.get.return_value = [
+        create_event("1", FIRST_OCCURRENCE),
+        create_event("2", FIRST_OCCURRENCE),
+        create_event("2", FIRST_OCCURRENCE),
+        create_event("2", SECOND_OCCURRENCE),
+        create_event("3", SECOND_OCCURRENCE),
+    ]
+    return [
+        create_provider(["1", "2", "3", "4", "5", "6", "7", "8", "10", "11"]),
+        create_provider(["1", "2", "3", "4", "5", "11"]),
+        create_provider(["1", "2", "3", "4", "5", "6", "7", "8", "9", "10"]),
+        create_provider(["1", "2", "3", "4", "5", "6", "7", "8", "9", "12"]),
+        number_of_tracks_to_be_validated,
+        get_all_enter_section_events,
+    ]
+
+
+class TestPolarsCalculateTrackStatistics:
+    def test_get_statistics(self) -> None:
+        calculator = PolarsCalculateTrackStatistics(*create_arguments())
+
+        actual = calculator.get_statistics()
+
+        assert actual == TrackStatistics(
+            track_count=10,
+            track_count_outside=1,
+            track_count_inside=9,
+            track_count_inside_not_intersecting=1,
+            track_count_inside_intersecting_but_unassigned=3,
+            track_count_inside_assigned=5,
+            percentage_inside_assigned=5 / 9,
+            percentage_inside_not_intersection=1 / 9,
+            percentage_inside_intersecting_but_unassigned=3 / 9,
+            number_of_tracks_to_be_validated=NUMBER_OF_TRACKS_TO_BE_VALIDATED,
+            number_of_tracks_with_simultaneous_section_events=1,
+        )
+
+    def test_get_statistics_as_id_set_calculation(self) -> None:
+        expected = CalculateTrackStatistics(*create_arguments()).get_statistics()
+
+        actual = PolarsCalculateTrackStatistics(*create_arguments()).get_statistics()
+
+        assert actual == expected
+
+    @pytest.mark.parametrize(
+        "ids", [[], [TrackId("1"), TrackId("2")]], ids=["empty", "python ids"]
+    )
+    def test_get_statistics_of_other_id_sets(self, ids: list[TrackId]) -> None:
+        provider = Mock()
+        provider.get_ids.return_value = set(ids)
+        get_all_enter_section_events = Mock()
+        get_all_enter_section_events.get.return_value = []
+        number_of_tracks_to_be_validated = Mock()
+        number_of_tracks_to_be_validated.calculate.return_value = 0
+        calculator = PolarsCalculateTrackStatistics(
+            provider,
+            provider,
+            provider,
+            provider,
+            number_of_tracks_to_be_validated,
+            get_all_enter_section_events,
+        )
+
+        actual = calculator.get_statistics()
+
+        assert actual.track_count == len(ids)
+        assert actual.track_count_inside_assigned == len(ids)
+        assert actual.number_of_tracks_with_simultaneous_section_events == 0
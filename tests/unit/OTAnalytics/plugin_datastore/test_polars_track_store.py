@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import timedelta
 from unittest.mock import Mock, call
 
 import polars as pl
@@ -6,8 +7,9 @@ import pytest
 
 from OTAnalytics.domain import track
 from OTAnalytics.domain.geometry import Coordinate, RelativeOffsetCoordinate
-from OTAnalytics.domain.section import LineSection, Section, SectionId
+from OTAnalytics.domain.section import LineSection, Section, SectionId, SectionType
 from OTAnalytics.domain.track import Track, TrackId
+from OTAnalytics.domain.track_dataset.track_dataset import TrackDataset, end_of_window
 from OTAnalytics.domain.types import EventType
 from OTAnalytics.plugin_datastore.polars_track_id_set import PolarsTrackIdSet
 from OTAnalytics.plugin_datastore.polars_track_store import (
@@ -25,14 +27,19 @@ from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store imp
 from tests.utils.assertions import assert_equal_track_properties
 from tests.utils.builders.track_builder import (
     TrackBuilder,
+    create_track,
     mark_last_detection_finished,
 )
 
 
 def create_line_section(
-    section_id: str, coordinates: list[tuple[float, float]]
+    section_id: str,
+    coordinates: list[tuple[float, float]],
+    section_type: SectionType | None = None,
 ) -> Section:
     section = Mock(spec=LineSection)
+    if section_type is not None:
+        section.get_type.return_value = section_type
     section.get_coordinates.return_value = [
         Coordinate(coord[0], coord[1]) for coord in coordinates
     ]
@@ -327,6 +334,55 @@ class TestPolarsTrackDataset:
         assert finished_ids == {first_track.id.id, second_track.id.id}
         assert remaining.empty
 
+    def test_split_by_end_window(
+        self, track_geometry_factory: POLARS_TRACK_GEOMETRY_FACTORY
+    ) -> None:
+        first_track = self.__build_track_from_second("first", 0)
+        second_track = self.__build_track_from_second("second", 2)
+        late_track = self.__build_track_from_second("late", 10)
+        dataset = PolarsTrackDataset.from_list(
+            [late_track, first_track, second_track], track_geometry_factory
+        )
+        window = timedelta(seconds=10)
+
+        actual = dataset.split_by_end_window(window)
+
+        assert [
+            (window_end, {track_id.id for track_id in tracks.track_ids})
+            for window_end, tracks in actual
+        ] == [
+            (
+                end_of_window(first_track.last_detection.occurrence, window),
+                {first_track.id.id, second_track.id.id},
+            ),
+            (
+                end_of_window(late_track.last_detection.occurrence, window),
+                {late_track.id.id},
+            ),
+        ]
+
+    def test_split_by_end_window_into_single_window(
+        self, track_geometry_factory: POLARS_TRACK_GEOMETRY_FACTORY
+    ) -> None:
+        track = self.__build_track_from_second("1", 0)
+        dataset = PolarsTrackDataset.from_list([track], track_geometry_factory)
+        window = timedelta(hours=1)
+
+        actual = dataset.split_by_end_window(window)
+
+        assert actual == [
+            (end_of_window(track.last_detection.occurrence, window), dataset)
+        ]
+
+    def __build_track_from_second(
+        self, track_id: str, start: int, length: int = 5
+    ) -> Track:
+        builder = TrackBuilder().add_track_id(track_id)
+        for second in range(start, start + length):
+            builder.add_second(second)
+            builder.append_detection()
+        return builder.build_track()
+
     def test_add_two_existing_polars_datasets(
         self, track_geometry_factory: POLARS_TRACK_GEOMETRY_FACTORY
     ) -> None:
@@ -480,6 +536,39 @@ class TestPolarsTrackDataset:
         )
         assert dataset.last_occurrence == expected_last
 
+    def test_ids_overlapping(
+        self,
+        track_geometry_factory: POLARS_TRACK_GEOMETRY_FACTORY,
+        car_track: Track,
+        pedestrian_track: Track,
+        bicycle_track: Track,
+    ) -> None:
+        dataset = PolarsTrackDataset.from_list(
+            [bicycle_track, car_track, pedestrian_track], track_geometry_factory
+        )
+
+        assert dataset.ids_overlapping(None, None) == PolarsTrackIdSet(
+            [car_track.id, pedestrian_track.id, bicycle_track.id]
+        )
+        assert dataset.ids_overlapping(None, car_track.end) == PolarsTrackIdSet(
+            [car_track.id, pedestrian_track.id]
+        )
+        assert dataset.ids_overlapping(pedestrian_track.end, None) == PolarsTrackIdSet(
+            [pedestrian_track.id, bicycle_track.id]
+        )
+        assert dataset.ids_overlapping(
+            bicycle_track.end, bicycle_track.end
+        ) == PolarsTrackIdSet([bicycle_track.id])
+        with pytest.raises(ValueError):
+            dataset.ids_overlapping(bicycle_track.end, car_track.start)
+
+    def test_ids_overlapping_on_empty_dataset(
+        self, track_geometry_factory: POLARS_TRACK_GEOMETRY_FACTORY
+    ) -> None:
+        dataset = PolarsTrackDataset(track_geometry_factory)
+
+        assert dataset.ids_overlapping(None, None) == PolarsTrackIdSet()
+
     def test_first_occurrence_on_empty_dataset(
         self, track_geometry_factory: POLARS_TRACK_GEOMETRY_FACTORY
     ) -> None:
@@ -602,6 +691,53 @@ class TestPolarsTrackDataset:
         unique_ids = df.get_column(track.TRACK_ID).unique().to_list()
         assert single_detection_track.id.id in unique_ids
 
+    def test_cut_with_sections(self, single_detection_track: Track) -> None:
+        moving_track = create_track(
+            "1", [(float(x), 1.0) for x in range(10)], start_second=1
+        )
+        dataset = PolarsTrackDataset.from_list(
+            [moving_track, single_detection_track],
+            PolarsTrackGeometryDataset.from_track_dataset,
+        )
+        sections = [
+            create_line_section(
+                "first", [(2.5, -10.0), (2.5, 10.0)], SectionType.CUTTING
+            ),
+            create_line_section(
+                "second", [(6.5, -10.0), (6.5, 10.0)], SectionType.CUTTING
+            ),
+        ]
+
+        result_dataset, original_track_ids = dataset.cut_with_sections(sections)
+
+        sequential_dataset: TrackDataset = dataset
+        for section in sections:
+            sequential_dataset, _ = sequential_dataset.cut_with_section(
+                section, section.get_offset(EventType.SECTION_ENTER)
+            )
+        assert sorted(
+            len(actual.detections) for actual in result_dataset.as_list()
+        ) == sorted(len(expected.detections) for expected in sequential_dataset)
+        assert set(result_dataset.track_ids) == {
+            TrackId("1_0"),
+            TrackId("1_1"),
+            TrackId("1_2"),
+            single_detection_track.id,
+        }
+        assert set(original_track_ids) == {moving_track.id, single_detection_track.id}
+
+    def test_cut_with_sections_on_empty_dataset(
+        self, track_geometry_factory: POLARS_TRACK_GEOMETRY_FACTORY
+    ) -> None:
+        dataset = PolarsTrackDataset(track_geometry_factory)
+
+        result_dataset, original_track_ids = dataset.cut_with_sections(
+            [create_line_section("cut", [(2.5, 0.0), (2.5, 3.0)])]
+        )
+
+        assert result_dataset is dataset
+        assert list(original_track_ids) == []
+
 
 def test_convert_tracks() -> None:
     builder = TrackBuilder().add_track_id("1")
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import cast
 from unittest.mock import Mock, call
@@ -33,6 +33,7 @@ from OTAnalytics.domain.track_dataset.track_dataset import (
     EmptyTrackIdSet,
     TrackDoesNotExistError,
     TrackGeometryDataset,
+    end_of_window,
 )
 from OTAnalytics.plugin_datastore.python_track_store import (
     ByMaxConfidence,
@@ -556,6 +557,27 @@ class TestPythonTrackDataset:
         assert finished.track_ids == PythonTrackIdSet({finished_track.id})
         assert remaining.track_ids == PythonTrackIdSet({pedestrian_track.id})
 
+    def test_split_by_end_window(self) -> None:
+        early_track = create_track("early", [(0, 0), (1, 1)], start_second=0)
+        late_track = create_track("late", [(0, 0), (1, 1)], start_second=10)
+        dataset = PythonTrackDataset.from_list(
+            [late_track, early_track], ShapelyTrackGeometryDataset.from_track_dataset
+        )
+        window = timedelta(seconds=5)
+
+        actual = dataset.split_by_end_window(window)
+
+        assert [(window_end, tracks.track_ids) for window_end, tracks in actual] == [
+            (
+                end_of_window(early_track.last_detection.occurrence, window),
+                PythonTrackIdSet({early_track.id}),
+            ),
+            (
+                end_of_window(late_track.last_detection.occurrence, window),
+                PythonTrackIdSet({late_track.id}),
+            ),
+        ]
+
     def test_split_finished_empty_dataset(self) -> None:
         dataset = PythonTrackDataset(ShapelyTrackGeometryDataset.from_track_dataset)
 
@@ -1,3 +1,4 @@
+from datetime import timedelta
 from typing import cast
 from unittest.mock import Mock, call
 
@@ -16,6 +17,7 @@ from OTAnalytics.domain.track_dataset.track_dataset import (
     TrackDoesNotExistError,
     TrackGeometryDataset,
     TrackIdSet,
+    end_of_window,
 )
 from OTAnalytics.plugin_datastore.python_track_store import (
     PythonTrack,
@@ -33,6 +35,7 @@ from OTAnalytics.plugin_datastore.track_store import (
     PandasTrackDataset,
     PandasTrackSegmentDataset,
     _convert_tracks,
+    _create_cut_track_ids,
 )
 from tests.utils.assertions import (
     assert_equal_detection_properties,
@@ -266,6 +269,55 @@ class TestPandasTrackDataset:
         assert set(finished.track_ids) == {first_track.id, second_track.id}
         assert remaining.empty
 
+    def test_split_by_end_window(
+        self, track_geometry_factory: TRACK_GEOMETRY_FACTORY
+    ) -> None:
+        first_track = self.__build_track_from_second("first", 0)
+        second_track = self.__build_track_from_second("second", 2)
+        late_track = self.__build_track_from_second("late", 10)
+        dataset = PandasTrackDataset.from_list(
+            [late_track, first_track, second_track], track_geometry_factory
+        )
+        window = timedelta(seconds=10)
+
+        actual = dataset.split_by_end_window(window)
+
+        assert [
+            (window_end, {track_id.id for track_id in tracks.track_ids})
+            for window_end, tracks in actual
+        ] == [
+            (
+                end_of_window(first_track.last_detection.occurrence, window),
+                {first_track.id.id, second_track.id.id},
+            ),
+            (
+                end_of_window(late_track.last_detection.occurrence, window),
+                {late_track.id.id},
+            ),
+        ]
+
+    def test_split_by_end_window_into_single_window(
+        self, track_geometry_factory: TRACK_GEOMETRY_FACTORY
+    ) -> None:
+        track = self.__build_track_from_second("1", 0)
+        dataset = PandasTrackDataset.from_list([track], track_geometry_factory)
+        window = timedelta(hours=1)
+
+        actual = dataset.split_by_end_window(window)
+
+        assert actual == [
+            (end_of_window(track.last_detection.occurrence, window), dataset)
+        ]
+
+    def __build_track_from_second(
+        self, track_id: str, start: int, length: int = 5
+    ) -> Track:
+        builder = TrackBuilder().add_track_id(track_id)
+        for second in range(start, start + length):
+            builder.add_second(second)
+            builder.append_detection()
+        return builder.build_track()
+
     def test_add_two_existing_pandas_datasets(
         self, track_geometry_factory: TRACK_GEOMETRY_FACTORY
     ) -> None:
@@ -721,3 +773,15 @@ class TestPandasTrackDataset:
         assert actual.index.names == INDEX_NAMES
         assert INDEX_NAMES not in actual.columns.to_list()
         assert set(COLUMNS) - set(INDEX_NAMES) == set(actual.columns.to_list())
+
+
+def test_create_cut_track_ids() -> None:
+    actual = _create_cut_track_ids(
+        track_ids=numpy.array(["1", "1", "1", "1", "1", "2", "2", "2"]),
+        positions=numpy.array([0, 1, 2, 3, 4, 0, 1, 2]),
+        track_codes=numpy.array([0, 0, 0, 0, 0, 1, 1, 1]),
+        cut_track_codes=numpy.array([0, 1, 0]),
+        cut_positions=numpy.array([3, 1, 1]),
+    )
+
+    assert actual.tolist() == ["1_0", "1_1", "1_1", "1_2", "1_2", "2_0", "2_1", "2_1"]
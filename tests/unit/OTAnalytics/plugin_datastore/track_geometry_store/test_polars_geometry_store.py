@@ -7,11 +7,24 @@ import pytest
 from polars import DataFrame
 from pytest import approx
 
+from OTAnalytics.domain.event import EventRepository, PythonEventDataset
 from OTAnalytics.domain.geometry import Coordinate, RelativeOffsetCoordinate
 from OTAnalytics.domain.section import LineSection, SectionId, SectionType
-from OTAnalytics.domain.track import FRAME, TRACK_CLASSIFICATION, VIDEO_NAME, H, W
-from OTAnalytics.domain.track_dataset.track_dataset import END_FRAME, END_VIDEO_NAME
+from OTAnalytics.domain.track import (
+    FRAME,
+    TRACK_CLASSIFICATION,
+    VIDEO_NAME,
+    H,
+    TrackId,
+    W,
+)
+from OTAnalytics.domain.track_dataset.track_dataset import (
+    END_FRAME,
+    END_VIDEO_NAME,
+    IntersectionPoint,
+)
 from OTAnalytics.domain.types import EventType
+from OTAnalytics.plugin_datastore.polars_track_id_set import PolarsTrackIdSet
 from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store import (
     END_H,
     END_OCCURRENCE,
@@ -31,6 +44,7 @@ from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store imp
     START_X,
     START_Y,
     TRACK_ID,
+    PolarsEventDataset,
     PolarsTrackGeometryDataset,
     Polygon,
     X,
@@ -39,6 +53,8 @@ from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store imp
     create_track_segments,
     find_line_intersections,
 )
+from tests.utils.builders.event_builder import EventBuilder
+from tests.utils.builders.track_builder import create_track
 
 
 def test_find_line_intersections_empty_df() -> None:
@@ -731,3 +747,204 @@ class TestTrackIdsAfterCut:
         assert "track1_0" in unique_track_ids
         assert "track1_1" in unique_track_ids
         assert "track1_2" in unique_track_ids
+
+
+class TestPolarsEventDataset:
+    def test_from_events(self) -> None:
+        builder = EventBuilder(direction_vector_x=1.0, event_coordinate_y=2.5)
+        section_event = builder.build_section_event()
+        builder.road_user_id = "2"
+        builder.section_id = None
+        builder.event_type = "enter-scene"
+        enter_scene_event = builder.build_section_event()
+
+        dataset = PolarsEventDataset.from_events([section_event, enter_scene_event])
+
+        assert len(dataset) == 2
+        assert list(dataset) == [section_event, enter_scene_event]
+
+    def test_from_no_events(self) -> None:
+        assert PolarsEventDataset.from_events([]).is_empty()
+
+    def test_add(self) -> None:
+        first = EventBuilder(road_user_id="1").build_section_event()
+        second = EventBuilder(road_user_id="2", section_id=None).build_section_event()
+        polars_events = PolarsEventDataset.from_events([first])
+
+        added = polars_events + PythonEventDataset([second])
+        reverse_added = PythonEventDataset([second]) + polars_events
+
+        assert isinstance(added, PolarsEventDataset)
+        assert isinstance(reverse_added, PolarsEventDataset)
+        assert list(added) == [first, second]
+        assert list(reverse_added) == [second, first]
+        assert list(polars_events) == [first]
+
+    def test_add_empty(self) -> None:
+        first = EventBuilder().build_section_event()
+        polars_events = PolarsEventDataset.from_events([first])
+
+        assert polars_events + PolarsEventDataset() == polars_events
+        assert PolarsEventDataset() + polars_events == polars_events
+
+    def test_extend_and_append(self) -> None:
+        first = EventBuilder(road_user_id="1").build_section_event()
+        second = EventBuilder(road_user_id="2").build_section_event()
+        third = EventBuilder(road_user_id="3").build_section_event()
+        dataset = PolarsEventDataset()
+
+        dataset.extend(PythonEventDataset([first, second]))
+        dataset.append(third)
+
+        assert list(dataset) == [first, second, third]
+
+    def test_unique_sorted_by_occurrence(self) -> None:
+        first = EventBuilder(occurrence_second=1).build_section_event()
+        second = EventBuilder(occurrence_second=2).build_section_event()
+        dataset = PolarsEventDataset.from_events([second, first, second])
+
+        actual = dataset.unique_sorted_by_occurrence()
+
+        assert list(actual) == [first, second]
+
+    def test_filter(self) -> None:
+        first = EventBuilder(occurrence_second=1).build_section_event()
+        second = EventBuilder(
+            occurrence_second=2, section_id="2", event_type="section-leave"
+        ).build_section_event()
+        third = EventBuilder(occurrence_second=3, section_id=None).build_section_event()
+        events = [first, second, third]
+        dataset = PolarsEventDataset.from_events(events)
+
+        by_date = dataset.filter(
+            start_date=second.occurrence, end_date=third.occurrence
+        )
+        by_section = dataset.filter(sections=[SectionId("2")])
+        by_type = dataset.filter(event_types=[EventType.SECTION_ENTER])
+
+        assert list(by_date) == [second, third]
+        assert list(by_section) == [second]
+        assert list(by_type) == [first, third]
+        assert list(dataset.filter()) == events
+        assert PolarsEventDataset().filter(sections=[SectionId("2")]).is_empty()
+
+    def test_stay_columnar_in_event_repository(self) -> None:
+        first = EventBuilder(occurrence_second=1).build_section_event()
+        second = EventBuilder(occurrence_second=2, section_id="2").build_section_event()
+        repository = EventRepository(dataset=PolarsEventDataset())
+
+        repository.add_all(PolarsEventDataset.from_events([second, first]))
+        actual = repository.get_dataset(sections=[SectionId("2")])
+
+        assert isinstance(actual, PolarsEventDataset)
+        assert list(actual) == [second]
+        assert repository.get_all() == [first, second]
+
+
+def create_line_section(
+    section_id: str, coordinates: list[tuple[float, float]]
+) -> LineSection:
+    return LineSection(
+        SectionId(section_id),
+        section_id,
+        {EventType.SECTION_ENTER: RelativeOffsetCoordinate(0, 0)},
+        {},
+        [Coordinate(x, y) for x, y in coordinates],
+    )
+
+
+class TestPolarsTrackGeometryDatasetSpatialIndex:
+    OFFSET = RelativeOffsetCoordinate(0, 0)
+    LEFT = create_line_section("left", [(15, 0), (15, 100)])
+    RIGHT = create_line_section("right", [(515, 0), (515, 100)])
+
+    def create_tracks(self) -> list:
+        return [
+            create_track("left", [(10, 10), (20, 10), (30, 10)], 0),
+            create_track("right", [(510, 10), (520, 10), (530, 10)], 0),
+            create_track("both", [(10, 50), (20, 50), (510, 50), (520, 50)], 0),
+        ]
+
+    def test_add_all_updates_spatial_index(self) -> None:
+        left, right, both = self.create_tracks()
+        dataset = PolarsTrackGeometryDataset(self.OFFSET).add_all([left, both])
+        assert dataset.intersecting_tracks([self.RIGHT]) == PolarsTrackIdSet(
+            {TrackId("both")}
+        )
+
+        moved_both = create_track("both", [(1000, 50), (1010, 50)], 0)
+        actual = dataset.add_all([right, moved_both])
+
+        assert actual.intersecting_tracks([self.LEFT]) == PolarsTrackIdSet(
+            {TrackId("left")}
+        )
+        assert actual.intersecting_tracks([self.RIGHT]) == PolarsTrackIdSet(
+            {TrackId("right")}
+        )
+
+    def test_remove_and_get_for_update_spatial_index(self) -> None:
+        dataset = PolarsTrackGeometryDataset(self.OFFSET).add_all(self.create_tracks())
+        dataset.intersecting_tracks([self.LEFT, self.RIGHT])
+
+        removed = dataset.remove(["left"])
+        selected = dataset.get_for(["right"])
+
+        assert removed.intersecting_tracks([self.LEFT]) == PolarsTrackIdSet(
+            {TrackId("both")}
+        )
+        assert selected.intersecting_tracks([self.LEFT, self.RIGHT]) == (
+            PolarsTrackIdSet({TrackId("right")})
+        )
+
+
+class TestPolarsIntersectionPoints:
+    OFFSET = RelativeOffsetCoordinate(0, 0)
+    FIRST = create_line_section("first", [(12.5, 0), (12.5, 100)])
+    SECOND = create_line_section("second", [(517.5, 0), (517.5, 100)])
+
+    def create_dataset(self) -> PolarsTrackGeometryDataset:
+        return PolarsTrackGeometryDataset(self.OFFSET).add_all(
+            [
+                create_track("first", [(10, 10), (20, 10), (30, 10)], 0),
+                create_track("both", [(10, 50), (20, 50), (510, 50), (520, 50)], 0),
+                create_track("none", [(100, 50), (110, 50)], 0),
+            ]
+        )
+
+    def test_wrap_intersection_points(self) -> None:
+        dataset = self.create_dataset()
+
+        actual = dataset.wrap_intersection_points([self.FIRST, self.SECOND])
+
+        # Segments are ordered by track id
+        expected = [
+            (
+                TrackId("both"),
+                [
+                    (SectionId("first"), IntersectionPoint(1, 0.25)),
+                    (SectionId("second"), IntersectionPoint(1, 0.75)),
+                ],
+            ),
+            (
+                TrackId("first"),
+                [(SectionId("first"), IntersectionPoint(1, 0.25))],
+            ),
+        ]
+        assert list(actual.items()) == expected
+        assert list(actual.keys()) == [TrackId("both"), TrackId("first")]
+        assert actual.get(TrackId("both")) == expected[0][1]
+        assert actual.get(TrackId("none")) == []
+        assert TrackId("first") in actual
+        assert TrackId("none") not in actual
+        assert dataset.intersection_points([self.FIRST, self.SECOND]) == dict(expected)
+
+    def test_wrap_intersection_points_without_intersections(self) -> None:
+        dataset = self.create_dataset()
+        section = create_line_section("nowhere", [(1000, 1000), (1000, 2000)])
+
+        actual = dataset.wrap_intersection_points([section])
+
+        assert actual.empty
+        assert list(actual.items()) == []
+        assert list(actual.keys()) == []
+        assert TrackId("first") not in actual
@@ -0,0 +1,109 @@
+import polars as pl
+
+from OTAnalytics.domain.geometry import Coordinate, RelativeOffsetCoordinate
+from OTAnalytics.domain.track_dataset.track_dataset import (
+    END_H,
+    END_W,
+    END_X,
+    END_Y,
+    START_H,
+    START_W,
+    START_X,
+    START_Y,
+)
+from OTAnalytics.plugin_datastore.track_geometry_store.segment_grid_index import (
+    CELL_X,
+    SegmentGridIndex,
+)
+
+NO_OFFSET = RelativeOffsetCoordinate(0, 0)
+CELL_SIZE = 10.0
+
+
+def create_segments(
+    *segments: tuple[float, float, float, float], size: float = 2.0
+) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            START_X: [segment[0] for segment in segments],
+            START_Y: [segment[1] for segment in segments],
+            END_X: [segment[2] for segment in segments],
+            END_Y: [segment[3] for segment in segments],
+            START_W: [size] * len(segments),
+            START_H: [size] * len(segments),
+            END_W: [size] * len(segments),
+            END_H: [size] * len(segments),
+        }
+    )
+
+
+def candidates_of(
+    index: SegmentGridIndex, start: tuple[float, float], end: tuple[float, float]
+) -> list[int]:
+    return index.candidates([Coordinate(*start), Coordinate(*end)]).to_list()
+
+
+SEGMENTS = create_segments(
+    (1, 1, 2, 2),
+    (15, 15, 25, 15),
+    (51, 51, 52, 52),
+    (1, 55, 5, 55),
+)
+
+
+class TestSegmentGridIndex:
+    def test_candidates(self) -> None:
+        index = SegmentGridIndex.build(SEGMENTS, NO_OFFSET, cell_size=CELL_SIZE)
+
+        assert candidates_of(index, (0, 0), (20, 20)) == [0, 1]
+        assert candidates_of(index, (21, 11), (29, 19)) == [1]
+        assert candidates_of(index, (50, 0), (55, 55)) == [2]
+        assert candidates_of(index, (100, 100), (110, 110)) == []
+
+    def test_candidates_on_cell_border(self) -> None:
+        index = SegmentGridIndex.build(SEGMENTS, NO_OFFSET, cell_size=CELL_SIZE)
+
+        assert candidates_of(index, (30, 15), (25, 10)) == [1]
+
+    def test_build_applies_offset(self) -> None:
+        segments = create_segments((1, 1, 2, 2), size=20)
+        offset = RelativeOffsetCoordinate(0.5, 0.5)
+        index = SegmentGridIndex.build(segments, offset, cell_size=CELL_SIZE)
+
+        assert candidates_of(index, (0, 0), (9, 9)) == []
+        assert candidates_of(index, (10, 10), (19, 19)) == [0]
+
+    def test_large_segments_are_always_candidates(self) -> None:
+        segments = create_segments((1, 1, 2, 2), (0, 0, 1000, 0))
+        index = SegmentGridIndex.build(segments, NO_OFFSET, cell_size=CELL_SIZE)
+
+        assert len(index.large_segments) == 1
+        assert candidates_of(index, (500, 500), (510, 510)) == [1]
+
+    def test_keep(self) -> None:
+        index = SegmentGridIndex.build(SEGMENTS, NO_OFFSET, cell_size=CELL_SIZE)
+
+        actual = index.keep(pl.Series([False, True, False, True]))
+
+        assert candidates_of(actual, (0, 0), (60, 60)) == [0, 1]
+        assert candidates_of(actual, (0, 50), (9, 59)) == [1]
+
+    def test_extend(self) -> None:
+        first = SegmentGridIndex.build(SEGMENTS[:2], NO_OFFSET, cell_size=CELL_SIZE)
+        second = SegmentGridIndex.build(
+            SEGMENTS[2:], NO_OFFSET, first_index=2, cell_size=CELL_SIZE
+        )
+        expected = SegmentGridIndex.build(SEGMENTS, NO_OFFSET, cell_size=CELL_SIZE)
+
+        actual = first.extend(second)
+
+        assert actual.cells[CELL_X].is_sorted()
+        for start, end in [((0, 0), (60, 60)), ((0, 50), (9, 59)), ((0, 0), (9, 9))]:
+            assert candidates_of(actual, start, end) == candidates_of(
+                expected, start, end
+            )
+
+    def test_build_empty(self) -> None:
+        index = SegmentGridIndex.build(pl.DataFrame(), NO_OFFSET)
+
+        assert candidates_of(index, (0, 0), (10, 10)) == []
@@ -2,6 +2,7 @@ from unittest.mock import Mock, call, patch
 
 import pytest
 
+from OTAnalytics.application.use_cases.cut_tracks_with_sections import CutTracksDto
 from OTAnalytics.application.use_cases.section_repository import (
     GetSectionsById,
     RemoveSection,
@@ -14,6 +15,7 @@ from OTAnalytics.application.use_cases.track_repository import (
 from OTAnalytics.domain.section import (
     Area,
     LineSection,
+    Section,
     SectionId,
     SectionRepositoryEvent,
     SectionType,
@@ -37,6 +39,7 @@ class TestSimpleCutTracksIntersectingSection:
     def line_section(self) -> LineSection:
         section = Mock(spec=LineSection)
         section.id = SectionId("LineSection")
+        section.name = "LineSection"
         section.get_type.return_value = SectionType.LINE
         return section
 
@@ -81,6 +84,41 @@ class TestSimpleCutTracksIntersectingSection:
         ]
         remove_section.assert_called_once_with(cutting_section.id)
 
+    def test_cut_all(
+        self, cutting_section: LineSection, line_section: LineSection
+    ) -> None:
+        track_id = TrackId("1")
+        sections: list[Section] = [cutting_section, line_section]
+        get_tracks = Mock(spec=GetTracksWithoutSingleDetections)
+        clear_all_tracks = Mock(spec=ClearAllTracks)
+        add_all_tracks = Mock(spec=AddAllTracks)
+        remove_section = Mock(spec=RemoveSection)
+        observer = Mock()
+        cut_tracks_dataset = Mock()
+        track_dataset = Mock()
+        track_dataset.cut_with_sections.return_value = (cut_tracks_dataset, {track_id})
+        get_tracks.as_dataset.return_value = track_dataset
+
+        cut_tracks_intersecting_section = SimpleCutTracksIntersectingSection(
+            Mock(spec=GetSectionsById),
+            get_tracks,
+            clear_all_tracks,
+            add_all_tracks,
+            remove_section,
+        )
+        cut_tracks_intersecting_section.register(observer)
+        cut_tracks_intersecting_section.cut_all(sections)
+
+        track_dataset.cut_with_sections.assert_called_once_with(sections)
+        track_dataset.cut_with_section.assert_not_called()
+        clear_all_tracks.assert_called_once()
+        add_all_tracks.assert_called_once_with(cut_tracks_dataset)
+        assert remove_section.call_args_list == [
+            call(cutting_section.id),
+            call(line_section.id),
+        ]
+        observer.assert_called_once_with(CutTracksDto(sections, [track_id]))
+
     def test_notify_sections(
         self,
         cutting_section: LineSection,
@@ -1,27 +1,65 @@
 from typing import Callable, Iterable, cast
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 import pytest
 
-from OTAnalytics.domain.event import Event, PythonEventDataset
-from OTAnalytics.domain.section import Section
+from OTAnalytics.domain.event import Event, EventDataset, PythonEventDataset
+from OTAnalytics.domain.geometry import DirectionVector2D, ImageCoordinate
+from OTAnalytics.domain.section import Section, SectionId
 from OTAnalytics.domain.track_dataset.track_dataset import TrackDataset
+from OTAnalytics.domain.types import EventType
+from OTAnalytics.plugin_datastore.polars_track_store import PolarsTrackDataset
+from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store import (
+    PolarsTrackGeometryDataset,
+)
 from OTAnalytics.plugin_intersect_parallelization.multiprocessing import (
     MultiprocessingIntersectParallelization,
 )
+from tests.utils.builders.track_builder import create_track
+
+
+def create_event_per_track(
+    tracks: TrackDataset, sections: Iterable[Section]
+) -> EventDataset:
+    return PythonEventDataset(
+        [
+            Event(
+                road_user_id=track.id.id,
+                road_user_type=track.classification,
+                hostname="myhostname",
+                occurrence=track.first_detection.occurrence,
+                frame_number=track.first_detection.frame,
+                section_id=SectionId("section"),
+                event_coordinate=ImageCoordinate(
+                    track.first_detection.x, track.first_detection.y
+                ),
+                event_type=EventType.SECTION_ENTER,
+                direction_vector=DirectionVector2D(1, 0),
+                video_name=track.first_detection.video_name,
+                interpolated_occurrence=track.first_detection.occurrence,
+                interpolated_event_coordinate=ImageCoordinate(
+                    track.first_detection.x, track.first_detection.y
+                ),
+            )
+            for track in tracks
+        ]
+    )
 
 
 class TestMultiprocessingIntersectParallelization:
-    @patch("OTAnalytics.plugin_intersect_parallelization.multiprocessing.Pool")
+    @patch("OTAnalytics.plugin_intersect_parallelization.multiprocessing.get_context")
     def test_execute(self, mock_pool_init: Mock) -> None:
         event_1 = Mock(spec=Event)
         event_2 = Mock(spec=Event)
 
-        mock_pool_instance = mock_pool_init.return_value.__enter__.return_value
-        mock_pool_instance.starmap.return_value = [[event_1], [event_2]]
+        mock_pool_instance = mock_pool_init.return_value.Pool.return_value
+        mock_pool_instance.starmap.return_value = [
+            PythonEventDataset([event_1]),
+            PythonEventDataset([event_2]),
+        ]
 
         intersect = Mock()
-        tasks = Mock()
+        tasks = [(Mock(spec=TrackDataset), [Mock()])]
 
         parallelizer = MultiprocessingIntersectParallelization(num_processes=2)
         result = parallelizer.execute(cast(Callable, intersect), tasks)
@@ -29,12 +67,55 @@ class TestMultiprocessingIntersectParallelization:
         assert result == PythonEventDataset([event_1, event_2])
         mock_pool_instance.starmap.assert_called_once_with(intersect, tasks)
 
-    @patch("OTAnalytics.plugin_intersect_parallelization.multiprocessing.Pool")
+    @patch("OTAnalytics.plugin_intersect_parallelization.multiprocessing.get_context")
+    def test_reuse_pool(self, mock_pool_init: Mock) -> None:
+        mock_pool_instance = mock_pool_init.return_value.Pool.return_value
+        mock_pool_instance.starmap.return_value = []
+        parallelizer = MultiprocessingIntersectParallelization(num_processes=2)
+
+        parallelizer.execute(Mock(), [])
+        parallelizer.execute(Mock(), [])
+        parallelizer.set_num_processes(3)
+        parallelizer.execute(Mock(), [])
+
+        assert mock_pool_init.return_value.Pool.call_args_list == [
+            call(processes=2),
+            call(processes=3),
+        ]
+        mock_pool_instance.terminate.assert_called_once()
+
+    def test_execute_with_shared_polars_tracks(self) -> None:
+        tracks = PolarsTrackDataset.from_list(
+            [
+                create_track("1", [(0, 0), (1, 1)], start_second=1),
+                create_track("2", [(0, 0), (1, 1)], start_second=2),
+                create_track("3", [(0, 0), (1, 1)], start_second=3),
+            ],
+            PolarsTrackGeometryDataset.from_track_dataset,
+        )
+        sections: list[Section] = []
+        tasks = [(batch, sections) for batch in tracks.split(2)]
+        expected = MultiprocessingIntersectParallelization(num_processes=1).execute(
+            create_event_per_track, tasks
+        )
+        parallelizer = MultiprocessingIntersectParallelization(num_processes=2)
+
+        try:
+            actual = parallelizer.execute(create_event_per_track, tasks)
+        finally:
+            parallelizer.close()
+
+        assert sorted(actual, key=lambda event: event.road_user_id) == sorted(
+            expected, key=lambda event: event.road_user_id
+        )
+        assert len(actual) == 3
+
+    @patch("OTAnalytics.plugin_intersect_parallelization.multiprocessing.get_context")
     def test_execute_sequentially(self, mock_pool_init: Mock) -> None:
         event_1 = Mock(spec=Event)
         event_2 = Mock(spec=Event)
 
-        mock_pool_instance = mock_pool_init.return_value.__enter__.return_value
+        mock_pool_instance = mock_pool_init.return_value.Pool.return_value
 
         intersect = Mock()
         intersect.side_effect = [PythonEventDataset([event_1, event_2])]
@@ -11,7 +11,7 @@ class TestSequentialIntersect:
     def test_execute(self) -> None:
         event_1 = Mock(spec=Event)
         event_2 = Mock(spec=Event)
-        side_effect = [[event_1], [event_2]]
+        side_effect = [PythonEventDataset([event_1]), PythonEventDataset([event_2])]
 
         mock_intersect = Mock(spec=Callable, side_effect=side_effect)
         first_track_dataset = Mock()
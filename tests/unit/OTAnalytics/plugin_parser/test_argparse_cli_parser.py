@@ -17,6 +17,7 @@ class TestArgparseCliParser:
         csv_format = "csv"
         otevents_format = "otevents"
         config_file = "path/to/config.otconfig"
+        track_cache_dir = "path/to/cache"
 
         cli_args: list[str] = [
             "path",
@@ -49,6 +50,13 @@ class TestArgparseCliParser:
             "car",
             "--exclude-classes",
             "pedestrian",
+            "--num-processes",
+            "4",
+            "--track-cache-dir",
+            track_cache_dir,
+            "--stream-window",
+            "60",
+            "--resume",
         ]
         with patch.object(sys, "argv", cli_args):
             parser = ArgparseCliParser()
@@ -71,4 +79,8 @@ class TestArgparseCliParser:
                 log_file=log_file,
                 include_classes=["truck", "car"],
                 exclude_classes=["pedestrian"],
+                num_processes=4,
+                track_cache_dir=track_cache_dir,
+                stream_window_in_minutes=60,
+                resume=True,
             )
@@ -0,0 +1,173 @@
+from pathlib import Path
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from OTAnalytics.domain import track
+from OTAnalytics.plugin_datastore.polars_track_store import PolarsTrackDataset
+from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store import (
+    PolarsTrackGeometryDataset,
+)
+from OTAnalytics.plugin_datastore.track_store import (
+    PandasByMaxConfidence,
+    PandasTrackDataset,
+)
+from OTAnalytics.plugin_parser import ottrk_dataformat
+from OTAnalytics.plugin_parser.chunked_ottrk_parser import (
+    ChunkedOttrkParser,
+    ColumnarOtdet_Version_1_0_to_1_1,
+    ColumnarOtdet_Version_1_0_To_1_2,
+    read_detection_chunks,
+)
+from OTAnalytics.plugin_parser.json_parser import write_json_bz2
+from OTAnalytics.plugin_parser.otvision_parser import (
+    VERSION_1_0,
+    VERSION_1_1,
+    VERSION_1_2,
+    OttrkParser,
+)
+from OTAnalytics.plugin_parser.pandas_parser import PandasDetectionParser
+from tests.utils.builders.track_builder import track_builder_with_sample_data
+
+
+def create_parser(chunk_size: int) -> ChunkedOttrkParser:
+    return ChunkedOttrkParser(
+        PolarsTrackGeometryDataset.from_track_dataset, chunk_size=chunk_size
+    )
+
+
+class TestColumnarOtdet_Version_1_0_to_1_1:
+    def test_fix_x_y_coordinates(self) -> None:
+        detections = pl.DataFrame(
+            {
+                ottrk_dataformat.X: [0.0, 10.0],
+                ottrk_dataformat.Y: [0.0, 20.0],
+                ottrk_dataformat.W: [10.0, 4.0],
+                ottrk_dataformat.H: [10.0, 2.0],
+            }
+        )
+        expected = detections.with_columns(
+            pl.Series(ottrk_dataformat.X, [-5.0, 8.0]),
+            pl.Series(ottrk_dataformat.Y, [-5.0, 19.0]),
+        )
+
+        fixed = ColumnarOtdet_Version_1_0_to_1_1().fix(detections, VERSION_1_0)
+
+        assert_frame_equal(fixed, expected)
+
+    def test_no_fix_in_newer_version(self) -> None:
+        detections = pl.DataFrame(
+            {
+                ottrk_dataformat.X: [0.0],
+                ottrk_dataformat.Y: [0.0],
+                ottrk_dataformat.W: [10.0],
+                ottrk_dataformat.H: [10.0],
+            }
+        )
+
+        fixed = ColumnarOtdet_Version_1_0_to_1_1().fix(detections, VERSION_1_1)
+
+        assert_frame_equal(fixed, detections)
+
+
+class TestColumnarOtdet_Version_1_0_To_1_2:
+    def test_fix_occurrence(self) -> None:
+        detections = pl.DataFrame(
+            {ottrk_dataformat.OCCURRENCE: ["2020-01-01 00:00:01.050000"]}
+        )
+
+        fixed = ColumnarOtdet_Version_1_0_To_1_2().fix(detections, VERSION_1_1)
+
+        assert fixed.get_column(ottrk_dataformat.OCCURRENCE).to_list() == [
+            1577836801.05
+        ]
+
+
+class TestReadDetectionChunks:
+    def test_chunks_have_at_most_chunk_size_detections(self, ottrk_path: Path) -> None:
+        chunks = list(read_detection_chunks(ottrk_path, VERSION_1_2, chunk_size=100))
+
+        assert [len(chunk) for chunk in chunks] == [100, 100, 100, 9]
+        assert ottrk_dataformat.INPUT_FILE_PATH not in chunks[0].columns
+
+    def test_keep_optional_column_missing_in_first_detection(
+        self, test_data_tmp_dir: Path
+    ) -> None:
+        ottrk_file = test_data_tmp_dir / "optional_column.ottrk"
+        content = track_builder_with_sample_data().build_ottrk()
+        detections = content[ottrk_dataformat.DATA][ottrk_dataformat.DATA_DETECTIONS]
+        for detection in detections:
+            detection.pop(ottrk_dataformat.FINISHED, None)
+        detections[-1][ottrk_dataformat.FINISHED] = True
+        write_json_bz2(content, ottrk_file)
+
+        chunks = list(read_detection_chunks(ottrk_file, VERSION_1_2, chunk_size=100))
+
+        assert len(chunks) == 1
+        finished = chunks[0].get_column(ottrk_dataformat.FINISHED).to_list()
+        assert finished == [None] * (len(detections) - 1) + [True]
+        ottrk_file.unlink()
+
+
+class TestChunkedOttrkParser:
+    @pytest.mark.parametrize("chunk_size", [1, 50, 100_000])
+    def test_parse_equals_pandas_detection_parser(
+        self, ottrk_path: Path, chunk_size: int
+    ) -> None:
+        pandas_parser = OttrkParser(
+            PandasDetectionParser(
+                PandasByMaxConfidence(), PolarsTrackGeometryDataset.from_track_dataset
+            )
+        )
+        expected = pandas_parser.parse(ottrk_path)
+
+        actual = create_parser(chunk_size).parse(ottrk_path)
+
+        assert isinstance(actual.tracks, PolarsTrackDataset)
+        assert isinstance(expected.tracks, PandasTrackDataset)
+        actual_data = actual.tracks.get_data()
+        columns = [
+            column
+            for column in actual_data.columns
+            if column in expected.tracks.get_data().columns
+            or column in [track.TRACK_ID, track.OCCURRENCE]
+        ]
+        expected_data = (
+            pl.from_pandas(expected.tracks.get_data().reset_index())
+            .select(columns)
+            .with_columns(pl.col(track.OCCURRENCE).dt.cast_time_unit("us"))
+        )
+        assert_frame_equal(
+            actual_data.select(columns).sort([track.TRACK_ID, track.OCCURRENCE]),
+            expected_data.sort([track.TRACK_ID, track.OCCURRENCE]),
+            check_dtypes=False,
+        )
+        assert actual.detection_metadata == expected.detection_metadata
+        assert actual.video_metadata == expected.video_metadata
+
+    @pytest.mark.parametrize(
+        "version,track_id", [("1.0", "legacy#legacy#1"), ("1.1", "1#1#1")]
+    )
+    def test_parse_ottrk_sample(
+        self, test_data_tmp_dir: Path, version: str, track_id: str
+    ) -> None:
+        ottrk_file = test_data_tmp_dir / "chunked_sample_file.ottrk"
+        track_builder = track_builder_with_sample_data(input_file=str(ottrk_file))
+        track_builder.set_ottrk_version(version)
+        write_json_bz2(track_builder.build_ottrk(), ottrk_file)
+
+        result = create_parser(chunk_size=2).parse(ottrk_file)
+
+        expected_track = track_builder.build_track()
+        actual_track = result.tracks.as_list()[0]
+        assert len(result.tracks) == 1
+        assert actual_track.id.id == track_id
+        assert actual_track.classification == expected_track.classification
+        assert [detection.occurrence for detection in actual_track.detections] == [
+            detection.occurrence for detection in expected_track.detections
+        ]
+        assert [detection.x for detection in actual_track.detections] == [
+            detection.x for detection in expected_track.detections
+        ]
+        ottrk_file.unlink()
@@ -0,0 +1,85 @@
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+import pytest
+
+from OTAnalytics.plugin_parser.columnar_export import (
+    ARROW,
+    PARQUET,
+    ArrowColumnarWriter,
+    ParquetColumnarWriter,
+    create_columnar_writer,
+)
+
+
+def read(file_format: str, file: Path) -> pa.Table:
+    if file_format == PARQUET:
+        return pq.read_table(file)
+    with pa.memory_map(str(file)) as source:
+        return ipc.open_file(source).read_all()
+
+
+class TestColumnarWriter:
+    @pytest.mark.parametrize("file_format", [PARQUET, ARROW])
+    def test_append_tables(self, file_format: str, test_data_tmp_dir: Path) -> None:
+        file = test_data_tmp_dir / f"tables.{file_format}"
+        writer = create_columnar_writer(file_format, file)
+
+        writer.write(pa.table({"id": ["1", "2"], "x": [1.0, 2.0]}))
+        writer.write(pa.table({"id": ["3"], "x": [3]}))
+        writer.close()
+
+        actual = read(file_format, file)
+        assert actual.to_pydict() == {"id": ["1", "2", "3"], "x": [1.0, 2.0, 3.0]}
+
+    @pytest.mark.parametrize("file_format", [PARQUET, ARROW])
+    def test_conform_later_tables(
+        self, file_format: str, test_data_tmp_dir: Path
+    ) -> None:
+        file = test_data_tmp_dir / f"tables.{file_format}"
+        writer = create_columnar_writer(file_format, file)
+
+        writer.write(pa.table({"id": ["1"], "note": pa.nulls(1)}))
+        writer.write(pa.table({"note": ["late"], "id": ["2"], "unknown": [1]}))
+        writer.write(pa.table({"id": ["3"]}))
+        writer.close()
+
+        actual = read(file_format, file)
+        assert actual.to_pydict() == {
+            "id": ["1", "2", "3"],
+            "note": [None, "late", None],
+        }
+
+    @pytest.mark.parametrize("file_format", [PARQUET, ARROW])
+    def test_write_empty_table(self, file_format: str, test_data_tmp_dir: Path) -> None:
+        file = test_data_tmp_dir / f"empty.{file_format}"
+        writer = create_columnar_writer(file_format, file)
+
+        writer.write(pa.table({"id": pa.array([], pa.string())}))
+        writer.close()
+
+        actual = read(file_format, file)
+        assert actual.num_rows == 0
+        assert actual.column_names == ["id"]
+
+    def test_no_file_without_tables(self, test_data_tmp_dir: Path) -> None:
+        file = test_data_tmp_dir / "nothing.parquet"
+        writer = create_columnar_writer(PARQUET, file)
+
+        writer.close()
+
+        assert not file.exists()
+
+
+class TestCreateColumnarWriter:
+    def test_create_writers(self) -> None:
+        file = Path("file")
+
+        assert isinstance(create_columnar_writer(PARQUET, file), ParquetColumnarWriter)
+        assert isinstance(create_columnar_writer(ARROW, file), ArrowColumnarWriter)
+
+    def test_unknown_format(self) -> None:
+        with pytest.raises(ValueError):
+            create_columnar_writer("csv", Path("file"))
@@ -0,0 +1,107 @@
+from pathlib import Path
+
+import pytest
+
+from OTAnalytics.application.analysis.traffic_counting import (
+    LEVEL_CLASSIFICATION,
+    LEVEL_FLOW,
+    Tag,
+    create_flow_tag,
+    create_mode_tag,
+)
+from OTAnalytics.plugin_parser.count_accumulator import (
+    COMPACTED_PREFIX,
+    COUNT,
+    SPILL_PREFIX,
+    ParquetCountAccumulator,
+)
+
+CAR_NORTH = create_flow_tag("north").combine(create_mode_tag("car"))
+BICYCLE_NORTH = create_flow_tag("north").combine(create_mode_tag("bicycle"))
+CAR_SOUTH = create_flow_tag("south").combine(create_mode_tag("car"))
+
+
+def as_counts(actual: list[dict]) -> dict[tuple[str, str], int]:
+    return {(row[LEVEL_FLOW], row[LEVEL_CLASSIFICATION]): row[COUNT] for row in actual}
+
+
+def file_names(directory: Path) -> list[str]:
+    return sorted(file.name for file in directory.iterdir())
+
+
+class TestParquetCountAccumulator:
+    def test_collect_sums_counts(self, test_data_tmp_dir: Path) -> None:
+        accumulator = ParquetCountAccumulator(test_data_tmp_dir / "sum")
+        first: dict[Tag, int] = {CAR_NORTH: 1, BICYCLE_NORTH: 2}
+        second: dict[Tag, int] = {CAR_SOUTH: 3, CAR_NORTH: 4}
+
+        accumulator.add(first)
+        accumulator.add(second)
+
+        assert accumulator.collect() == [
+            {LEVEL_FLOW: "north", LEVEL_CLASSIFICATION: "car", COUNT: 5},
+            {LEVEL_FLOW: "north", LEVEL_CLASSIFICATION: "bicycle", COUNT: 2},
+            {LEVEL_FLOW: "south", LEVEL_CLASSIFICATION: "car", COUNT: 3},
+        ]
+
+    def test_collect_without_counts(self, test_data_tmp_dir: Path) -> None:
+        accumulator = ParquetCountAccumulator(test_data_tmp_dir / "empty")
+
+        accumulator.add({})
+
+        assert accumulator.collect() == []
+        assert not accumulator.directory.exists()
+
+    def test_compaction(self, test_data_tmp_dir: Path) -> None:
+        directory = test_data_tmp_dir / "compaction"
+        accumulator = ParquetCountAccumulator(directory, compaction_threshold=2)
+
+        accumulator.add({CAR_NORTH: 1})
+        accumulator.add({CAR_NORTH: 2, CAR_SOUTH: 1})
+        accumulator.add({CAR_SOUTH: 1})
+
+        assert file_names(directory) == [
+            f"{COMPACTED_PREFIX}-00000002.parquet",
+            f"{SPILL_PREFIX}-00000003.parquet",
+        ]
+        assert as_counts(accumulator.collect()) == {
+            ("north", "car"): 3,
+            ("south", "car"): 2,
+        }
+
+    def test_resume_from_existing_directory(self, test_data_tmp_dir: Path) -> None:
+        directory = test_data_tmp_dir / "resume"
+        ParquetCountAccumulator(directory, compaction_threshold=2).add({CAR_NORTH: 1})
+
+        accumulator = ParquetCountAccumulator(directory, compaction_threshold=2)
+        accumulator.add({CAR_NORTH: 2})
+
+        assert as_counts(accumulator.collect()) == {("north", "car"): 3}
+
+    def test_ignore_files_of_interrupted_compaction(
+        self, test_data_tmp_dir: Path
+    ) -> None:
+        directory = test_data_tmp_dir / "interrupted"
+        accumulator = ParquetCountAccumulator(directory, compaction_threshold=2)
+        accumulator.add({CAR_NORTH: 1})
+        left_over = directory / f"{SPILL_PREFIX}-00000001.parquet"
+        left_over_content = left_over.read_bytes()
+        accumulator.add({CAR_NORTH: 2})
+        left_over.write_bytes(left_over_content)
+
+        assert as_counts(accumulator.collect()) == {("north", "car"): 3}
+        assert not left_over.exists()
+
+    def test_clear(self, test_data_tmp_dir: Path) -> None:
+        directory = test_data_tmp_dir / "clear"
+        accumulator = ParquetCountAccumulator(directory)
+        accumulator.add({CAR_NORTH: 1})
+
+        accumulator.clear()
+
+        assert accumulator.collect() == []
+        assert not directory.exists()
+
+    def test_invalid_compaction_threshold(self, test_data_tmp_dir: Path) -> None:
+        with pytest.raises(ValueError):
+            ParquetCountAccumulator(test_data_tmp_dir, compaction_threshold=0)
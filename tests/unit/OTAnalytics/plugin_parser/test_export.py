@@ -33,6 +33,7 @@ from OTAnalytics.application.export_formats.export_mode import (
     INITIAL_MERGE,
     MERGE,
     OVERWRITE,
+    RESUME_FLUSH,
     ExportMode,
 )
 from OTAnalytics.plugin_parser.export import (
@@ -72,18 +73,64 @@ class TestCsvExport:
     def test_increment_no_export(
         self, test_data_tmp_dir: Path, export_mode: ExportMode
     ) -> None:
-        output_file = test_data_tmp_dir / "no_counts.csv"
+        output_file = test_data_tmp_dir / export_mode.name / "no_counts.csv"
         counts = self._mock_counts_with_single_tag()
 
         export = CsvExport(output_file=str(output_file))
         export.export(counts, export_mode)
 
         assert not output_file.exists()
-        assert len(export._counts) == 1 and list(export._counts.values())[0] == 1
+        actual = export._accumulator.collect()
+        assert len(actual) == 1 and actual[0]["count"] == 1
 
-        export.export(counts, export_mode)
+        export.export(counts, MERGE)
         assert not output_file.exists()
-        assert len(export._counts) == 1 and list(export._counts.values())[0] == 2
+        actual = export._accumulator.collect()
+        assert len(actual) == 1 and actual[0]["count"] == 2
+
+    def test_incremental_export(self, test_data_tmp_dir: Path) -> None:
+        output_file = test_data_tmp_dir / "incremental" / "counts.csv"
+        counts = self._mock_counts_with_single_tag()
+        expected = self._expected_counts()
+        expected["count"] = {0: 3}
+
+        export = CsvExport(output_file=str(output_file), compaction_threshold=2)
+        export.export(counts, INITIAL_MERGE)
+        export.export(counts, MERGE)
+        export.export(counts, FLUSH)
+
+        actual: DataFrame = pandas.read_csv(output_file)
+        assert actual.to_dict() == expected
+        assert not export._accumulator.directory.exists()
+
+    def test_initial_merge_discards_previous_counts(
+        self, test_data_tmp_dir: Path
+    ) -> None:
+        output_file = test_data_tmp_dir / "discard" / "counts.csv"
+        counts = self._mock_counts_with_single_tag()
+        expected = self._expected_counts()
+
+        CsvExport(output_file=str(output_file)).export(counts, INITIAL_MERGE)
+        export = CsvExport(output_file=str(output_file))
+        export.export(counts, INITIAL_MERGE)
+        export.export(self._mock_empty_counts(), FLUSH)
+
+        actual: DataFrame = pandas.read_csv(output_file)
+        assert actual.to_dict() == expected
+
+    def test_resumed_export_continues_previous_counts(
+        self, test_data_tmp_dir: Path
+    ) -> None:
+        output_file = test_data_tmp_dir / "resumed" / "counts.csv"
+        counts = self._mock_counts_with_single_tag()
+        expected = self._expected_counts()
+        expected["count"] = {0: 2}
+
+        CsvExport(output_file=str(output_file)).export(counts, INITIAL_MERGE)
+        CsvExport(output_file=str(output_file)).export(counts, RESUME_FLUSH)
+
+        actual: DataFrame = pandas.read_csv(output_file)
+        assert actual.to_dict() == expected
 
     def _expected_counts(self) -> dict:
         expected = {
@@ -115,6 +162,11 @@ class TestCsvExport:
         counts.to_dict.return_value = {tag: 1}
         return counts
 
+    def _mock_empty_counts(self) -> Count:
+        counts = Mock(spec=Count)
+        counts.to_dict.return_value = {}
+        return counts
+
 
 class TestTagExploder:
     def test_export_single(self) -> None:
@@ -417,3 +469,17 @@ class TestFillZerosExporter:
         exporter.export(counts, OVERWRITE)
 
         other.export.assert_called_once_with(FillEmptyCount(counts, tags), OVERWRITE)
+
+    @pytest.mark.parametrize("export_mode", [INITIAL_MERGE, MERGE])
+    def test_export_fills_zeros_on_final_write_only(
+        self, export_mode: ExportMode
+    ) -> None:
+        other = Mock(spec=Exporter)
+        tag_exploder = Mock(spec=TagExploder)
+        counts = Mock(spec=Count)
+        exporter = FillZerosExporter(other, tag_exploder)
+
+        exporter.export(counts, export_mode)
+
+        other.export.assert_called_once_with(counts, export_mode)
+        tag_exploder.explode.assert_not_called()
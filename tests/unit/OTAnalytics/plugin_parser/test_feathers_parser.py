@@ -11,6 +11,7 @@ from unittest.mock import Mock, patch
 import pandas as pd
 import polars
 import pytest
+from polars.testing import assert_frame_equal
 
 from OTAnalytics.application.datastore import DetectionMetadata, TrackParseResult
 from OTAnalytics.domain import track
@@ -20,7 +21,8 @@ from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store imp
     PolarsTrackGeometryDataset,
 )
 from OTAnalytics.plugin_parser import ottrk_dataformat as ottrk
-from OTAnalytics.plugin_parser.feathers_parser import FeathersParser
+from OTAnalytics.plugin_parser.feathers_parser import FeathersParser, ScanFilter
+from OTAnalytics.plugin_parser.track_parse_cache import TrackParseCache
 
 
 @pytest.fixture
@@ -134,7 +136,7 @@ class TestFeathersParser:
             temp_path.unlink()  # Clean up
 
     @patch("OTAnalytics.plugin_parser.feathers_parser.parse_json")
-    @patch("polars.read_ipc")
+    @patch("polars.scan_ipc")
     @patch(
         "OTAnalytics.plugin_datastore.polars_track_store."
         "PolarsTrackDataset.from_dataframe"
@@ -142,7 +144,7 @@ class TestFeathersParser:
     def test_parse_success(
         self,
         mock_from_dataframe: Mock,
-        mock_read_ipc: Mock,
+        mock_scan_ipc: Mock,
         mock_parse_json: Mock,
         parser: FeathersParser,
         sample_df: pd.DataFrame,
@@ -150,7 +152,7 @@ class TestFeathersParser:
     ) -> None:
         """Test successful parsing of feather file and metadata."""
         # Set up mocks
-        mock_read_ipc.return_value = sample_df
+        mock_scan_ipc.return_value = polars.from_pandas(sample_df).lazy()
         mock_parse_json.return_value = sample_metadata
         mock_track_dataset = Mock(spec=PolarsTrackDataset)
         mock_from_dataframe.return_value = mock_track_dataset
@@ -187,7 +189,7 @@ class TestFeathersParser:
             assert detection_metadata.detection_classes == expected_classes
 
             # Verify mock calls
-            mock_read_ipc.assert_called_once_with(feather_path)
+            mock_scan_ipc.assert_called_once_with(feather_path, memory_map=True)
             mock_parse_json.assert_called_once_with(metadata_path)
             mock_from_dataframe.assert_called_once()
 
@@ -357,3 +359,60 @@ class TestFeathersParser:
         concat_df = mock_from_dataframe.call_args[0][0]
         assert concat_df.shape[0] == 2
         assert set(concat_df.columns) == set(columns_order_a)
+
+    def test_parse_ottrk_with_and_without_cache(
+        self, ottrk_path: Path, test_data_tmp_dir: Path
+    ) -> None:
+        cache = TrackParseCache(test_data_tmp_dir / "track_cache", max_size_in_mb=10)
+        uncached_parser = FeathersParser()
+        cached_parser = FeathersParser(track_parse_cache=cache)
+
+        expected = uncached_parser.parse(ottrk_path)
+        actual = cached_parser.parse(ottrk_path)
+        actual_from_cache = cached_parser.parse(ottrk_path)
+
+        assert not ottrk_path.with_suffix(".feather").exists()
+        for result in [actual, actual_from_cache]:
+            assert isinstance(result.tracks, PolarsTrackDataset)
+            assert isinstance(expected.tracks, PolarsTrackDataset)
+            assert_frame_equal(
+                result.tracks.get_data(),
+                expected.tracks.get_data(),
+                check_column_order=False,
+            )
+            assert result.detection_metadata == expected.detection_metadata
+            assert result.video_metadata == expected.video_metadata
+
+
+class TestScanFilter:
+    @pytest.fixture
+    def detections(self) -> polars.LazyFrame:
+        return polars.DataFrame(
+            {
+                track.TRACK_ID: ["1", "1", "2", "2", "3"],
+                track.CLASSIFICATION: ["car", "truck", "truck", "truck", "bicyclist"],
+            }
+        ).lazy()
+
+    @pytest.mark.parametrize(
+        "include_classes,exclude_classes,expected_track_ids",
+        [
+            (frozenset(), frozenset(), ["1", "1", "2", "2", "3"]),
+            (frozenset(["car"]), frozenset(), ["1", "1"]),
+            (frozenset(["car"]), frozenset(["car"]), ["1", "1"]),
+            (frozenset(), frozenset(["truck"]), ["1", "1", "3"]),
+            (frozenset(), frozenset(["truck", "bicyclist"]), ["1", "1"]),
+        ],
+    )
+    def test_apply(
+        self,
+        detections: polars.LazyFrame,
+        include_classes: frozenset[str],
+        exclude_classes: frozenset[str],
+        expected_track_ids: list[str],
+    ) -> None:
+        scan_filter = ScanFilter(include_classes, exclude_classes)
+
+        actual = scan_filter.apply(detections).collect()
+
+        assert actual.get_column(track.TRACK_ID).to_list() == expected_track_ids
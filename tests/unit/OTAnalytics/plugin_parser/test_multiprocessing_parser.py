@@ -0,0 +1,86 @@
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from polars.testing import assert_frame_equal
+
+from OTAnalytics.application.datastore import TrackParser, TrackParseResult
+from OTAnalytics.plugin_datastore.polars_track_store import PolarsTrackDataset
+from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store import (
+    PolarsTrackGeometryDataset,
+)
+from OTAnalytics.plugin_parser.chunked_ottrk_parser import ChunkedOttrkParser
+from OTAnalytics.plugin_parser.multiprocessing_parser import (
+    MultiprocessingTrackParser,
+    serialize_tracks,
+)
+
+TEST_FILES = [
+    "Sample_FR20_2020-01-01_00-00-00.ottrk",
+    "Testvideo_Cars-Cyclist_FR20_2020-01-01_00-00-00.ottrk",
+    "Testvideo_Cars-Truck_FR20_2020-01-01_00-00-00.ottrk",
+]
+
+
+@pytest.fixture
+def track_files(test_data_dir: Path) -> list[Path]:
+    return [test_data_dir / file for file in TEST_FILES]
+
+
+def create_parser(num_processes: int) -> MultiprocessingTrackParser:
+    return MultiprocessingTrackParser(
+        ChunkedOttrkParser(PolarsTrackGeometryDataset.from_track_dataset),
+        PolarsTrackGeometryDataset.from_track_dataset,
+        num_processes=num_processes,
+    )
+
+
+def assert_equal_results(actual: TrackParseResult, expected: TrackParseResult) -> None:
+    assert isinstance(actual.tracks, PolarsTrackDataset)
+    assert isinstance(expected.tracks, PolarsTrackDataset)
+    assert_frame_equal(actual.tracks.get_data(), expected.tracks.get_data())
+    assert actual.detection_metadata == expected.detection_metadata
+    assert actual.video_metadata == expected.video_metadata
+
+
+class TestMultiprocessingTrackParser:
+    def test_invalid_num_processes(self) -> None:
+        with pytest.raises(ValueError):
+            MultiprocessingTrackParser(Mock(), Mock(), num_processes=0)
+
+    def test_parse_delegates_to_track_parser(self) -> None:
+        track_parser = Mock(spec=TrackParser)
+        file = Mock()
+        parser = MultiprocessingTrackParser(track_parser, Mock(), num_processes=2)
+
+        result = parser.parse(file)
+
+        assert result == track_parser.parse.return_value
+        track_parser.parse.assert_called_once_with(file)
+
+    def test_parse_each_sequentially(self) -> None:
+        track_parser = Mock(spec=TrackParser)
+        files = [Mock(), Mock()]
+        track_parser.parse_each.return_value = iter(["first", "second"])
+        parser = MultiprocessingTrackParser(track_parser, Mock(), num_processes=1)
+
+        result = list(parser.parse_each(files))
+
+        assert result == ["first", "second"]
+        track_parser.parse_each.assert_called_once_with(files)
+
+    def test_parse_each_in_parallel_keeps_file_order(
+        self, track_files: list[Path]
+    ) -> None:
+        expected = list(create_parser(num_processes=1).parse_each(track_files))
+
+        actual = list(create_parser(num_processes=2).parse_each(track_files))
+
+        assert len(actual) == len(expected)
+        for actual_result, expected_result in zip(actual, expected):
+            assert_equal_results(actual_result, expected_result)
+
+
+def test_serialize_tracks_requires_polars_dataset() -> None:
+    with pytest.raises(TypeError):
+        serialize_tracks(Mock())
@@ -0,0 +1,130 @@
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from OTAnalytics.plugin_parser import ottrk_dataformat
+from OTAnalytics.plugin_parser.json_parser import parse_json_bz2
+from OTAnalytics.plugin_parser.ottrk_metadata_index import (
+    METADATA_INDEX_FILE,
+    OttrkMetadataIndex,
+    read_ottrk_metadata,
+)
+
+
+def create_metadata(start_date: float) -> dict:
+    return {ottrk_dataformat.VIDEO: {ottrk_dataformat.RECORDED_START_DATE: start_date}}
+
+
+@pytest.fixture
+def directory(test_data_tmp_dir: Path, request: pytest.FixtureRequest) -> Path:
+    directory = test_data_tmp_dir / request.node.name
+    directory.mkdir()
+    return directory
+
+
+@pytest.fixture
+def format_fixer() -> Mock:
+    format_fixer = Mock()
+    format_fixer.fix_metadata.side_effect = lambda metadata: metadata
+    return format_fixer
+
+
+def create_file(directory: Path, name: str) -> Path:
+    file = directory / name
+    file.write_text(name)
+    return file
+
+
+def test_read_ottrk_metadata(ottrk_path: Path) -> None:
+    expected = parse_json_bz2(ottrk_path)[ottrk_dataformat.METADATA]
+
+    actual = read_ottrk_metadata(ottrk_path)
+
+    assert actual == expected
+
+
+class TestOttrkMetadataIndex:
+    def test_get_reads_file_only_once(
+        self, directory: Path, format_fixer: Mock
+    ) -> None:
+        ottrk_file = create_file(directory, "first.ottrk")
+        reader = Mock(return_value=create_metadata(1.0))
+        index = OttrkMetadataIndex(None, format_fixer, reader)
+
+        first = index.get(ottrk_file)
+        second = index.recorded_start_date(ottrk_file)
+
+        assert first == create_metadata(1.0)
+        assert second == 1.0
+        reader.assert_called_once_with(ottrk_file)
+        format_fixer.fix_metadata.assert_called_once_with(create_metadata(1.0))
+
+    def test_get_rereads_changed_file(
+        self, directory: Path, format_fixer: Mock
+    ) -> None:
+        ottrk_file = create_file(directory, "first.ottrk")
+        reader = Mock(side_effect=[create_metadata(1.0), create_metadata(2.0)])
+        index = OttrkMetadataIndex(None, format_fixer, reader)
+
+        index.get(ottrk_file)
+        ottrk_file.write_text("changed content")
+        actual = index.recorded_start_date(ottrk_file)
+
+        assert actual == 2.0
+        assert reader.call_count == 2
+
+    def test_save_and_reuse_index_file(
+        self, directory: Path, format_fixer: Mock
+    ) -> None:
+        index_file = directory / METADATA_INDEX_FILE
+        ottrk_file = create_file(directory, "first.ottrk")
+        reader = Mock(return_value=create_metadata(1.0))
+        first_index = OttrkMetadataIndex(index_file, format_fixer, reader)
+        first_index.get(ottrk_file)
+        first_index.save()
+
+        second_reader = Mock()
+        second_index = OttrkMetadataIndex(index_file, format_fixer, second_reader)
+        actual = second_index.get(ottrk_file)
+
+        assert actual == create_metadata(1.0)
+        second_reader.assert_not_called()
+
+    def test_modified_file_invalidates_saved_entry(
+        self, directory: Path, format_fixer: Mock
+    ) -> None:
+        index_file = directory / METADATA_INDEX_FILE
+        ottrk_file = create_file(directory, "first.ottrk")
+        first_index = OttrkMetadataIndex(
+            index_file, format_fixer, Mock(return_value=create_metadata(1.0))
+        )
+        first_index.get(ottrk_file)
+        first_index.save()
+        stat = ottrk_file.stat()
+        os.utime(ottrk_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        second_index = OttrkMetadataIndex(
+            index_file, format_fixer, Mock(return_value=create_metadata(2.0))
+        )
+
+        assert second_index.recorded_start_date(ottrk_file) == 2.0
+
+    def test_invalid_index_file_is_ignored(
+        self, directory: Path, format_fixer: Mock
+    ) -> None:
+        index_file = directory / METADATA_INDEX_FILE
+        index_file.write_text("no json")
+        ottrk_file = create_file(directory, "first.ottrk")
+        index = OttrkMetadataIndex(
+            index_file, format_fixer, Mock(return_value=create_metadata(1.0))
+        )
+
+        actual = index.recorded_start_date(ottrk_file)
+        index.save()
+
+        assert actual == 1.0
+        assert OttrkMetadataIndex(index_file, format_fixer, Mock()).get(
+            ottrk_file
+        ) == create_metadata(1.0)
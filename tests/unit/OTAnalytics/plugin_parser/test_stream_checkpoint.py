@@ -0,0 +1,152 @@
+from pathlib import Path
+
+import pytest
+
+from OTAnalytics.plugin_datastore.python_track_store import PythonTrackDataset
+from OTAnalytics.plugin_datastore.track_geometry_store.shapely_store import (
+    ShapelyTrackGeometryDataset,
+)
+from OTAnalytics.plugin_parser.stream_checkpoint import (
+    CheckpointError,
+    StreamCheckpointStore,
+)
+from OTAnalytics.plugin_parser.streaming_parser import StreamPosition
+from tests.utils.builders.track_builder import create_track
+
+RUN_KEY = "run"
+
+
+def create_position(directory: Path) -> StreamPosition:
+    track = create_track("1", [(0, 0), (1, 1)], 0)
+    return StreamPosition(
+        processed_files=(directory / "1.ottrk",),
+        remaining_tracks=PythonTrackDataset.from_list(
+            [track], ShapelyTrackGeometryDataset.from_track_dataset
+        ),
+        detection_classes=frozenset(["car"]),
+    )
+
+
+class TestStreamCheckpointStore:
+    def test_save_and_load(self, test_data_tmp_dir: Path) -> None:
+        directory = test_data_tmp_dir / "save_and_load"
+        directory.mkdir()
+        appended_file = directory / "events.csv"
+        appended_file.write_text("header\n")
+        store = StreamCheckpointStore(directory / "run.checkpoint")
+        position = create_position(directory)
+
+        store.save(RUN_KEY, position, [appended_file, directory / "missing"], [])
+        actual = store.load(RUN_KEY)
+
+        assert actual is not None
+        assert actual.position.processed_files == position.processed_files
+        assert actual.position.detection_classes == position.detection_classes
+        assert actual.position.remaining_tracks is not None
+        assert [track.id for track in actual.position.remaining_tracks] == [
+            track.id for track in position.remaining_tracks or []
+        ]
+        assert actual.file_sizes == {appended_file: len("header\n")}
+
+    def test_load_without_checkpoint(self, test_data_tmp_dir: Path) -> None:
+        store = StreamCheckpointStore(test_data_tmp_dir / "missing.checkpoint")
+
+        assert store.load(RUN_KEY) is None
+
+    def test_load_checkpoint_of_other_run(self, test_data_tmp_dir: Path) -> None:
+        directory = test_data_tmp_dir / "other_run"
+        directory.mkdir()
+        store = StreamCheckpointStore(directory / "run.checkpoint")
+        store.save(RUN_KEY, StreamPosition(), [], [])
+
+        assert store.load("other") is None
+
+    def test_load_invalid_checkpoint(self, test_data_tmp_dir: Path) -> None:
+        checkpoint_file = test_data_tmp_dir / "invalid.checkpoint"
+        checkpoint_file.write_text("invalid")
+        store = StreamCheckpointStore(checkpoint_file)
+
+        assert store.load(RUN_KEY) is None
+
+    def test_restore(self, test_data_tmp_dir: Path) -> None:
+        directory = test_data_tmp_dir / "restore"
+        spill_directory = directory / "spills"
+        spill_directory.mkdir(parents=True)
+        kept_spill = spill_directory / "part-1"
+        kept_spill.write_text("1")
+        appended_file = directory / "events.csv"
+        appended_file.write_text("header\n")
+        store = StreamCheckpointStore(directory / "run.checkpoint")
+        store.save(RUN_KEY, StreamPosition(), [appended_file], [spill_directory])
+
+        with open(appended_file, "a") as file:
+            file.write("row\n")
+        kept_spill.unlink()
+        (spill_directory / "part-2").write_text("2")
+        checkpoint = store.load(RUN_KEY)
+        assert checkpoint is not None
+        store.restore(checkpoint)
+
+        assert appended_file.read_text() == "header\n"
+        assert [file.name for file in spill_directory.iterdir()] == ["part-1"]
+        assert kept_spill.read_text() == "1"
+
+    def test_restore_removes_directory_created_after_checkpoint(
+        self, test_data_tmp_dir: Path
+    ) -> None:
+        directory = test_data_tmp_dir / "created_after"
+        directory.mkdir()
+        spill_directory = directory / "spills"
+        store = StreamCheckpointStore(directory / "run.checkpoint")
+        store.save(RUN_KEY, StreamPosition(), [], [spill_directory])
+        spill_directory.mkdir()
+        (spill_directory / "part-1").write_text("1")
+        checkpoint = store.load(RUN_KEY)
+        assert checkpoint is not None
+
+        store.restore(checkpoint)
+
+        assert not spill_directory.exists()
+
+    def test_restore_shortened_file(self, test_data_tmp_dir: Path) -> None:
+        directory = test_data_tmp_dir / "shortened"
+        directory.mkdir()
+        appended_file = directory / "events.csv"
+        appended_file.write_text("header\n")
+        store = StreamCheckpointStore(directory / "run.checkpoint")
+        store.save(RUN_KEY, StreamPosition(), [appended_file], [])
+        appended_file.write_text("")
+        checkpoint = store.load(RUN_KEY)
+        assert checkpoint is not None
+
+        with pytest.raises(CheckpointError):
+            store.restore(checkpoint)
+
+    def test_save_keeps_latest_snapshot_only(self, test_data_tmp_dir: Path) -> None:
+        directory = test_data_tmp_dir / "snapshots"
+        spill_directory = directory / "spills"
+        spill_directory.mkdir(parents=True)
+        (spill_directory / "part-1").write_text("1")
+        checkpoint_file = directory / "run.checkpoint"
+        store = StreamCheckpointStore(checkpoint_file)
+
+        store.save(RUN_KEY, StreamPosition(), [], [spill_directory])
+        store.save(RUN_KEY, StreamPosition(), [], [spill_directory])
+
+        snapshots = list((directory / "run.checkpoint_snapshots").iterdir())
+        assert len(snapshots) == 1
+
+    def test_delete(self, test_data_tmp_dir: Path) -> None:
+        directory = test_data_tmp_dir / "delete"
+        spill_directory = directory / "spills"
+        spill_directory.mkdir(parents=True)
+        (spill_directory / "part-1").write_text("1")
+        checkpoint_file = directory / "run.checkpoint"
+        store = StreamCheckpointStore(checkpoint_file)
+        store.save(RUN_KEY, StreamPosition(), [], [spill_directory])
+
+        store.delete()
+
+        assert not checkpoint_file.exists()
+        assert not (directory / "run.checkpoint_snapshots").exists()
+        assert store.load(RUN_KEY) is None
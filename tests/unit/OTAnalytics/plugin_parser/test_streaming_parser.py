@@ -1,10 +1,15 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import AsyncIterator
 from unittest.mock import Mock
 
 import pytest
 
+from OTAnalytics.application.datastore import (
+    DetectionMetadata,
+    TrackParser,
+    TrackParseResult,
+)
 from OTAnalytics.application.state import TracksMetadata, VideosMetadata
 from OTAnalytics.application.track_input_source import OttrkFileInputSource
 from OTAnalytics.domain.track import Track
@@ -25,13 +30,18 @@ from OTAnalytics.plugin_parser.otvision_parser import (
     OttrkParser,
     PythonDetectionParser,
 )
-from OTAnalytics.plugin_parser.streaming_parser import StreamOttrkParser
+from OTAnalytics.plugin_parser.streaming_parser import (
+    StreamOttrkParser,
+    StreamPosition,
+)
 from OTAnalytics.plugin_progress.lazy_tqdm_progressbar import LazyTqdmBuilder
 from tests.utils.assertions import assert_equal_track_properties
 from tests.utils.builders.ottrk_file_input_source import create_ottrk_file_input_source
 from tests.utils.builders.track_builder import (
     TrackBuilder,
     append_sample_data,
+    create_track,
+    mark_last_detection_finished,
     track_builder_with_sample_data,
 )
 
@@ -84,6 +94,49 @@ def assert_track_list_equals_dataset(
             )
 
 
+def create_finished_tracks(track_id: str, start_second: int) -> TrackDataset:
+    track = create_track(track_id, [(0, 0), (1, 1)], start_second)
+    return PythonTrackDataset.from_list(
+        [mark_last_detection_finished(track)],
+        ShapelyTrackGeometryDataset.from_track_dataset,
+    )
+
+
+def combine_finished_tracks(indices: list[int]) -> TrackDataset:
+    """Create finished tracks with the given ids starting 10 seconds apart."""
+    tracks = create_finished_tracks(str(indices[0]), start_second=10 * indices[0])
+    for index in indices[1:]:
+        tracks = tracks.add_all(
+            create_finished_tracks(str(index), start_second=10 * index)
+        )
+    return tracks
+
+
+def create_unfinished_tracks(track_id: str, start_second: int) -> TrackDataset:
+    track = create_track(track_id, [(0, 0), (1, 1)], start_second)
+    return PythonTrackDataset.from_list(
+        [track], ShapelyTrackGeometryDataset.from_track_dataset
+    )
+
+
+def create_parse_result(tracks: TrackDataset, index: int) -> TrackParseResult:
+    return TrackParseResult(
+        tracks,
+        DetectionMetadata(frozenset([f"class {index}"])),
+        Mock(spec=VideoMetadata, start=datetime(2020, 1, 1, index)),
+    )
+
+
+def create_input_source(files: list[Path]) -> Mock:
+    async def produce() -> AsyncIterator[Path]:
+        for file in files:
+            yield file
+
+    input_source = Mock(spec=OttrkFileInputSource)
+    input_source.produce.side_effect = produce
+    return input_source
+
+
 class TestStreamOttrkParser:
     @pytest.fixture
     def bulk_ottrk_parser(
@@ -231,3 +284,172 @@ class TestStreamOttrkParser:
             number_of_frames=60,
         )
         ottrk_file.unlink()
+
+    @pytest.mark.parametrize(
+        "window, expected_track_ids",
+        [
+            (None, [{"1", "2", "3"}, {"4", "5"}]),
+            (timedelta(seconds=20), [{"1"}, {"2", "3"}, {"4", "5"}]),
+            (timedelta(seconds=5), [{"1"}, {"2"}, {"3"}, {"4"}, {"5"}]),
+            (timedelta(hours=1), [{"1", "2", "3", "4", "5"}]),
+        ],
+    )
+    async def test_parse_windows(
+        self, window: timedelta | None, expected_track_ids: list[set[str]]
+    ) -> None:
+        files = [Path(f"{index}.ottrk") for index in range(1, 3)]
+        track_parser = Mock(spec=TrackParser)
+        track_parser.parse.side_effect = [
+            create_parse_result(combine_finished_tracks([1, 2, 3]), 1),
+            create_parse_result(combine_finished_tracks([4, 5]), 2),
+        ]
+        parser = StreamOttrkParser(track_parser, window=window)
+
+        actual = [
+            {track_id.id for track_id in dataset.track_ids}
+            async for dataset in parser.parse(create_input_source(files))
+        ]
+
+        assert actual == expected_track_ids
+
+    async def test_parse_windows_provides_pending_tracks_in_position(self) -> None:
+        files = [Path("1.ottrk")]
+        track_parser = Mock(spec=TrackParser)
+        track_parser.parse.side_effect = [
+            create_parse_result(
+                combine_finished_tracks([1, 2]).add_all(
+                    create_unfinished_tracks("3", start_second=30)
+                ),
+                1,
+            )
+        ]
+        parser = StreamOttrkParser(track_parser, window=timedelta(seconds=5))
+
+        actual = [
+            position
+            async for _, position in parser.parse_from(create_input_source(files), None)
+        ]
+
+        assert len(actual) == 3
+        assert actual[0].remaining_tracks is not None
+        assert {track.id.id for track in actual[0].remaining_tracks} == {"3"}
+        assert [
+            {track.id.id for track in window} for window in actual[0].pending_windows
+        ] == [{"2"}]
+        assert actual[1].remaining_tracks is not None
+        assert {track.id.id for track in actual[1].remaining_tracks} == {"3"}
+        assert actual[1].pending_windows == ()
+        assert actual[2].remaining_tracks is None
+
+    async def test_parse_windows_carries_incomplete_windows_to_next_file(
+        self,
+    ) -> None:
+        files = [Path(f"{index}.ottrk") for index in range(1, 3)]
+        track_parser = Mock(spec=TrackParser)
+        track_parser.parse.side_effect = [
+            create_parse_result(combine_finished_tracks([1, 2]), 1),
+            create_parse_result(combine_finished_tracks([3, 4]), 2),
+        ]
+        parser = StreamOttrkParser(track_parser, window=timedelta(seconds=40))
+
+        actual = [
+            (dataset, position)
+            async for dataset, position in parser.parse_from(
+                create_input_source(files), None
+            )
+        ]
+
+        assert [
+            {track_id.id for track_id in dataset.track_ids} for dataset, _ in actual
+        ] == [{"1", "2", "3"}, {"4"}]
+        first_position = actual[0][1]
+        assert first_position.processed_files == tuple(file.resolve() for file in files)
+        assert first_position.remaining_tracks is not None
+        assert {track.id.id for track in first_position.remaining_tracks} == {"4"}
+
+    async def test_parse_from_continues_with_pending_windows(self) -> None:
+        files = [Path("1.ottrk")]
+        position = StreamPosition(
+            processed_files=(files[0].resolve(),),
+            pending_windows=(
+                create_finished_tracks("1", start_second=0),
+                create_finished_tracks("2", start_second=10),
+            ),
+        )
+        parser = StreamOttrkParser(Mock(spec=TrackParser), window=timedelta(seconds=5))
+
+        actual = [
+            {track_id.id for track_id in dataset.track_ids}
+            async for dataset, _ in parser.parse_from(
+                create_input_source(files), position
+            )
+        ]
+
+        assert actual == [{"1"}, {"2"}]
+
+    async def test_parse_from_provides_positions(self) -> None:
+        files = [Path(f"{index}.ottrk") for index in range(1, 3)]
+        first = create_parse_result(create_finished_tracks("1", start_second=0), 1)
+        second = create_parse_result(
+            create_finished_tracks("2", start_second=10).add_all(
+                create_unfinished_tracks("3", start_second=20)
+            ),
+            2,
+        )
+        track_parser = Mock(spec=TrackParser)
+        track_parser.parse.side_effect = [first, second]
+        parser = StreamOttrkParser(track_parser)
+
+        actual = [
+            position
+            async for _, position in parser.parse_from(create_input_source(files), None)
+        ]
+
+        assert len(actual) == 3
+        assert actual[0].processed_files == (files[0].resolve(),)
+        assert actual[0].video_metadata == (first.video_metadata,)
+        assert actual[0].detection_classes == frozenset(["class 1"])
+        assert actual[1].processed_files == tuple(file.resolve() for file in files)
+        assert actual[1].remaining_tracks is not None
+        assert {track.id.id for track in actual[1].remaining_tracks} == {"3"}
+        assert actual[1].detection_classes == frozenset(["class 1", "class 2"])
+        assert actual[2].remaining_tracks is None
+
+    async def test_parse_from_continues_after_position(self) -> None:
+        files = [Path(f"{index}.ottrk") for index in range(1, 3)]
+        video_metadata = Mock(spec=VideoMetadata)
+        position = StreamPosition(
+            processed_files=(files[0].resolve(),),
+            remaining_tracks=create_unfinished_tracks("1", start_second=0),
+            video_metadata=(video_metadata,),
+            detection_classes=frozenset(["car"]),
+        )
+        track_parser = Mock(spec=TrackParser)
+        track_parser.parse.side_effect = [
+            create_parse_result(create_finished_tracks("1", start_second=2), 2)
+        ]
+        tracks_metadata = Mock(spec=TracksMetadata)
+        videos_metadata = Mock(spec=VideosMetadata)
+        parser = StreamOttrkParser(
+            track_parser,
+            registered_tracks_metadata=[tracks_metadata],
+            registered_videos_metadata=[videos_metadata],
+        )
+
+        actual = [
+            dataset
+            async for dataset, _ in parser.parse_from(
+                create_input_source(files), position
+            )
+        ]
+
+        track_parser.parse.assert_called_once_with(files[1])
+        assert len(actual) == 1
+        assert {track.id.id for track in actual[0]} == {"1"}
+        assert len(actual[0].as_list()[0].detections) == 4
+        tracks_metadata.update_detection_classes.assert_any_call(frozenset(["car"]))
+        videos_metadata.update.assert_any_call(video_metadata)
+
+    def test_invalid_window(self) -> None:
+        with pytest.raises(ValueError):
+            StreamOttrkParser(Mock(), window=timedelta(0))
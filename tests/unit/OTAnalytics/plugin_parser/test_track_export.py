@@ -2,9 +2,18 @@ from pathlib import Path
 from unittest.mock import Mock
 
 import pandas
+import polars as pl
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+import pytest
 from pandas.testing import assert_frame_equal
+from polars.testing import assert_frame_equal as assert_polars_frame_equal
 
-from OTAnalytics.application.export_formats.export_mode import OVERWRITE
+from OTAnalytics.application.export_formats.export_mode import (
+    FLUSH,
+    INITIAL_MERGE,
+    OVERWRITE,
+)
 from OTAnalytics.application.state import TracksMetadata, VideosMetadata
 from OTAnalytics.application.use_cases.track_export import (
     TrackExportSpecification,
@@ -13,8 +22,20 @@ from OTAnalytics.application.use_cases.track_export import (
 from OTAnalytics.domain import track
 from OTAnalytics.domain.track_dataset.track_dataset import TRACK_GEOMETRY_FACTORY
 from OTAnalytics.domain.track_repository import TrackRepository
+from OTAnalytics.plugin_datastore.polars_track_store import (
+    PolarsTrackDataset,
+    drop_row_id,
+)
+from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store import (
+    PolarsTrackGeometryDataset,
+)
 from OTAnalytics.plugin_datastore.track_store import PandasTrackDataset
-from OTAnalytics.plugin_parser.track_export import CsvTrackExport, set_column_order
+from OTAnalytics.plugin_parser.track_export import (
+    ColumnarTrackExport,
+    CsvTrackExport,
+    order_columns,
+    set_column_order,
+)
 from tests.utils.builders.track_builder import TrackBuilder, append_sample_data
 
 
@@ -57,3 +78,104 @@ class TestCsvTrackExport:
         expected = set_column_order(track_dataset.get_data().reset_index())
         assert sorted(actual.columns.tolist()) == sorted(expected.columns.tolist())
         assert_frame_equal(actual, expected)
+
+
+class TestColumnarTrackExport:
+    @pytest.mark.parametrize(
+        "file_format, suffix",
+        [(TrackFileFormat.PARQUET, ".parquet"), (TrackFileFormat.ARROW, ".arrow")],
+    )
+    def test_export_incrementally(
+        self,
+        file_format: TrackFileFormat,
+        suffix: str,
+        track_builder: TrackBuilder,
+        track_geometry_factory: TRACK_GEOMETRY_FACTORY,
+        test_data_tmp_dir: Path,
+    ) -> None:
+        mock_tracks_metadata = Mock(spec=TracksMetadata)
+        mock_tracks_metadata.to_dict.return_value = {"tracks": "metadata"}
+        mock_videos_metadata = Mock(spec=VideosMetadata)
+        mock_videos_metadata.to_dict.return_value = {"videos": "metadata"}
+        track_builder = append_sample_data(track_builder)
+        track_repository = Mock(spec=TrackRepository)
+        track_dataset = PandasTrackDataset.from_list(
+            tracks=[track_builder.build_track()],
+            track_geometry_factory=track_geometry_factory,
+        )
+        track_repository.get_all.return_value = track_dataset
+        use_case = ColumnarTrackExport(
+            track_repository, mock_tracks_metadata, mock_videos_metadata, file_format
+        )
+        export_file = test_data_tmp_dir / "exported_tracks"
+        actual_file = export_file.with_suffix(f".tracks{suffix}")
+
+        for export_mode in [INITIAL_MERGE, FLUSH]:
+            use_case.export(
+                specification=TrackExportSpecification(
+                    save_path=export_file,
+                    export_format=[file_format],
+                    export_mode=export_mode,
+                )
+            )
+
+        if file_format == TrackFileFormat.PARQUET:
+            table = pq.read_table(actual_file)
+        else:
+            with ipc.open_file(actual_file) as reader:
+                table = reader.read_all()
+        actual = table.to_pandas()
+        data = set_column_order(track_dataset.get_data().reset_index())
+        expected = pandas.concat([data, data], ignore_index=True)
+        assert actual.columns.tolist() == expected.columns.tolist()
+        assert len(actual) == len(expected)
+        assert actual[track.TRACK_ID].tolist() == expected[track.TRACK_ID].tolist()
+        assert actual[track.X].tolist() == expected[track.X].tolist()
+
+    @pytest.mark.parametrize(
+        "file_format, suffix",
+        [(TrackFileFormat.PARQUET, ".parquet"), (TrackFileFormat.ARROW, ".arrow")],
+    )
+    def test_export_polars_dataset(
+        self,
+        file_format: TrackFileFormat,
+        suffix: str,
+        track_builder: TrackBuilder,
+        test_data_tmp_dir: Path,
+    ) -> None:
+        mock_tracks_metadata = Mock(spec=TracksMetadata)
+        mock_tracks_metadata.to_dict.return_value = {"tracks": "metadata"}
+        mock_videos_metadata = Mock(spec=VideosMetadata)
+        mock_videos_metadata.to_dict.return_value = {"videos": "metadata"}
+        track_builder = append_sample_data(track_builder)
+        track_repository = Mock(spec=TrackRepository)
+        track_dataset = PolarsTrackDataset.from_list(
+            [track_builder.build_track()],
+            PolarsTrackGeometryDataset.from_track_dataset,
+        )
+        track_repository.get_all.return_value = track_dataset
+        use_case = ColumnarTrackExport(
+            track_repository, mock_tracks_metadata, mock_videos_metadata, file_format
+        )
+        export_file = test_data_tmp_dir / "exported_polars_tracks"
+        actual_file = export_file.with_suffix(f".tracks{suffix}")
+
+        use_case.export(
+            specification=TrackExportSpecification(
+                save_path=export_file,
+                export_format=[file_format],
+                export_mode=OVERWRITE,
+            )
+        )
+
+        if file_format == TrackFileFormat.PARQUET:
+            actual = pl.read_parquet(actual_file)
+        else:
+            actual = pl.read_ipc(actual_file, memory_map=False)
+        expected = drop_row_id(track_dataset.get_data())
+        assert actual.columns == order_columns(expected.columns)
+        assert_polars_frame_equal(actual, expected.select(actual.columns))
+
+    def test_reject_non_columnar_format(self) -> None:
+        with pytest.raises(ValueError):
+            ColumnarTrackExport(Mock(), Mock(), Mock(), TrackFileFormat.CSV)
@@ -0,0 +1,142 @@
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from OTAnalytics.plugin_parser.track_parse_cache import (
+    BYTES_PER_MEGABYTE,
+    TrackParseCache,
+    hash_file,
+    metadata_file_of,
+)
+
+
+def write_cache_entry(ottrk_file: Path, feather_file: Path) -> None:
+    content = ottrk_file.read_bytes()
+    feather_file.write_bytes(content)
+    metadata_file_of(feather_file).write_text("{}")
+
+
+def create_ottrk(directory: Path, name: str, size: int) -> Path:
+    file = directory / f"{name}.ottrk"
+    file.write_bytes(name.encode().ljust(size, b"x"))
+    return file
+
+
+@pytest.fixture
+def directory(test_data_tmp_dir: Path, request: pytest.FixtureRequest) -> Path:
+    directory = test_data_tmp_dir / request.node.name
+    directory.mkdir()
+    return directory
+
+
+@pytest.fixture
+def converter() -> Mock:
+    return Mock(side_effect=write_cache_entry)
+
+
+class TestTrackParseCache:
+    def test_negative_size(self, directory: Path) -> None:
+        with pytest.raises(ValueError):
+            TrackParseCache(directory, max_size_in_mb=-1)
+
+    def test_missing_file(self, directory: Path, converter: Mock) -> None:
+        cache = TrackParseCache(directory / "cache", 1, converter)
+
+        with pytest.raises(FileNotFoundError):
+            cache.get(directory / "missing.ottrk")
+
+    def test_get_converts_only_once(self, directory: Path, converter: Mock) -> None:
+        cache_dir = directory / "cache"
+        ottrk_file = create_ottrk(directory, "first", size=10)
+        cache = TrackParseCache(cache_dir, 1, converter)
+
+        first = cache.get(ottrk_file)
+        second = cache.get(ottrk_file)
+
+        assert first == second
+        assert first == cache_dir / f"{hash_file(ottrk_file)}.feather"
+        assert first.read_bytes() == ottrk_file.read_bytes()
+        assert metadata_file_of(first).exists()
+        assert converter.call_count == 1
+        assert list((cache_dir / "tmp").iterdir()) == []
+
+    def test_get_converts_changed_file(self, directory: Path, converter: Mock) -> None:
+        ottrk_file = create_ottrk(directory, "first", size=10)
+        cache = TrackParseCache(directory / "cache", 1, converter)
+
+        first = cache.get(ottrk_file)
+        ottrk_file.write_bytes(b"changed")
+        second = cache.get(ottrk_file)
+
+        assert first != second
+        assert converter.call_count == 2
+
+    def test_failed_conversion_leaves_no_entry(self, directory: Path) -> None:
+        cache_dir = directory / "cache"
+        ottrk_file = create_ottrk(directory, "first", size=10)
+        cache = TrackParseCache(cache_dir, 1, Mock(side_effect=ValueError))
+
+        with pytest.raises(ValueError):
+            cache.get(ottrk_file)
+
+        assert list(cache_dir.glob("*.feather")) == []
+
+    def test_evict_least_recently_used(self, directory: Path, converter: Mock) -> None:
+        quarter_of_cache = BYTES_PER_MEGABYTE // 4
+        first = create_ottrk(directory, "first", 2 * quarter_of_cache)
+        second = create_ottrk(directory, "second", quarter_of_cache)
+        third = create_ottrk(directory, "third", quarter_of_cache)
+        cache = TrackParseCache(directory / "cache", 1, converter)
+
+        first_entry = cache.get(first)
+        second_entry = cache.get(second)
+        os.utime(first_entry, (0, 0))
+        os.utime(second_entry, (1, 1))
+        cache.get(first)
+        third_entry = cache.get(third)
+
+        assert first_entry.exists()
+        assert not second_entry.exists()
+        assert not metadata_file_of(second_entry).exists()
+        assert third_entry.exists()
+
+    def test_evict_ignores_entries_removed_by_other_process(
+        self, directory: Path, converter: Mock
+    ) -> None:
+        cache_dir = directory / "cache"
+        cache_dir.mkdir()
+        removed_entry = cache_dir / "removed.feather"
+        removed_entry.symlink_to(cache_dir / "missing.feather")
+        ottrk_file = create_ottrk(directory, "first", BYTES_PER_MEGABYTE * 2)
+        cache = TrackParseCache(cache_dir, 1, converter)
+
+        entry = cache.get(ottrk_file)
+
+        assert entry.exists()
+
+    def test_read_adds_entry_evicted_by_other_process(
+        self, directory: Path, converter: Mock
+    ) -> None:
+        ottrk_file = create_ottrk(directory, "first", size=10)
+        cache = TrackParseCache(directory / "cache", 1, converter)
+
+        def evict_first_read(feather_file: Path) -> bytes:
+            if converter.call_count == 1:
+                feather_file.unlink()
+            return feather_file.read_bytes()
+
+        actual = cache.read(ottrk_file, evict_first_read)
+
+        assert actual == ottrk_file.read_bytes()
+        assert converter.call_count == 2
+
+    def test_read_missing_file(self, directory: Path, converter: Mock) -> None:
+        cache = TrackParseCache(directory / "cache", 1, converter)
+        reader = Mock()
+
+        with pytest.raises(FileNotFoundError):
+            cache.read(directory / "missing.ottrk", reader)
+
+        reader.assert_not_called()
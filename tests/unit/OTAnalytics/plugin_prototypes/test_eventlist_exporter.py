@@ -1,5 +1,36 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+import pytest
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+
+from OTAnalytics.application.export_formats.export_mode import (
+    FLUSH,
+    INITIAL_MERGE,
+    MERGE,
+)
+from OTAnalytics.application.use_cases.export_events import EventExportSpecification
+from OTAnalytics.plugin_datastore.track_geometry_store.polars_geometry_store import (
+    PolarsEventDataset,
+)
 from OTAnalytics.plugin_prototypes.eventlist_exporter.eventlist_exporter import (
+    EventListArrowExporter,
+    EventListColumnarExporter,
     EventListDataFrameBuilder,
+    EventListParquetExporter,
+    provide_available_eventlist_exporter,
+)
+from tests.unit.OTAnalytics.plugin_datastore.track_geometry_store.test_polars_geometry_store import (  # noqa: E501
+    create_line_section,
+)
+from tests.utils.builders.event_builder import EventBuilder
+
+BUILD_EVENTS = (
+    "OTAnalytics.plugin_prototypes.eventlist_exporter.eventlist_exporter."
+    "EventListDataFrameBuilder.build"
 )
 
 
@@ -13,3 +44,71 @@ class TestEventListDataFrameBuilder:
         actual = builder.build()
 
         assert actual.empty
+
+    def test_build_no_polars_events(self) -> None:
+        builder = EventListDataFrameBuilder(PolarsEventDataset(), [])
+
+        actual = builder.build()
+
+        assert actual.empty
+
+    def test_build_polars_events_as_event_objects(self) -> None:
+        events = [
+            EventBuilder(
+                road_user_id="1",
+                occurrence_microsecond=123456,
+                event_coordinate_x=1.26,
+                direction_vector_x=0.123456,
+            ).build_section_event(),
+            EventBuilder(
+                road_user_id="2", section_id=None, event_type="enter-scene"
+            ).build_section_event(),
+        ]
+        sections = [create_line_section("N", [(0.0, 0.0), (1.0, 1.0)])]
+
+        expected = EventListDataFrameBuilder(events, sections).build()
+        actual = EventListDataFrameBuilder(
+            PolarsEventDataset.from_events(events), sections
+        ).build()
+
+        assert_frame_equal(actual, expected, check_dtype=False)
+
+
+class TestEventListColumnarExporter:
+    @pytest.mark.parametrize(
+        "exporter", [EventListParquetExporter(), EventListArrowExporter()]
+    )
+    def test_append_events_until_flush(
+        self, exporter: EventListColumnarExporter, test_data_tmp_dir: Path
+    ) -> None:
+        file = test_data_tmp_dir / f"events{exporter.get_extension()}"
+        chunks = [
+            DataFrame({"road_user_id": ["1"], "frame_number": [1]}),
+            DataFrame({"road_user_id": ["2"], "frame_number": [2]}),
+            DataFrame({"road_user_id": ["3"], "frame_number": [3]}),
+        ]
+
+        with patch(BUILD_EVENTS, side_effect=chunks):
+            for export_mode in [INITIAL_MERGE, MERGE, FLUSH]:
+                exporter.export([], [], EventExportSpecification(file, export_mode))
+
+        if isinstance(exporter, EventListParquetExporter):
+            actual = pq.read_table(file)
+        else:
+            with ipc.open_file(file) as reader:
+                actual = reader.read_all()
+        assert actual.to_pydict() == {
+            "road_user_id": ["1", "2", "3"],
+            "frame_number": [1, 2, 3],
+        }
+
+
+@pytest.mark.parametrize(
+    "event_format", ["csv", "xlsx", "otevents", "parquet", "arrow"]
+)
+def test_provide_new_exporter_per_export(event_format: str) -> None:
+    first = provide_available_eventlist_exporter(event_format)
+    second = provide_available_eventlist_exporter(event_format)
+
+    assert first is not second
+    assert type(first) is type(second)
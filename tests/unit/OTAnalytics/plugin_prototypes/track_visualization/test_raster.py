@@ -0,0 +1,354 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import numpy
+import pytest
+from pandas import DataFrame, MultiIndex
+
+from OTAnalytics.adapter_visualization.color_provider import ColorPaletteProvider
+from OTAnalytics.domain import track
+from OTAnalytics.plugin_prototypes.track_visualization.raster import (
+    END_MARKER,
+    LINE_PIXEL_COVERAGE,
+    RasterCanvas,
+    RasterTrackGeometryPlotter,
+    RasterTrackPlotter,
+    RasterTrackStartEndPointPlotter,
+    TileCache,
+    marker_pixels,
+    segment_coverage,
+)
+from OTAnalytics.plugin_prototypes.track_visualization.track_viz import (
+    NumpyImageFactory,
+    PandasTrackProvider,
+)
+
+WIDTH = 20
+HEIGHT = 10
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+SEGMENT_PIXELS = (
+    "OTAnalytics.plugin_prototypes.track_visualization.raster.segment_coverage"
+)
+
+
+def create_tracks(*tracks: tuple[str, str, list[tuple[float, float]]]) -> DataFrame:
+    ids: list[str] = []
+    occurrences: list[datetime] = []
+    rows: list[dict] = []
+    for track_id, classification, coordinates in tracks:
+        for index, (x, y) in enumerate(coordinates):
+            ids.append(track_id)
+            occurrences.append(START + timedelta(seconds=index))
+            rows.append(
+                {track.X: x, track.Y: y, track.TRACK_CLASSIFICATION: classification}
+            )
+    return DataFrame(
+        rows,
+        index=MultiIndex.from_arrays(
+            [ids, occurrences], names=[track.TRACK_ID, track.OCCURRENCE]
+        ),
+    )
+
+
+TRACKS = create_tracks(
+    ("1", "car", [(1, 1), (5, 1), (5, 4)]),
+    ("2", "bicyclist", [(10, 8), (15, 8)]),
+)
+
+
+def create_color_palette_provider() -> Mock:
+    color_palette_provider = Mock(spec=ColorPaletteProvider)
+    color_palette_provider.get.return_value = {"car": "blue", "bicyclist": "red"}
+    return color_palette_provider
+
+
+def pixels_of(*coordinates: tuple[int, int]) -> list[int]:
+    return sorted(y * WIDTH + x for x, y in coordinates)
+
+
+class TestSegmentCoverage:
+    def test_horizontal_and_vertical_segments(self) -> None:
+        actual = segment_coverage(
+            numpy.array([0, 0]),
+            numpy.array([1.0, 5.0]),
+            numpy.array([1.0, 1.0]),
+            numpy.array([4.0, 5.0]),
+            numpy.array([1.0, 3.0]),
+            WIDTH,
+            HEIGHT,
+        )
+
+        assert actual[0].tolist() == pixels_of(
+            (1, 1), (2, 1), (3, 1), (4, 1), (5, 1), (5, 2), (5, 3)
+        )
+        assert actual[1].tolist() == [1] * 7
+
+    def test_count_tracks_covering_pixel(self) -> None:
+        actual = segment_coverage(
+            numpy.array([0, 0, 1]),
+            numpy.array([1.0, 2.0, 2.0]),
+            numpy.array([1.0, 1.0, 0.0]),
+            numpy.array([2.0, 2.0, 2.0]),
+            numpy.array([1.0, 2.0, 2.0]),
+            WIDTH,
+            HEIGHT,
+        )
+
+        assert actual[0].tolist() == pixels_of((1, 1), (2, 0), (2, 1), (2, 2))
+        assert actual[1].tolist() == [1, 1, 2, 2]
+
+    def test_drop_pixels_outside_of_image(self) -> None:
+        actual = segment_coverage(
+            numpy.array([0]),
+            numpy.array([-2.0]),
+            numpy.array([7.0]),
+            numpy.array([2.0]),
+            numpy.array([11.0]),
+            WIDTH,
+            HEIGHT,
+        )
+
+        assert actual[0].tolist() == pixels_of((0, 9))
+
+    def test_no_segments(self) -> None:
+        empty = numpy.array([], dtype=float)
+
+        actual = segment_coverage(
+            numpy.array([], dtype=int), empty, empty, empty, empty, WIDTH, HEIGHT
+        )
+
+        assert actual.shape == (2, 0)
+
+
+def test_marker_pixels() -> None:
+    actual = marker_pixels(
+        numpy.array([0.5]), numpy.array([0.5]), END_MARKER, WIDTH, HEIGHT
+    )
+
+    assert actual.tolist() == pixels_of(
+        *[(x, y) for x in range(0, 3) for y in range(0, 3)]
+    )
+
+
+class TestRasterCanvas:
+    def test_paint(self) -> None:
+        canvas = RasterCanvas(WIDTH, HEIGHT)
+
+        canvas.paint(numpy.array([0, 1]), (1.0, 0.0, 0.0, 0.5))
+        canvas.paint(numpy.array([1]), (0.0, 0.0, 1.0, 0.5))
+        actual = canvas.to_array()
+
+        assert actual.shape == (HEIGHT, WIDTH, 4)
+        assert actual[0, 0].tolist() == [255, 0, 0, 128]
+        assert actual[0, 1].tolist() == [85, 0, 170, 191]
+        assert actual[0, 2].tolist() == [0, 0, 0, 0]
+
+    def test_paint_coverage(self) -> None:
+        canvas = RasterCanvas(WIDTH, HEIGHT)
+
+        canvas.paint_coverage(
+            numpy.array([0, 1]), numpy.array([1, 2]), (1.0, 0.0, 0.0, 0.5)
+        )
+        actual = canvas.to_array()
+
+        assert actual[0, 0].tolist() == [255, 0, 0, 128]
+        assert actual[0, 1].tolist() == [255, 0, 0, 191]
+
+    def test_overlay(self) -> None:
+        canvas = RasterCanvas(WIDTH, HEIGHT)
+        image = numpy.zeros((HEIGHT, WIDTH, 4), dtype=numpy.uint8)
+        image[2, 3] = [0, 255, 0, 255]
+
+        canvas.paint(numpy.array([0, 2 * WIDTH + 3]), (1.0, 0.0, 0.0, 1.0))
+        canvas.overlay(image)
+        actual = canvas.to_array()
+
+        assert actual[0, 0].tolist() == [255, 0, 0, 255]
+        assert actual[2, 3].tolist() == [0, 255, 0, 255]
+
+
+class TestTileCache:
+    def test_evict_least_recently_used_tile(self) -> None:
+        cache = TileCache(max_tiles=2)
+        first = numpy.array([1])
+
+        cache.put("first", first)
+        cache.put("second", numpy.array([2]))
+        cache.get("first")
+        cache.put("third", numpy.array([3]))
+
+        assert cache.get("first") is first
+        assert cache.get("second") is None
+        assert len(cache) == 2
+
+
+class TestRasterTrackGeometryPlotter:
+    def test_plot(self) -> None:
+        data_provider = Mock(spec=PandasTrackProvider)
+        data_provider.get_data.return_value = TRACKS
+        plotter = RasterTrackPlotter(
+            RasterTrackGeometryPlotter(
+                data_provider,
+                create_color_palette_provider(),
+                enable_legend=False,
+                alpha=1,
+            ),
+            NumpyImageFactory(),
+        )
+
+        image = plotter.plot(WIDTH, HEIGHT).as_image()
+
+        line_alpha = round(255 * LINE_PIXEL_COVERAGE)
+        assert image.getpixel((3, 1)) == (0, 0, 255, line_alpha)
+        assert image.getpixel((5, 3)) == (0, 0, 255, line_alpha)
+        assert image.getpixel((12, 8)) == (255, 0, 0, line_alpha)
+        assert image.getpixel((0, 0)) == (0, 0, 0, 0)
+
+    def test_render_snapshot_of_data(self) -> None:
+        data_provider = Mock(spec=PandasTrackProvider)
+        data_provider.get_data.return_value = TRACKS
+        plotter = RasterTrackPlotter(
+            RasterTrackGeometryPlotter(
+                data_provider,
+                create_color_palette_provider(),
+                enable_legend=False,
+                alpha=1,
+            ),
+            NumpyImageFactory(),
+        )
+
+        render = plotter.snapshot(WIDTH, HEIGHT)
+        data_provider.get_data.return_value = DataFrame()
+        image = render().as_image()
+
+        data_provider.get_data.assert_called_once()
+        assert image.getpixel((3, 1)) == (0, 0, 255, round(255 * LINE_PIXEL_COVERAGE))
+
+    def test_accumulate_alpha_of_overlapping_tracks(self) -> None:
+        data_provider = Mock(spec=PandasTrackProvider)
+        data_provider.get_data.return_value = create_tracks(
+            ("1", "car", [(1, 1), (5, 1)]),
+            ("2", "car", [(3, 1), (8, 1)]),
+        )
+        plotter = RasterTrackPlotter(
+            RasterTrackGeometryPlotter(
+                data_provider,
+                create_color_palette_provider(),
+                enable_legend=False,
+                alpha=0.5,
+            ),
+            NumpyImageFactory(),
+        )
+
+        alpha = numpy.asarray(plotter.plot(WIDTH, HEIGHT).as_image())[:, :, 3]
+
+        track_alpha = 0.5 * LINE_PIXEL_COVERAGE
+        assert alpha[1, 2] == round(255 * track_alpha)
+        assert alpha[1, 4] == round(255 * (1 - (1 - track_alpha) ** 2))
+        assert alpha[1, 7] == round(255 * track_alpha)
+
+    def test_plot_empty_data(self) -> None:
+        data_provider = Mock(spec=PandasTrackProvider)
+        data_provider.get_data.return_value = DataFrame()
+        plotter = RasterTrackPlotter(
+            RasterTrackGeometryPlotter(
+                data_provider, create_color_palette_provider(), enable_legend=True
+            ),
+            NumpyImageFactory(),
+        )
+
+        image = plotter.plot(WIDTH, HEIGHT).as_image()
+
+        assert numpy.asarray(image)[:, :, 3].max() == 0
+
+    def test_rasterize_changed_tiles_only(self) -> None:
+        data_provider = Mock(spec=PandasTrackProvider)
+        data_provider.get_data.return_value = TRACKS
+        plotter = RasterTrackGeometryPlotter(
+            data_provider, create_color_palette_provider(), enable_legend=False
+        )
+
+        with patch(SEGMENT_PIXELS, wraps=segment_coverage) as rasterize:
+            plotter.plot(RasterCanvas(WIDTH, HEIGHT))
+            assert rasterize.call_count == 2
+
+            plotter.plot(RasterCanvas(WIDTH, HEIGHT))
+            assert rasterize.call_count == 2
+
+            data_provider.get_data.return_value = create_tracks(
+                ("1", "car", [(1, 1), (5, 1), (5, 4)]),
+                ("2", "bicyclist", [(10, 8), (16, 8)]),
+            )
+            plotter.plot(RasterCanvas(WIDTH, HEIGHT))
+            assert rasterize.call_count == 3
+
+    def test_rasterize_tiles_with_equal_coordinate_sums_again(self) -> None:
+        data_provider = Mock(spec=PandasTrackProvider)
+        data_provider.get_data.return_value = create_tracks(
+            ("1", "car", [(1, 1), (5, 1)]), ("3", "car", [(1, 4), (5, 4)])
+        )
+        plotter = RasterTrackGeometryPlotter(
+            data_provider, create_color_palette_provider(), enable_legend=False
+        )
+
+        with patch(SEGMENT_PIXELS, wraps=segment_coverage) as rasterize:
+            plotter.plot(RasterCanvas(WIDTH, HEIGHT))
+            data_provider.get_data.return_value = create_tracks(
+                ("1", "car", [(1, 4), (5, 1)]), ("3", "car", [(1, 1), (5, 4)])
+            )
+            plotter.plot(RasterCanvas(WIDTH, HEIGHT))
+
+            assert rasterize.call_count == 2
+
+    @pytest.mark.parametrize("enable_legend", [True, False])
+    def test_plot_legend(self, enable_legend: bool) -> None:
+        data_provider = Mock(spec=PandasTrackProvider)
+        data_provider.get_data.return_value = TRACKS
+        plotter = RasterTrackGeometryPlotter(
+            data_provider, create_color_palette_provider(), enable_legend=enable_legend
+        )
+        canvas = Mock(spec=RasterCanvas)
+        canvas.width = 200
+        canvas.height = 100
+
+        plotter.plot(canvas)
+
+        assert canvas.overlay.called == enable_legend
+
+
+class TestRasterTrackStartEndPointPlotter:
+    def test_plot(self) -> None:
+        data_provider = Mock(spec=PandasTrackProvider)
+        data_provider.get_data.return_value = create_tracks(
+            ("1", "car", [(2, 2), (10, 2), (17, 7)])
+        )
+        plotter = RasterTrackPlotter(
+            RasterTrackStartEndPointPlotter(
+                data_provider,
+                create_color_palette_provider(),
+                enable_legend=False,
+                alpha=1,
+            ),
+            NumpyImageFactory(),
+        )
+
+        image = plotter.plot(WIDTH, HEIGHT).as_image()
+
+        assert image.getpixel((2, 2)) == (0, 0, 255, 255)
+        assert image.getpixel((17, 7)) == (0, 0, 255, 255)
+        assert image.getpixel((10, 2)) == (0, 0, 0, 0)
+
+    @pytest.mark.parametrize("enable_legend", [True, False])
+    def test_plot_legend(self, enable_legend: bool) -> None:
+        data_provider = Mock(spec=PandasTrackProvider)
+        data_provider.get_data.return_value = TRACKS
+        plotter = RasterTrackStartEndPointPlotter(
+            data_provider, create_color_palette_provider(), enable_legend=enable_legend
+        )
+        canvas = Mock(spec=RasterCanvas)
+        canvas.width = 200
+        canvas.height = 100
+
+        plotter.plot(canvas)
+
+        assert canvas.overlay.called == enable_legend
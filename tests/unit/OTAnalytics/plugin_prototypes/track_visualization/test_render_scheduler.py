@@ -0,0 +1,165 @@
+import asyncio
+import threading
+from threading import Event
+from typing import Optional
+from unittest.mock import Mock
+
+from OTAnalytics.application.plotting import CachedPlotter
+from OTAnalytics.application.state import Plotter, RenderImage
+from OTAnalytics.domain.track import TrackImage
+from OTAnalytics.plugin_prototypes.track_visualization.render_scheduler import (
+    DebouncedRenderScheduler,
+)
+
+TIMEOUT = 5
+
+
+class RecordingPublisher:
+    def __init__(self) -> None:
+        self.images: list[Optional[TrackImage]] = []
+        self.published = Event()
+
+    def __call__(self, image: Optional[TrackImage]) -> None:
+        self.images.append(image)
+        self.published.set()
+
+
+def plotter_rendering(render: RenderImage) -> Mock:
+    plotter = Mock(spec=Plotter)
+    plotter.snapshot.return_value = render
+    return plotter
+
+
+class TestDebouncedRenderScheduler:
+    def test_coalesce_burst_of_requests(self) -> None:
+        scheduler = DebouncedRenderScheduler(debounce_in_seconds=0.2)
+        publish = RecordingPublisher()
+        first = Mock(spec=TrackImage)
+        last = Mock(spec=TrackImage)
+        render_first = Mock(return_value=first)
+        render_last = Mock(return_value=last)
+
+        scheduler.schedule(plotter_rendering(render_first), publish)
+        scheduler.schedule(plotter_rendering(render_first), publish)
+        scheduler.schedule(plotter_rendering(render_last), publish)
+
+        assert publish.published.wait(TIMEOUT)
+        scheduler.shutdown()
+        render_first.assert_not_called()
+        render_last.assert_called_once()
+        assert publish.images == [last]
+
+    def test_drop_image_of_superseded_render(self) -> None:
+        scheduler = DebouncedRenderScheduler(debounce_in_seconds=0)
+        publish = RecordingPublisher()
+        started = Event()
+        release = Event()
+        stale = Mock(spec=TrackImage)
+        latest = Mock(spec=TrackImage)
+
+        def render_stale() -> TrackImage:
+            started.set()
+            release.wait(TIMEOUT)
+            return stale
+
+        scheduler.schedule(plotter_rendering(render_stale), publish)
+        assert started.wait(TIMEOUT)
+        scheduler.schedule(plotter_rendering(Mock(return_value=latest)), publish)
+        release.set()
+
+        assert publish.published.wait(TIMEOUT)
+        scheduler.shutdown()
+        assert publish.images == [latest]
+
+    def test_failing_render_does_not_publish(self) -> None:
+        scheduler = DebouncedRenderScheduler(debounce_in_seconds=0)
+        publish = RecordingPublisher()
+        image = Mock(spec=TrackImage)
+
+        scheduler.schedule(
+            plotter_rendering(Mock(side_effect=ValueError("broken"))), publish
+        )
+        assert not publish.published.wait(0.2)
+        scheduler.schedule(plotter_rendering(Mock(return_value=image)), publish)
+
+        assert publish.published.wait(TIMEOUT)
+        scheduler.shutdown()
+        assert publish.images == [image]
+
+    def test_shutdown_cancels_pending_render(self) -> None:
+        scheduler = DebouncedRenderScheduler(debounce_in_seconds=0.1)
+        publish = RecordingPublisher()
+        plotter = plotter_rendering(Mock())
+
+        scheduler.schedule(plotter, publish)
+        scheduler.shutdown()
+
+        assert not publish.published.wait(0.3)
+        plotter.snapshot.assert_not_called()
+
+    def test_render_overlapping_invalidation_publishes_latest_image(self) -> None:
+        scheduler = DebouncedRenderScheduler(debounce_in_seconds=0)
+        publish = RecordingPublisher()
+        started = Event()
+        release = Event()
+        stale = Mock(spec=TrackImage)
+        latest = Mock(spec=TrackImage)
+        images = iter([stale, latest])
+
+        def plot() -> Optional[TrackImage]:
+            image = next(images)
+            if image is stale:
+                started.set()
+                release.wait(TIMEOUT)
+            return image
+
+        other = Mock(spec=Plotter)
+        other.snapshot.return_value = plot
+        cached_plotter = CachedPlotter(other, [])
+
+        scheduler.schedule(cached_plotter, publish)
+        assert started.wait(TIMEOUT)
+        cached_plotter.invalidate_cache(None)
+        scheduler.schedule(cached_plotter, publish)
+        release.set()
+
+        assert publish.published.wait(TIMEOUT)
+        scheduler.shutdown()
+        assert publish.images == [latest]
+
+    async def test_publish_on_event_loop(self) -> None:
+        scheduler = DebouncedRenderScheduler(debounce_in_seconds=0)
+        image = Mock(spec=TrackImage)
+        published: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+
+        def publish(_: Optional[TrackImage]) -> None:
+            published.set_result(threading.get_ident())
+
+        scheduler.schedule(plotter_rendering(Mock(return_value=image)), publish)
+
+        publishing_thread = await asyncio.wait_for(published, TIMEOUT)
+        scheduler.shutdown()
+        assert publishing_thread == threading.get_ident()
+
+    async def test_take_snapshot_on_event_loop(self) -> None:
+        scheduler = DebouncedRenderScheduler(debounce_in_seconds=0)
+        threads: dict[str, int] = {}
+        published: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+        def render() -> Optional[TrackImage]:
+            threads["render"] = threading.get_ident()
+            return Mock(spec=TrackImage)
+
+        def snapshot() -> RenderImage:
+            threads["snapshot"] = threading.get_ident()
+            return render
+
+        plotter = Mock(spec=Plotter)
+        plotter.snapshot.side_effect = snapshot
+
+        scheduler.schedule(plotter, lambda _: published.set_result(None))
+
+        await asyncio.wait_for(published, TIMEOUT)
+        scheduler.shutdown()
+        assert threads["snapshot"] == threading.get_ident()
+        assert threads["render"] != threading.get_ident()
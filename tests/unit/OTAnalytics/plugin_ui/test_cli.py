@@ -1,8 +1,9 @@
+import asyncio
 from datetime import datetime
 from pathlib import Path
 from shutil import copy2, rmtree
 from typing import Any, AsyncIterator
-from unittest.mock import Mock, PropertyMock, patch
+from unittest.mock import Mock, PropertyMock, call, patch
 
 import pytest
 
@@ -30,7 +31,13 @@ from OTAnalytics.application.config import (
 )
 from OTAnalytics.application.datastore import TrackParser, VideoParser
 from OTAnalytics.application.eventlist import SceneActionDetector
-from OTAnalytics.application.export_formats.export_mode import OVERWRITE
+from OTAnalytics.application.export_formats.export_mode import (
+    FLUSH,
+    INITIAL_MERGE,
+    MERGE,
+    OVERWRITE,
+    RESUME_MERGE,
+)
 from OTAnalytics.application.logger import DEFAULT_LOG_FILE
 from OTAnalytics.application.parser.cli_parser import (
     CliArguments,
@@ -149,6 +156,7 @@ from OTAnalytics.plugin_parser.otconfig_parser import (
     OtConfigFormatFixer,
     OtConfigParser,
 )
+from OTAnalytics.plugin_parser.ottrk_metadata_index import METADATA_INDEX_FILE
 from OTAnalytics.plugin_parser.otvision_parser import (
     DEFAULT_TRACK_LENGTH_LIMIT,
     CachedVideoParser,
@@ -160,8 +168,10 @@ from OTAnalytics.plugin_parser.otvision_parser import (
 from OTAnalytics.plugin_parser.road_user_assignment_export import (
     SimpleRoadUserAssignmentExporterFactory,
 )
+from OTAnalytics.plugin_parser.stream_checkpoint import StreamCheckpointStore
 from OTAnalytics.plugin_parser.streaming_parser import (
     StreamOttrkParser,
+    StreamPosition,
     StreamTrackParser,
 )
 from OTAnalytics.plugin_parser.track_export import CsvTrackExport
@@ -180,6 +190,7 @@ from OTAnalytics.plugin_ui.cli import (
     OTAnalyticsCli,
     OTAnalyticsStreamCli,
     SectionsFileDoesNotExist,
+    StreamEventCreation,
 )
 from OTAnalytics.plugin_video_processing.video_reader import PyAvVideoReader
 from tests.conftest import YieldFixture
@@ -246,7 +257,7 @@ def temp_otconfig(
 
 @pytest.fixture
 def event_list_exporter() -> EventListExporter:
-    return AVAILABLE_EVENTLIST_EXPORTERS[OTC_OTEVENTS_FORMAT_NAME]
+    return AVAILABLE_EVENTLIST_EXPORTERS[OTC_OTEVENTS_FORMAT_NAME]()
 
 
 @pytest.fixture
@@ -298,6 +309,8 @@ def create_run_config(
     track_statistics_export: bool = False,
     logfile: str = str(DEFAULT_LOG_FILE),
     logfile_overwrite: bool = False,
+    track_cache_dir: str | None = None,
+    track_formats: list[str] | None = None,
 ) -> RunConfiguration:
     if event_formats:
         _event_formats = event_formats
@@ -327,6 +340,9 @@ def create_run_config(
         event_formats=_event_formats,
         count_intervals=_count_intervals,
         log_file=logfile,
+        track_cache_dir=track_cache_dir,
+        no_track_cache=track_cache_dir is None,
+        track_formats=track_formats,
     )
     run_config = RunConfiguration(flow_parser, cli_args)
     return run_config
@@ -334,6 +350,7 @@ def create_run_config(
 
 class TestOTAnalyticsCli:
     TRACK_PARSER: str = "track_parser"
+    EVENT_CREATION: str = "event_creation"
     EVENT_REPOSITORY: str = "event_repository"
     ASSIGNMENT_REPOSITORY: str = "assignment_repository"
     ADD_SECTION: str = "add_section"
@@ -393,8 +410,11 @@ class TestOTAnalyticsCli:
     def mock_cli_stream_dependencies(
         self, mock_cli_dependencies: dict[str, Any]
     ) -> dict[str, Any]:
+        event_creation = Mock(spec=StreamEventCreation)
+        event_creation.create_events_of.return_value = (Mock(), [])
         return {
             self.TRACK_PARSER: Mock(spec=StreamTrackParser),
+            self.EVENT_CREATION: event_creation,
             **mock_cli_dependencies,
         }
 
@@ -518,6 +538,9 @@ class TestOTAnalyticsCli:
 
     @pytest.fixture
     def cli_dependencies(self) -> dict[str, Any]:
+        return self.create_cli_dependencies()
+
+    def create_cli_dependencies(self) -> dict[str, Any]:
         track_geometry_factory = ShapelyTrackGeometryDataset.from_track_dataset
         track_repository = TrackRepository(PythonTrackDataset(track_geometry_factory))
         section_repository = SectionRepository()
@@ -662,9 +685,24 @@ class TestOTAnalyticsCli:
                 registered_tracks_metadata=[tracks_metadata],
                 registered_videos_metadata=[videos_metadata],
             ),
+            self.EVENT_CREATION: self.create_stream_event_creation(),
             **dependencies,
         }
 
+    def create_stream_event_creation(self) -> StreamEventCreation:
+        dependencies = self.create_cli_dependencies()
+        tracks_metadata: TracksMetadata = dependencies[self.TRACKS_METADATA]
+        return StreamEventCreation(
+            dependencies[self.ADD_SECTION],
+            dependencies[self.GET_ALL_SECTIONS],
+            dependencies[self.APPLY_CLI_CUTS],
+            dependencies[self.ADD_ALL_TRACKS],
+            GetAllTracks(tracks_metadata._track_repository),
+            dependencies[self.CLEAR_ALL_TRACKS],
+            dependencies[self.CREATE_EVENTS],
+            dependencies[self.EVENT_REPOSITORY],
+        )
+
     @pytest.fixture
     def cli_bulk_dependencies(self, cli_dependencies: dict[str, Any]) -> dict[str, Any]:
         dependencies = cli_dependencies
@@ -745,6 +783,7 @@ class TestOTAnalyticsCli:
             cli = OTAnalyticsStreamCli(run_config, **mock_cli_stream_dependencies)
             expected_dependencies = mock_cli_stream_dependencies
             assert cli._track_parser == expected_dependencies[self.TRACK_PARSER]
+            assert cli._event_creation == expected_dependencies[self.EVENT_CREATION]
         else:
             cli = OTAnalyticsBulkCli(run_config, **mock_cli_bulk_dependencies)
             expected_dependencies = mock_cli_bulk_dependencies
@@ -796,6 +835,35 @@ class TestOTAnalyticsCli:
                 run_config,
             )
 
+    @pytest.mark.parametrize(
+        "mode",
+        [CliMode.STREAM, CliMode.BULK],
+    )
+    def test_keep_event_list_exporter_for_run(
+        self,
+        mode: CliMode,
+        mock_cli_bulk_dependencies: dict[str, Any],
+        mock_cli_stream_dependencies: dict[str, Any],
+        mock_flow_parser: FlowParser,
+    ) -> None:
+        run_config = create_run_config(mock_flow_parser, cli_mode=mode)
+        provide_exporter = Mock(side_effect=lambda _: Mock(spec=EventListExporter))
+        dependencies = (
+            mock_cli_stream_dependencies
+            if mode == CliMode.STREAM
+            else mock_cli_bulk_dependencies
+        )
+        dependencies[self.PROVIDE_EVENTLIST_EXPORTER] = provide_exporter
+        cli = self.init_cli_with(
+            mode, mock_cli_bulk_dependencies, mock_cli_stream_dependencies, run_config
+        )
+
+        first = cli._get_event_list_exporter("parquet")
+        second = cli._get_event_list_exporter("parquet")
+
+        assert first is second
+        provide_exporter.assert_called_once_with("parquet")
+
     @pytest.mark.parametrize(
         "mode",
         [CliMode.STREAM, CliMode.BULK],
@@ -845,6 +913,15 @@ class TestOTAnalyticsCli:
         with pytest.raises(CliParseError, match=expected_error_msg):
             OTAnalyticsCli._validate_cli_args(run_config)
 
+    def test_validate_cli_args_unknown_track_format(
+        self, mock_flow_parser: FlowParser
+    ) -> None:
+        run_config = create_run_config(
+            mock_flow_parser, track_formats=[".Parquet", "ottrk"]
+        )
+        with pytest.raises(CliParseError, match=r"Track formats \['ottrk'\].*"):
+            OTAnalyticsCli._validate_cli_args(run_config)
+
     def test_parse_ottrk_files_with_subdirs(self, temp_tracks_directory: Path) -> None:
         tracks = OTAnalyticsCli._get_ottrk_files([temp_tracks_directory])
         assert temp_tracks_directory / f"track_1.{DEFAULT_TRACK_FILE_TYPE}" in tracks
@@ -893,6 +970,33 @@ class TestOTAnalyticsCli:
             in parsed_tracks
         )
 
+    @pytest.mark.parametrize("mode", [CliMode.STREAM, CliMode.BULK])
+    @pytest.mark.asyncio
+    async def test_ottrk_metadata_index_is_stored_in_track_cache_dir(
+        self,
+        mode: CliMode,
+        mock_flow_parser: FlowParser,
+        mock_cli_bulk_dependencies: dict[str, Any],
+        mock_cli_stream_dependencies: dict[str, Any],
+        ottrk_path: Path,
+        test_data_tmp_dir: Path,
+    ) -> None:
+        cache_dir = test_data_tmp_dir / f"metadata_index_{mode.value}"
+        run_config = create_run_config(
+            mock_flow_parser,
+            cli_mode=mode,
+            track_files=[str(ottrk_path)],
+            track_cache_dir=str(cache_dir),
+        )
+        cli = self.init_cli_with(
+            mode, mock_cli_bulk_dependencies, mock_cli_stream_dependencies, run_config
+        )
+
+        files = [file async for file in cli.ottrk_file_input_source.produce()]
+
+        assert files == [ottrk_path]
+        assert (cache_dir / METADATA_INDEX_FILE).exists()
+
     def test_parse_sections_file(self, otsection_file: Path) -> None:
         section_file = OTAnalyticsCli._get_sections_file(str(otsection_file))
         assert section_file == otsection_file
@@ -998,6 +1102,7 @@ class TestOTAnalyticsCli:
         )
 
         run_config = Mock()
+        run_config.track_formats = {"csv"}
         run_config.count_intervals = {interval}
         run_config.counting_event = CountingEvent.START
 
@@ -1020,7 +1125,7 @@ class TestOTAnalyticsCli:
             output_file=str(expected_output_file),
             export_mode=OVERWRITE,
         )
-        export_counts.export.assert_called_with(expected_specification)
+        export_counts.export_all.assert_called_with([expected_specification])
 
     @pytest.mark.parametrize(
         "mode",
@@ -1043,6 +1148,7 @@ class TestOTAnalyticsCli:
             track_export=False,
             track_statistics_export=False,
             config_file=str(temp_otconfig),
+            track_cache_dir=str(temp_otconfig.with_name("track_cache")),
         )
         otconfig = config_parser.parse(temp_otconfig)
         run_config = RunConfiguration(flow_parser, cli_args, otconfig)
@@ -1091,7 +1197,7 @@ class TestOTAnalyticsCli:
             mode,
             mock_cli_bulk_dependencies,
             mock_cli_stream_dependencies,
-            Mock(),
+            Mock(track_formats={"csv"}),
         )
 
         await cli.start()
@@ -1122,10 +1228,12 @@ class TestOTAnalyticsCli:
         mock_cli_bulk_dependencies: dict[str, Mock],
     ) -> None:
         run_config = Mock()
+        run_config.track_formats = {"csv"}
         type(run_config).do_events = PropertyMock(return_value=True)
         type(run_config).do_counting = PropertyMock(return_value=True)
         type(run_config).save_dir = PropertyMock(return_value=Path("path/to/my/dir"))
         type(run_config).save_name = PropertyMock(return_value="my_save_name")
+        type(run_config).resume = PropertyMock(return_value=False)
 
         first_track_file = Path("path/to/a.ottrk")
         second_track_file = Path("path/to/b.ottrk")
@@ -1135,7 +1243,7 @@ class TestOTAnalyticsCli:
 
         async def async_track_generator() -> AsyncIterator[Any]:
             for track in tracks:
-                yield track
+                yield track, Mock()
 
         mock_parse_track_stream.return_value = async_track_generator()
 
@@ -1165,26 +1273,267 @@ class TestOTAnalyticsCli:
         mock_add_flows.assert_called_once_with(flows)
         mock_add_sections.assert_called_once_with(sections)
 
-        dependencies[self.GET_ALL_SECTIONS].assert_called_once()
-        dependencies[self.CREATE_EVENTS].assert_called_once()
-        mock_export_events.assert_called_once_with(
-            sections, run_config.save_dir / run_config.save_name, OVERWRITE
-        )
-        mock_do_export_counts.assert_called_once_with(
-            run_config.save_dir / run_config.save_name, OVERWRITE
-        )
-
+        save_path = run_config.save_dir / run_config.save_name
         if mode == CliMode.STREAM:
-            mock_parse_track_stream.assert_called_once_with(ottrk_file_input_source)
+            mock_parse_track_stream.assert_called_once_with(
+                ottrk_file_input_source, None
+            )
+            event_creation = dependencies[self.EVENT_CREATION]
+            event_creation.add_sections.assert_called_once_with(sections)
+            event_creation.create_events_of.assert_called_once_with(tracks[0])
+            cut_tracks, events = event_creation.create_events_of.return_value
+            dependencies[self.ADD_ALL_TRACKS].assert_called_once_with(cut_tracks)
+            dependencies[self.EVENT_REPOSITORY].add_all.assert_called_once_with(events)
             dependencies[self.CLEAR_ALL_TRACKS].assert_called()
             dependencies[self.EVENT_REPOSITORY].clear.assert_called()
-            dependencies[self.APPLY_CLI_CUTS].apply.assert_called_once_with(
-                sections, preserve_cutting_sections=True
-            )
+            assert mock_export_events.call_args_list == [
+                call(sections, save_path, INITIAL_MERGE),
+                call(sections, save_path, FLUSH),
+            ]
+            assert mock_do_export_counts.call_args_list == [
+                call(save_path, INITIAL_MERGE),
+                call(save_path, FLUSH),
+            ]
         else:
+            dependencies[self.GET_ALL_SECTIONS].assert_called_once()
+            dependencies[self.CREATE_EVENTS].assert_called_once()
+            mock_export_events.assert_called_once_with(sections, save_path, OVERWRITE)
+            mock_do_export_counts.assert_called_once_with(save_path, OVERWRITE)
             mock_parse_tracks.assert_called_once_with(ottrk_file_input_source)
             dependencies[self.CLEAR_ALL_TRACKS].assert_called_once()
             dependencies[self.EVENT_REPOSITORY].clear.assert_called_once()
             dependencies[self.APPLY_CLI_CUTS].apply.assert_called_once_with(
                 sections, preserve_cutting_sections=True
             )
+
+    def create_resumable_run_config(self, save_dir: Path) -> Mock:
+        run_config = Mock()
+        run_config.track_formats = {"csv"}
+        type(run_config).resume = PropertyMock(return_value=True)
+        type(run_config).save_dir = PropertyMock(return_value=save_dir)
+        type(run_config).save_name = PropertyMock(return_value="my_save_name")
+        type(run_config).track_files = PropertyMock(return_value={Path("a.ottrk")})
+        type(run_config).sections = PropertyMock(return_value=[])
+        type(run_config).flows = PropertyMock(return_value=[])
+        type(run_config).event_formats = PropertyMock(return_value={"csv"})
+        type(run_config).count_intervals = PropertyMock(return_value={15})
+        type(run_config).counting_event = PropertyMock(return_value="start")
+        type(run_config).stream_window = PropertyMock(return_value=None)
+        type(run_config).do_export_tracks = PropertyMock(return_value=False)
+        type(run_config).do_export_track_statistics = PropertyMock(return_value=False)
+        type(run_config).include_classes = PropertyMock(return_value=frozenset())
+        type(run_config).exclude_classes = PropertyMock(return_value=frozenset())
+        return run_config
+
+    @patch("OTAnalytics.plugin_ui.cli.OTAnalyticsCli._export_analysis")
+    @patch("OTAnalytics.plugin_ui.cli.OTAnalyticsStreamCli._parse_track_stream")
+    @pytest.mark.asyncio
+    async def test_stream_saves_checkpoints(
+        self,
+        mock_parse_track_stream: Mock,
+        mock_export_analysis: Mock,
+        mock_cli_stream_dependencies: dict[str, Mock],
+        test_data_tmp_dir: Path,
+    ) -> None:
+        save_dir = test_data_tmp_dir / "save_checkpoints"
+        save_dir.mkdir()
+        checkpoint_file = save_dir / "my_save_name.checkpoint"
+        run_config = self.create_resumable_run_config(save_dir)
+        positions = [
+            StreamPosition(processed_files=(Path("a.ottrk"),)),
+            StreamPosition(processed_files=(Path("a.ottrk"), Path("b.ottrk"))),
+        ]
+        checkpoint_exists: list[bool] = []
+
+        async def track_stream() -> AsyncIterator[Any]:
+            for position in positions:
+                yield Mock(), position
+
+        async def export_analysis(*args: Any) -> None:
+            checkpoint_exists.append(checkpoint_file.exists())
+
+        mock_parse_track_stream.return_value = track_stream()
+        mock_export_analysis.side_effect = export_analysis
+        cli = OTAnalyticsStreamCli(run_config, **mock_cli_stream_dependencies)
+
+        await cli._run_analysis(Mock())
+
+        assert [call.args[1] for call in mock_export_analysis.call_args_list] == [
+            INITIAL_MERGE,
+            MERGE,
+            FLUSH,
+        ]
+        assert checkpoint_exists == [False, True, True]
+        assert not checkpoint_file.exists()
+
+    @patch("OTAnalytics.plugin_ui.cli.OTAnalyticsCli._export_analysis")
+    @patch("OTAnalytics.plugin_ui.cli.OTAnalyticsStreamCli._parse_track_stream")
+    @pytest.mark.asyncio
+    async def test_stream_resumes_from_checkpoint(
+        self,
+        mock_parse_track_stream: Mock,
+        mock_export_analysis: Mock,
+        mock_cli_stream_dependencies: dict[str, Mock],
+        test_data_tmp_dir: Path,
+    ) -> None:
+        save_dir = test_data_tmp_dir / "resume_checkpoint"
+        save_dir.mkdir()
+        events_file = save_dir / "my_save_name.events.csv"
+        events_file.write_text("header\n")
+        run_config = self.create_resumable_run_config(save_dir)
+        position = StreamPosition(processed_files=(Path("a.ottrk"),))
+        cli = OTAnalyticsStreamCli(run_config, **mock_cli_stream_dependencies)
+        StreamCheckpointStore(save_dir / "my_save_name.checkpoint").save(
+            cli._checkpoint_run_key(), position, [events_file], []
+        )
+        events_file.write_text("header\nrow of interrupted run\n")
+
+        async def track_stream() -> AsyncIterator[Any]:
+            yield Mock(), StreamPosition(processed_files=(Path("a.ottrk"),))
+
+        mock_parse_track_stream.return_value = track_stream()
+        input_source = Mock()
+
+        await cli._run_analysis(input_source)
+
+        assert mock_parse_track_stream.call_args.args[0] == input_source
+        assert mock_parse_track_stream.call_args.args[1] == position
+        assert mock_export_analysis.call_args_list == [
+            call([], RESUME_MERGE),
+            call([], FLUSH),
+        ]
+        assert events_file.read_text() == "header\n"
+
+    @patch("OTAnalytics.plugin_ui.cli.OTAnalyticsStreamCli._parse_track_stream")
+    @pytest.mark.asyncio
+    async def test_stream_without_resumable_formats_saves_no_checkpoint(
+        self,
+        mock_parse_track_stream: Mock,
+        mock_cli_stream_dependencies: dict[str, Mock],
+        test_data_tmp_dir: Path,
+    ) -> None:
+        run_config = self.create_resumable_run_config(test_data_tmp_dir)
+        type(run_config).event_formats = PropertyMock(
+            return_value={DEFAULT_EVENTLIST_FILE_TYPE}
+        )
+        cli = OTAnalyticsStreamCli(run_config, **mock_cli_stream_dependencies)
+
+        assert cli._create_checkpoint_store() is None
+
+    @patch("OTAnalytics.plugin_ui.cli.OTAnalyticsCli._export_analysis")
+    @patch("OTAnalytics.plugin_ui.cli.OTAnalyticsStreamCli._parse_track_stream")
+    @pytest.mark.asyncio
+    async def test_stream_creates_events_while_exporting(
+        self,
+        mock_parse_track_stream: Mock,
+        mock_export_analysis: Mock,
+        mock_cli_stream_dependencies: dict[str, Mock],
+        test_data_tmp_dir: Path,
+    ) -> None:
+        run_config = self.create_resumable_run_config(test_data_tmp_dir)
+        type(run_config).resume = PropertyMock(return_value=False)
+        first_chunk, second_chunk = Mock(), Mock()
+        steps: list[str] = []
+
+        async def track_stream() -> AsyncIterator[Any]:
+            for chunk in [first_chunk, second_chunk]:
+                yield chunk, Mock()
+
+        def create_events_of(chunk: Mock) -> tuple[Mock, list]:
+            steps.append("create first" if chunk is first_chunk else "create second")
+            return chunk, []
+
+        async def export_analysis(sections: Any, export_mode: Any) -> None:
+            steps.append("start export")
+            await asyncio.sleep(0.1)
+            steps.append("end export")
+
+        mock_parse_track_stream.return_value = track_stream()
+        mock_export_analysis.side_effect = export_analysis
+        event_creation = mock_cli_stream_dependencies[self.EVENT_CREATION]
+        event_creation.create_events_of.side_effect = create_events_of
+        cli = OTAnalyticsStreamCli(run_config, **mock_cli_stream_dependencies)
+
+        await cli._run_analysis(Mock())
+
+        assert steps[:4] == [
+            "create first",
+            "start export",
+            "create second",
+            "end export",
+        ]
+
+
+class TestOTAnalyticsStreamCliPrefetch:
+    @pytest.mark.asyncio
+    async def test_prefetch_keeps_order_and_bounds_buffer(self) -> None:
+        produced: list[int] = []
+
+        async def stream() -> AsyncIterator[Any]:
+            for index in range(5):
+                produced.append(index)
+                yield index
+
+        actual: list[Any] = []
+        async for item in OTAnalyticsStreamCli._prefetch(stream(), max_size=1):
+            await asyncio.sleep(0)
+            # one item in the consumer, one in the queue, one waiting for the queue
+            assert len(produced) <= len(actual) + 3
+            actual.append(item)
+
+        assert actual == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_raises_errors_of_stream(self) -> None:
+        async def stream() -> AsyncIterator[Any]:
+            yield 0
+            raise ValueError("broken file")
+
+        actual = []
+        with pytest.raises(ValueError, match="broken file"):
+            async for item in OTAnalyticsStreamCli._prefetch(stream(), max_size=1):
+                actual.append(item)
+
+        assert actual == [0]
+
+
+class TestStreamEventCreation:
+    def test_create_events_of(self) -> None:
+        add_section = Mock(spec=AddSection)
+        get_all_sections = Mock(spec=GetAllSections)
+        apply_cli_cuts = Mock(spec=ApplyCliCuts)
+        add_all_tracks = Mock(spec=AddAllTracks)
+        get_all_tracks = Mock(spec=GetAllTracks)
+        clear_all_tracks = Mock(spec=ClearAllTracks)
+        create_events = Mock(spec=CreateEvents)
+        event_repository = Mock(spec=EventRepository)
+        section = Mock()
+        tracks = Mock()
+        cut_tracks = Mock()
+        events = Mock()
+        get_all_sections.return_value = [section]
+        get_all_tracks.as_dataset.return_value = cut_tracks
+        event_repository.get_dataset.return_value = events
+        event_creation = StreamEventCreation(
+            add_section,
+            get_all_sections,
+            apply_cli_cuts,
+            add_all_tracks,
+            get_all_tracks,
+            clear_all_tracks,
+            create_events,
+            event_repository,
+        )
+
+        event_creation.add_sections([section])
+        actual = event_creation.create_events_of(tracks)
+
+        assert actual == (cut_tracks, events)
+        add_section.assert_called_once_with(section)
+        add_all_tracks.assert_called_once_with(tracks)
+        apply_cli_cuts.apply.assert_called_once_with(
+            [section], preserve_cutting_sections=True
+        )
+        create_events.assert_called_once()
+        clear_all_tracks.assert_called_once()
+        event_repository.clear.assert_called_once()
@@ -0,0 +1,26 @@
+from unittest.mock import Mock
+
+import pytest
+
+from OTAnalytics.application.run_configuration import RunConfiguration
+from OTAnalytics.application.state import RenderScheduler
+from OTAnalytics.plugin_ui.nicegui_application import (
+    OtAnalyticsNiceGuiApplicationStarter,
+    Webserver,
+)
+
+
+class TestOtAnalyticsNiceGuiApplicationStarter:
+    def test_shutdown_render_scheduler_when_webserver_stops(self) -> None:
+        webserver = Mock(spec=Webserver)
+        webserver.run.side_effect = KeyboardInterrupt
+        render_scheduler = Mock(spec=RenderScheduler)
+        starter = OtAnalyticsNiceGuiApplicationStarter(Mock(spec=RunConfiguration))
+        starter.__dict__["webserver"] = webserver
+        starter.__dict__["render_scheduler"] = render_scheduler
+
+        with pytest.raises(KeyboardInterrupt):
+            starter.start_ui()
+
+        webserver.run.assert_called_once()
+        render_scheduler.shutdown.assert_called_once()
@@ -0,0 +1,38 @@
+from pathlib import Path
+
+import av
+import numpy
+import pytest
+from av.video.stream import VideoStream
+
+KEYFRAME_VIDEO_FRAMES = 40
+KEYFRAME_INTERVAL = 5
+
+
+@pytest.fixture(scope="module")
+def keyframe_video(test_data_tmp_dir: Path) -> Path:
+    """Video with a keyframe every KEYFRAME_INTERVAL frames."""
+    video_path = test_data_tmp_dir / "keyframe_video.mp4"
+    with av.open(str(video_path), "w") as container:
+        stream: VideoStream = container.add_stream(  # type: ignore[assignment]
+            "libx264",
+            rate=10,
+            options={
+                "g": str(KEYFRAME_INTERVAL),
+                "keyint_min": str(KEYFRAME_INTERVAL),
+                "sc_threshold": "0",
+            },
+        )
+        stream.width = 64
+        stream.height = 48
+        stream.pix_fmt = "yuv420p"
+        for index in range(KEYFRAME_VIDEO_FRAMES):
+            array = numpy.random.default_rng(index).integers(
+                0, 255, (48, 64, 3), dtype=numpy.uint8
+            )
+            frame = av.VideoFrame.from_ndarray(array, format="rgb24")
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+    return video_path
@@ -0,0 +1,132 @@
+import os
+from fractions import Fraction
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from OTAnalytics.plugin_video_processing.video_probe import (
+    Keyframes,
+    VideoProbe,
+    VideoProbeIndex,
+    probe_video,
+)
+from tests.unit.OTAnalytics.plugin_video_processing.conftest import (
+    KEYFRAME_INTERVAL,
+    KEYFRAME_VIDEO_FRAMES,
+)
+
+PROBE = VideoProbe(
+    framerate=Fraction(20, 1),
+    total_frames=60,
+    side_data={},
+    keyframes=Keyframes((0, 30), (0, 15360)),
+)
+
+
+def create_video_file(directory: Path, name: str = "video.mp4") -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    video_file = directory / name
+    video_file.write_bytes(b"video")
+    return video_file
+
+
+class TestKeyframes:
+    @pytest.mark.parametrize(
+        "frame, expected",
+        [(0, (0, 0)), (29, (0, 0)), (30, (30, 15360)), (59, (30, 15360))],
+    )
+    def test_nearest(self, frame: int, expected: tuple[int, int]) -> None:
+        assert PROBE.keyframes is not None
+        assert PROBE.keyframes.nearest(frame) == expected
+
+    def test_nearest_before_first_keyframe(self) -> None:
+        assert Keyframes((5,), (100,)).nearest(4) is None
+
+
+class TestProbeVideo:
+    def test_probe_header(self, cyclist_video: Path) -> None:
+        actual = probe_video(cyclist_video, with_keyframes=False)
+
+        assert actual == VideoProbe(Fraction(20, 1), 60, {}, None)
+
+    def test_probe_with_keyframes(self, keyframe_video: Path) -> None:
+        actual = probe_video(keyframe_video, with_keyframes=True)
+
+        assert actual.framerate == Fraction(10, 1)
+        assert actual.total_frames == KEYFRAME_VIDEO_FRAMES
+        assert actual.keyframes is not None
+        assert actual.keyframes.frames == tuple(
+            range(0, KEYFRAME_VIDEO_FRAMES, KEYFRAME_INTERVAL)
+        )
+
+
+class TestVideoProbeIndex:
+    def test_persist_probe(self, test_data_tmp_dir: Path) -> None:
+        directory = test_data_tmp_dir / "persist_probe"
+        video_file = create_video_file(directory)
+        index_file = directory / "index.json"
+        prober = Mock(return_value=PROBE)
+
+        first = VideoProbeIndex(index_file, prober).get(video_file)
+        second = VideoProbeIndex(index_file, prober).get(video_file)
+
+        assert first == PROBE
+        assert second == PROBE
+        prober.assert_called_once_with(video_file, False)
+
+    def test_probe_changed_video(self, test_data_tmp_dir: Path) -> None:
+        directory = test_data_tmp_dir / "changed_video"
+        video_file = create_video_file(directory)
+        prober = Mock(return_value=PROBE)
+        index = VideoProbeIndex(directory / "index.json", prober)
+
+        index.get(video_file)
+        stat = video_file.stat()
+        os.utime(video_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        index.get(video_file)
+
+        assert prober.call_count == 2
+
+    def test_probe_again_for_keyframes(self, test_data_tmp_dir: Path) -> None:
+        directory = test_data_tmp_dir / "probe_keyframes"
+        video_file = create_video_file(directory)
+        header = VideoProbe(Fraction(20, 1), 0, {})
+        prober = Mock(side_effect=[header, PROBE])
+        index = VideoProbeIndex(prober=prober)
+
+        assert index.get(video_file) == header
+        assert index.get(video_file, with_keyframes=True) == PROBE
+        assert index.get(video_file) == PROBE
+        assert prober.call_count == 2
+
+    def test_keep_keyframes_indexed_while_probing(
+        self, test_data_tmp_dir: Path
+    ) -> None:
+        directory = test_data_tmp_dir / "probe_concurrently"
+        video_file = create_video_file(directory)
+        header = VideoProbe(Fraction(20, 1), 0, {})
+        index = VideoProbeIndex()
+
+        def probe_header(video_path: Path, with_keyframes: bool) -> VideoProbe:
+            # Keyframes are indexed by another thread while the header is probed.
+            index._prober = Mock(return_value=PROBE)
+            index.get(video_path, with_keyframes=True)
+            return header
+
+        index._prober = probe_header
+
+        assert index.get(video_file) == PROBE
+        assert index.get(video_file, with_keyframes=True) == PROBE
+
+    def test_ignore_invalid_index_file(self, test_data_tmp_dir: Path) -> None:
+        directory = test_data_tmp_dir / "invalid_index"
+        video_file = create_video_file(directory)
+        index_file = directory / "index.json"
+        index_file.write_text("no json")
+        prober = Mock(return_value=PROBE)
+
+        actual = VideoProbeIndex(index_file, prober).get(video_file)
+
+        assert actual == PROBE
+        prober.assert_called_once_with(video_file, False)
@@ -1,4 +1,6 @@
+from concurrent.futures import Executor, Future
 from datetime import timedelta
+from fractions import Fraction
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -9,14 +11,25 @@ from PIL import Image, ImageChops
 from OTAnalytics.domain.video import VideoReader
 from OTAnalytics.plugin_prototypes.track_visualization.pil_image import PilImage
 from OTAnalytics.plugin_prototypes.track_visualization.track_viz import PilImageFactory
+from OTAnalytics.plugin_video_processing.video_probe import Keyframes, VideoProbe
 from OTAnalytics.plugin_video_processing.video_reader import (
     PyAvVideoReader,
     av_to_image,
 )
+from tests.unit.OTAnalytics.plugin_video_processing.conftest import (
+    KEYFRAME_VIDEO_FRAMES,
+)
 
 DEFAULT_IMAGE_FACTORY = PilImageFactory()
 
 
+class SynchronousExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs) -> Future:  # type: ignore
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
 class TestPyAVVideoReader:
     def read_expected_frames(self, video_path: Path) -> list[Image.Image]:
         expected_frames = []
@@ -64,6 +77,114 @@ class TestPyAVVideoReader:
         assert frame.size == streaming_frame.size
         assert ImageChops.difference(frame, streaming_frame).getbbox() is None
 
+    def test_get_frames_in_mixed_order(self, cyclist_video: Path) -> None:
+        expected_frames = self.read_expected_frames(cyclist_video)
+        video_reader = PyAvVideoReader(
+            Mock(),
+            DEFAULT_IMAGE_FACTORY,
+            max_cached_frames=2,
+            prefetch_executor=SynchronousExecutor(),
+        )
+
+        for frame_num in (3, 4, 5, 40, 41, 2, 59, 0, 1, 30, 31, 32, 5):
+            frame = video_reader.get_frame(cyclist_video, frame_num).as_image()
+            assert (
+                ImageChops.difference(frame, expected_frames[frame_num]).getbbox()
+                is None
+            )
+
+    def test_get_frames_using_keyframes(self, keyframe_video: Path) -> None:
+        expected_frames = self.read_expected_frames(keyframe_video)
+        video_reader = PyAvVideoReader(
+            Mock(), DEFAULT_IMAGE_FACTORY, max_cached_frames=0
+        )
+
+        for frame_num in (37, 12, 10, 9, 30, 31, 0, 39, 21, 4, 5):
+            frame = video_reader.get_frame(keyframe_video, frame_num).as_image()
+            assert (
+                ImageChops.difference(frame, expected_frames[frame_num]).getbbox()
+                is None
+            )
+        assert len(expected_frames) == KEYFRAME_VIDEO_FRAMES
+
+    def test_get_fps_from_probe_index(self) -> None:
+        video_path = Path("some/path/to/video.mp4")
+        probe_index = Mock()
+        probe_index.get.return_value = VideoProbe(Fraction(30000, 1001), 0, {})
+        video_reader = PyAvVideoReader(Mock(), DEFAULT_IMAGE_FACTORY, probe_index)
+
+        actual = video_reader.get_fps(video_path)
+
+        assert actual == 30000 / 1001
+        probe_index.get.assert_called_once_with(video_path)
+
+    def test_open_video_with_header_probe(self, keyframe_video: Path) -> None:
+        header_probe = VideoProbe(Fraction(25), KEYFRAME_VIDEO_FRAMES, {})
+        keyframe_probe = VideoProbe(
+            Fraction(25), KEYFRAME_VIDEO_FRAMES, {}, Keyframes((0,), (0,))
+        )
+        probe_index = Mock()
+        probe_index.get.side_effect = [header_probe, keyframe_probe]
+        keyframe_executor = Mock(spec=Executor)
+        video_reader = PyAvVideoReader(
+            Mock(),
+            DEFAULT_IMAGE_FACTORY,
+            probe_index,
+            keyframe_executor=keyframe_executor,
+        )
+
+        video_reader.get_frame(keyframe_video, 12)
+
+        probe_index.get.assert_called_once_with(keyframe_video)
+        video = video_reader._videos[keyframe_video.absolute()]
+        assert video.probe is header_probe
+        keyframe_executor.submit.assert_called_once()
+        index_keyframes, *args = keyframe_executor.submit.call_args.args
+
+        index_keyframes(*args)
+
+        probe_index.get.assert_called_with(
+            keyframe_video.absolute(), with_keyframes=True
+        )
+        assert video.probe is keyframe_probe
+
+    def test_get_frame_from_cache(self, cyclist_video: Path) -> None:
+        video_reader = PyAvVideoReader(Mock(), DEFAULT_IMAGE_FACTORY)
+
+        first = video_reader.get_frame(cyclist_video, 10)
+        second = video_reader.get_frame(cyclist_video, 10)
+
+        assert first is second
+
+    def test_prefetch_frames_on_sequential_access(self, cyclist_video: Path) -> None:
+        video_reader = PyAvVideoReader(
+            Mock(),
+            DEFAULT_IMAGE_FACTORY,
+            prefetch_size=3,
+            prefetch_executor=SynchronousExecutor(),
+        )
+        video_path = cyclist_video.absolute()
+
+        video_reader.get_frame(cyclist_video, 10)
+        assert list(video_reader._frames) == [(video_path, 10)]
+
+        video_reader.get_frame(cyclist_video, 11)
+        assert list(video_reader._frames) == [
+            (video_path, frame_num) for frame_num in range(10, 15)
+        ]
+
+    def test_close_least_recently_used_video(
+        self, cyclist_video: Path, test_data_tmp_dir: Path
+    ) -> None:
+        other_video = test_data_tmp_dir / "other_video.mp4"
+        other_video.write_bytes(cyclist_video.read_bytes())
+        video_reader = PyAvVideoReader(Mock(), DEFAULT_IMAGE_FACTORY, max_open_videos=1)
+
+        video_reader.get_frame(cyclist_video, 1)
+        video_reader.get_frame(other_video, 1)
+
+        assert list(video_reader._videos) == [other_video.absolute()]
+
     def test_get_total_frames_video_stream_has_no_frame_info(self) -> None:
         given_video_path = Path("some/path/to/video.mp4")
         given_video_stream = Mock()